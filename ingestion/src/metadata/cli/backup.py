@@ -18,7 +18,7 @@ from enum import Enum
 from pathlib import Path
 from typing import Optional, Tuple
 
-from metadata.cli.db_dump import dump
+from metadata.cli.db_dump import GZIP_SUFFIX, dump
 from metadata.cli.utils import get_engine
 from metadata.utils.helpers import BackupRestoreArgs
 from metadata.utils.logger import ANSI, cli_logger, log_ansi_encoded_string
@@ -32,7 +32,7 @@ class UploadDestinationType(Enum):
 logger = cli_logger()
 
 
-def get_output(output: Optional[str] = None) -> Path:
+def get_output(output: Optional[str] = None, compress: bool = False) -> Path:
     """
     Helper function to prepare the output backup file
     path and name.
@@ -40,10 +40,11 @@ def get_output(output: Optional[str] = None) -> Path:
     It will create the output dir if it does not exist.
 
     :param output: local path to store the backup
+    :param compress: gzip the backup file
     :return: backup file name
     """
     now = datetime.now().strftime("%Y%m%d%H%M")
-    name = f"openmetadata_{now}_backup.sql"
+    name = f"openmetadata_{now}_backup.sql{GZIP_SUFFIX if compress else ''}"
 
     if output:
         # Create the output directory if it does not exist
@@ -161,6 +162,8 @@ def run_backup(
     output: Optional[str],
     upload_destination_type: Optional[UploadDestinationType],
     upload: Optional[Tuple[str, str, str]],
+    compress: bool = False,
+    workers: int = 1,
 ) -> None:
     """
     Run `mysqldump` to MySQL database and store the
@@ -170,6 +173,8 @@ def run_backup(
     :param output: local path to store the backup
     :param upload_destination_type: Azure or AWS Destination Type
     :param upload: URI to upload result file
+    :param compress: gzip the backup file
+    :param workers: number of tables dumped in parallel
 
     """
     log_ansi_encoded_string(
@@ -179,10 +184,15 @@ def run_backup(
         f"{common_backup_obj_instance.host}:{common_backup_obj_instance.port}/{common_backup_obj_instance.database}...",
     )
 
-    out = get_output(output)
+    out = get_output(output, compress)
 
     engine = get_engine(common_args=common_backup_obj_instance)
-    dump(engine=engine, output=out, schema=common_backup_obj_instance.schema)
+    dump(
+        engine=engine,
+        output=out,
+        schema=common_backup_obj_instance.schema,
+        workers=workers,
+    )
 
     log_ansi_encoded_string(
         color=ANSI.GREEN, bold=False, message=f"Backup stored locally under {out}"
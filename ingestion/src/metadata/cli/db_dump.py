@@ -13,10 +13,13 @@
 Database Dumping utility for the metadata CLI
 """
 
+import gzip
 import json
-from functools import singledispatch
+import shutil
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial, singledispatch
 from pathlib import Path
-from typing import List, Optional, Union
+from typing import IO, Callable, Iterable, List, Optional, Union
 
 from sqlalchemy import inspect, text
 from sqlalchemy.engine import Engine
@@ -43,6 +46,13 @@ STATEMENT_ALL_NEW = "SELECT {cols} FROM {table}"
 
 MYSQL_ENGINE_NAME = "mysql"
 
+GZIP_SUFFIX = ".gz"
+# Rows fetched at once from the server side cursor
+FETCH_SIZE = 1000
+# Rows grouped in each INSERT statement, up to the given size
+INSERT_BATCH_ROWS = 100
+INSERT_BATCH_BYTES = 1024 * 1024
+
 
 def single_quote_wrap(raw: str) -> str:
     """
@@ -104,6 +114,94 @@ def _(column_raw: Optional[Union[dict, list]], engine: Engine) -> str:
     )
 
 
+def open_dump(path: Path, mode: str) -> IO:
+    """
+    Open the dump file as text, compressing it with gzip
+    if its name ends with `.gz`
+    """
+    if Path(path).suffix == GZIP_SUFFIX:
+        return gzip.open(path, f"{mode}t", encoding=UTF_8)
+    return open(path, mode, encoding=UTF_8)  # pylint: disable=consider-using-with
+
+
+def stream_rows(engine: Engine, statement: str) -> Iterable:
+    """
+    Iterate over the query results with a server side cursor,
+    so that we never load the whole table in memory
+    """
+    with engine.connect() as conn:
+        result = conn.execution_options(stream_results=True).execute(text(statement))
+        while True:
+            rows = result.fetchmany(FETCH_SIZE)
+            if not rows:
+                break
+            yield from rows
+
+
+def write_inserts(file: IO, insert: str, values: Iterable[str]) -> None:
+    """
+    Write multi-row INSERT statements, one per line,
+    e.g., `INSERT INTO table (json) VALUES ('a'),('b');`
+    """
+    batch: List[str] = []
+    batch_bytes = 0
+    for value in values:
+        batch.append(f"({value})")
+        batch_bytes += len(value)
+        if len(batch) >= INSERT_BATCH_ROWS or batch_bytes >= INSERT_BATCH_BYTES:
+            file.write(f"{insert} {','.join(batch)};\n")
+            batch = []
+            batch_bytes = 0
+    if batch:
+        file.write(f"{insert} {','.join(batch)};\n")
+
+
+def dump_json_table(table: str, engine: Engine, file: IO) -> None:
+    file.write(STATEMENT_TRUNCATE.format(table=table))
+    write_inserts(
+        file,
+        insert=f"INSERT INTO {table} (json) VALUES",
+        values=(
+            clean_col(row.json, engine)
+            for row in stream_rows(engine, STATEMENT_JSON.format(table=table))
+        ),
+    )
+
+
+def dump_all_table(table: str, engine: Engine, file: IO) -> None:
+    file.write(STATEMENT_TRUNCATE.format(table=table))
+    write_inserts(
+        file,
+        insert=f"INSERT INTO {table} VALUES",
+        values=(
+            ",".join(clean_col(col, engine) for col in row)
+            for row in stream_rows(engine, STATEMENT_ALL.format(table=table))
+        ),
+    )
+
+
+def dump_custom_table(table: str, engine: Engine, file: IO, inspector) -> None:
+    """
+    Dump the table columns but the excluded ones
+    """
+    file.write(STATEMENT_TRUNCATE.format(table=table))
+    cols = ",".join(
+        col["name"]
+        for col in inspector.get_columns(table_name=table)
+        if col["name"] not in CUSTOM_TABLES[table]["exclude_columns"]
+    )
+    write_inserts(
+        file,
+        insert=f"INSERT INTO {table} ({cols}) VALUES",
+        values=(
+            ",".join(clean_col(col, engine) for col in row)
+            for row in stream_rows(
+                engine, STATEMENT_ALL_NEW.format(cols=cols, table=table)
+            )
+        ),
+    )
+
+
 def dump_json(tables: List[str], engine: Engine, output: Path) -> None:
     """
     Dumps JSON data.
@@ -111,70 +209,62 @@ def dump_json(tables: List[str], engine: Engine, output: Path) -> None:
     Postgres: engine.name == "postgresql"
     MySQL: engine.name == "mysql"
     """
-    with open(output, "a", encoding=UTF_8) as file:
+    with open_dump(output, "a") as file:
         for table in tables:
-            truncate = STATEMENT_TRUNCATE.format(table=table)
-            file.write(truncate)
-
-            res = engine.execute(text(STATEMENT_JSON.format(table=table))).all()
-            for row in res:
-                insert = f"INSERT INTO {table} (json) VALUES ({clean_col(row.json, engine)});\n"
-                file.write(insert)
+            dump_json_table(table, engine, file)
 
 
 def dump_all(tables: List[str], engine: Engine, output: Path) -> None:
     """
     Dump tables that need to store all data
     """
-    with open(output, "a", encoding=UTF_8) as file:
+    with open_dump(output, "a") as file:
         for table in tables:
-            truncate = STATEMENT_TRUNCATE.format(table=table)
-            file.write(truncate)
-
-            res = engine.execute(text(STATEMENT_ALL.format(table=table))).all()
-            for row in res:
-                data = ",".join(clean_col(col, engine) for col in row)
-
-                insert = f"INSERT INTO {table} VALUES ({data});\n"
-                file.write(insert)
+            dump_all_table(table, engine, file)
 
 
 def dump_entity_custom(engine: Engine, output: Path, inspector) -> None:
     """
     This function is used to dump entities with custom handling
     """
-    with open(output, "a", encoding=UTF_8) as file:
-        for table, data in CUSTOM_TABLES.items():
-            truncate = STATEMENT_TRUNCATE.format(table=table)
-            file.write(truncate)
+    with open_dump(output, "a") as file:
+        for table in CUSTOM_TABLES:
+            dump_custom_table(table, engine, file, inspector)
 
-            columns = inspector.get_columns(table_name=table)
 
-            statement = STATEMENT_ALL_NEW.format(
-                cols=",".join(
-                    col["name"]
-                    for col in columns
-                    if col["name"] not in data["exclude_columns"]
-                ),
-                table=table,
-            )
-            res = engine.execute(text(statement)).all()
-            for row in res:
-                # Let's use .format here to not add more variables
-                # pylint: disable=consider-using-f-string
-                insert = "INSERT INTO {table} ({cols}) VALUES ({data});\n".format(
-                    table=table,
-                    data=",".join(clean_col(col, engine) for col in row),
-                    cols=",".join(
-                        col["name"]
-                        for col in columns
-                        if col["name"] not in data["exclude_columns"]
-                    ),
-                )
-                file.write(insert)
-
-
-def dump(engine: Engine, output: Path, schema: str = None) -> None:
+def _dump_part(dump_table: Callable, part: Path) -> Path:
+    with open_dump(part, "w") as file:
+        dump_table(file=file)
+    return part
+
+
+def dump_parallel(dump_tables: List[Callable], output: Path, workers: int) -> None:
+    """
+    Dump each table in its own part file, one worker per table, and append
+    the parts to the output in order. Gzip files can be concatenated as well.
+    """
+    # Parts keep the output suffix to be compressed the same way
+    parts = [
+        output.with_name(f".{output.stem}.{idx}.part{output.suffix}")
+        for idx in range(len(dump_tables))
+    ]
+    try:
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = [
+                executor.submit(_dump_part, dump_table, part)
+                for dump_table, part in zip(dump_tables, parts)
+            ]
+            with open(output, "ab") as file:
+                for future in futures:
+                    with open(future.result(), "rb") as part_file:
+                        shutil.copyfileobj(part_file, file)
+    finally:
+        for part in parts:
+            if part.exists():
+                part.unlink()
+
+
+def dump(engine: Engine, output: Path, schema: str = None, workers: int = 1) -> None:
     """
     Get all tables from the database and dump
     only the JSON column for the required tables
@@ -192,6 +282,21 @@ def dump(engine: Engine, output: Path, schema: str = None) -> None:
         and table not in CUSTOM_TABLES
     ]
 
-    dump_all(tables=list(TABLES_DUMP_ALL), engine=engine, output=output)
-    dump_json(tables=dump_json_tables, engine=engine, output=output)
-    dump_entity_custom(engine=engine, output=output, inspector=inspector)
+    if workers <= 1:
+        dump_all(tables=list(TABLES_DUMP_ALL), engine=engine, output=output)
+        dump_json(tables=dump_json_tables, engine=engine, output=output)
+        dump_entity_custom(engine=engine, output=output, inspector=inspector)
+        return
+
+    dump_parallel(
+        dump_tables=[
+            *(partial(dump_all_table, table, engine) for table in TABLES_DUMP_ALL),
+            *(partial(dump_json_table, table, engine) for table in dump_json_tables),
+            *(
+                partial(dump_custom_table, table, engine, inspector=inspector)
+                for table in CUSTOM_TABLES
+            ),
+        ],
+        output=output,
+        workers=workers,
+    )
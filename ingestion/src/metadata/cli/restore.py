@@ -12,56 +12,247 @@
 """
 Restore utility for the metadata CLI
 """
+import json
+import os
+import re
+import threading
 import traceback
+from concurrent.futures import Future, ThreadPoolExecutor
+from itertools import cycle
+from pathlib import Path
+from typing import Dict, List, Optional, Set
 
-from sqlalchemy.engine import Engine
+from sqlalchemy.engine import Connection, Engine
 
+from metadata.cli.db_dump import open_dump
 from metadata.cli.utils import get_engine
 from metadata.utils.helpers import BackupRestoreArgs
 from metadata.utils.logger import ANSI, cli_logger, log_ansi_encoded_string
 
 logger = cli_logger()
 
+TRUNCATE_PATTERN = re.compile(r"^TRUNCATE TABLE (\S+);")
+CHECKPOINT_SUFFIX = ".checkpoint"
+PROGRESS_EVERY = 100_000
 
-def execute_sql_file(engine: Engine, sql_file: str) -> None:
+
+class RestoreWorker:
     """
-    Method to create the connection and execute the sql query
+    Run batches of statements in a single transaction, reusing the same
+    connection. Each worker has its own thread, so that the statements
+    of a table are always executed in order.
     """
 
-    with open(sql_file, encoding="utf-8") as file:
-        failed_queries = 0
-        all_queries = file.readlines()
-        log_ansi_encoded_string(
-            color=ANSI.GREEN,
-            bold=False,
-            message=f"Queries to process for restore: {len(all_queries)}",
-        )
+    def __init__(self, engine: Engine):
+        self.engine = engine
+        self.executor = ThreadPoolExecutor(max_workers=1)
+        self.connection: Optional[Connection] = None
 
-        for query in all_queries:
-            # `%` is a reserved syntax in SQLAlchemy to bind parameters. Escaping it with `%%`
-            clean_query = query.replace("%", "%%")
+    def submit(self, statements: List[str]) -> Future:
+        return self.executor.submit(self.execute, statements)
 
-            try:
-                with engine.connect() as conn:
-                    conn.execute(clean_query)
+    def execute(self, statements: List[str]) -> int:
+        """
+        Execute the batch and return the number of failed statements.
+        If the transaction fails, we run the statements one by one
+        to only skip the failing ones.
+        """
+        if self.connection is None:
+            self.connection = self.engine.connect()
+        try:
+            with self.connection.begin():
+                for statement in statements:
+                    self.connection.execute(statement)
+            return 0
+        except Exception:
+            logger.debug(traceback.format_exc())
 
+        failed = 0
+        for statement in statements:
+            try:
+                with self.connection.begin():
+                    self.connection.execute(statement)
             except Exception as err:
-                failed_queries += 1
+                failed += 1
                 logger.debug(traceback.format_exc())
                 logger.warning(
                     f"Error processing the following query while restoring - {err}"
                 )
+        return failed
+
+    def close(self) -> None:
+        self.executor.shutdown(wait=True)
+        if self.connection is not None:
+            self.connection.close()
+
+
+class RestoreCheckpoint:
+    """
+    Tables fully restored, stored next to the backup file. A resumed
+    restore skips them, and the rest are truncated and restored again.
+    """
+
+    def __init__(self, sql_file: Path, resume: bool):
+        self.location = Path(f"{sql_file}{CHECKPOINT_SUFFIX}")
+        self.tables: Set[str] = set()
+        self.lock = threading.Lock()
+        if resume and self.location.exists():
+            with open(self.location, encoding="utf-8") as file:
+                self.tables = set(json.load(file))
+            log_ansi_encoded_string(
+                color=ANSI.GREEN,
+                bold=False,
+                message=f"Resuming the restore, skipping {len(self.tables)} tables already restored",
+            )
+
+    def add(self, table: str) -> None:
+        with self.lock:
+            self.tables.add(table)
+            tmp_location = Path(f"{self.location}.tmp")
+            with open(tmp_location, "w", encoding="utf-8") as file:
+                json.dump(sorted(self.tables), file)
+            os.replace(tmp_location, self.location)
+
+    def clear(self) -> None:
+        if self.location.exists():
+            self.location.unlink()
+
+
+class Restore:
+    """
+    Stream the backup file and execute its statements in batches.
+
+    The backup file has a section per table, starting with its TRUNCATE
+    statement. Each table is restored by a single worker, so that tables
+    are restored in parallel while keeping their statements in order.
+    """
+
+    def __init__(  # pylint: disable=too-many-arguments
+        self,
+        engine: Engine,
+        sql_file: Path,
+        batch_size: int = 1000,
+        workers: int = 1,
+        resume: bool = False,
+    ):
+        self.sql_file = Path(sql_file)
+        self.batch_size = max(batch_size, 1)
+        self.workers = [RestoreWorker(engine) for _ in range(max(workers, 1))]
+        self.next_worker = cycle(self.workers)
+        self.checkpoint = RestoreCheckpoint(self.sql_file, resume)
+        # Bound the batches waiting to be executed, as the file is read faster
+        self.pending = threading.BoundedSemaphore(2 * len(self.workers))
+        self.futures: Dict[Optional[str], List[Future]] = {}
+        self.table_worker: Dict[Optional[str], RestoreWorker] = {}
+        self.processed = 0
+        self.next_progress = PROGRESS_EVERY
+
+    def _submit(self, table: Optional[str], statements: List[str]) -> None:
+        if table not in self.table_worker:
+            self.table_worker[table] = next(self.next_worker)
+        self.pending.acquire()  # pylint: disable=consider-using-with
+        future = self.table_worker[table].submit(statements)
+        future.add_done_callback(lambda _: self.pending.release())
+        self.futures.setdefault(table, []).append(future)
+
+        self.processed += len(statements)
+        if self.processed >= self.next_progress:
+            self.next_progress += PROGRESS_EVERY
+            log_ansi_encoded_string(
+                color=ANSI.GREEN,
+                bold=False,
+                message=f"Queries processed: {self.processed}",
+            )
+
+    def _complete_tables(self, wait: bool = False) -> int:
+        """
+        Checkpoint the tables whose batches are all executed without
+        failures and return the number of failed queries. Tables with
+        failures are restored again when resuming.
+        """
+        failed = 0
+        for table in list(self.futures):
+            futures = self.futures[table]
+            if not wait and not all(future.done() for future in futures):
+                continue
+            table_failed = sum(future.result() for future in futures)
+            failed += table_failed
+            del self.futures[table]
+            if table is not None and not table_failed:
+                self.checkpoint.add(table)
+        return failed
+
+    def run(self) -> None:
+        """
+        Restore the backup, skipping the tables checkpointed by a previous
+        run. The checkpoint is removed once all the tables are restored
+        without failures.
+        """
+        failed_queries = 0
+        table: Optional[str] = None
+        batch: List[str] = []
+        skip = False
+        try:
+            with open_dump(self.sql_file, "r") as file:
+                for query in file:
+                    match = TRUNCATE_PATTERN.match(query)
+                    if match:
+                        if batch:
+                            self._submit(table, batch)
+                            batch = []
+                        failed_queries += self._complete_tables()
+                        table = match.group(1)
+                        skip = table in self.checkpoint.tables
+                    if skip or not query.strip():
+                        continue
+
+                    # `%` is a reserved syntax in SQLAlchemy to bind parameters. Escaping it with `%%`
+                    batch.append(query.replace("%", "%%"))
+                    if len(batch) >= self.batch_size:
+                        self._submit(table, batch)
+                        batch = []
 
+                if batch:
+                    self._submit(table, batch)
+                failed_queries += self._complete_tables(wait=True)
+        finally:
+            for worker in self.workers:
+                worker.close()
+
+        if not failed_queries:
+            self.checkpoint.clear()
         log_ansi_encoded_string(
             color=ANSI.GREEN,
             bold=False,
-            message=f"Restore finished. {failed_queries} queries failed from {len(all_queries)}.",
+            message=f"Restore finished. {failed_queries} queries failed from {self.processed}.",
         )
 
 
+def execute_sql_file(  # pylint: disable=too-many-arguments
+    engine: Engine,
+    sql_file: str,
+    batch_size: int = 1000,
+    workers: int = 1,
+    resume: bool = False,
+) -> None:
+    """
+    Method to create the connection and execute the sql query
+    """
+    Restore(
+        engine=engine,
+        sql_file=Path(sql_file),
+        batch_size=batch_size,
+        workers=workers,
+        resume=resume,
+    ).run()
+
+
 def run_restore(
     common_restore_obj_instance: BackupRestoreArgs,
     sql_file: str,
+    batch_size: int = 1000,
+    workers: int = 1,
+    resume: bool = False,
 ) -> None:
     """
     Run and restore the
@@ -69,6 +260,9 @@ def run_restore(
 
     :param common_restore_obj_instance: cls instance to fetch common args
     :param sql_file: local path of file to restore the backup
+    :param batch_size: number of queries executed in each transaction
+    :param workers: number of tables restored in parallel
+    :param resume: skip the tables restored by a previous, interrupted, run
     """
     log_ansi_encoded_string(
         color=ANSI.GREEN,
@@ -79,7 +273,13 @@ def run_restore(
 
     engine = get_engine(common_args=common_restore_obj_instance)
 
-    execute_sql_file(engine=engine, sql_file=sql_file)
+    execute_sql_file(
+        engine=engine,
+        sql_file=sql_file,
+        batch_size=batch_size,
+        workers=workers,
+        resume=resume,
+    )
 
     log_ansi_encoded_string(
         color=ANSI.GREEN,
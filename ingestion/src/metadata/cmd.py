@@ -251,6 +251,17 @@ def backup_args(parser: argparse.ArgumentParser):
         "--schema",
         default=None,
     )
+    parser.add_argument(
+        "--compress",
+        help="Flag option. If passed, the backup file will be compressed with gzip",
+        action="store_true",
+    )
+    parser.add_argument(
+        "--workers",
+        help="Number of tables to dump in parallel",
+        type=int,
+        default=4,
+    )
 
 
 def restore_args(parser: argparse.ArgumentParser):
@@ -309,6 +320,26 @@ def restore_args(parser: argparse.ArgumentParser):
         required=False,
     )
 
+    parser.add_argument(
+        "--batch-size",
+        help="Number of queries to execute in each transaction",
+        type=int,
+        default=1000,
+    )
+
+    parser.add_argument(
+        "--workers",
+        help="Number of tables to restore in parallel",
+        type=int,
+        default=4,
+    )
+
+    parser.add_argument(
+        "--resume",
+        help="Flag option. If passed, skip the tables restored by a previous interrupted run",
+        action="store_true",
+    )
+
 
 def add_metadata_args(parser: argparse.ArgumentParser):
     """
@@ -428,6 +459,8 @@ def metadata(args=None):  # pylint: disable=too-many-branches
             output=contains_args.get("output"),
             upload_destination_type=contains_args.get("upload_destination_type"),
             upload=contains_args.get("upload"),
+            compress=contains_args.get("compress"),
+            workers=contains_args.get("workers"),
         )
     if metadata_workflow == MetadataCommands.RESTORE.value:
         run_restore(
@@ -442,6 +475,9 @@ def metadata(args=None):  # pylint: disable=too-many-branches
                 schema=contains_args.get("schema"),
             ),
             sql_file=contains_args.get("input"),
+            batch_size=contains_args.get("batch_size"),
+            workers=contains_args.get("workers"),
+            resume=contains_args.get("resume"),
         )
     if metadata_workflow == MetadataCommands.DOCKER.value:
         run_docker(
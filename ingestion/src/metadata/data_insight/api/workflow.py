@@ -231,6 +231,9 @@ class DataInsightWorkflow(WorkflowStatusMixin):
                         logger.warning(
                             "No sink attribute found, skipping ingestion of KPI result"
                         )
+                if hasattr(self, "es_sink"):
+                    # Index any buffered document before computing the KPIs
+                    self.es_sink.flush()
                 self.status.records.extend(self.source.processor_status.records)
                 self.status.failures.extend(self.source.processor_status.failures)
                 self.status.warnings.extend(self.source.processor_status.warnings)
@@ -16,6 +16,7 @@ Workflow definition for the test suite
 from __future__ import annotations
 
 import traceback
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from copy import deepcopy
 from logging import Logger
 from typing import List, Optional, cast
@@ -27,6 +28,10 @@ from metadata.data_quality.api.models import (
     TestCaseDefinition,
     TestSuiteProcessorConfig,
 )
+from metadata.data_quality.interface.sqlalchemy.sqa_test_suite_interface import (
+    SQATestSuiteInterface,
+)
+from metadata.data_quality.runner.models import TestCaseResultResponse
 from metadata.data_quality.source.test_suite_source_factory import (
     test_suite_source_factory,
 )
@@ -56,11 +61,12 @@ from metadata.generated.schema.type.basic import EntityLink, FullyQualifiedEntit
 from metadata.ingestion.api.parser import parse_workflow_config_gracefully
 from metadata.ingestion.api.processor import ProcessorStatus
 from metadata.ingestion.ometa.client_utils import create_ometa_client
-from metadata.utils import entity_link
+from metadata.utils import entity_link, fqn
 from metadata.utils.class_helper import (
     get_service_class_from_service_type,
     get_service_type_from_source_type,
 )
+from metadata.utils.filters import filter_by_table
 from metadata.utils.importer import get_sink
 from metadata.utils.logger import test_suite_logger
 from metadata.utils.workflow_output_handler import print_test_suite_status
@@ -106,6 +112,7 @@ class TestSuiteWorkflow(WorkflowStatusMixin):
 
         self._retrieve_service_connection()
         self.source_config: TestSuitePipeline = self.config.source.sourceConfig.config
+        self._validate_source_config()
         self.processor_config: TestSuiteProcessorConfig = (
             TestSuiteProcessorConfig.parse_obj(
                 self.config.processor.dict().get("config")
@@ -116,8 +123,10 @@ class TestSuiteWorkflow(WorkflowStatusMixin):
 
         self.status = ProcessorStatus()
 
-        self.table_entity: Optional[Table] = self._get_table_entity(
-            self.source_config.entityFullyQualifiedName.__root__
+        self.table_entity: Optional[Table] = (
+            self._get_table_entity(self.source_config.entityFullyQualifiedName.__root__)
+            if self.source_config.entityFullyQualifiedName
+            else None
         )
 
         if self.config.sink:
@@ -147,6 +156,40 @@ class TestSuiteWorkflow(WorkflowStatusMixin):
             )
             raise err
 
+    def _validate_source_config(self) -> None:
+        """
+        The tables are given by entityFullyQualifiedName or entityFullyQualifiedNames,
+        but not both, and/or the tableFilterPattern. The listed tables must belong to
+        the service of the workflow, as the filter pattern applies to its tables.
+        """
+        if (
+            self.source_config.entityFullyQualifiedName
+            and self.source_config.entityFullyQualifiedNames
+        ):
+            raise ValueError(
+                "Only one of entityFullyQualifiedName and entityFullyQualifiedNames can be set"
+            )
+        if not (
+            self.source_config.entityFullyQualifiedName
+            or self.source_config.entityFullyQualifiedNames
+            or self.source_config.tableFilterPattern
+        ):
+            raise ValueError(
+                "One of entityFullyQualifiedName, entityFullyQualifiedNames"
+                " or tableFilterPattern is required"
+            )
+
+        service_name = self.config.source.serviceName
+        outside_service = [
+            entity_fqn.__root__
+            for entity_fqn in self.source_config.entityFullyQualifiedNames or []
+            if fqn.split(entity_fqn.__root__)[0] != service_name
+        ]
+        if outside_service:
+            raise ValueError(
+                f"Tables {outside_service} do not belong to the service [{service_name}]"
+            )
+
     def _get_table_entity(self, entity_fqn: str) -> Optional[Table]:
         """given an entity fqn return the table entity
 
@@ -159,14 +202,54 @@ class TestSuiteWorkflow(WorkflowStatusMixin):
             fields=["tableProfilerConfig", "testSuite"],
         )
 
-    def create_or_return_test_suite_entity(self) -> Optional[TestSuite]:
+    def get_table_entities(self) -> List[Table]:
+        """
+        Get the tables to test: the pipeline entity, the listed ones
+        and the tables of the service matching the filter pattern
+        """
+        table_entities = [self.table_entity] if self.table_entity else []
+        for entity_fqn in self.source_config.entityFullyQualifiedNames or []:
+            table_entity = self._get_table_entity(entity_fqn.__root__)
+            if table_entity:
+                table_entities.append(table_entity)
+            else:
+                self.status.failed(
+                    entity_fqn.__root__,
+                    f"Could not retrieve table entity for {entity_fqn.__root__}",
+                )
+
+        if self.source_config.tableFilterPattern:
+            table_entities.extend(
+                table_entity
+                for table_entity in self.metadata.list_all_entities(
+                    entity=Table,
+                    fields=["tableProfilerConfig", "testSuite"],
+                    params={"service": self.config.source.serviceName},
+                )
+                if not filter_by_table(
+                    self.source_config.tableFilterPattern, table_entity.name.__root__
+                )
+            )
+
+        # The same table could be both listed and matching the filter
+        return list(
+            {
+                table_entity.fullyQualifiedName.__root__: table_entity
+                for table_entity in table_entities
+            }.values()
+        )
+
+    def create_or_return_test_suite_entity(
+        self, table_entity: Optional[Table] = None
+    ) -> Optional[TestSuite]:
         """
         try to get test suite name from source.servicName.
         In the UI workflow we'll write the entity name (i.e. the test suite)
         to source.serviceName.
         """
-        self.table_entity = cast(Table, self.table_entity)  # satisfy type checker
-        test_suite = self.table_entity.testSuite
+        table_entity = cast(Table, table_entity or self.table_entity)
+        table_fqn = table_entity.fullyQualifiedName.__root__
+        test_suite = table_entity.testSuite
         if test_suite and not test_suite.executable:
             logger.debug(
                 f"Test suite {test_suite.fullyQualifiedName.__root__} is not executable."
@@ -182,24 +265,25 @@ class TestSuiteWorkflow(WorkflowStatusMixin):
             )
             test_suite = self.metadata.create_or_update_executable_test_suite(
                 CreateTestSuiteRequest(
-                    name=f"{self.source_config.entityFullyQualifiedName.__root__}.TestSuite",
-                    displayName=f"{self.source_config.entityFullyQualifiedName.__root__} Test Suite",
+                    name=f"{table_fqn}.TestSuite",
+                    displayName=f"{table_fqn} Test Suite",
                     description="Test Suite created from YAML processor config file",
                     owner=None,
-                    executableEntityReference=self.source_config.entityFullyQualifiedName.__root__,
+                    executableEntityReference=table_fqn,
                 )
             )
 
         return test_suite
 
     def get_test_cases_from_test_suite(
-        self, test_suite: TestSuite
+        self, test_suite: TestSuite, table_entity: Optional[Table] = None
     ) -> Optional[List[TestCase]]:
         """
         Get test cases from test suite name
 
         Args:
             test_suite_name: the name of the test suite
+            table_entity: table of the test suite, the pipeline entity by default
         """
         test_cases = self.metadata.list_entities(
             entity=TestCase,
@@ -213,7 +297,7 @@ class TestSuiteWorkflow(WorkflowStatusMixin):
                 List[TestCaseDefinition], cli_test_cases
             )  # satisfy type checker
             test_cases = self.compare_and_create_test_cases(
-                cli_test_cases, test_cases, test_suite
+                cli_test_cases, test_cases, test_suite, table_entity
             )
 
         return test_cases
@@ -248,13 +332,18 @@ class TestSuiteWorkflow(WorkflowStatusMixin):
         return None
 
     def _update_test_cases(
-        self, test_cases_to_update: List[TestCaseDefinition], test_cases: List[TestCase]
+        self,
+        test_cases_to_update: List[TestCaseDefinition],
+        test_cases: List[TestCase],
+        table_entity: Optional[Table] = None,
     ):
         """Given a list of CLI test definition patch test cases in the platform
 
         Args:
             test_cases_to_update (List[TestCaseDefinition]): list of test case definitions
+            table_entity: table of the test cases, the pipeline entity by default
         """
+        table_entity = cast(Table, table_entity or self.table_entity)
         test_cases_to_update_names = {
             test_case_to_update.name for test_case_to_update in test_cases_to_update
         }
@@ -268,7 +357,7 @@ class TestSuiteWorkflow(WorkflowStatusMixin):
                 updated_test_case = self.metadata.patch_test_case_definition(
                     source=test_case,
                     entity_link=entity_link.get_entity_link(
-                        self.source_config.entityFullyQualifiedName.__root__,
+                        table_entity.fullyQualifiedName.__root__,
                         test_case_definition.columnName,
                     ),
                     test_case_parameter_values=test_case_definition.parameterValues,
@@ -284,6 +373,7 @@ class TestSuiteWorkflow(WorkflowStatusMixin):
         cli_test_cases_definitions: Optional[List[TestCaseDefinition]],
         test_cases: List[TestCase],
         test_suite: TestSuite,
+        table_entity: Optional[Table] = None,
     ) -> Optional[List[TestCase]]:
         """
         compare test cases defined in CLI config workflow with test cases
@@ -292,9 +382,12 @@ class TestSuiteWorkflow(WorkflowStatusMixin):
         Args:
             cli_test_cases_definitions: test cases defined in CLI workflow associated with its test suite
             test_cases: list of test cases entities fetch from the server using test suite names in the config file
+            table_entity: table of the test suite, the pipeline entity by default
         """
         if not cli_test_cases_definitions:
             return test_cases
+        table_entity = cast(Table, table_entity or self.table_entity)
+        table_fqn = table_entity.fullyQualifiedName.__root__
         test_cases = deepcopy(test_cases)
         test_case_names = {test_case.name.__root__ for test_case in test_cases}
 
@@ -311,7 +404,9 @@ class TestSuiteWorkflow(WorkflowStatusMixin):
                 for cli_test_case_definition in cli_test_cases_definitions
                 if cli_test_case_definition.name in test_case_names
             ]
-            test_cases = self._update_test_cases(test_cases_to_update, test_cases)
+            test_cases = self._update_test_cases(
+                test_cases_to_update, test_cases, table_entity
+            )
 
         if not test_cases_to_create:
             return test_cases
@@ -329,7 +424,7 @@ class TestSuiteWorkflow(WorkflowStatusMixin):
                         ),
                         entityLink=EntityLink(
                             __root__=entity_link.get_entity_link(
-                                self.source_config.entityFullyQualifiedName.__root__,
+                                table_fqn,
                                 test_case_to_create.columnName,
                             )
                         ),
@@ -348,7 +443,7 @@ class TestSuiteWorkflow(WorkflowStatusMixin):
                 logger.error(error)
                 logger.debug(traceback.format_exc())
                 self.status.failed(
-                    self.source_config.entityFullyQualifiedName.__root__,
+                    table_fqn,
                     error,
                     traceback.format_exc(),
                 )
@@ -356,29 +451,80 @@ class TestSuiteWorkflow(WorkflowStatusMixin):
         return test_cases
 
     def run_test_suite(self):
-        """Main logic to run the tests"""
-        if not self.table_entity:
+        """
+        Main logic to run the tests. The test suites of the tables run
+        concurrently and their results are sent to the sink as each
+        table finishes.
+        """
+        table_entities = self.get_table_entities()
+        if not table_entities:
             logger.debug(traceback.format_exc())
             raise ValueError(
                 f"Could not retrieve table entity for {self.source_config.entityFullyQualifiedName.__root__}. "
                 "Make sure the table exists in OpenMetadata and/or the JWT Token provided is valid."
+                if self.source_config.entityFullyQualifiedName
+                else "No table to test. Make sure the tables exist in OpenMetadata "
+                "and/or the JWT Token provided is valid."
             )
 
-        test_suite = self.create_or_return_test_suite_entity()
+        thread_count = int(self.source_config.threadCount or 1)
+        with SQATestSuiteInterface.shared_engines():
+            if thread_count <= 1 or len(table_entities) == 1:
+                for table_entity in table_entities:
+                    self._handle_table_results(
+                        table_entity,
+                        lambda entity=table_entity: self.run_table_test_suite(entity),
+                    )
+                return
+
+            with ThreadPoolExecutor(max_workers=thread_count) as executor:
+                futures = {
+                    executor.submit(
+                        self.run_table_test_suite, table_entity
+                    ): table_entity
+                    for table_entity in table_entities
+                }
+                for future in as_completed(futures):
+                    self._handle_table_results(futures[future], future.result)
+
+    def _handle_table_results(self, table_entity: Table, get_results) -> None:
+        """Send the test case results of the table to the sink"""
+        try:
+            test_results = get_results()
+        except Exception as exc:
+            table_fqn = table_entity.fullyQualifiedName.__root__
+            error = f"Could not run the test suite of table {table_fqn}: {exc}"
+            logger.debug(traceback.format_exc())
+            logger.error(error)
+            self.status.failed(table_fqn, error, traceback.format_exc())
+            return
+
+        for test_result in test_results:
+            if hasattr(self, "sink"):
+                self.sink.write_record(test_result)
+            logger.debug(
+                f"Successfully ran test case {test_result.testCase.name.__root__}"
+            )
+            self.status.processed(test_result.testCase.fullyQualifiedName.__root__)
+
+    def run_table_test_suite(self, table_entity: Table) -> List[TestCaseResultResponse]:
+        """Run the test cases of the table test suite"""
+        table_fqn = table_entity.fullyQualifiedName.__root__
+        test_suite = self.create_or_return_test_suite_entity(table_entity)
         if not test_suite:
             logger.debug(
-                f"No test suite found for table {self.source_config.entityFullyQualifiedName.__root__} "
+                f"No test suite found for table {table_fqn} "
                 "or test suite is not executable."
             )
-            return
+            return []
 
-        test_cases = self.get_test_cases_from_test_suite(test_suite)
+        test_cases = self.get_test_cases_from_test_suite(test_suite, table_entity)
         if not test_cases:
             logger.debug(
-                f"No test cases found for table {self.source_config.entityFullyQualifiedName.__root__}"
+                f"No test cases found for table {table_fqn}"
                 f"and test suite {test_suite.fullyQualifiedName.__root__}"
             )
-            return
+            return []
 
         openmetadata_test_cases = self.filter_for_om_test_cases(test_cases)
 
@@ -386,25 +532,26 @@ class TestSuiteWorkflow(WorkflowStatusMixin):
             self.config.source.type.lower(),
             self.config,
             self.metadata,
-            self.table_entity,
+            table_entity,
         ).get_data_quality_runner()
-
-        for test_case in openmetadata_test_cases:
-            try:
-                test_result = test_suite_runner.run_and_handle(test_case)
-                if not test_result:
-                    continue
-                if hasattr(self, "sink"):
-                    self.sink.write_record(test_result)
-                logger.debug(f"Successfully ran test case {test_case.name.__root__}")
-                self.status.processed(test_case.fullyQualifiedName.__root__)
-            except Exception as exc:
-                error = f"Could not run test case {test_case.name.__root__}: {exc}"
-                logger.debug(traceback.format_exc())
-                logger.error(error)
-                self.status.failed(
-                    test_case.name.__root__, error, traceback.format_exc()
-                )
+        test_results = []
+        try:
+            test_suite_runner.prepare(openmetadata_test_cases)
+            for test_case in openmetadata_test_cases:
+                try:
+                    test_result = test_suite_runner.run_and_handle(test_case)
+                    if test_result:
+                        test_results.append(test_result)
+                except Exception as exc:
+                    error = f"Could not run test case {test_case.name.__root__}: {exc}"
+                    logger.debug(traceback.format_exc())
+                    logger.error(error)
+                    self.status.failed(
+                        test_case.name.__root__, error, traceback.format_exc()
+                    )
+        finally:
+            test_suite_runner.close()
+        return test_results
 
     def _retrieve_service_connection(self) -> None:
         """
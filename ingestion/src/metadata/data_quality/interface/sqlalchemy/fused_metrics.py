@@ -0,0 +1,148 @@
+#  Copyright 2021 Collate
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#  http://www.apache.org/licenses/LICENSE-2.0
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+"""
+Compute the metrics of all the test cases of a table with as few
+queries as possible.
+
+Validators are first dry run against a MetricRecorder to find out the
+aggregate metrics they query. They are then computed together, in
+chunks, by the FusedQueryRunner, which answers the validators from
+these results when running the test cases for real.
+"""
+import traceback
+from typing import Any, Dict, List, Optional, Tuple
+
+from sqlalchemy.orm import DeclarativeMeta
+from sqlalchemy.sql.elements import Label
+
+from metadata.profiler.metrics.registry import Metrics
+from metadata.profiler.processor.runner import QueryRunner
+from metadata.utils.logger import test_suite_logger
+
+logger = test_suite_logger()
+
+FUSED_CHUNK_SIZE = 50
+FUSED_LABEL = "fused"
+
+# Window functions cannot be mixed with aggregates in the same SELECT
+WINDOW_METRICS = {
+    metric.value.name() for metric in Metrics if metric.value.is_window_metric()
+}
+
+
+class UnrecordableQuery(Exception):
+    """
+    Raise when a validator runs a query other than a single
+    metric, which cannot be computed with the others
+    """
+
+
+class MetricRecorder:
+    """
+    Runner used to dry run the validators. It records the metrics
+    they query and answers with a placeholder value, so that
+    validators using more than one metric get to query all of them.
+    """
+
+    def __init__(self, table: DeclarativeMeta):
+        self.table = table
+        self.expressions: List[Label] = []
+
+    def __getattr__(self, name: str):
+        """Validators using the session, sample or other queries of the runner"""
+        if name.startswith("__"):
+            raise AttributeError(name)
+        raise UnrecordableQuery(f"Runner {name} is not recorded")
+
+    def dispatch_query_select_first(self, *entities, **kwargs) -> Dict[str, Any]:
+        if len(entities) == 1 and not kwargs and isinstance(entities[0], Label):
+            self.expressions.append(entities[0])
+            return {entities[0].name: 0}
+        raise UnrecordableQuery("Only single metrics are recorded")
+
+
+class FusedQueryRunner(QueryRunner):
+    """
+    QueryRunner answering the metrics computed
+    in advance by `prefetch`
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.fused_results: Dict[Tuple[str, str], Any] = {}
+
+    def _metric_key(self, expression: Label) -> Optional[Tuple[str, str]]:
+        """
+        The compiled query and its parameters identify the metric,
+        e.g., the values of an IN clause
+        """
+        try:
+            compiled = expression.compile(dialect=self._session.get_bind().dialect)
+            return str(compiled), repr(sorted(compiled.params.items()))
+        except Exception:  # pylint: disable=broad-except
+            # e.g., REGEXP not supported by the dialect
+            return None
+
+    def prefetch(self, expressions: List[Label]) -> None:
+        """
+        Compute the metrics together, in chunks to keep the queries short
+        """
+        fusable: Dict[Tuple[str, str], Label] = {}
+        for expression in expressions:
+            if expression.name in WINDOW_METRICS:
+                continue
+            key = self._metric_key(expression)
+            if key is not None:
+                fusable.setdefault(key, expression)
+        if len(fusable) < 2:
+            return
+
+        items = list(fusable.items())
+        for start in range(0, len(items), FUSED_CHUNK_SIZE):
+            self._fetch(items[start : start + FUSED_CHUNK_SIZE])
+
+    def _fetch(self, chunk: List[Tuple[Tuple[str, str], Label]]) -> None:
+        """
+        Run the chunk metrics in a single query. If it fails, we split the chunk
+        in halves to isolate the failing metrics, which the validators will
+        query on their own.
+        """
+        try:
+            row = super().dispatch_query_select_first(
+                *(
+                    expression.element.label(f"{FUSED_LABEL}_{idx}")
+                    for idx, (_, expression) in enumerate(chunk)
+                )
+            )
+            results = dict(row)
+            for idx, (key, _) in enumerate(chunk):
+                self.fused_results[key] = results[f"{FUSED_LABEL}_{idx}"]
+        except Exception as exc:  # pylint: disable=broad-except
+            self._session.rollback()
+            logger.debug(traceback.format_exc())
+            logger.debug(f"Could not compute {len(chunk)} metrics together: {exc}")
+            if len(chunk) > 1:
+                half = len(chunk) // 2
+                self._fetch(chunk[:half])
+                self._fetch(chunk[half:])
+
+    def dispatch_query_select_first(self, *entities, **kwargs):
+        if (
+            self.fused_results
+            and len(entities) == 1
+            and not kwargs
+            and isinstance(entities[0], Label)
+        ):
+            key = self._metric_key(entities[0])
+            if key in self.fused_results:
+                return {entities[0].name: self.fused_results[key]}
+        return super().dispatch_query_select_first(*entities, **kwargs)
@@ -14,13 +14,20 @@ Interfaces with database for all database engine
 supporting sqlalchemy abstraction layer
 """
 
+import traceback
 from datetime import datetime, timezone
-from typing import Optional, Union
+from typing import Dict, List, Optional, Type, Union
 
 from sqlalchemy.orm import DeclarativeMeta
 from sqlalchemy.orm.util import AliasedClass
 
+from metadata.data_quality.interface.sqlalchemy.fused_metrics import (
+    FusedQueryRunner,
+    MetricRecorder,
+    UnrecordableQuery,
+)
 from metadata.data_quality.interface.test_suite_interface import TestSuiteInterface
+from metadata.data_quality.validations.base_test_handler import BaseTestValidator
 from metadata.data_quality.validations.validator import Validator
 from metadata.generated.schema.entity.data.table import Table
 from metadata.generated.schema.entity.services.databaseService import DatabaseConnection
@@ -29,9 +36,7 @@ from metadata.generated.schema.tests.testCase import TestCase
 from metadata.generated.schema.tests.testDefinition import TestDefinition
 from metadata.ingestion.connections.session import create_and_bind_session
 from metadata.ingestion.ometa.ometa_api import OpenMetadata
-from metadata.ingestion.source.connections import get_connection
 from metadata.mixins.sqalchemy.sqa_mixin import SQAInterfaceMixin
-from metadata.profiler.processor.runner import QueryRunner
 from metadata.profiler.processor.sampler import Sampler
 from metadata.utils.constants import TEN_MIN
 from metadata.utils.importer import import_test_case_class
@@ -57,9 +62,10 @@ class SQATestSuiteInterface(SQAInterfaceMixin, TestSuiteInterface):
         self.ometa_client = ometa_client
         self.table_entity = table_entity
         self.service_connection_config = service_connection_config
-        self.session = create_and_bind_session(
-            get_connection(self.service_connection_config)
-        )
+        engine = self._get_engine()
+        # Engines shared by the tables are disposed by `shared_engines`
+        self._engine = None if self._engines is not None else engine
+        self.session = create_and_bind_session(engine)
         self.set_session_tag(self.session)
         self.set_catalog(self.session)
 
@@ -73,6 +79,7 @@ class SQATestSuiteInterface(SQAInterfaceMixin, TestSuiteInterface):
 
         self._sampler = self._create_sampler()
         self._runner = self._create_runner()
+        self._test_handlers: Dict[str, Type[BaseTestValidator]] = {}
 
     @property
     def sample(self) -> Union[DeclarativeMeta, AliasedClass]:
@@ -89,7 +96,7 @@ class SQATestSuiteInterface(SQAInterfaceMixin, TestSuiteInterface):
         return self.sampler.random_sample()
 
     @property
-    def runner(self) -> QueryRunner:
+    def runner(self) -> FusedQueryRunner:
         """getter method for the QueryRunner object
 
         Returns:
@@ -129,8 +136,8 @@ class SQATestSuiteInterface(SQAInterfaceMixin, TestSuiteInterface):
     def _create_runner(self) -> None:
         """Create a QueryRunner Instance"""
 
-        return cls_timeout(TEN_MIN)(
-            QueryRunner(
+        return cls_timeout(TEN_MIN, on_timeout=self._invalidate_session)(
+            FusedQueryRunner(
                 session=self.session,
                 table=self.table,
                 sample=self.sample,
@@ -139,6 +146,64 @@ class SQATestSuiteInterface(SQAInterfaceMixin, TestSuiteInterface):
             )
         )
 
+    def _invalidate_session(self) -> None:
+        """
+        A query that timed out may still be running with the connection of the
+        session. Invalidate it, so that the next queries get a new connection.
+        """
+        try:
+            self.session.invalidate()
+        except Exception as exc:
+            logger.debug(traceback.format_exc())
+            logger.warning(f"Error invalidating the session after a timeout: {exc}")
+
+    def close(self) -> None:
+        """Close the session, and dispose the engine unless it is shared"""
+        self.session.close()
+        if self._engine is not None:
+            self._engine.dispose()
+
+    def _get_test_handler(self, test_case: TestCase) -> Type[BaseTestValidator]:
+        """Import the validator of the test definition, once per definition"""
+        test_definition_id = str(test_case.testDefinition.id.__root__)
+        if test_definition_id not in self._test_handlers:
+            self._test_handlers[test_definition_id] = import_test_case_class(
+                self.ometa_client.get_by_id(
+                    TestDefinition, test_case.testDefinition.id
+                ).entityType.value,
+                "sqlalchemy",
+                test_case.testDefinition.fullyQualifiedName,
+            )
+        return self._test_handlers[test_definition_id]
+
+    def prepare_test_cases(self, test_cases: List[TestCase]) -> None:
+        """
+        Dry run the validators to find the metrics they query,
+        and compute them together instead of scanning the table
+        once per test case
+
+        Args:
+            test_cases: test cases of the table to execute
+        """
+        recorder = MetricRecorder(self.runner.table)
+        for test_case in test_cases:
+            try:
+                self._get_test_handler(test_case)(
+                    recorder,
+                    test_case=test_case,
+                    execution_date=datetime.now(tz=timezone.utc).timestamp(),
+                ).run_validation()
+            except UnrecordableQuery as exc:
+                logger.debug(
+                    f"Test case {test_case.name.__root__} runs its own queries: {exc}"
+                )
+            except Exception as exc:
+                logger.debug(traceback.format_exc())
+                logger.warning(
+                    f"Could not plan the metrics of {test_case.name.__root__}: {exc}"
+                )
+        self.runner.prefetch(recorder.expressions)
+
     def run_test_case(
         self,
         test_case: TestCase,
@@ -153,12 +218,8 @@ class SQATestSuiteInterface(SQAInterfaceMixin, TestSuiteInterface):
         """
 
         try:
-            TestHandler = import_test_case_class(  # pylint: disable=invalid-name
-                self.ometa_client.get_by_id(
-                    TestDefinition, test_case.testDefinition.id
-                ).entityType.value,
-                "sqlalchemy",
-                test_case.testDefinition.fullyQualifiedName,
+            TestHandler = self._get_test_handler(  # pylint: disable=invalid-name
+                test_case
             )
 
             test_handler = TestHandler(
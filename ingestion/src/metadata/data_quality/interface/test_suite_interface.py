@@ -15,7 +15,7 @@ supporting sqlalchemy abstraction layer
 """
 
 from abc import ABC, abstractmethod
-from typing import Optional
+from typing import List, Optional
 
 from metadata.generated.schema.entity.data.table import Table
 from metadata.generated.schema.entity.services.databaseService import DatabaseConnection
@@ -41,6 +41,15 @@ class TestSuiteInterface(ABC):
         self.service_connection_config = service_connection_config
         self.table_entity = table_entity
 
+    def prepare_test_cases(self, test_cases: List[TestCase]) -> None:
+        """
+        Prepare anything the test cases can share before running
+        them one by one, e.g., compute their metrics together
+        """
+
+    def close(self) -> None:
+        """Release the resources of the table, e.g., its session"""
+
     @abstractmethod
     def run_test_case(self, test_case: TestCase) -> Optional[TestCaseResult]:
         """run column data quality tests"""
@@ -13,6 +13,7 @@
 Main class to run data tests
 """
 
+from typing import List
 
 from metadata.data_quality.interface.test_suite_interface import TestSuiteInterface
 from metadata.data_quality.runner.models import TestCaseResultResponse
@@ -28,6 +29,10 @@ class DataTestsRunner:
     def __init__(self, test_runner_interface: TestSuiteInterface):
         self.test_runner_interace = test_runner_interface
 
+    def prepare(self, test_cases: List[TestCase]):
+        """prepare the execution of the test cases of the table"""
+        self.test_runner_interace.prepare_test_cases(test_cases)
+
     def run_and_handle(self, test_case: TestCase):
         """run and handle test case validation"""
         logger.info(
@@ -43,3 +48,7 @@ class DataTestsRunner:
                 testCaseResult=test_result, testCase=test_case
             )
         return None
+
+    def close(self):
+        """close the test runner interface"""
+        self.test_runner_interace.close()
@@ -27,10 +27,15 @@ from metadata.ingestion.api.status import Status
 
 class SinkStatus(Status):
     records: List[str] = Field(default_factory=list)
+    skipped_records: List[str] = Field(default_factory=list)
 
     def records_written(self, record: str) -> None:
         self.records.append(record)
 
+    def skipped(self, record: str) -> None:
+        """Records we did not need to write, e.g., unchanged entities"""
+        self.skipped_records.append(record)
+
     def warning(self, info: Any) -> None:
         self.warnings.append(info)
 
@@ -56,6 +61,12 @@ class Sink(Closeable, Generic[Entity], metaclass=ABCMeta):
         # must call callback when done.
         pass
 
+    def flush(self) -> None:
+        """
+        Write any record the sink might be buffering.
+        Sinks writing each record as it comes have nothing to do.
+        """
+
     def get_status(self) -> SinkStatus:
         return self.status
 
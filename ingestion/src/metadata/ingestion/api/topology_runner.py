@@ -13,12 +13,35 @@ Mixin to be used by service sources to dynamically
 generate the next_record based on their topology.
 """
 import traceback
-from typing import Any, Generic, Iterable, List, TypeVar
+from collections import defaultdict
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Generic,
+    Iterable,
+    List,
+    Optional,
+    Tuple,
+    Type,
+    TypeVar,
+)
 
 from pydantic import BaseModel
 
+from metadata.generated.schema.entity.data.chart import Chart
+from metadata.generated.schema.entity.data.dashboard import Dashboard
+from metadata.generated.schema.entity.data.dashboardDataModel import DashboardDataModel
+from metadata.generated.schema.entity.data.database import Database
+from metadata.generated.schema.entity.data.databaseSchema import DatabaseSchema
+from metadata.generated.schema.entity.data.mlmodel import MlModel
+from metadata.generated.schema.entity.data.pipeline import Pipeline
+from metadata.generated.schema.entity.data.table import Table
+from metadata.generated.schema.entity.data.topic import Topic
 from metadata.ingestion.api.common import Entity
 from metadata.ingestion.models.topology import (
+    EntityAck,
+    MissingExpectedEntityAckException,
     NodeStage,
     ServiceTopology,
     TopologyContext,
@@ -35,13 +58,34 @@ logger = ingestion_logger()
 
 C = TypeVar("C", bound=BaseModel)
 
+# Query param used to list all the entities of a type under their parent FQN.
+# Only these entities can be prefetched and acknowledged in batch.
+ENTITY_PARENT_LIST_PARAM = {
+    Database: "service",
+    DatabaseSchema: "database",
+    Table: "database",
+    Chart: "service",
+    Dashboard: "service",
+    DashboardDataModel: "service",
+    Pipeline: "service",
+    Topic: "service",
+    MlModel: "service",
+}
+
+ACK_TRIES = 3
 
-class MissingExpectedEntityAckException(Exception):
+
+class NodeAcks:
     """
-    After running the ack to the sink, we got no
-    Entity back
+    Tracks the acknowledgements of a node run when pipelining
+    the acks: the existing entities we prefetched per parent and
+    the requests sent to the sink still waiting for their Entity.
     """
 
+    def __init__(self):
+        self.prefetched: Dict[Tuple[Type[Entity], str], Dict[str, Entity]] = {}
+        self.pending: List[EntityAck] = []
+
 
 class TopologyRunnerMixin(Generic[C]):
     """
@@ -53,6 +97,10 @@ class TopologyRunnerMixin(Generic[C]):
     context: TopologyContext
     metadata: OpenMetadata
 
+    # Called before reading back from OM the entities we sent to the sink,
+    # in case the sink is buffering them
+    sink_flush: Optional[Callable[[], None]] = None
+
     def process_nodes(self, nodes: List[TopologyNode]) -> Iterable[Entity]:
         """
         Given a list of nodes, either roots or children,
@@ -72,6 +120,8 @@ class TopologyRunnerMixin(Generic[C]):
                 else []
             )
 
+            node_acks = NodeAcks()
+
             for element in node_producer() or []:
                 for stage in node.stages:
                     logger.debug(f"Processing stage: {stage}")
@@ -81,7 +131,9 @@ class TopologyRunnerMixin(Generic[C]):
                         try:
                             # yield and make sure the data is updated
                             yield from self.sink_request(
-                                stage=stage, entity_request=entity_request
+                                stage=stage,
+                                entity_request=entity_request,
+                                node_acks=node_acks,
                             )
                         except ValueError as err:
                             logger.debug(traceback.format_exc())
@@ -97,6 +149,9 @@ class TopologyRunnerMixin(Generic[C]):
                 # process all children from the node being run
                 yield from self.process_nodes(child_nodes)
 
+            # Fetch back in batch whatever the children did not need to resolve
+            yield from self.reconcile_acks(node_acks)
+
             if node.post_process:
                 logger.debug(f"Post processing node {node}")
                 for process in node.post_process:
@@ -154,6 +209,22 @@ class TopologyRunnerMixin(Generic[C]):
         """
         self.context.__dict__[stage.context] = get_ctx_default(stage)
 
+    def parent_fqn_from_context(self, stage: NodeStage) -> Optional[str]:
+        """
+        Read the context
+        :param stage: Topology node being processed
+        :return: FQN of the parent derived from context, if any
+        """
+        context_names = [
+            self.context.__dict__[dependency].name.__root__
+            for dependency in stage.consumer or []  # root nodes do not have consumers
+        ]
+        return (
+            fqn._build(*context_names)  # pylint: disable=protected-access
+            if context_names
+            else None
+        )
+
     def fqn_from_context(self, stage: NodeStage, entity_request: C) -> str:
         """
         Read the context
@@ -169,15 +240,148 @@ class TopologyRunnerMixin(Generic[C]):
             *context_names, entity_request.name.__root__
         )
 
-    def sink_request(self, stage: NodeStage, entity_request: C) -> Iterable[Entity]:
+    def _flush_sink(self) -> None:
+        if self.sink_flush:
+            self.sink_flush()
+
+    def on_entity_ack(  # pylint: disable=unused-argument
+        self, stage: NodeStage, entity: Entity
+    ) -> None:
+        """
+        Called with each Entity we sent to the sink once we
+        read it back from OM. Sources can override it.
+        """
+
+    def _get_entity(self, stage: NodeStage, entity_fqn: str) -> Optional[Entity]:
+        return self.metadata.get_by_name(
+            entity=stage.type_,
+            fqn=entity_fqn,
+            fields=["*"],  # Get all the available data from the Entity
+        )
+
+    def _list_entities_by_fqn(
+        self, entity_type: Type[Entity], parent_fqn: str
+    ) -> Dict[str, Entity]:
+        """
+        List all the entities of a type under the parent with paginated calls
+        """
+        return {
+            entity.fullyQualifiedName.__root__: entity
+            for entity in self.metadata.list_all_entities(
+                entity=entity_type,
+                fields=["*"],
+                params={ENTITY_PARENT_LIST_PARAM[entity_type]: parent_fqn},
+            )
+        }
+
+    def _get_existing_entity(
+        self,
+        stage: NodeStage,
+        entity_fqn: str,
+        parent_fqn: Optional[str],
+        node_acks: Optional[NodeAcks],
+    ) -> Optional[Entity]:
+        """
+        Get the Entity from OM before sending its request to the sink.
+        When pipelining the acks, all the entities under the parent are
+        listed once for the node instead of one GET per request.
+        """
+        if node_acks is None:
+            return self._get_entity(stage=stage, entity_fqn=entity_fqn)
+
+        key = (stage.type_, parent_fqn)
+        if key not in node_acks.prefetched:
+            node_acks.prefetched[key] = self._list_entities_by_fqn(
+                entity_type=stage.type_, parent_fqn=parent_fqn
+            )
+        return node_acks.prefetched[key].get(entity_fqn)
+
+    def _resolve_ack(self, ack: EntityAck) -> Optional[Entity]:
+        """
+        A source needs the Entity from the context before the
+        batch reconciliation. Fetch this one right away.
+        """
+        self._flush_sink()
+        entity = self._get_entity(stage=ack.stage, entity_fqn=ack.fqn)
+        if entity is None:
+            logger.warning(
+                f"Missing ack back from [{ack.stage.type_.__name__}: {ack.fqn}]"
+            )
+        else:
+            self.on_entity_ack(stage=ack.stage, entity=entity)
+        return entity
+
+    def _is_pipelined_ack(self, stage: NodeStage, parent_fqn: Optional[str]) -> bool:
+        """
+        We can only pipeline the acks of entities that we know how to list
+        under their parent. Stages that must return keep blocking, since
+        we want them to fail as soon as possible.
+        """
+        return (
+            self._is_pipelined_ack_enabled()
+            and not stage.must_return
+            and parent_fqn is not None
+            and stage.type_ in ENTITY_PARENT_LIST_PARAM
+        )
+
+    def reconcile_acks(self, node_acks: NodeAcks) -> Iterable[Entity]:
+        """
+        Fetch the pending acks with one paginated list call per parent
+        and yield again the requests we still cannot find, as we
+        do when blocking on each ack.
+
+        :param node_acks: acks tracked while running a node
+        :return: requests to send again to the sink
+        """
+        tries = ACK_TRIES
+        pending = [ack for ack in node_acks.pending if not ack.resolved]
+        while pending and tries > 0:
+            self._flush_sink()
+            by_parent = defaultdict(list)
+            for ack in pending:
+                by_parent[(ack.stage.type_, ack.parent_fqn)].append(ack)
+
+            for (entity_type, parent_fqn), acks in by_parent.items():
+                entities = self._list_entities_by_fqn(
+                    entity_type=entity_type, parent_fqn=parent_fqn
+                )
+                for ack in acks:
+                    if ack.fqn in entities:
+                        ack.set_entity(entities[ack.fqn])
+                        self.on_entity_ack(stage=ack.stage, entity=entities[ack.fqn])
+
+            pending = [ack for ack in pending if not ack.resolved]
+            tries -= 1
+            if tries > 0:
+                for ack in pending:
+                    yield ack.entity_request
+
+        for ack in pending:
+            logger.warning(
+                f"Missing ack back from [{ack.stage.type_.__name__}: {ack.fqn}]"
+            )
+        node_acks.pending.clear()
+        node_acks.prefetched.clear()
+
+    def sink_request(
+        self,
+        stage: NodeStage,
+        entity_request: C,
+        node_acks: Optional[NodeAcks] = None,
+    ) -> Iterable[Entity]:
         """
         Validate that the entity was properly updated or retry if
         ack_sink is flagged.
 
         If we get the Entity back, update the context with it.
 
+        When pipelining the acks, the context gets an EntityAck
+        instead, which is resolved when a source reads it or
+        when the node reconciles its acks.
+
         :param stage: Node stage being processed
         :param entity_request: Request to pass
+        :param node_acks: acks tracked for the node being run
         :return: Entity generator
         """
 
@@ -194,26 +398,41 @@ class TopologyRunnerMixin(Generic[C]):
                 entity_fqn = self.fqn_from_context(
                     stage=stage, entity_request=entity_request
                 )
+                parent_fqn = self.parent_fqn_from_context(stage=stage)
+                pipelined = node_acks is not None and self._is_pipelined_ack(
+                    stage=stage, parent_fqn=parent_fqn
+                )
 
                 # we get entity from OM if we do not want to overwrite existing data in OM
                 if not stage.overwrite and not self._is_force_overwrite_enabled():
-                    entity = self.metadata.get_by_name(
-                        entity=stage.type_,
-                        fqn=entity_fqn,
-                        fields=["*"],  # Get all the available data from the Entity
+                    entity = self._get_existing_entity(
+                        stage=stage,
+                        entity_fqn=entity_fqn,
+                        parent_fqn=parent_fqn,
+                        node_acks=node_acks if pipelined else None,
                     )
                 # if entity does not exist in OM, or we want to overwrite, we will yield the entity_request
-                if entity is None:
-                    tries = 3
+                if entity is None and pipelined:
+                    yield entity_request
+                    entity = EntityAck(
+                        stage=stage,
+                        entity_request=entity_request,
+                        entity_fqn=entity_fqn,
+                        parent_fqn=parent_fqn,
+                        resolver=self._resolve_ack,
+                    )
+                    node_acks.pending.append(entity)
+                elif entity is None:
+                    tries = ACK_TRIES
                     while not entity and tries > 0:
                         yield entity_request
+                        # The sink needs to write the request we are waiting for
+                        self._flush_sink()
                         # Improve validation logic
-                        entity = self.metadata.get_by_name(
-                            entity=stage.type_,
-                            fqn=entity_fqn,
-                            fields=["*"],  # Get all the available data from the Entity
-                        )
+                        entity = self._get_entity(stage=stage, entity_fqn=entity_fqn)
                         tries -= 1
+                    if entity is not None:
+                        self.on_entity_ack(stage=stage, entity=entity)
 
                 # We have ack the sink waiting for a response, but got nothing back
                 if stage.must_return and entity is None:
@@ -235,3 +454,6 @@ class TopologyRunnerMixin(Generic[C]):
 
     def _is_force_overwrite_enabled(self) -> bool:
         return self.metadata.config and self.metadata.config.forceEntityOverwriting
+
+    def _is_pipelined_ack_enabled(self) -> bool:
+        return self.metadata.config and self.metadata.config.pipelinedEntityAck
@@ -34,6 +34,7 @@ from metadata.ingestion.api.processor import Processor
 from metadata.ingestion.api.sink import Sink
 from metadata.ingestion.api.source import Source
 from metadata.ingestion.api.stage import Stage
+from metadata.ingestion.api.topology_runner import TopologyRunnerMixin
 from metadata.ingestion.models.custom_types import ServiceWithConnectionType
 from metadata.ingestion.ometa.ometa_api import OpenMetadata
 from metadata.timer.repeated_timer import RepeatedTimer
@@ -157,6 +158,9 @@ class Workflow(WorkflowStatusMixin):
             sink_config = self.config.sink.dict().get("config", {})
             self.sink: Sink = sink_class.create(sink_config, metadata_config)
             logger.debug(f"Sink type:{self.config.sink.type},{sink_class} configured")
+            if isinstance(self.source, TopologyRunnerMixin):
+                # The source reads back the entities it sends to the sink
+                self.source.sink_flush = self.sink.flush
 
         if self.config.bulkSink:
             bulk_sink_type = self.config.bulkSink.type
@@ -202,6 +206,9 @@ class Workflow(WorkflowStatusMixin):
                     self.stage.stage_record(processed_record)
                 if hasattr(self, "sink"):
                     self.sink.write_record(processed_record)
+            if hasattr(self, "sink"):
+                # Buffered records need to be in the status we report
+                self.sink.flush()
             if hasattr(self, "bulk_sink"):
                 self.stage.close()
                 self.bulk_sink.write_records()
@@ -0,0 +1,286 @@
+#  Copyright 2021 Collate
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#  http://www.apache.org/licenses/LICENSE-2.0
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+"""
+Cache the lineage parsing results by query shape.
+
+The same queries are run over and over (dashboards, dbt runs, scheduled jobs)
+only changing their literal values. We fingerprint the queries ignoring
+whitespaces, comments and literals, and keep the output of the best
+LineageRunner for each fingerprint and dialect. Results can be persisted
+in a SQLite file to be shared between workflow runs.
+"""
+import hashlib
+import json
+import os
+import sqlite3
+import traceback
+from copy import copy
+from typing import Dict, List, Optional, Tuple
+
+from sqllineage.core.models import Column, Schema, Table
+from sqllineage.runner import LineageRunner, split, trim_comment
+from sqlparse import tokens as T
+from sqlparse.lexer import tokenize
+
+from metadata.ingestion.lineage.models import Dialect
+from metadata.utils.logger import ingestion_logger
+from metadata.utils.lru_cache import LRUCache
+
+logger = ingestion_logger()
+
+PARSE_CACHE_SIZE = 10_000
+LITERAL_PLACEHOLDER = "?"
+
+
+def fingerprint_query(query: str, dialect: Dialect) -> str:
+    """
+    Hash the query shape: comments are removed, whitespaces collapsed
+    and string and number literals replaced by a placeholder.
+    Quoted identifiers are kept as they are part of the table names.
+    """
+    normalized = []
+    for ttype, value in tokenize(query):
+        if ttype in T.Comment:
+            continue
+        if ttype in T.Whitespace or ttype in T.Newline:
+            if normalized and normalized[-1] != " ":
+                normalized.append(" ")
+            continue
+        if ttype in T.Number or ttype in T.String.Single:
+            normalized.append(LITERAL_PLACEHOLDER)
+            continue
+        normalized.append(value)
+    shape = "".join(normalized).strip()
+    return hashlib.sha256(f"{dialect.value}:{shape}".encode("utf-8")).hexdigest()
+
+
+class CachedLineageRunner:
+    """
+    Snapshot of the LineageRunner results used by the LineageParser.
+
+    Statements are always computed from the current query, as
+    they keep the literals.
+    """
+
+    def __init__(
+        self,
+        dialect: str,
+        source_tables: List[Table],
+        target_tables: List[Table],
+        intermediate_tables: List[Table],
+        column_lineage: List[Tuple[Column, ...]],
+    ):
+        self._dialect = dialect
+        self.source_tables = source_tables
+        self.target_tables = target_tables
+        self.intermediate_tables = intermediate_tables
+        self._column_lineage = column_lineage
+        self._query: Optional[str] = None
+
+    @classmethod
+    def from_runner(cls, runner: LineageRunner) -> "CachedLineageRunner":
+        return cls(
+            dialect=runner._dialect,  # pylint: disable=protected-access
+            source_tables=runner.source_tables,
+            target_tables=runner.target_tables,
+            intermediate_tables=runner.intermediate_tables,
+            column_lineage=runner.get_column_lineage(),
+        )
+
+    def for_query(self, query: str) -> "CachedLineageRunner":
+        """Bind a copy of the snapshot to the query being parsed"""
+        runner = copy(self)
+        runner._query = query  # pylint: disable=protected-access
+        return runner
+
+    def get_column_lineage(self) -> List[Tuple[Column, ...]]:
+        return self._column_lineage
+
+    def statements(self) -> List[str]:
+        return [trim_comment(stmt) for stmt in split((self._query or "").strip())]
+
+    def to_json(self) -> str:
+        """
+        Serialize the snapshot. Only the first and last columns of each
+        lineage path are used by the LineageParser, and they must belong
+        to tables: subqueries and paths cannot be rebuilt from their name.
+        """
+        return json.dumps(
+            {
+                "dialect": self._dialect,
+                "source_tables": [
+                    _table_to_dict(table) for table in self.source_tables
+                ],
+                "target_tables": [
+                    _table_to_dict(table) for table in self.target_tables
+                ],
+                "intermediate_tables": [
+                    _table_to_dict(table) for table in self.intermediate_tables
+                ],
+                "column_lineage": [
+                    [_column_to_dict(path[0]), _column_to_dict(path[-1])]
+                    for path in self._column_lineage
+                ],
+            }
+        )
+
+    @classmethod
+    def from_json(cls, value: str) -> "CachedLineageRunner":
+        result = json.loads(value)
+        return cls(
+            dialect=result["dialect"],
+            source_tables=[_dict_to_table(table) for table in result["source_tables"]],
+            target_tables=[_dict_to_table(table) for table in result["target_tables"]],
+            intermediate_tables=[
+                _dict_to_table(table) for table in result["intermediate_tables"]
+            ],
+            column_lineage=[
+                tuple(_dict_to_column(column) for column in path)
+                for path in result["column_lineage"]
+            ],
+        )
+
+
+def _table_to_dict(table: Table) -> dict:
+    if not isinstance(table, Table):
+        raise ValueError(f"Cannot serialize the lineage of {type(table).__name__}")
+    return {
+        "schema": table.schema.raw_name,
+        "name": table.raw_name,
+        "alias": table.alias,
+    }
+
+
+def _dict_to_table(value: dict) -> Table:
+    """Set the raw names as they are, without parsing them again"""
+    schema = Schema.__new__(Schema)
+    schema.raw_name = value["schema"]
+    table = Table.__new__(Table)
+    table.schema = schema
+    table.raw_name = value["name"]
+    table.alias = value["alias"]
+    return table
+
+
+def _column_to_dict(column: Column) -> dict:
+    return {
+        "name": column.raw_name,
+        "parents": [
+            _table_to_dict(parent)
+            for parent in column._parent  # pylint: disable=protected-access
+        ],
+    }
+
+
+def _dict_to_column(value: dict) -> Column:
+    column = Column(value["name"])
+    for parent in value["parents"]:
+        column.parent = _dict_to_table(parent)
+    return column
+
+
+class LineageParseCache:
+    """
+    In memory LRU cache of CachedLineageRunner by query fingerprint,
+    optionally backed by a SQLite file
+    """
+
+    def __init__(
+        self, location: Optional[str] = None, capacity: int = PARSE_CACHE_SIZE
+    ):
+        self._memory = LRUCache(capacity)
+        self._location = location
+        # SQLite connections cannot be shared with forked processes
+        self._connections: Dict[int, sqlite3.Connection] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def configure(self, location: Optional[str]) -> None:
+        """
+        Set the SQLite file where results are persisted
+        """
+        if location == self._location:
+            return
+        self.close()
+        self._location = location
+
+    @property
+    def connection(self) -> Optional[sqlite3.Connection]:
+        """
+        SQLite connection for the current process, if persisting the results
+        """
+        if not self._location:
+            return None
+        pid = os.getpid()
+        if pid not in self._connections:
+            connection = sqlite3.connect(self._location, timeout=30)
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS lineage_parse_results "
+                "(fingerprint TEXT PRIMARY KEY, result TEXT)"
+            )
+            connection.commit()
+            self._connections[pid] = connection
+        return self._connections[pid]
+
+    def get(self, fingerprint: str) -> Optional[CachedLineageRunner]:
+        """
+        Get the cached results, looking into the SQLite file
+        on memory misses
+        """
+        if fingerprint in self._memory:
+            self.hits += 1
+            return self._memory.get(fingerprint)
+
+        result = None
+        try:
+            if self.connection:
+                row = self.connection.execute(
+                    "SELECT result FROM lineage_parse_results WHERE fingerprint = ?",
+                    (fingerprint,),
+                ).fetchone()
+                if row:
+                    result = CachedLineageRunner.from_json(row[0])
+                    self._memory.put(fingerprint, result)
+        except Exception as exc:
+            logger.debug(traceback.format_exc())
+            logger.warning(f"Error reading the lineage parse cache: {exc}")
+
+        if result is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return result
+
+    def put(self, fingerprint: str, result: CachedLineageRunner) -> None:
+        self._memory.put(fingerprint, result)
+        try:
+            if self.connection:
+                self.connection.execute(
+                    "INSERT OR REPLACE INTO lineage_parse_results VALUES (?, ?)",
+                    (fingerprint, result.to_json()),
+                )
+                self.connection.commit()
+        except ValueError as exc:
+            # Kept in memory only
+            logger.debug(f"Not persisting the lineage parse result: {exc}")
+        except Exception as exc:
+            logger.debug(traceback.format_exc())
+            logger.warning(f"Error writing the lineage parse cache: {exc}")
+
+    def close(self) -> None:
+        connection = self._connections.pop(os.getpid(), None)
+        if connection:
+            connection.close()
+        # Connections inherited from the parent process are just dropped
+        self._connections.clear()
+
+
+parse_cache = LineageParseCache()
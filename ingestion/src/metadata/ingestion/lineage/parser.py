@@ -11,11 +11,12 @@
 """
 Lineage Parser configuration
 """
+import time
 import traceback
 from collections import defaultdict
 from copy import deepcopy
 from logging.config import DictConfigurator
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, List, Optional, Tuple, Union
 
 import sqlparse
 from cached_property import cached_property
@@ -27,6 +28,16 @@ from sqlparse.sql import Comparison, Identifier, Parenthesis, Statement
 
 from metadata.generated.schema.type.tableUsageCount import TableColumn, TableColumnJoin
 from metadata.ingestion.lineage.models import Dialect
+from metadata.ingestion.lineage.parse_cache import (
+    CachedLineageRunner,
+    fingerprint_query,
+    parse_cache,
+)
+from metadata.ingestion.lineage.parser_selection import (
+    ParserChoice,
+    ParserShapeStats,
+    parser_selector,
+)
 from metadata.utils.helpers import (
     find_in_iter,
     get_formatted_entity_name,
@@ -56,7 +67,7 @@ class LineageParser:
     Class that acts like a wrapper for the LineageRunner library usage
     """
 
-    parser: LineageRunner
+    parser: Union[LineageRunner, CachedLineageRunner]
     query: str
     _clean_query: str
 
@@ -68,7 +79,7 @@ class LineageParser:
     ):
         self.query = query
         self._clean_query = self.clean_raw_query(query)
-        self.parser = self._evaluate_best_parser(
+        self.parser = self._get_parser(
             self._clean_query, dialect=dialect, timeout_seconds=timeout_seconds
         )
 
@@ -369,17 +380,52 @@ class LineageParser:
 
         return clean_query.strip()
 
+    @classmethod
+    def _get_parser(
+        cls, query: Optional[str], dialect: Dialect, timeout_seconds: int
+    ) -> Union[LineageRunner, CachedLineageRunner]:
+        """
+        Look for the parsing results of the same query shape
+        before evaluating the parsers
+        """
+        if not query:
+            return cls._evaluate_best_parser(
+                query, dialect=dialect, timeout_seconds=timeout_seconds
+            )
+
+        fingerprint = fingerprint_query(query, dialect)
+        cached_runner = parse_cache.get(fingerprint)
+        if cached_runner:
+            return cached_runner.for_query(query)
+
+        runner = cls._evaluate_best_parser(
+            query, dialect=dialect, timeout_seconds=timeout_seconds
+        )
+        try:
+            cached_runner = CachedLineageRunner.from_runner(runner)
+        except Exception as exc:
+            # Runners failing to compute the lineage are not cached
+            logger.debug(f"Not caching the lineage of the query [{query}]: {exc}")
+            return runner
+        parse_cache.put(fingerprint, cached_runner)
+        return cached_runner.for_query(query)
+
     @staticmethod
-    def _evaluate_best_parser(
-        query: str, dialect: Dialect, timeout_seconds: int
-    ) -> LineageRunner:
+    def _run_sqlfluff_parser(
+        query: str, dialect: Dialect, timeout_seconds: int, stats: ParserShapeStats
+    ) -> Tuple[Optional[LineageRunner], int]:
+        """
+        Run the sqlfluff parser with a timeout and count the lineage found.
+        Returns no runner if the parser failed.
+        """
+
         @timeout(seconds=timeout_seconds)
         def get_sqlfluff_lineage_runner(qry: str, dlct: str) -> LineageRunner:
             lr_dialect = LineageRunner(qry, dialect=dlct)
             lr_dialect.get_column_lineage()
             return lr_dialect
 
-        sqlfluff_count = 0
+        start = time.perf_counter()
         try:
             lr_sqlfluff = get_sqlfluff_lineage_runner(query, dialect.value)
             sqlfluff_count = len(lr_sqlfluff.get_column_lineage()) + len(
@@ -389,18 +435,31 @@ class LineageParser:
                     )
                 )
             )
+            return lr_sqlfluff, sqlfluff_count
         except TimeoutError:
             logger.debug(
                 f"Lineage with SqlFluff failed for the [{dialect.value}] query: [{query}]: "
                 f"Parser has been running for more than {timeout_seconds} seconds."
             )
-            lr_sqlfluff = None
         except Exception:
             logger.debug(
                 f"Lineage with SqlFluff failed for the [{dialect.value}] query: [{query}]"
             )
-            lr_sqlfluff = None
+        finally:
+            parser_selector.record_run(
+                stats, ParserChoice.SQLFLUFF, time.perf_counter() - start
+            )
+        return None, 0
 
+    @staticmethod
+    def _run_sqlparse_parser(
+        query: str, stats: ParserShapeStats
+    ) -> Tuple[LineageRunner, Optional[int]]:
+        """
+        Run the sqlparse parser and count the lineage found.
+        The count is None if the parser failed.
+        """
+        start = time.perf_counter()
         lr_sqlparser = LineageRunner(query)
         try:
             sqlparser_count = len(lr_sqlparser.get_column_lineage()) + len(
@@ -410,8 +469,85 @@ class LineageParser:
                     )
                 )
             )
+            return lr_sqlparser, sqlparser_count
         except Exception:
+            return lr_sqlparser, None
+        finally:
+            parser_selector.record_run(
+                stats, ParserChoice.SQLPARSE, time.perf_counter() - start
+            )
+
+    @classmethod
+    def _evaluate_best_parser(
+        cls, query: str, dialect: Dialect, timeout_seconds: int
+    ) -> LineageRunner:
+        """
+        Pick the runner finding more lineage between sqlfluff and sqlparse.
+        Once a parser wins consistently for the dialect and query shape,
+        we only run the other one if the winner fails.
+        """
+        stats = parser_selector.stats_for(dialect, query or "")
+        choice = parser_selector.choose(stats)
+
+        if choice == ParserChoice.SQLFLUFF:
+            return cls._run_sqlfluff_first(query, dialect, timeout_seconds, stats)
+        if choice == ParserChoice.SQLPARSE:
+            return cls._run_sqlparse_first(query, dialect, timeout_seconds, stats)
+        return cls._compare_parsers(query, dialect, timeout_seconds, stats)
+
+    @classmethod
+    def _run_sqlfluff_first(
+        cls, query: str, dialect: Dialect, timeout_seconds: int, stats: ParserShapeStats
+    ) -> LineageRunner:
+        """
+        sqlfluff won for this query shape, only run sqlparse if it fails
+        """
+        lr_sqlfluff, _ = cls._run_sqlfluff_parser(
+            query, dialect, timeout_seconds, stats
+        )
+        if lr_sqlfluff:
+            return lr_sqlfluff
+        lr_sqlparser, sqlparser_count = cls._run_sqlparse_parser(query, stats)
+        parser_selector.record_winner(
+            stats, ParserChoice.SQLPARSE if sqlparser_count is not None else None
+        )
+        return lr_sqlparser
+
+    @classmethod
+    def _run_sqlparse_first(
+        cls, query: str, dialect: Dialect, timeout_seconds: int, stats: ParserShapeStats
+    ) -> LineageRunner:
+        """
+        sqlparse won for this query shape, only run sqlfluff if it fails
+        """
+        lr_sqlparser, sqlparser_count = cls._run_sqlparse_parser(query, stats)
+        if sqlparser_count is not None:
+            return lr_sqlparser
+        lr_sqlfluff, _ = cls._run_sqlfluff_parser(
+            query, dialect, timeout_seconds, stats
+        )
+        parser_selector.record_winner(
+            stats, ParserChoice.SQLFLUFF if lr_sqlfluff else None
+        )
+        return lr_sqlfluff if lr_sqlfluff else lr_sqlparser
+
+    @classmethod
+    def _compare_parsers(
+        cls, query: str, dialect: Dialect, timeout_seconds: int, stats: ParserShapeStats
+    ) -> LineageRunner:
+        """
+        No parser won yet for this query shape, run both
+        and keep the one finding more lineage
+        """
+        lr_sqlfluff, sqlfluff_count = cls._run_sqlfluff_parser(
+            query, dialect, timeout_seconds, stats
+        )
+        lr_sqlparser, sqlparser_count = cls._run_sqlparse_parser(query, stats)
+        if sqlparser_count is None:
             # if both runner have failed we return the usual one
+            parser_selector.record_winner(
+                stats, ParserChoice.SQLFLUFF if lr_sqlfluff else None
+            )
             return lr_sqlfluff if lr_sqlfluff else lr_sqlparser
 
         if lr_sqlfluff:
@@ -421,8 +557,11 @@ class LineageParser:
                     "Lineage computed with SqlFluff did not perform as expected "
                     f"for the [{dialect.value}] query: [{query}]"
                 )
+                parser_selector.record_winner(stats, ParserChoice.SQLPARSE)
                 return lr_sqlparser
+            parser_selector.record_winner(stats, ParserChoice.SQLFLUFF)
             return lr_sqlfluff
+        parser_selector.record_winner(stats, ParserChoice.SQLPARSE)
         return lr_sqlparser
 
     @staticmethod
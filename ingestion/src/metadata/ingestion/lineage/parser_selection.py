@@ -0,0 +1,193 @@
+#  Copyright 2021 Collate
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#  http://www.apache.org/licenses/LICENSE-2.0
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+"""
+Pick which lineage parsers to run for a query.
+
+By default, the LineageParser runs both sqlfluff and sqlparse and keeps
+the one finding more lineage. We track the outcome of these evaluations
+per dialect and query shape, and once a parser consistently wins we only
+run that one. Some queries still run both parsers to keep the stats fresh.
+"""
+from enum import Enum
+from typing import Dict, Optional, Tuple
+
+from pydantic import BaseModel
+from sqlparse import tokens as T
+from sqlparse.lexer import tokenize
+
+from metadata.ingestion.lineage.models import Dialect
+
+# Evaluations needed before skipping a parser
+MIN_EVALUATIONS = 20
+# Ratio of the evaluations a parser needs to win to skip the other one
+WIN_RATIO = 0.95
+# Every how many queries we run both parsers again for a decided shape
+EVALUATE_EVERY = 50
+
+QUERY_SIZE_BUCKETS = (1_000, 10_000, 100_000)
+
+
+class ParserChoice(Enum):
+    """Parsers to run for a query"""
+
+    BOTH = "both"
+    SQLFLUFF = "sqlfluff"
+    SQLPARSE = "sqlparse"
+
+
+class ParserShapeStats(BaseModel):
+    """
+    Outcome of the parsers for a dialect and query shape
+    """
+
+    evaluations: int = 0
+    sqlfluffWins: int = 0
+    sqlparseWins: int = 0
+    sqlfluffRuns: int = 0
+    sqlfluffSeconds: float = 0.0
+    sqlparseRuns: int = 0
+    sqlparseSeconds: float = 0.0
+    sqlfluffSkipped: int = 0
+    sqlparseSkipped: int = 0
+    queriesSinceEvaluation: int = 0
+
+
+def query_shape(query: str) -> str:
+    """
+    Coarse shape of the query: the statement type and its size
+    """
+    statement_type = "UNKNOWN"
+    for ttype, value in tokenize(query):
+        if ttype in T.Keyword.DML or ttype in T.Keyword.DDL or ttype in T.Keyword.CTE:
+            statement_type = value.upper()
+            break
+    size = next(
+        (f"<{bucket}" for bucket in QUERY_SIZE_BUCKETS if len(query) < bucket),
+        f">={QUERY_SIZE_BUCKETS[-1]}",
+    )
+    return f"{statement_type}:{size}"
+
+
+class ParserSelector:
+    """
+    Keep the parsers outcome stats and decide which ones to run
+    """
+
+    def __init__(
+        self,
+        min_evaluations: int = MIN_EVALUATIONS,
+        win_ratio: float = WIN_RATIO,
+        evaluate_every: int = EVALUATE_EVERY,
+    ):
+        self.min_evaluations = min_evaluations
+        self.win_ratio = win_ratio
+        self.evaluate_every = evaluate_every
+        self._stats: Dict[Tuple[str, str], ParserShapeStats] = {}
+
+    def stats_for(self, dialect: Dialect, query: str) -> ParserShapeStats:
+        key = (dialect.value, query_shape(query))
+        return self._stats.setdefault(key, ParserShapeStats())
+
+    def choose(self, stats: ParserShapeStats) -> ParserChoice:
+        """
+        Run both parsers until one of them wins consistently
+        """
+        choice = ParserChoice.BOTH
+        if stats.evaluations >= self.min_evaluations:
+            if stats.sqlfluffWins >= self.win_ratio * stats.evaluations:
+                choice = ParserChoice.SQLFLUFF
+            elif stats.sqlparseWins >= self.win_ratio * stats.evaluations:
+                choice = ParserChoice.SQLPARSE
+
+        if choice != ParserChoice.BOTH:
+            stats.queriesSinceEvaluation += 1
+            if stats.queriesSinceEvaluation >= self.evaluate_every:
+                choice = ParserChoice.BOTH
+
+        if choice == ParserChoice.BOTH:
+            stats.queriesSinceEvaluation = 0
+        elif choice == ParserChoice.SQLFLUFF:
+            stats.sqlparseSkipped += 1
+        else:
+            stats.sqlfluffSkipped += 1
+        return choice
+
+    @staticmethod
+    def record_run(
+        stats: ParserShapeStats, parser: ParserChoice, seconds: float
+    ) -> None:
+        if parser == ParserChoice.SQLFLUFF:
+            stats.sqlfluffRuns += 1
+            stats.sqlfluffSeconds += seconds
+        else:
+            stats.sqlparseRuns += 1
+            stats.sqlparseSeconds += seconds
+
+    @staticmethod
+    def record_winner(stats: ParserShapeStats, winner: Optional[ParserChoice]) -> None:
+        """
+        Record which parser result was picked when both could be compared.
+        A skipped parser being needed after all counts as a win for it.
+        """
+        stats.evaluations += 1
+        if winner == ParserChoice.SQLFLUFF:
+            stats.sqlfluffWins += 1
+        elif winner == ParserChoice.SQLPARSE:
+            stats.sqlparseWins += 1
+
+    def snapshot(self) -> Dict[Tuple[str, str], ParserShapeStats]:
+        return {key: stats.copy() for key, stats in self._stats.items()}
+
+    def load(self, stats: Dict[Tuple[str, str], ParserShapeStats]) -> None:
+        """
+        Start from the given stats, e.g., the ones of the parent
+        process when parsing in a pool
+        """
+        self._stats = {key: shape_stats.copy() for key, shape_stats in stats.items()}
+
+    def get_changes(
+        self, since: Dict[Tuple[str, str], ParserShapeStats]
+    ) -> Dict[Tuple[str, str], ParserShapeStats]:
+        """
+        Stats learnt since the given snapshot
+        """
+        changes = {}
+        for key, stats in self._stats.items():
+            before = since.get(key, ParserShapeStats())
+            change = ParserShapeStats(
+                **{
+                    field: getattr(stats, field) - getattr(before, field)
+                    for field in ParserShapeStats.__fields__
+                }
+            )
+            if change != ParserShapeStats():
+                changes[key] = change
+        return changes
+
+    def merge(self, changes: Dict[Tuple[str, str], ParserShapeStats]) -> None:
+        """
+        Add the stats learnt somewhere else, e.g., in a pool process
+        """
+        for key, change in changes.items():
+            stats = self._stats.setdefault(key, ParserShapeStats())
+            for field in ParserShapeStats.__fields__:
+                setattr(stats, field, getattr(stats, field) + getattr(change, field))
+            # Not a counter: it is reset after each evaluation
+            stats.queriesSinceEvaluation = max(stats.queriesSinceEvaluation, 0)
+
+    def get_stats(self) -> Dict[str, dict]:
+        return {
+            f"{dialect}:{shape}": stats.dict()
+            for (dialect, shape), stats in self._stats.items()
+        }
+
+
+parser_selector = ParserSelector()
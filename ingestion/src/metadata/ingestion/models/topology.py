@@ -12,10 +12,12 @@
 Defines the topology for ingesting sources
 """
 
-from typing import Any, Generic, List, Optional, Type, TypeVar
+from typing import Any, Callable, Generic, List, Optional, Type, TypeVar
 
 from pydantic import BaseModel, Extra, create_model
 
+from metadata.generated.schema.type.basic import FullyQualifiedEntityName
+
 T = TypeVar("T", bound=BaseModel)
 
 
@@ -80,6 +82,79 @@ class ServiceTopology(BaseModel):
         extra = Extra.allow
 
 
+class MissingExpectedEntityAckException(Exception):
+    """
+    After running the ack to the sink, we got no
+    Entity back
+    """
+
+
+class EntityAck:
+    """
+    Placeholder stored in the TopologyContext for an Entity
+    that has been sent to the sink but whose acknowledgement
+    has not been fetched back from OM yet.
+
+    The name and FQN are known from the request, so sources and
+    the runner can read them without waiting. Any other attribute
+    fetches the Entity, unless the runner already reconciled the
+    pending acks in batch.
+    """
+
+    def __init__(
+        self,
+        stage: "NodeStage",
+        entity_request: BaseModel,
+        entity_fqn: str,
+        parent_fqn: Optional[str],
+        resolver: Callable[["EntityAck"], Optional[BaseModel]],
+    ):
+        self.stage = stage
+        self.entity_request = entity_request
+        self.fqn = entity_fqn
+        self.parent_fqn = parent_fqn
+        self._resolver = resolver
+        self._entity: Optional[BaseModel] = None
+
+    @property
+    def name(self):
+        return self.entity_request.name
+
+    @property
+    def fullyQualifiedName(self):  # pylint: disable=invalid-name
+        return FullyQualifiedEntityName(__root__=self.fqn)
+
+    @property
+    def resolved(self) -> bool:
+        return self._entity is not None
+
+    def set_entity(self, entity: BaseModel) -> None:
+        self._entity = entity
+
+    def get_entity(self) -> Optional[BaseModel]:
+        """
+        Block until we have the Entity back from OM
+        """
+        if self._entity is None:
+            self._entity = self._resolver(self)
+        if self._entity is None and self.stage.must_return:
+            raise MissingExpectedEntityAckException(
+                f"Missing ack back from [{self.stage.type_.__name__}: {self.fqn}]"
+            )
+        return self._entity
+
+    def __getattr__(self, item: str) -> Any:
+        """
+        Only called for the attributes we do not know from the request
+        """
+        if item.startswith("_"):
+            raise AttributeError(item)
+        return getattr(self.get_entity(), item)
+
+    def __repr__(self):
+        return f"EntityAck({self.fqn})"
+
+
 class TopologyContext(BaseModel):
     """
     Bounds all topology contexts
@@ -13,20 +13,28 @@ Mixin class containing Lineage specific methods
 
 To be used by OpenMetadata class
 """
-import functools
 import traceback
 from typing import Generic, List, Optional, Type, TypeVar
 
-from pydantic import BaseModel
+from pydantic import BaseModel, ValidationError
 
 from metadata.ingestion.ometa.client import REST
-from metadata.utils.elasticsearch import ES_INDEX_MAP
+from metadata.utils.elasticsearch import (
+    ES_INDEX_MAP,
+    ES_SOURCE_BASE_FIELDS,
+    ES_SOURCE_SKIPPED_ENTITY_FIELDS,
+    ES_SOURCE_SKIPPED_FIELDS,
+)
 from metadata.utils.logger import ometa_logger
+from metadata.utils.lru_cache import TTLLRUCache
 
 logger = ometa_logger()
 
 T = TypeVar("T", bound=BaseModel)
 
+ES_CACHE_SIZE = 512
+ES_CACHE_TTL = 300  # seconds
+
 
 class ESMixin(Generic[T]):
     """
@@ -36,10 +44,61 @@ class ESMixin(Generic[T]):
     """
 
     client: REST
+    _es_cache: Optional[TTLLRUCache] = None
 
     fqdn_search = "/search/query?q=fullyQualifiedName:{fqn}&from={from_}&size={size}&index={index}"
 
-    @functools.lru_cache(maxsize=512)
+    @property
+    def es_cache(self) -> TTLLRUCache:
+        """
+        Search results of this client, expiring after ES_CACHE_TTL
+        so that we pick up the entities created in the meantime
+        """
+        if self._es_cache is None:
+            self._es_cache = TTLLRUCache(ES_CACHE_SIZE, ES_CACHE_TTL)
+        return self._es_cache
+
+    @staticmethod
+    def _entity_from_source(
+        entity_type: Type[T], source: dict, fields: Optional[List[str]] = None
+    ) -> Optional[T]:
+        """
+        Build the entity from the indexed document. Returns None if any of the
+        requested fields is not indexed, or not as the entity defines it.
+
+        We only read the fields the API would return: the base ones, the
+        required ones and the requested ones.
+        """
+        skipped = ES_SOURCE_SKIPPED_FIELDS | ES_SOURCE_SKIPPED_ENTITY_FIELDS.get(
+            entity_type.__name__, set()
+        )
+        for field in fields or []:
+            if field == "*" or field in skipped or field not in source:
+                return None
+
+        known_fields = ES_SOURCE_BASE_FIELDS.union(
+            fields or [],
+            (name for name, field in entity_type.__fields__.items() if field.required),
+        )
+        values = {
+            key: value
+            for key, value in source.items()
+            if key in entity_type.__fields__
+            and key in known_fields
+            and key not in skipped
+        }
+        # Documents are indexed with an empty description when there is none
+        if values.get("description") == "":
+            values["description"] = None
+
+        try:
+            return entity_type.parse_obj(values)
+        except ValidationError as exc:
+            logger.debug(
+                f"Cannot build {entity_type.__name__} from the ES document: {exc}"
+            )
+        return None
+
     def _search_es_entity(
         self,
         entity_type: Type[T],
@@ -47,25 +106,35 @@ class ESMixin(Generic[T]):
         fields: Optional[List[str]] = None,
     ) -> Optional[List[T]]:
         """
-        Run the ES query and return a list of entities that match. It does an extra query to the OM API with the
-        requested fields per each entity found in ES.
+        Run the ES query and return a list of entities that match. Entities are built
+        from the indexed documents, and only fetched from the OM API with the requested
+        fields when the documents are missing any of them. Deleted entities are skipped.
         :param entity_type: Entity to look for
         :param query_string: Query to run
         :return: List of Entities or None
         """
-        response = self.client.get(query_string)
+        cache_key = (entity_type.__name__, query_string, tuple(fields or ()))
+        try:
+            return self.es_cache.get(cache_key)
+        except KeyError:
+            pass
 
+        entities = None
+        response = self.client.get(query_string)
         if response:
-            return [
-                self.get_by_name(
+            entities = [
+                self._entity_from_source(entity_type, hit["_source"], fields)
+                or self.get_by_name(
                     entity=entity_type,
                     fqn=hit["_source"]["fullyQualifiedName"],
                     fields=fields,
                 )
                 for hit in response["hits"]["hits"]
+                if not hit["_source"].get("deleted")
             ] or None
 
-        return None
+        self.es_cache.put(cache_key, entities)
+        return entities
 
     def es_search_from_fqn(
         self,
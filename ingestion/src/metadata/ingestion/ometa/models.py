@@ -10,7 +10,7 @@
 #  limitations under the License.
 """Pydantic models for ometa client API"""
 
-from typing import Generic, List, Optional, TypeVar
+from typing import Any, Generic, List, Optional, TypeVar
 
 from pydantic import BaseModel
 
@@ -30,3 +30,20 @@ class EntityList(Generic[T], BaseModel):
     entities: List[T]
     total: int
     after: Optional[str] = None
+
+
+class BulkResult(BaseModel):
+    """
+    Outcome of each create request sent in a bulk operation
+
+    Attributes
+        request: create request sent to the server
+        entity: Entity returned by the server, if it succeeded
+        error: error message, if it failed
+        stack_trace: traceback of the failure
+    """
+
+    request: Any
+    entity: Optional[Any] = None
+    error: Optional[str] = None
+    stack_trace: Optional[str] = None
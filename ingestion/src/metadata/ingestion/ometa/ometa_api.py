@@ -15,6 +15,7 @@ models from the JSON schemas and provides a typed approach to
 working with OpenMetadata entities.
 """
 import traceback
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, Generic, Iterable, List, Optional, Type, TypeVar, Union
 
 try:
@@ -100,7 +101,7 @@ from metadata.ingestion.ometa.mixins.tests_mixin import OMetaTestsMixin
 from metadata.ingestion.ometa.mixins.topic_mixin import OMetaTopicMixin
 from metadata.ingestion.ometa.mixins.user_mixin import OMetaUserMixin
 from metadata.ingestion.ometa.mixins.version_mixin import OMetaVersionMixin
-from metadata.ingestion.ometa.models import EntityList
+from metadata.ingestion.ometa.models import BulkResult, EntityList
 from metadata.ingestion.ometa.provider_registry import (
     InvalidAuthProviderException,
     auth_provider_registry,
@@ -577,6 +578,37 @@ class OpenMetadata(
             )
         return entity_class(**resp)
 
+    def _bulk_create_or_update_one(self, data: C) -> BulkResult:
+        try:
+            return BulkResult(request=data, entity=self.create_or_update(data))
+        except Exception as exc:  # pylint: disable=broad-except
+            logger.debug(traceback.format_exc())
+            return BulkResult(
+                request=data, error=str(exc), stack_trace=traceback.format_exc()
+            )
+
+    def bulk_create_or_update(
+        self, data: List[C], max_workers: int = 10
+    ) -> List[BulkResult]:
+        """
+        PUT a batch of CreateEntity requests.
+
+        The requests are pipelined over the client session with a bounded
+        pool of workers, so we only pay the HTTP latency once per batch
+        instead of once per entity.
+
+        :param data: list of CreateEntity requests
+        :param max_workers: max number of requests in flight
+        :return: results in the same order as the requests, one per request
+        """
+        if not data:
+            return []
+        if len(data) == 1 or max_workers <= 1:
+            return [self._bulk_create_or_update_one(request) for request in data]
+
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(data))) as executor:
+            return list(executor.map(self._bulk_create_or_update_one, data))
+
     def get_by_name(
         self,
         entity: Type[T],
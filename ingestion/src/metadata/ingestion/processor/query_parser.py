@@ -13,8 +13,12 @@ Query parser implementation
 """
 
 import datetime
+import time
 import traceback
-from typing import Optional
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from concurrent.futures.process import BrokenProcessPool
+from typing import Deque, Dict, List, Optional, Tuple
 
 from metadata.config.common import ConfigModel
 from metadata.generated.schema.entity.services.connections.metadata.openMetadataConnection import (
@@ -25,6 +29,10 @@ from metadata.generated.schema.type.tableQuery import TableQueries, TableQuery
 from metadata.ingestion.api.processor import Processor
 from metadata.ingestion.lineage.models import ConnectionTypeDialectMapper, Dialect
 from metadata.ingestion.lineage.parser import LineageParser
+from metadata.ingestion.lineage.parser_selection import (
+    ParserShapeStats,
+    parser_selector,
+)
 from metadata.utils.logger import ingestion_logger
 
 logger = ingestion_logger()
@@ -64,6 +72,170 @@ def parse_sql_statement(record: TableQuery, dialect: Dialect) -> Optional[Parsed
     )
 
 
+def parse_sql_statement_in_pool(
+    record: TableQuery,
+    dialect: Dialect,
+    selector_stats: Dict[Tuple[str, str], ParserShapeStats],
+) -> Tuple[Optional[ParsedData], Dict[Tuple[str, str], ParserShapeStats]]:
+    """
+    Parse the statement in a pool process. The process starts from the
+    parser selection stats of the parent, and returns what it learnt
+    for the parent to merge it.
+    """
+    parser_selector.load(selector_stats)
+    parsed_data = parse_sql_statement(record, dialect)
+    return parsed_data, parser_selector.get_changes(selector_stats)
+
+
+class QueryParserProcessorConfig(ConfigModel):
+    # Processes parsing the queries. With 1, queries are parsed in the calling thread
+    processes: int = 1
+    # Max time to parse a single query when using processes
+    query_timeout_seconds: int = 60
+
+
+class QueryParserPool:
+    """
+    Parse the queries in a pool of processes.
+
+    Results are returned in the same order as the queries. We keep at most one
+    query in flight per process, so that when a worker hangs or dies we know
+    which queries were being parsed. Hung queries are failed and their
+    processes killed. When a process dies, the queries in flight are
+    parsed again one at a time to find and fail the one that broke it.
+    The parser selection stats learnt by the processes are merged back
+    into the ones of this process.
+    """
+
+    def __init__(self, processes: int, query_timeout_seconds: int):
+        self.processes = processes
+        self.query_timeout_seconds = query_timeout_seconds
+        self._executor: Optional[ProcessPoolExecutor] = None
+
+    @property
+    def executor(self) -> ProcessPoolExecutor:
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(max_workers=self.processes)
+        return self._executor
+
+    def close(self, kill: bool = False) -> None:
+        """
+        Shut down the pool, killing the processes if they are stuck
+        """
+        if self._executor is None:
+            return
+        if kill:
+            # pylint: disable=protected-access
+            for process in (self._executor._processes or {}).values():
+                process.terminate()
+        self._executor.shutdown(wait=not kill)
+        self._executor = None
+
+    def parse(
+        self, records: List[TableQuery], dialect: Dialect
+    ) -> List[Optional[ParsedData]]:
+        """
+        Parse all the records, returning None for the failed ones
+        """
+        results: List[Optional[ParsedData]] = [None] * len(records)
+        pending: Deque[int] = deque(range(len(records)))
+        suspects: Deque[int] = deque()
+
+        while pending or suspects:
+            # Suspects of breaking the pool run alone
+            queue, window = (suspects, 1) if suspects else (pending, self.processes)
+            self._run_window(records, dialect, results, queue, window, suspects)
+
+        return results
+
+    def _run_window(  # pylint: disable=too-many-arguments
+        self,
+        records: List[TableQuery],
+        dialect: Dialect,
+        results: List[Optional[ParsedData]],
+        queue: Deque[int],
+        window: int,
+        suspects: Deque[int],
+    ) -> None:
+        """
+        Keep `window` queries in flight until the queue is empty or
+        the pool needs to be restarted
+        """
+        in_flight: Dict[Future, int] = {}
+        deadlines: Dict[Future, float] = {}
+
+        while queue or in_flight:
+            while queue and len(in_flight) < window:
+                idx = queue.popleft()
+                future = self.executor.submit(
+                    parse_sql_statement_in_pool,
+                    records[idx],
+                    dialect,
+                    parser_selector.snapshot(),
+                )
+                in_flight[future] = idx
+                deadlines[future] = time.monotonic() + self.query_timeout_seconds
+
+            done, _ = wait(
+                in_flight,
+                timeout=max(min(deadlines.values()) - time.monotonic(), 0),
+                return_when=FIRST_COMPLETED,
+            )
+
+            if not done:
+                self._fail_hung_queries(records, queue, in_flight, deadlines)
+                return
+
+            for future in done:
+                idx = in_flight.pop(future)
+                deadlines.pop(future)
+                try:
+                    results[idx], selector_changes = future.result()
+                    parser_selector.merge(selector_changes)
+                except BrokenProcessPool:
+                    self._handle_broken_pool(records, idx, in_flight, suspects)
+                    return
+                except Exception as exc:
+                    logger.debug(traceback.format_exc())
+                    logger.warning(
+                        f"Error processing query [{records[idx].query}]: {exc}"
+                    )
+
+    def _fail_hung_queries(
+        self,
+        records: List[TableQuery],
+        queue: Deque[int],
+        in_flight: Dict[Future, int],
+        deadlines: Dict[Future, float],
+    ) -> None:
+        now = time.monotonic()
+        for future, idx in in_flight.items():
+            if deadlines[future] <= now:
+                logger.warning(
+                    f"Error processing query [{records[idx].query}]: "
+                    f"Parser has been running for more than {self.query_timeout_seconds} seconds."
+                )
+            else:
+                queue.appendleft(idx)
+        self.close(kill=True)
+
+    def _handle_broken_pool(
+        self,
+        records: List[TableQuery],
+        idx: int,
+        in_flight: Dict[Future, int],
+        suspects: Deque[int],
+    ) -> None:
+        in_flight_idx = sorted([idx, *in_flight.values()])
+        if len(in_flight_idx) == 1:
+            logger.warning(
+                f"Error processing query [{records[idx].query}]: the parser process died"
+            )
+        else:
+            suspects.extend(in_flight_idx)
+        self.close(kill=True)
+
+
 class QueryParserProcessor(Processor):
     """
     Extension of the `Processor` class
@@ -74,11 +246,11 @@ class QueryParserProcessor(Processor):
         connection_type (str):
     """
 
-    config: ConfigModel
+    config: QueryParserProcessorConfig
 
     def __init__(
         self,
-        config: ConfigModel,
+        config: QueryParserProcessorConfig,
         metadata_config: OpenMetadataConnection,
         connection_type: str,
     ):
@@ -86,12 +258,20 @@ class QueryParserProcessor(Processor):
         self.config = config
         self.metadata_config = metadata_config
         self.connection_type = connection_type
+        self.pool = (
+            QueryParserPool(
+                processes=self.config.processes,
+                query_timeout_seconds=self.config.query_timeout_seconds,
+            )
+            if self.config.processes > 1
+            else None
+        )
 
     @classmethod
     def create(
         cls, config_dict: dict, metadata_config: OpenMetadataConnection, **kwargs
     ):
-        config = ConfigModel.parse_obj(config_dict)
+        config = QueryParserProcessorConfig.parse_obj(config_dict)
         connection_type = kwargs.pop("connection_type", "")
         return cls(config, metadata_config, connection_type)
 
@@ -99,13 +279,17 @@ class QueryParserProcessor(Processor):
         self, queries: TableQueries
     ) -> Optional[QueryParserData]:
         if queries and queries.queries:
+            dialect = ConnectionTypeDialectMapper.dialect_of(self.connection_type)
+            if self.pool:
+                data = self.pool.parse(queries.queries, dialect)
+                return QueryParserData(
+                    parsedData=[parsed_sql for parsed_sql in data if parsed_sql]
+                )
+
             data = []
             for record in queries.queries:
                 try:
-                    parsed_sql = parse_sql_statement(
-                        record,
-                        ConnectionTypeDialectMapper.dialect_of(self.connection_type),
-                    )
+                    parsed_sql = parse_sql_statement(record, dialect)
                     if parsed_sql:
                         data.append(parsed_sql)
                 except Exception as exc:
@@ -116,4 +300,5 @@ class QueryParserProcessor(Processor):
         return None
 
     def close(self):
-        pass
+        if self.pool:
+            self.pool.close()
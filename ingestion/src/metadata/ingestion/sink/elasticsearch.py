@@ -19,7 +19,7 @@ import json
 import ssl
 import traceback
 from functools import singledispatch
-from typing import Any, List, Optional, Tuple
+from typing import Any, List, Optional, Tuple, Type
 
 import boto3
 from requests_aws4auth import AWS4Auth
@@ -35,6 +35,7 @@ from metadata.generated.schema.entity.data.container import Container
 from metadata.generated.schema.entity.data.dashboard import Dashboard
 from metadata.generated.schema.entity.data.database import Database
 from metadata.generated.schema.entity.data.databaseSchema import DatabaseSchema
+from metadata.generated.schema.entity.data.glossary import Glossary
 from metadata.generated.schema.entity.data.glossaryTerm import GlossaryTerm
 from metadata.generated.schema.entity.data.mlmodel import MlModel
 from metadata.generated.schema.entity.data.pipeline import Pipeline
@@ -45,6 +46,12 @@ from metadata.generated.schema.entity.policies.policy import Policy
 from metadata.generated.schema.entity.services.connections.metadata.openMetadataConnection import (
     OpenMetadataConnection,
 )
+from metadata.generated.schema.entity.services.dashboardService import DashboardService
+from metadata.generated.schema.entity.services.databaseService import DatabaseService
+from metadata.generated.schema.entity.services.messagingService import MessagingService
+from metadata.generated.schema.entity.services.mlmodelService import MlModelService
+from metadata.generated.schema.entity.services.pipelineService import PipelineService
+from metadata.generated.schema.entity.services.storageService import StorageService
 from metadata.generated.schema.entity.teams.team import Team
 from metadata.generated.schema.entity.teams.user import User
 from metadata.generated.schema.type.entityReferenceList import EntityReferenceList
@@ -108,6 +115,8 @@ from metadata.ingestion.sink.elasticsearch_mapping.web_analytic_entity_view_repo
 from metadata.ingestion.sink.elasticsearch_mapping.web_analytic_user_activity_report_data_index_mapping import (
     WEB_ANALYTIC_USER_ACTIVITY_REPORT_DATA_INDEX_MAPPING,
 )
+from metadata.ingestion.sink.es_bulk import BulkDocument, ElasticsearchBulkIndexer
+from metadata.ingestion.sink.es_parent_cache import ParentReferenceCache
 from metadata.utils.elasticsearch import ES_INDEX_MAP
 from metadata.utils.logger import ingestion_logger
 
@@ -148,6 +157,13 @@ class ElasticSearchConfig(ConfigModel):
     use_AWS_credentials: Optional[bool] = False
     region_name: Optional[str] = None
 
+    # Buffer the documents and index them with the bulk API. The buffer is sent
+    # when reaching any of the limits. A bulk_size of 1 indexes each document as it comes.
+    bulk_size: int = 1
+    bulk_max_bytes: int = 5 * 1024 * 1024
+    bulk_max_workers: int = 4
+    bulk_max_retries: int = 3
+
 
 class ElasticsearchSink(Sink[Entity]):
     """
@@ -297,6 +313,12 @@ class ElasticsearchSink(Sink[Entity]):
 
         super().__init__()
 
+        self.bulk_indexer = ElasticsearchBulkIndexer(
+            self.elasticsearch_client, self.status, self.config
+        )
+        # Names of the parent entities, shared by all the documents of this sink
+        self.parent_cache = ParentReferenceCache(self.metadata)
+
     def _check_or_create_index(self, index_name: str, es_mapping: str):
         """
         Retrieve all indices that currently have {elasticsearch_alias} alias
@@ -338,6 +360,10 @@ class ElasticsearchSink(Sink[Entity]):
                 index=index_name, body=es_mapping, request_timeout=self.config.timeout
             )
 
+    @property
+    def is_bulk_enabled(self) -> bool:
+        return self.config.bulk_size > 1
+
     def write_record(self, record: Entity) -> None:
         """
         Default implementation for the single dispatch
@@ -345,15 +371,16 @@ class ElasticsearchSink(Sink[Entity]):
 
         try:
             self._write_record(record)
-            self.status.records_written(
+        except Exception as exc:
+            name = (
                 record.name.__root__
                 if hasattr(record, "name")
                 else type(record).__name__
             )
-
-        except Exception as exc:
+            error = f"Failed to index due to {exc} - Entity: {record}"
             logger.debug(traceback.format_exc())
-            logger.error(f"Failed to index due to {exc} - Entity: {record}")
+            logger.error(error)
+            self.status.failed(name, error, traceback.format_exc())
 
     def _write_record(self, record: Entity) -> None:  # pylint: disable=method-hidden
         """
@@ -361,33 +388,58 @@ class ElasticsearchSink(Sink[Entity]):
 
         Default implementation for the single dispatch
         """
-        es_record = create_record_document(record, self.metadata)
-        self.elasticsearch_client.index(
+        es_record = create_record_document(record, self.metadata, self.parent_cache)
+        self._index_document(
             index=ES_INDEX_MAP[type(record).__name__],
-            id=str(es_record.id),
+            doc_id=str(es_record.id),
             body=es_record.json(),
-            request_timeout=self.config.timeout,
+            name=es_record.name,
         )
-        self.status.records_written(es_record.name)
 
     def _write_report_data(self, record: ReportData) -> None:
-        self.elasticsearch_client.index(
+        self._index_document(
             index=DataInsightEsIndex[record.data.__class__.__name__].value,
-            id=record.id,
+            doc_id=str(record.id.__root__) if record.id else None,
             body=record.json(),
-            request_timeout=self.config.timeout,
+            name=type(record).__name__,
         )
 
     def _write_classification(self, record: Classification) -> None:
-        es_record = create_record_document(record, self.metadata)
+        es_record = create_record_document(record, self.metadata, self.parent_cache)
         for es_record_elem in es_record:
-            self.elasticsearch_client.index(
+            self._index_document(
                 index=ES_INDEX_MAP[Tag.__name__],
-                id=str(es_record_elem.id),
+                doc_id=str(es_record_elem.id),
                 body=es_record_elem.json(),
+                name=es_record_elem.name,
+            )
+
+    def _index_document(
+        self, index: str, doc_id: Optional[str], body: str, name: str
+    ) -> None:
+        """
+        Index the document right away, or add it to the bulk buffer
+        and send it if we reach any limit. Documents without id get one from ES.
+        """
+        if not self.is_bulk_enabled:
+            self.elasticsearch_client.index(
+                index=index,
+                id=doc_id,
+                body=body,
                 request_timeout=self.config.timeout,
             )
-            self.status.records_written(es_record_elem.name)
+            self.status.records_written(name)
+            return
+
+        self.bulk_indexer.add(
+            BulkDocument(index=index, id=doc_id, body=body, name=name)
+        )
+
+    def flush(self) -> None:
+        """
+        Index the buffered documents and wait for all the bulk requests
+        """
+        self.bulk_indexer.flush()
 
     @staticmethod
     def _write_policy(_: Policy) -> None:
@@ -417,6 +469,9 @@ class ElasticsearchSink(Sink[Entity]):
         return self.elasticsearch_client.bulk(body=body)
 
     def close(self):
+        self.flush()
+        logger.debug(f"Parent reference cache: {self.parent_cache.get_stats()}")
+        self.bulk_indexer.close()
         self.elasticsearch_client.close()
 
 
@@ -523,8 +578,15 @@ def _build_suggest_of(
     return suggest_list
 
 
+def _get_service_suggest(
+    record: Entity, service_type: Type[Entity], parent_cache: ParentReferenceCache
+) -> List[ESSuggest]:
+    service_name = parent_cache.get_name(service_type, record.service)
+    return [ESSuggest(input=service_name, weight=5)]
+
+
 @singledispatch
-def create_record_document(record: Entity, _: OpenMetadata) -> Any:
+def create_record_document(record: Entity, *_) -> Any:
     """
     Entrypoint to create documents from records
     and get them ready to send to ES
@@ -533,7 +595,9 @@ def create_record_document(record: Entity, _: OpenMetadata) -> Any:
 
 
 @create_record_document.register
-def _(record: Table, metadata: OpenMetadata) -> TableESDocument:
+def _(
+    record: Table, _: OpenMetadata, parent_cache: ParentReferenceCache
+) -> TableESDocument:
     tags, tier = get_es_tag_list_and_tier(record)
     suggest = _get_es_suggest(
         input_5=record.fullyQualifiedName.__root__, input_10=record.name.__root__
@@ -552,12 +616,8 @@ def _(record: Table, metadata: OpenMetadata) -> TableESDocument:
         tags=tags,
     )
 
-    database_entity = metadata.get_by_id(
-        entity=Database, entity_id=str(record.database.id.__root__)
-    )
-    database_schema_entity = metadata.get_by_id(
-        entity=DatabaseSchema, entity_id=str(record.databaseSchema.id.__root__)
-    )
+    database_name = parent_cache.get_name(Database, record.database)
+    database_schema_name = parent_cache.get_name(DatabaseSchema, record.databaseSchema)
 
     return TableESDocument(
         id=str(record.id.__root__),
@@ -578,11 +638,9 @@ def _(record: Table, metadata: OpenMetadata) -> TableESDocument:
         deleted=record.deleted,
         serviceType=str(record.serviceType.name),
         suggest=suggest,
-        service_suggest=[ESSuggest(input=record.service.name, weight=5)],
-        database_suggest=[ESSuggest(input=database_entity.name.__root__, weight=5)],
-        schema_suggest=[
-            ESSuggest(input=database_schema_entity.name.__root__, weight=5)
-        ],
+        service_suggest=_get_service_suggest(record, DatabaseService, parent_cache),
+        database_suggest=[ESSuggest(input=database_name, weight=5)],
+        schema_suggest=[ESSuggest(input=database_schema_name, weight=5)],
         column_suggest=[ESSuggest(input=column, weight=5) for column in column_names],
         description=record.description.__root__ if record.description else "",
         tier=tier,
@@ -592,7 +650,9 @@ def _(record: Table, metadata: OpenMetadata) -> TableESDocument:
 
 
 @create_record_document.register
-def _(record: Topic, _: OpenMetadata) -> TopicESDocument:
+def _(
+    record: Topic, _: OpenMetadata, parent_cache: ParentReferenceCache
+) -> TopicESDocument:
     tags, tier = get_es_tag_list_and_tier(record)
     suggest = _get_es_suggest(
         input_5=record.fullyQualifiedName.__root__, input_10=record.name.__root__
@@ -620,7 +680,7 @@ def _(record: Topic, _: OpenMetadata) -> TopicESDocument:
         maximumMessageSize=record.maximumMessageSize,
         retentionSize=record.retentionSize,
         suggest=suggest,
-        service_suggest=[ESSuggest(input=record.service.name, weight=5)],
+        service_suggest=_get_service_suggest(record, MessagingService, parent_cache),
         tier=tier,
         tags=tags,
         owner=record.owner,
@@ -629,7 +689,9 @@ def _(record: Topic, _: OpenMetadata) -> TopicESDocument:
 
 
 @create_record_document.register
-def _(record: Dashboard, _: OpenMetadata) -> DashboardESDocument:
+def _(
+    record: Dashboard, _: OpenMetadata, parent_cache: ParentReferenceCache
+) -> DashboardESDocument:
     tags, tier = get_es_tag_list_and_tier(record)
     display_name = get_es_display_name(record)
     suggest = _get_es_suggest(
@@ -663,12 +725,14 @@ def _(record: Dashboard, _: OpenMetadata) -> DashboardESDocument:
         suggest=suggest,
         chart_suggest=chart_suggest,
         data_model_suggest=data_model_suggest,
-        service_suggest=[ESSuggest(input=record.service.name, weight=5)],
+        service_suggest=_get_service_suggest(record, DashboardService, parent_cache),
     )
 
 
 @create_record_document.register
-def _create_pipeline_es_doc(record: Pipeline, _: OpenMetadata) -> PipelineESDocument:
+def _create_pipeline_es_doc(
+    record: Pipeline, _: OpenMetadata, parent_cache: ParentReferenceCache
+) -> PipelineESDocument:
     tags, tier = get_es_tag_list_and_tier(record)
     display_name = get_es_display_name(record)
     suggest = _get_es_suggest(
@@ -699,7 +763,7 @@ def _create_pipeline_es_doc(record: Pipeline, _: OpenMetadata) -> PipelineESDocu
         serviceType=str(record.serviceType.name),
         suggest=suggest,
         task_suggest=task_suggest,
-        service_suggest=[ESSuggest(input=record.service.name, weight=5)],
+        service_suggest=_get_service_suggest(record, PipelineService, parent_cache),
         tier=tier,
         tags=list(tags),
         owner=record.owner,
@@ -708,7 +772,9 @@ def _create_pipeline_es_doc(record: Pipeline, _: OpenMetadata) -> PipelineESDocu
 
 
 @create_record_document.register
-def _create_ml_model_es_doc(record: MlModel, _: OpenMetadata) -> MlModelESDocument:
+def _create_ml_model_es_doc(
+    record: MlModel, _: OpenMetadata, parent_cache: ParentReferenceCache
+) -> MlModelESDocument:
     tags, tier = get_es_tag_list_and_tier(record)
     display_name = get_es_display_name(record)
     suggest = _get_es_suggest(
@@ -741,13 +807,15 @@ def _create_ml_model_es_doc(record: MlModel, _: OpenMetadata) -> MlModelESDocume
         owner=record.owner,
         followers=followers,
         service=record.service,
-        service_suggest=[ESSuggest(input=record.service.name, weight=5)],
+        service_suggest=_get_service_suggest(record, MlModelService, parent_cache),
         serviceType=str(record.serviceType.name),
     )
 
 
 @create_record_document.register
-def _create_container_es_doc(record: Container, _: OpenMetadata) -> ContainerESDocument:
+def _create_container_es_doc(
+    record: Container, _: OpenMetadata, parent_cache: ParentReferenceCache
+) -> ContainerESDocument:
     tags, tier = get_es_tag_list_and_tier(record)
     display_name = get_es_display_name(record)
     suggest = _get_es_suggest(
@@ -772,20 +840,20 @@ def _create_container_es_doc(record: Container, _: OpenMetadata) -> ContainerESD
         owner=record.owner,
         followers=followers,
         service=record.service,
-        parent=record.parent,
+        parent=parent_cache.resolve(Container, record.parent),
         dataModel=record.dataModel,
         children=record.children,
         prefix=record.prefix,
         numberOfObjects=record.numberOfObjects,
         size=record.size,
         fileFormats=[file_format.value for file_format in record.fileFormats or []],
-        service_suggest=[ESSuggest(input=record.service.name, weight=5)],
+        service_suggest=_get_service_suggest(record, StorageService, parent_cache),
         serviceType=str(record.serviceType.name),
     )
 
 
 @create_record_document.register
-def _create_query_es_doc(record: Query, _: OpenMetadata) -> QueryESDocument:
+def _create_query_es_doc(record: Query, *_) -> QueryESDocument:
     tags, tier = get_es_tag_list_and_tier(record)
     display_name = get_es_display_name(record)
     followers = get_es_followers(record)
@@ -817,7 +885,7 @@ def _create_query_es_doc(record: Query, _: OpenMetadata) -> QueryESDocument:
 
 
 @create_record_document.register
-def _create_user_es_doc(record: User, _: OpenMetadata) -> UserESDocument:
+def _create_user_es_doc(record: User, *_) -> UserESDocument:
     display_name = get_es_display_name(record)
     suggest = _get_es_suggest(input_5=record.name.__root__, input_10=display_name)
 
@@ -842,7 +910,7 @@ def _create_user_es_doc(record: User, _: OpenMetadata) -> UserESDocument:
 
 
 @create_record_document.register
-def _create_team_es_doc(record: Team, _: OpenMetadata) -> TeamESDocument:
+def _create_team_es_doc(record: Team, *_) -> TeamESDocument:
     display_name = get_es_display_name(record)
     suggest = _get_es_suggest(input_5=record.name.__root__, input_10=display_name)
 
@@ -868,7 +936,7 @@ def _create_team_es_doc(record: Team, _: OpenMetadata) -> TeamESDocument:
 
 @create_record_document.register
 def _create_glossary_term_es_doc(
-    record: GlossaryTerm, _: OpenMetadata
+    record: GlossaryTerm, _: OpenMetadata, parent_cache: ParentReferenceCache
 ) -> GlossaryTermESDocument:
     display_name = get_es_display_name(record)
     suggest = _get_es_suggest(input_5=record.name.__root__, input_10=display_name)
@@ -884,7 +952,7 @@ def _create_glossary_term_es_doc(
         updatedBy=record.updatedBy,
         href=record.href.__root__,
         synonyms=[str(synonym.__root__) for synonym in record.synonyms],
-        glossary=record.glossary,
+        glossary=parent_cache.resolve(Glossary, record.glossary),
         children=record.children if record.children else [],
         relatedTerms=record.relatedTerms if record.relatedTerms else [],
         reviewers=record.reviewers if record.reviewers else [],
@@ -898,7 +966,7 @@ def _create_glossary_term_es_doc(
 
 @create_record_document.register
 def _create_tag_es_doc(
-    record: Classification, metadata: OpenMetadata
+    record: Classification, metadata: OpenMetadata, *_
 ) -> List[TagESDocument]:
     tag_docs = []
     tag_list = metadata.list_entities(
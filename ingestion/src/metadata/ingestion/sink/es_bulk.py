@@ -0,0 +1,183 @@
+#  Copyright 2021 Collate
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#  http://www.apache.org/licenses/LICENSE-2.0
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+"""
+Buffer the documents of the Elasticsearch sink and index them
+with the bulk API from a pool of background threads
+"""
+
+import json
+import time
+import traceback
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Dict, Iterable, List, NamedTuple, Optional, Tuple
+
+from metadata.ingestion.api.sink import SinkStatus
+from metadata.utils.logger import ingestion_logger
+
+logger = ingestion_logger()
+
+# Bulk items failing with these statuses are sent again. We only send `index`
+# actions, which overwrite the document: a 409 version conflict would fail
+# again with the same body, so it is reported instead of retried.
+BULK_RETRY_STATUSES = {429}
+BULK_RETRY_BACKOFF_SECONDS = 0.5
+
+BulkResult = Tuple[str, Optional[str]]
+
+
+class BulkDocument(NamedTuple):
+    """Document waiting to be indexed with the bulk API"""
+
+    index: str
+    id: Optional[str]
+    body: str
+    name: str
+
+
+class ElasticsearchBulkIndexer:
+    """
+    Send the buffered documents in bulk requests when reaching
+    any of the limits. Each request runs in a background thread,
+    and the status is only updated from the thread adding the documents.
+    """
+
+    def __init__(self, client, status: SinkStatus, config):
+        """The config is the ElasticSearchConfig of the sink"""
+        self.client = client
+        self.status = status
+        self.timeout = config.timeout
+        self.bulk_size = config.bulk_size
+        self.bulk_max_bytes = config.bulk_max_bytes
+        self.bulk_max_workers = config.bulk_max_workers
+        self.bulk_max_retries = config.bulk_max_retries
+
+        self.buffer: List[BulkDocument] = []
+        self.buffer_bytes = 0
+        self.executor: Optional[ThreadPoolExecutor] = None
+        # Documents sent by each running request, to report them if it fails
+        self.futures: Dict[Future, List[BulkDocument]] = {}
+
+    def add(self, document: BulkDocument) -> None:
+        """Buffer the document and send the buffer if we reach any limit"""
+        self.buffer.append(document)
+        self.buffer_bytes += len(document.body)
+        if (
+            len(self.buffer) >= self.bulk_size
+            or self.buffer_bytes >= self.bulk_max_bytes
+        ):
+            self._send_buffer()
+
+    def flush(self) -> None:
+        """Send the buffered documents and wait for all the bulk requests"""
+        self._send_buffer()
+        if self.futures:
+            done, _ = wait(list(self.futures))
+            self._report_bulk_results(done)
+
+    def close(self) -> None:
+        self.flush()
+        if self.executor:
+            self.executor.shutdown()
+
+    def _send_buffer(self) -> None:
+        """
+        Send the buffered documents in a background bulk request.
+        We wait for a request to finish if there are already
+        bulk_max_workers of them running.
+        """
+        if not self.buffer:
+            return
+
+        documents = self.buffer
+        self.buffer = []
+        self.buffer_bytes = 0
+
+        if self.executor is None:
+            self.executor = ThreadPoolExecutor(max_workers=self.bulk_max_workers)
+        while len(self.futures) >= self.bulk_max_workers:
+            done, _ = wait(list(self.futures), return_when=FIRST_COMPLETED)
+            self._report_bulk_results(done)
+        self.futures[self.executor.submit(self._bulk_index, documents)] = documents
+
+    def _report_bulk_results(self, futures: Iterable[Future]) -> None:
+        """
+        Report the result of each document. If the request raised,
+        all the documents it sent are reported as failed.
+        """
+        for future in futures:
+            documents = self.futures.pop(future)
+            try:
+                results = future.result()
+            except Exception as exc:  # pylint: disable=broad-except
+                logger.debug(traceback.format_exc())
+                results = [(document.name, str(exc)) for document in documents]
+
+            for name, error in results:
+                if error:
+                    logger.warning(f"Failed to index [{name}]: {error}")
+                    self.status.failed(name, f"Failed to index due to {error}")
+                else:
+                    self.status.records_written(name)
+
+    @staticmethod
+    def _build_body(documents: List[BulkDocument]) -> List:
+        body = []
+        for document in documents:
+            action = {"_index": document.index}
+            if document.id:
+                action["_id"] = document.id
+            body.append({"index": action})
+            body.append(document.body)
+        return body
+
+    def _bulk_index(self, documents: List[BulkDocument]) -> List[BulkResult]:
+        """
+        Index the documents with the bulk API, sending again the ones failing
+        with a retryable status. Returns the name of each document and its error.
+        """
+        # pylint: disable=import-outside-toplevel
+        from elasticsearch.exceptions import ConnectionError as ESConnectionError
+        from elasticsearch.exceptions import TransportError
+
+        results: List[BulkResult] = []
+        for attempt in range(self.bulk_max_retries + 1):
+            if attempt:
+                time.sleep(BULK_RETRY_BACKOFF_SECONDS * 2 ** (attempt - 1))
+            last_attempt = attempt == self.bulk_max_retries
+
+            try:
+                response = self.client.bulk(
+                    body=self._build_body(documents), request_timeout=self.timeout
+                )
+            except TransportError as exc:
+                retryable = (
+                    isinstance(exc, ESConnectionError)
+                    or exc.status_code in BULK_RETRY_STATUSES
+                )
+                if retryable and not last_attempt:
+                    continue
+                logger.debug(traceback.format_exc())
+                return results + [(document.name, str(exc)) for document in documents]
+
+            retries = []
+            for document, item in zip(documents, response["items"]):
+                result = item.get("index", {})
+                status = result.get("status", 500)
+                if status < 300:
+                    results.append((document.name, None))
+                elif status in BULK_RETRY_STATUSES and not last_attempt:
+                    retries.append(document)
+                else:
+                    results.append((document.name, json.dumps(result.get("error"))))
+            if not retries:
+                break
+            documents = retries
+        return results
@@ -0,0 +1,90 @@
+#  Copyright 2021 Collate
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#  http://www.apache.org/licenses/LICENSE-2.0
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+"""
+Cache of the parent entities referenced by the Elasticsearch documents
+"""
+
+from typing import Any, Dict, Optional, Type
+
+from metadata.generated.schema.type.entityReference import EntityReference
+from metadata.ingestion.api.common import Entity
+from metadata.ingestion.ometa.ometa_api import OpenMetadata
+from metadata.utils.lru_cache import LRUCache
+
+PARENT_CACHE_SIZE = 10_000
+
+
+class ParentReferenceCache:
+    """
+    LRU cache of the names of the parent entities referenced by the
+    documents, e.g., the database and schema of the tables.
+
+    All the tables of a schema point to the same parents, so we only
+    fetch each of them once instead of once per document.
+    """
+
+    def __init__(self, metadata: OpenMetadata, capacity: int = PARENT_CACHE_SIZE):
+        self.metadata = metadata
+        self._cache = LRUCache(capacity)
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get_name(
+        self,
+        entity: Type[Entity],
+        reference: Optional[EntityReference],
+    ) -> Optional[str]:
+        """
+        Name of the referenced entity. The reference name is used if
+        informed, otherwise we get the entity from the API once.
+        """
+        if reference is None:
+            return None
+        if reference.name:
+            return reference.name
+
+        key = (entity.__name__, str(reference.id.__root__))
+        if key in self._cache:
+            self.hits += 1
+            return self._cache.get(key)
+
+        self.misses += 1
+        parent = self.metadata.get_by_id(entity=entity, entity_id=key[1])
+        if parent is None:
+            # Do not cache the failures, the entity might be there next time
+            return None
+        if len(self._cache) >= self._cache.capacity:
+            self.evictions += 1
+        self._cache.put(key, parent.name.__root__)
+        return parent.name.__root__
+
+    def resolve(
+        self,
+        entity: Type[Entity],
+        reference: Optional[EntityReference],
+    ) -> Optional[EntityReference]:
+        """
+        Reference with its name informed, to be indexed as is
+        """
+        if reference is None or reference.name:
+            return reference
+        return reference.copy(update={"name": self.get_name(entity, reference)})
+
+    def get_stats(self) -> Dict[str, Any]:
+        lookups = self.hits + self.misses
+        return {
+            "size": len(self._cache),
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hitRate": self.hits / lookups if lookups else None,
+        }
@@ -13,9 +13,11 @@ This is the main used sink for all OM Workflows.
 It picks up the generated Entities and send them
 to the OM API.
 """
+import threading
+import time
 import traceback
 from functools import singledispatch
-from typing import Optional, TypeVar
+from typing import Callable, List, Optional, Set, TypeVar
 
 from pydantic import BaseModel, ValidationError
 from requests.exceptions import HTTPError
@@ -50,9 +52,15 @@ from metadata.ingestion.models.tests_data import (
 )
 from metadata.ingestion.models.user import OMetaUserProfile
 from metadata.ingestion.ometa.client import APIError
+from metadata.ingestion.ometa.models import BulkResult
 from metadata.ingestion.ometa.ometa_api import OpenMetadata
+from metadata.ingestion.sink.request_fingerprint import (
+    RequestFingerprintStore,
+    request_key,
+)
 from metadata.ingestion.source.dashboard.dashboard_service import DashboardUsage
 from metadata.ingestion.source.database.database_service import DataModelLink
+from metadata.timer.repeated_timer import RepeatedTimer
 from metadata.utils.helpers import calculate_execution_time
 from metadata.utils.logger import get_add_lineage_log_str, ingestion_logger
 
@@ -61,9 +69,87 @@ logger = ingestion_logger()
 # Allow types from the generated pydantic models
 T = TypeVar("T", bound=BaseModel)
 
+# How often the timer checks if the bulk buffer time window expired
+FLUSH_CHECKS_PER_INTERVAL = 5
+
 
 class MetadataRestSinkConfig(ConfigModel):
     api_endpoint: Optional[str] = None
+    # Buffer the create requests and send them in bulk. The buffer is flushed
+    # when reaching any of the limits. A bulk_size of 1 sends each request as it comes.
+    # Sources blocking on the ack of each entity flush it right away, enable the
+    # pipelinedEntityAck of the server config to batch them.
+    bulk_size: int = 1
+    bulk_max_bytes: int = 5 * 1024 * 1024
+    bulk_flush_interval_seconds: float = 5.0
+    bulk_max_workers: int = 10
+    # SQLite file keeping the fingerprint of the requests sent, to skip the
+    # unchanged ones in the next runs. They are sent again after the TTL.
+    fingerprint_location: Optional[str] = None
+    fingerprint_ttl_seconds: float = 7 * 24 * 60 * 60
+
+
+class CreateRequestBuffer:
+    """
+    Create requests waiting to be sent in bulk. Once the buffer
+    time window expires, a timer calls `on_expired` so that the
+    requests do not wait for the next one to be flushed.
+    """
+
+    def __init__(self, flush_interval_seconds: float, on_expired: Callable[[], None]):
+        self.flush_interval_seconds = flush_interval_seconds
+        self.on_expired = on_expired
+        self.requests: List[BaseModel] = []
+        self.keys: Set[str] = set()
+        self.size_bytes = 0
+        self.started_at: Optional[float] = None
+        # Requests are flushed by the timer thread as well
+        self.lock = threading.RLock()
+        self.timer: Optional[RepeatedTimer] = None
+
+    def __contains__(self, request: BaseModel) -> bool:
+        return request_key(request) in self.keys
+
+    def add(self, request: BaseModel) -> None:
+        self.requests.append(request)
+        self.keys.add(request_key(request))
+        self.size_bytes += len(request.json())
+        if self.started_at is None:
+            self.started_at = time.time()
+        if self.timer is None:
+            self.timer = RepeatedTimer(
+                self.flush_interval_seconds / FLUSH_CHECKS_PER_INTERVAL,
+                self._flush_if_expired,
+            )
+            self.timer.thread.daemon = True
+            self.timer.trigger()
+
+    def is_expired(self) -> bool:
+        return (
+            self.started_at is not None
+            and time.time() - self.started_at >= self.flush_interval_seconds
+        )
+
+    def pop_all(self) -> List[BaseModel]:
+        requests = self.requests
+        self.requests = []
+        self.keys = set()
+        self.size_bytes = 0
+        self.started_at = None
+        return requests
+
+    def _flush_if_expired(self) -> None:
+        try:
+            with self.lock:
+                if self.is_expired():
+                    self.on_expired()
+        except Exception as exc:  # pylint: disable=broad-except
+            logger.debug(traceback.format_exc())
+            logger.warning(f"Error flushing the bulk buffer: {exc}")
+
+    def close(self) -> None:
+        if self.timer:
+            self.timer.stop()
 
 
 class MetadataRestSink(Sink[Entity]):
@@ -89,6 +175,18 @@ class MetadataRestSink(Sink[Entity]):
         self.role_entities = {}
         self.team_entities = {}
 
+        self.bulk_buffer = CreateRequestBuffer(
+            flush_interval_seconds=self.config.bulk_flush_interval_seconds,
+            on_expired=self.flush,
+        )
+
+        self.fingerprints: Optional[RequestFingerprintStore] = None
+        if self.config.fingerprint_location:
+            self.fingerprints = RequestFingerprintStore(
+                location=self.config.fingerprint_location,
+                ttl_seconds=self.config.fingerprint_ttl_seconds,
+            )
+
         # Prepare write record dispatching
         self.write_record = singledispatch(self.write_record)
         self.write_record.register(AddLineageRequest, self.write_lineage)
@@ -112,6 +210,14 @@ class MetadataRestSink(Sink[Entity]):
         )
         self.write_record.register(OMetaTopicSampleData, self.write_topic_sample_data)
 
+        if self.is_bulk_enabled:
+            self._dispatch_record = self.write_record
+            self.write_record = self._write_record_in_order
+
+    @property
+    def is_bulk_enabled(self) -> bool:
+        return self.config.bulk_size > 1
+
     @classmethod
     def create(cls, config_dict: dict, metadata_config: OpenMetadataConnection):
         config = MetadataRestSinkConfig.parse_obj(config_dict)
@@ -126,18 +232,102 @@ class MetadataRestSink(Sink[Entity]):
         logger.debug(f"Processing Create request {type(record)}")
         self.write_create_request(record)
 
+    def _write_record_in_order(self, record: Entity) -> None:
+        """
+        Any record that is not a create request, e.g., lineage or
+        table constraints, might depend on the entities we are
+        buffering. Flush them first.
+        """
+        if self._dispatch_record.dispatch(type(record)) is not (
+            self._dispatch_record.dispatch(object)
+        ):
+            self.flush()
+        self._dispatch_record(record)
+
+    def _buffer_create_request(self, entity_request) -> None:
+        """
+        Add the request to the bulk buffer and flush it if we reach any limit.
+
+        A request of a different type flushes the buffer first, so that
+        parents, e.g., schemas, are always created before their children.
+        :param entity_request: Create Entity request
+        """
+        with self.bulk_buffer.lock:
+            if self.bulk_buffer.requests and type(entity_request) is not type(
+                self.bulk_buffer.requests[0]
+            ):
+                self.flush()
+
+            if entity_request in self.bulk_buffer:
+                # The same entity is sent again, let the last version win in order
+                self.flush()
+
+            self.bulk_buffer.add(entity_request)
+
+            if (
+                len(self.bulk_buffer.requests) >= self.config.bulk_size
+                or self.bulk_buffer.size_bytes >= self.config.bulk_max_bytes
+                or self.bulk_buffer.is_expired()
+            ):
+                self.flush()
+
+    def flush(self) -> None:
+        """
+        Send the buffered create requests in bulk and report
+        the result of each of them
+        """
+        with self.bulk_buffer.lock:
+            if not self.bulk_buffer.requests:
+                return
+
+            results = self.metadata.bulk_create_or_update(
+                self.bulk_buffer.pop_all(), max_workers=self.config.bulk_max_workers
+            )
+            for result in results:
+                self._report_bulk_result(result)
+
+    def _report_bulk_result(self, result: BulkResult) -> None:
+        log = f"{type(result.request).__name__} [{result.request.name.__root__}]"
+        if result.entity:
+            self.status.records_written(
+                f"{type(result.entity).__name__}: {result.entity.fullyQualifiedName.__root__}"
+            )
+            if self.fingerprints:
+                self.fingerprints.put(
+                    result.request, result.entity.fullyQualifiedName.__root__
+                )
+            logger.debug(f"Successfully ingested {log}")
+        else:
+            error = f"Failed to ingest {log}: {result.error}"
+            logger.warning(error)
+            self.status.failed(log, error, result.stack_trace)
+
     def write_create_request(self, entity_request) -> None:
         """
         Send to OM the request creation received as is.
+        Requests equal to the last one we sent for the entity are skipped.
         :param entity_request: Create Entity request
         """
         log = f"{type(entity_request).__name__} [{entity_request.name.__root__}]"
+        if self.fingerprints and self.fingerprints.is_unchanged(entity_request):
+            self.status.skipped(log)
+            logger.debug(f"Skipping unchanged {log}")
+            return
+
+        if self.is_bulk_enabled:
+            self._buffer_create_request(entity_request)
+            return
+
         try:
             created = self.metadata.create_or_update(entity_request)
             if created:
                 self.status.records_written(
                     f"{type(created).__name__}: {created.fullyQualifiedName.__root__}"
                 )
+                if self.fingerprints:
+                    self.fingerprints.put(
+                        entity_request, created.fullyQualifiedName.__root__
+                    )
                 logger.debug(f"Successfully ingested {log}")
             else:
                 error = f"Failed to ingest {log}"
@@ -333,6 +523,8 @@ class MetadataRestSink(Sink[Entity]):
                 entity_id=record.entity.id,
                 recursive=record.mark_deleted_entities,
             )
+            if self.fingerprints:
+                self.fingerprints.invalidate(record.entity.fullyQualifiedName.__root__)
             logger.debug(
                 f"{record.entity.name} doesn't exist in source state, marking it as deleted"
             )
@@ -488,4 +680,11 @@ class MetadataRestSink(Sink[Entity]):
             )
 
     def close(self):
-        pass
+        self.bulk_buffer.close()
+        self.flush()
+        if self.fingerprints:
+            self.fingerprints.close()
+            logger.info(
+                f"Records written: {len(self.status.records)},"
+                f" unchanged create requests skipped: {len(self.status.skipped_records)}"
+            )
@@ -0,0 +1,185 @@
+#  Copyright 2021 Collate
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#  http://www.apache.org/licenses/LICENSE-2.0
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+"""
+Fingerprints of the create requests sent to OM.
+
+Most of the entities of a metadata run are the same as in the previous one.
+We keep a hash of each create request that was successfully written,
+so that the sink can skip the PUTs that would not change anything.
+Fingerprints are persisted in a SQLite file and expire after a while,
+so that entities are periodically sent again, e.g., if they were
+deleted from OM by a user. Entities deleted by the ingestion drop their
+fingerprints and the ones of their children right away.
+"""
+import hashlib
+import sqlite3
+import threading
+import time
+import traceback
+from typing import Optional
+
+from pydantic import BaseModel
+
+from metadata.utils.logger import ingestion_logger
+
+logger = ingestion_logger()
+
+# Fields pointing to the parent entity of the create requests
+PARENT_FIELDS = (
+    "service",
+    "database",
+    "databaseSchema",
+    "parent",
+    "glossary",
+    "classification",
+)
+COMMIT_EVERY = 1000
+
+
+def _key_part(value) -> str:
+    """FQN strings and names are root models, references are identified by id"""
+    if hasattr(value, "__root__"):
+        return str(value.__root__)
+    if hasattr(value, "id"):
+        return _key_part(value.id)
+    return str(value)
+
+
+def request_key(request: BaseModel) -> str:
+    """
+    Identify the entity of the request by its type, parent and name,
+    e.g., `CreateTableRequest:service.db.schema:table`
+    """
+    parents = [
+        _key_part(getattr(request, field))
+        for field in PARENT_FIELDS
+        if getattr(request, field, None) is not None
+    ]
+    return ":".join([type(request).__name__, *parents, _key_part(request.name)])
+
+
+def request_fingerprint(request: BaseModel) -> str:
+    return hashlib.sha256(
+        request.json(sort_keys=True, exclude_none=True).encode("utf-8")
+    ).hexdigest()
+
+
+class RequestFingerprintStore:
+    """
+    Fingerprint of the last successful request of each entity,
+    stored in a SQLite file with the FQN of the entity.
+
+    The bulk buffer timer thread writes fingerprints when it flushes the
+    requests, so the connection is shared between threads behind a lock.
+    """
+
+    def __init__(self, location: str, ttl_seconds: float):
+        self.location = location
+        self.ttl_seconds = ttl_seconds
+        self.pending = 0
+        self.connection: Optional[sqlite3.Connection] = None
+        self._lock = threading.Lock()
+        try:
+            self.connection = sqlite3.connect(
+                location, timeout=30, check_same_thread=False
+            )
+            self.connection.execute(
+                "CREATE TABLE IF NOT EXISTS entity_fingerprints "
+                "(key TEXT PRIMARY KEY, entity_fqn TEXT, fingerprint TEXT, updated_at REAL)"
+            )
+            self.connection.execute(
+                "CREATE INDEX IF NOT EXISTS entity_fingerprints_fqn "
+                "ON entity_fingerprints (entity_fqn)"
+            )
+            self.connection.commit()
+        except Exception as exc:  # pylint: disable=broad-except
+            logger.debug(traceback.format_exc())
+            logger.warning(
+                f"Could not open the request fingerprints file, all requests will be sent: {exc}"
+            )
+            self.connection = None
+
+    def is_unchanged(self, request: BaseModel) -> bool:
+        """
+        Check if the same request was successfully sent before the TTL expired
+        """
+        if self.connection is None:
+            return False
+        try:
+            with self._lock:
+                row = self.connection.execute(
+                    "SELECT fingerprint, updated_at FROM entity_fingerprints WHERE key = ?",
+                    (request_key(request),),
+                ).fetchone()
+        except Exception as exc:  # pylint: disable=broad-except
+            logger.debug(traceback.format_exc())
+            logger.warning(f"Error reading the request fingerprints: {exc}")
+            return False
+        return (
+            row is not None
+            and row[0] == request_fingerprint(request)
+            and time.time() - row[1] < self.ttl_seconds
+        )
+
+    def put(self, request: BaseModel, entity_fqn: str) -> None:
+        """
+        Keep the fingerprint of a request OM accepted
+        """
+        self._write(
+            "INSERT OR REPLACE INTO entity_fingerprints VALUES (?, ?, ?, ?)",
+            (
+                request_key(request),
+                entity_fqn,
+                request_fingerprint(request),
+                time.time(),
+            ),
+        )
+
+    def invalidate(self, entity_fqn: str) -> None:
+        """
+        Drop the fingerprints of a deleted entity and its children,
+        so that they are sent again if they come back to the source
+        """
+        children = f"{entity_fqn}."
+        self._write(
+            "DELETE FROM entity_fingerprints WHERE entity_fqn = ? "
+            "OR substr(entity_fqn, 1, length(?)) = ?",
+            (entity_fqn, children, children),
+        )
+
+    def _write(self, statement: str, parameters: tuple) -> None:
+        try:
+            with self._lock:
+                if self.connection is None:
+                    return
+                self.connection.execute(statement, parameters)
+                self.pending += 1
+                if self.pending >= COMMIT_EVERY:
+                    self._commit()
+        except Exception as exc:  # pylint: disable=broad-except
+            logger.debug(traceback.format_exc())
+            logger.warning(f"Error writing the request fingerprints: {exc}")
+
+    def _commit(self) -> None:
+        if self.connection is not None:
+            self.connection.commit()
+            self.pending = 0
+
+    def commit(self) -> None:
+        with self._lock:
+            self._commit()
+
+    def close(self) -> None:
+        with self._lock:
+            if self.connection is not None:
+                self._commit()
+                self.connection.close()
+                self.connection = None
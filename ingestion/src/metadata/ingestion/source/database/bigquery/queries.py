@@ -50,3 +50,10 @@ BIGQUERY_SCHEMA_DESCRIPTION = textwrap.dedent(
     and option_value is not null
     """
 )
+
+BIGQUERY_TABLE_WATERMARKS = textwrap.dedent(
+    """
+    SELECT table_id AS table_name, last_modified_time
+    FROM `{schema_name}.__TABLES__`
+    """
+)
@@ -0,0 +1,179 @@
+#  Copyright 2021 Collate
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#  http://www.apache.org/licenses/LICENSE-2.0
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+"""
+Reflect the constraints of all the tables of a schema with a single
+catalog query, instead of asking the inspector for the primary key,
+unique constraints and foreign keys of each table.
+
+The queries return a row per constraint column, plus a row without
+constraint for each table of the schema, so that we know which tables
+have no constraints at all.
+"""
+import traceback
+from collections import defaultdict
+from types import SimpleNamespace
+from typing import Callable, Dict, Iterable, List, Optional, Set
+
+from sqlalchemy import text
+from sqlalchemy.engine.reflection import Inspector
+
+from metadata.ingestion.source.database.mysql.queries import MYSQL_SCHEMA_CONSTRAINTS
+from metadata.ingestion.source.database.oracle.queries import ORACLE_SCHEMA_CONSTRAINTS
+from metadata.ingestion.source.database.postgres.queries import (
+    POSTGRES_SCHEMA_CONSTRAINTS,
+)
+from metadata.utils.logger import ingestion_logger
+
+logger = ingestion_logger()
+
+PRIMARY_KEY = "p"
+UNIQUE = "u"
+FOREIGN_KEY = "f"
+
+NAME_FIELDS = (
+    "table_name",
+    "constraint_name",
+    "column_name",
+    "referred_schema",
+    "referred_table",
+    "referred_column",
+)
+
+
+class SchemaConstraints:
+    """
+    Constraints of the schema tables, in the same format
+    as the Inspector methods return them.
+
+    The catalog names are normalized as the dialect does when reflecting,
+    e.g., Oracle upper case names are returned in lower case.
+    """
+
+    def __init__(
+        self,
+        rows: Iterable,
+        normalize_name: Optional[Callable[[str], str]] = None,
+    ):
+        self._normalize_name = normalize_name
+        self._tables: Set[str] = set()
+        self._pk_constraints: Dict[str, dict] = {}
+        self._unique_constraints: Dict[str, List[dict]] = defaultdict(list)
+        self._foreign_keys: Dict[str, List[dict]] = defaultdict(list)
+
+        # Rows come sorted by table, constraint and position
+        constraints: Dict[tuple, dict] = {}
+        for row in map(self._normalize_row, rows):
+            self._tables.add(row.table_name)
+            if row.constraint_name is None:
+                continue
+            key = (row.table_name, row.constraint_name)
+            if key not in constraints:
+                constraints[key] = self._new_constraint(row)
+            constraint = constraints[key]
+            if row.constraint_type == UNIQUE:
+                constraint["column_names"].append(row.column_name)
+            else:
+                constraint["constrained_columns"].append(row.column_name)
+            if row.constraint_type == FOREIGN_KEY:
+                constraint["referred_columns"].append(row.referred_column)
+
+    def _normalize_row(self, row) -> SimpleNamespace:
+        names = {field: getattr(row, field) for field in NAME_FIELDS}
+        if self._normalize_name:
+            names = {
+                field: self._normalize_name(name) if name is not None else None
+                for field, name in names.items()
+            }
+        return SimpleNamespace(constraint_type=row.constraint_type, **names)
+
+    def has_table(self, table_name: str) -> bool:
+        """Check if the table was listed when reflecting the schema"""
+        return table_name in self._tables
+
+    def _new_constraint(self, row) -> dict:
+        if row.constraint_type == PRIMARY_KEY:
+            constraint = {"constrained_columns": [], "name": row.constraint_name}
+            self._pk_constraints[row.table_name] = constraint
+        elif row.constraint_type == UNIQUE:
+            constraint = {"column_names": [], "name": row.constraint_name}
+            self._unique_constraints[row.table_name].append(constraint)
+        else:
+            constraint = {
+                "name": row.constraint_name,
+                "constrained_columns": [],
+                "referred_schema": row.referred_schema,
+                "referred_table": row.referred_table,
+                "referred_columns": [],
+                "options": {},
+            }
+            self._foreign_keys[row.table_name].append(constraint)
+        return constraint
+
+    def get_pk_constraint(self, table_name: str) -> dict:
+        return self._pk_constraints.get(
+            table_name, {"constrained_columns": [], "name": None}
+        )
+
+    def get_unique_constraints(self, table_name: str) -> List[dict]:
+        return self._unique_constraints.get(table_name, [])
+
+    def get_foreign_keys(self, table_name: str) -> List[dict]:
+        return self._foreign_keys.get(table_name, [])
+
+
+class SchemaConstraintsFactory:
+    """
+    Factory returning the constraints of a schema based on dialect.
+    Dialects without a registered query keep reflecting table by table.
+    """
+
+    def __init__(self):
+        self._queries = {}
+
+    def register(self, dialect: str, query: str):
+        """Register the constraints query of a dialect"""
+        self._queries[dialect] = text(query)
+
+    def get_constraints(
+        self, inspector: Inspector, schema_name: str
+    ) -> Optional[SchemaConstraints]:
+        """
+        Run the catalog query for the schema. Returns None if the dialect
+        is not supported or the query fails, e.g., missing privileges.
+        """
+        dialect = getattr(inspector, "dialect", None)
+        query = self._queries.get(getattr(dialect, "name", None))
+        if query is None:
+            return None
+        normalize_name = None
+        if getattr(dialect, "requires_name_normalize", False):
+            normalize_name = dialect.normalize_name
+            schema_name = dialect.denormalize_name(schema_name)
+        try:
+            with inspector.bind.connect() as conn:
+                return SchemaConstraints(
+                    conn.execute(query, {"schema_name": schema_name}),
+                    normalize_name=normalize_name,
+                )
+        except Exception as exc:  # pylint: disable=broad-except
+            logger.debug(traceback.format_exc())
+            logger.warning(
+                f"Could not reflect the constraints of schema [{schema_name}] in bulk,"
+                f" falling back to table by table reflection: {exc}"
+            )
+        return None
+
+
+schema_constraints_factory = SchemaConstraintsFactory()
+schema_constraints_factory.register("postgresql", POSTGRES_SCHEMA_CONSTRAINTS)
+schema_constraints_factory.register("mysql", MYSQL_SCHEMA_CONSTRAINTS)
+schema_constraints_factory.register("mariadb", MYSQL_SCHEMA_CONSTRAINTS)
+schema_constraints_factory.register("oracle", ORACLE_SCHEMA_CONSTRAINTS)
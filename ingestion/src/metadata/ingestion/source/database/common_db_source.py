@@ -11,10 +11,11 @@
 """
 Generic source to build SQL connectors.
 """
+import hashlib
 import traceback
 from abc import ABC
 from copy import deepcopy
-from typing import Iterable, List, Optional, Tuple
+from typing import Dict, Iterable, List, Optional, Tuple
 
 from pydantic import BaseModel
 from sqlalchemy.engine import Connection
@@ -44,12 +45,18 @@ from metadata.generated.schema.metadataIngestion.databaseServiceMetadataPipeline
 from metadata.generated.schema.metadataIngestion.workflow import (
     Source as WorkflowSource,
 )
+from metadata.ingestion.api.common import Entity
 from metadata.ingestion.lineage.sql_lineage import get_column_fqn
 from metadata.ingestion.models.ometa_classification import OMetaTagAndClassification
 from metadata.ingestion.models.table_metadata import OMetaTableConstraints
+from metadata.ingestion.models.topology import NodeStage
 from metadata.ingestion.ometa.ometa_api import OpenMetadata
 from metadata.ingestion.source.connections import get_connection
 from metadata.ingestion.source.database.database_service import DatabaseServiceSource
+from metadata.ingestion.source.database.incremental import (
+    IncrementalState,
+    table_watermark_factory,
+)
 from metadata.ingestion.source.database.sql_column_handler import SqlColumnHandlerMixin
 from metadata.ingestion.source.database.sqlalchemy_source import SqlAlchemySource
 from metadata.ingestion.source.models import TableView
@@ -107,6 +114,17 @@ class CommonDbSourceService(
         self.database_source_state = set()
         self.context.table_views = []
         self.context.table_constrains = []
+
+        self.incremental_state: Optional[IncrementalState] = None
+        if self.source_config.incrementalStateLocation:
+            self.incremental_state = IncrementalState(
+                location=self.source_config.incrementalStateLocation,
+                config_fingerprint=hashlib.sha256(
+                    self.source_config.json(sort_keys=True).encode()
+                ).hexdigest(),
+            )
+        self._table_watermarks_key: Optional[Tuple[Inspector, str]] = None
+        self._table_watermarks: Dict[str, str] = {}
         super().__init__()
 
     def set_inspector(self, database_name: str) -> None:
@@ -263,6 +281,8 @@ class CommonDbSourceService(
                             "Table Filtered Out",
                         )
                         continue
+                    if self.is_table_unchanged(schema_name, table_name, table_fqn):
+                        continue
                     yield table_name, table_and_type.type_
 
             if self.source_config.includeViews:
@@ -288,13 +308,75 @@ class CommonDbSourceService(
                             "Table Filtered Out",
                         )
                         continue
+                    if self.is_table_unchanged(schema_name, view_name, view_fqn):
+                        continue
                     yield view_name, TableType.View
+
+            if self.incremental_state:
+                self.incremental_state.visit_schema(
+                    self.context.database_schema.fullyQualifiedName.__root__
+                )
         except Exception as err:
             logger.warning(
                 f"Fetching tables names failed for schema {schema_name} due to - {err}"
             )
             logger.debug(traceback.format_exc())
 
+    def get_table_watermark(self, schema_name: str, table_name: str) -> Optional[str]:
+        """
+        Watermark of the table in the source. We get the
+        ones of all the schema tables at once.
+        """
+        key = (self.inspector, schema_name)
+        if self._table_watermarks_key != key:
+            self._table_watermarks_key = key
+            self._table_watermarks = (
+                table_watermark_factory.get_watermarks(self.inspector, schema_name)
+                or {}
+            )
+        return self._table_watermarks.get(table_name)
+
+    def is_table_unchanged(
+        self, schema_name: str, table_name: str, table_fqn: str
+    ) -> bool:
+        """
+        When running incrementally, check if the table did not change since the
+        previous run. Unchanged tables are still part of the source state,
+        so that they are not marked as deleted.
+        """
+        if not self.incremental_state:
+            return False
+        if self.incremental_state.is_unchanged(
+            table_fqn, self.get_table_watermark(schema_name, table_name)
+        ):
+            logger.debug(f"Skipping unchanged table [{table_fqn}]")
+            self.database_source_state.add(table_fqn)
+            return True
+        return False
+
+    def register_record(self, table_request: CreateTableRequest) -> None:
+        super().register_record(table_request)
+        if self.incremental_state:
+            schema_name = self.context.database_schema.name.__root__
+            table_fqn = fqn.build(
+                self.metadata,
+                entity_type=Table,
+                service_name=self.context.database_service.name.__root__,
+                database_name=self.context.database.name.__root__,
+                schema_name=schema_name,
+                table_name=table_request.name.__root__,
+                skip_es_search=True,
+            )
+            self.incremental_state.add_pending(
+                table_fqn,
+                self.get_table_watermark(schema_name, table_request.name.__root__),
+            )
+
+    def on_entity_ack(self, stage: NodeStage, entity: Entity) -> None:
+        """Tables keep their watermark once the sink stored them"""
+        if self.incremental_state and stage.type_ == Table:
+            self.incremental_state.confirm(entity.fullyQualifiedName.__root__)
+
     def get_view_definition(
         self, table_type: str, table_name: str, schema_name: str, inspector: Inspector
     ) -> Optional[str]:
@@ -490,6 +572,8 @@ class CommonDbSourceService(
         return self._connection
 
     def close(self):
+        if self.incremental_state:
+            self.incremental_state.save()
         if self.connection is not None:
             self.connection.close()
         self.engine.dispose()
@@ -63,7 +63,7 @@ from metadata.utils.constants import DEFAULT_DATABASE
 from metadata.utils.datalake.datalake_utils import (
     COMPLEX_COLUMN_SEPARATOR,
     SUPPORTED_TYPES,
-    fetch_dataframe,
+    fetch_dataframe_schema,
 )
 from metadata.utils.filters import filter_by_schema, filter_by_table
 from metadata.utils.logger import ingestion_logger
@@ -377,16 +377,20 @@ class DatalakeSource(DatabaseServiceSource):
         try:
             table_constraints = None
             connection_args = self.service_connection.configSource.securityConfig
-            data_frame = fetch_dataframe(
+            schema_wrapper = fetch_dataframe_schema(
                 config_source=self.service_connection.configSource,
                 client=self.client,
                 file_fqn=DatalakeTableSchemaWrapper(
                     key=table_name,
                     bucket_name=schema_name,
                 ),
+                use_avro_schema=self.service_connection.useAvroSchema,
                 connection_kwargs=connection_args,
             )
-            columns = self.get_columns(data_frame[0])
+            if schema_wrapper:
+                columns = schema_wrapper.columns or self.get_columns(
+                    schema_wrapper.dataframes
+                )
             if columns:
                 table_request = CreateTableRequest(
                     name=table_name,
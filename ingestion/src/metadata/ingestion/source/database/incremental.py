@@ -0,0 +1,222 @@
+#  Copyright 2021 Collate
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#  http://www.apache.org/licenses/LICENSE-2.0
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+"""
+Incremental metadata extraction.
+
+Each table gets a watermark from the source catalog: a hash of its last
+change timestamp where the source keeps one, or of its definition otherwise.
+Watermarks are kept in a state file between runs, so that we only
+reflect the tables whose watermark changed since the previous run.
+
+Snowflake LAST_ALTERED and BigQuery last_modified_time are also updated
+by DML statements, not only by DDL ones. Tables receiving writes between
+runs are then extracted again even if their definition did not change.
+"""
+import hashlib
+import json
+import os
+import traceback
+from collections import defaultdict
+from typing import Callable, Dict, Iterable, Optional, Set
+
+from sqlalchemy import text
+from sqlalchemy.engine import Connection
+from sqlalchemy.engine.reflection import Inspector
+
+from metadata.ingestion.source.database.bigquery.queries import (
+    BIGQUERY_TABLE_WATERMARKS,
+)
+from metadata.ingestion.source.database.postgres.queries import (
+    POSTGRES_TABLE_WATERMARKS,
+)
+from metadata.ingestion.source.database.redshift.queries import (
+    REDSHIFT_TABLE_WATERMARKS,
+)
+from metadata.ingestion.source.database.snowflake.queries import (
+    SNOWFLAKE_TABLE_WATERMARKS,
+)
+from metadata.utils import fqn
+from metadata.utils.logger import ingestion_logger
+
+logger = ingestion_logger()
+
+
+def hash_table_rows(rows: Iterable) -> Dict[str, str]:
+    """
+    Hash the catalog rows of each table. The first value of
+    the rows is the table name, the order of the rows does not matter.
+    """
+    table_rows = defaultdict(list)
+    for table_name, *values in rows:
+        table_rows[table_name].append(repr(values))
+    return {
+        table_name: hashlib.sha256("\n".join(sorted(values)).encode()).hexdigest()
+        for table_name, values in table_rows.items()
+    }
+
+
+def _catalog_watermarks(query: str) -> Callable:
+    """Build a watermarks function running the catalog query for the schema"""
+
+    def watermarks(connection: Connection, schema_name: str) -> Iterable:
+        return connection.execute(text(query), {"schema_name": schema_name})
+
+    return watermarks
+
+
+def bigquery_watermarks(connection: Connection, schema_name: str) -> Iterable:
+    """BigQuery keeps the last modification time in the dataset __TABLES__"""
+    return connection.execute(
+        text(BIGQUERY_TABLE_WATERMARKS.format(schema_name=schema_name))
+    )
+
+
+class TableWatermarkFactory:
+    """
+    Factory returning the watermarks of the tables of a schema based on dialect.
+    Dialects without a registered function are always fully extracted.
+    """
+
+    def __init__(self):
+        self._watermarks = {}
+
+    def register(self, dialect: str, watermarks: Callable):
+        """Register the watermarks function of a dialect"""
+        self._watermarks[dialect] = watermarks
+
+    def get_watermarks(
+        self, inspector: Inspector, schema_name: str
+    ) -> Optional[Dict[str, str]]:
+        """
+        Watermarks by table name. Returns None if the dialect
+        is not supported or the catalog query fails.
+        """
+        dialect = inspector.dialect
+        watermarks = self._watermarks.get(dialect.name)
+        if watermarks is None:
+            return None
+        try:
+            if dialect.requires_name_normalize:
+                schema_name = dialect.denormalize_name(schema_name)
+            with inspector.bind.connect() as conn:
+                rows = watermarks(conn, schema_name)
+                table_watermarks = hash_table_rows(rows)
+            if dialect.requires_name_normalize:
+                return {
+                    dialect.normalize_name(table_name): watermark
+                    for table_name, watermark in table_watermarks.items()
+                }
+            return table_watermarks
+        except Exception as exc:  # pylint: disable=broad-except
+            logger.debug(traceback.format_exc())
+            logger.warning(
+                f"Could not get the table watermarks of schema [{schema_name}],"
+                f" all its tables will be extracted: {exc}"
+            )
+        return None
+
+
+table_watermark_factory = TableWatermarkFactory()
+table_watermark_factory.register(
+    "snowflake", _catalog_watermarks(SNOWFLAKE_TABLE_WATERMARKS)
+)
+table_watermark_factory.register("bigquery", bigquery_watermarks)
+table_watermark_factory.register(
+    "postgresql", _catalog_watermarks(POSTGRES_TABLE_WATERMARKS)
+)
+table_watermark_factory.register(
+    "redshift", _catalog_watermarks(REDSHIFT_TABLE_WATERMARKS)
+)
+
+
+def _get_schema_fqn(table_fqn: str) -> str:
+    return fqn._build(*fqn.split(table_fqn)[:-1])  # pylint: disable=protected-access
+
+
+class IncrementalState:
+    """
+    Table watermarks by FQN, read from the state file of the previous
+    run. The state is discarded if the pipeline configuration changed,
+    e.g., including the tags, as unchanged tables would miss it.
+
+    The watermarks of the extracted tables are pending until the
+    sink stores them, so that failed tables are extracted again.
+    """
+
+    def __init__(self, location: str, config_fingerprint: str):
+        self.location = location
+        self.config_fingerprint = config_fingerprint
+        self.previous: Dict[str, str] = {}
+        self.pending: Dict[str, str] = {}
+        self.current: Dict[str, str] = {}
+        # Schemas whose tables were all listed in this run
+        self.visited_schemas: Set[str] = set()
+
+        if os.path.exists(location):
+            try:
+                with open(location, encoding="utf-8") as file:
+                    state = json.load(file)
+                if state.get("config") == config_fingerprint:
+                    self.previous = state.get("tables", {})
+                else:
+                    logger.info(
+                        "The pipeline configuration changed, all tables will be extracted"
+                    )
+            except Exception as exc:  # pylint: disable=broad-except
+                logger.debug(traceback.format_exc())
+                logger.warning(f"Could not read the incremental state file: {exc}")
+
+    def is_unchanged(self, table_fqn: str, watermark: Optional[str]) -> bool:
+        """
+        Check if the table has not changed since the previous run, keeping
+        its watermark for the next one
+        """
+        if watermark is not None and self.previous.get(table_fqn) == watermark:
+            self.current[table_fqn] = watermark
+            return True
+        # Only extracted tables get a new watermark
+        self.previous.pop(table_fqn, None)
+        return False
+
+    def add_pending(self, table_fqn: str, watermark: Optional[str]) -> None:
+        """Keep the watermark of an extracted table until the sink stores it"""
+        if watermark is not None:
+            self.pending[table_fqn] = watermark
+
+    def confirm(self, table_fqn: str) -> None:
+        """The table is stored in OM, its watermark is kept for the next run"""
+        if table_fqn in self.pending:
+            self.current[table_fqn] = self.pending.pop(table_fqn)
+
+    def visit_schema(self, schema_fqn: str) -> None:
+        self.visited_schemas.add(schema_fqn)
+
+    def save(self) -> None:
+        """
+        Write the state of the tables of this run. Tables we did not see
+        keep their previous watermark if their schema was not listed, e.g.,
+        the run failed before reaching it. The ones from the listed schemas
+        were dropped. Pending watermarks are from tables the sink failed.
+        """
+        tables = {
+            table_fqn: watermark
+            for table_fqn, watermark in self.previous.items()
+            if _get_schema_fqn(table_fqn) not in self.visited_schemas
+        }
+        tables.update(self.current)
+        tmp_location = f"{self.location}.tmp"
+        try:
+            with open(tmp_location, "w", encoding="utf-8") as file:
+                json.dump({"config": self.config_fingerprint, "tables": tables}, file)
+            os.replace(tmp_location, self.location)
+        except Exception as exc:  # pylint: disable=broad-except
+            logger.debug(traceback.format_exc())
+            logger.warning(f"Could not write the incremental state file: {exc}")
@@ -0,0 +1,41 @@
+#  Copyright 2021 Collate
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#  http://www.apache.org/licenses/LICENSE-2.0
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+"""
+SQL Queries used during ingestion
+"""
+
+MYSQL_SCHEMA_CONSTRAINTS = """
+SELECT
+    kcu.TABLE_NAME AS table_name,
+    kcu.CONSTRAINT_NAME AS constraint_name,
+    CASE tc.CONSTRAINT_TYPE
+        WHEN 'PRIMARY KEY' THEN 'p'
+        WHEN 'UNIQUE' THEN 'u'
+        ELSE 'f'
+    END AS constraint_type,
+    kcu.COLUMN_NAME AS column_name,
+    kcu.REFERENCED_TABLE_SCHEMA AS referred_schema,
+    kcu.REFERENCED_TABLE_NAME AS referred_table,
+    kcu.REFERENCED_COLUMN_NAME AS referred_column,
+    kcu.ORDINAL_POSITION AS position
+FROM information_schema.KEY_COLUMN_USAGE kcu
+JOIN information_schema.TABLE_CONSTRAINTS tc
+    ON tc.CONSTRAINT_SCHEMA = kcu.CONSTRAINT_SCHEMA
+    AND tc.TABLE_NAME = kcu.TABLE_NAME
+    AND tc.CONSTRAINT_NAME = kcu.CONSTRAINT_NAME
+WHERE kcu.TABLE_SCHEMA = :schema_name
+AND tc.CONSTRAINT_TYPE IN ('PRIMARY KEY', 'UNIQUE', 'FOREIGN KEY')
+UNION ALL
+SELECT TABLE_NAME, NULL, NULL, NULL, NULL, NULL, NULL, NULL
+FROM information_schema.TABLES
+WHERE TABLE_SCHEMA = :schema_name
+ORDER BY table_name, constraint_name, position
+"""
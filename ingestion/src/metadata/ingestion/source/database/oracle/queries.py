@@ -83,3 +83,38 @@ ORACLE_GET_COLUMNS = """
         WHERE col.table_name = CAST(:table_name AS VARCHAR2(128))
         AND col.hidden_column = 'NO'
     """
+
+ORACLE_SCHEMA_CONSTRAINTS = """
+SELECT
+    c.table_name "table_name",
+    c.constraint_name "constraint_name",
+    DECODE(c.constraint_type, 'P', 'p', 'U', 'u', 'R', 'f') "constraint_type",
+    cc.column_name "column_name",
+    rc.owner "referred_schema",
+    rc.table_name "referred_table",
+    rcc.column_name "referred_column",
+    cc.position "position"
+FROM all_constraints c
+JOIN all_cons_columns cc
+    ON cc.owner = c.owner
+    AND cc.constraint_name = c.constraint_name
+    AND cc.table_name = c.table_name
+LEFT JOIN all_constraints rc
+    ON rc.owner = c.r_owner
+    AND rc.constraint_name = c.r_constraint_name
+LEFT JOIN all_cons_columns rcc
+    ON rcc.owner = rc.owner
+    AND rcc.constraint_name = rc.constraint_name
+    AND rcc.position = cc.position
+WHERE c.owner = :schema_name
+AND c.constraint_type IN ('P', 'U', 'R')
+UNION ALL
+SELECT table_name, NULL, NULL, NULL, NULL, NULL, NULL, NULL
+FROM all_tables
+WHERE owner = :schema_name
+UNION ALL
+SELECT view_name, NULL, NULL, NULL, NULL, NULL, NULL, NULL
+FROM all_views
+WHERE owner = :schema_name
+ORDER BY "table_name", "constraint_name", "position"
+"""
@@ -186,3 +186,64 @@ POSTGRES_SQL_COLUMNS = """
 POSTGRES_GET_SERVER_VERSION = """
 show server_version
 """
+
+POSTGRES_SCHEMA_CONSTRAINTS = """
+SELECT
+    c.relname AS table_name,
+    con.conname AS constraint_name,
+    con.contype AS constraint_type,
+    a.attname AS column_name,
+    rn.nspname AS referred_schema,
+    rc.relname AS referred_table,
+    ra.attname AS referred_column,
+    k.position AS position
+FROM pg_catalog.pg_constraint con
+JOIN pg_catalog.pg_class c ON c.oid = con.conrelid
+JOIN pg_catalog.pg_namespace n ON n.oid = c.relnamespace
+CROSS JOIN LATERAL unnest(con.conkey, con.confkey)
+    WITH ORDINALITY AS k(attnum, referred_attnum, position)
+JOIN pg_catalog.pg_attribute a ON a.attrelid = con.conrelid AND a.attnum = k.attnum
+LEFT JOIN pg_catalog.pg_class rc ON rc.oid = con.confrelid
+LEFT JOIN pg_catalog.pg_namespace rn ON rn.oid = rc.relnamespace
+LEFT JOIN pg_catalog.pg_attribute ra
+    ON ra.attrelid = con.confrelid AND ra.attnum = k.referred_attnum
+WHERE n.nspname = :schema_name
+AND con.contype IN ('p', 'u', 'f')
+UNION ALL
+SELECT c.relname, NULL, NULL, NULL, NULL, NULL, NULL, NULL
+FROM pg_catalog.pg_class c
+JOIN pg_catalog.pg_namespace n ON n.oid = c.relnamespace
+WHERE n.nspname = :schema_name
+AND c.relkind IN ('r', 'p', 'v', 'm', 'f')
+ORDER BY table_name, constraint_name, position
+"""
+
+POSTGRES_TABLE_WATERMARKS = """
+SELECT
+    c.relname AS table_name,
+    a.attname,
+    pg_catalog.format_type(a.atttypid, a.atttypmod),
+    a.attnotnull,
+    pg_catalog.col_description(c.oid, a.attnum),
+    pg_catalog.obj_description(c.oid, 'pg_class'),
+    CASE WHEN c.relkind IN ('v', 'm') THEN pg_catalog.pg_get_viewdef(c.oid) END
+FROM pg_catalog.pg_class c
+JOIN pg_catalog.pg_namespace n ON n.oid = c.relnamespace
+JOIN pg_catalog.pg_attribute a
+    ON a.attrelid = c.oid AND a.attnum > 0 AND NOT a.attisdropped
+WHERE n.nspname = :schema_name
+AND c.relkind IN ('r', 'v', 'm', 'p', 'f')
+UNION ALL
+SELECT
+    c.relname AS table_name,
+    con.conname,
+    pg_catalog.pg_get_constraintdef(con.oid),
+    NULL,
+    NULL,
+    NULL,
+    NULL
+FROM pg_catalog.pg_constraint con
+JOIN pg_catalog.pg_class c ON c.oid = con.conrelid
+JOIN pg_catalog.pg_namespace n ON n.oid = c.relnamespace
+WHERE n.nspname = :schema_name
+"""
@@ -24,6 +24,8 @@ from metadata.generated.schema.metadataIngestion.workflow import (
 )
 from metadata.generated.schema.type.tableQuery import TableQuery
 from metadata.ingestion.api.source import Source
+from metadata.ingestion.lineage.parse_cache import parse_cache
+from metadata.ingestion.lineage.parser_selection import parser_selector
 from metadata.ingestion.ometa.ometa_api import OpenMetadata
 from metadata.ingestion.source.connections import get_connection, get_test_connection_fn
 from metadata.utils.helpers import get_start_and_end
@@ -60,6 +62,7 @@ class QueryParserSource(Source[Union[TableQuery, AddLineageRequest]], ABC):
         self.service_connection = self.config.serviceConnection.__root__.config
         self.source_config = self.config.sourceConfig.config
         self.start, self.end = get_start_and_end(self.source_config.queryLogDuration)
+        parse_cache.configure(self.source_config.parseCacheLocation)
         self.engine = get_connection(self.service_connection) if get_engine else None
 
     def prepare(self):
@@ -109,8 +112,11 @@ class QueryParserSource(Source[Union[TableQuery, AddLineageRequest]], ABC):
 
     def close(self):
         """
-        By default, there is nothing to close
+        Close the lineage parse cache file, and
+        share the lineage parser selection stats.
         """
+        parse_cache.close()
+        logger.debug(f"Lineage parser selection stats: {parser_selector.get_stats()}")
 
     def test_connection(self) -> None:
         test_connection_fn = get_test_connection_fn(self.service_connection)
@@ -274,3 +274,55 @@ REDSHIFT_GET_ALL_RELATIONS = """
     where 1 {schema_clause} {table_clause}
     ORDER BY "relkind", "schema_oid", "schema";
     """
+
+REDSHIFT_TABLE_WATERMARKS = """
+SELECT
+    c.table_name,
+    c.column_name,
+    c.data_type,
+    c.character_maximum_length,
+    c.numeric_precision,
+    c.numeric_scale,
+    c.remarks
+FROM svv_columns c
+WHERE c.table_schema = :schema_name
+UNION ALL
+SELECT
+    c.relname AS table_name,
+    NULL,
+    NULL,
+    NULL,
+    NULL,
+    NULL,
+    d.description
+FROM pg_catalog.pg_class c
+JOIN pg_catalog.pg_namespace n ON n.oid = c.relnamespace
+JOIN pg_catalog.pg_description d ON d.objoid = c.oid AND d.objsubid = 0
+WHERE n.nspname = :schema_name
+UNION ALL
+SELECT
+    c.relname AS table_name,
+    NULL,
+    NULL,
+    NULL,
+    NULL,
+    NULL,
+    pg_catalog.pg_get_viewdef(c.oid, true)
+FROM pg_catalog.pg_class c
+JOIN pg_catalog.pg_namespace n ON n.oid = c.relnamespace
+WHERE n.nspname = :schema_name
+AND c.relkind IN ('v', 'm')
+UNION ALL
+SELECT
+    c.relname AS table_name,
+    con.conname,
+    pg_catalog.pg_get_constraintdef(con.oid, true),
+    NULL,
+    NULL,
+    NULL,
+    NULL
+FROM pg_catalog.pg_constraint con
+JOIN pg_catalog.pg_class c ON c.oid = con.conrelid
+JOIN pg_catalog.pg_namespace n ON n.oid = c.relnamespace
+WHERE n.nspname = :schema_name
+"""
@@ -131,3 +131,9 @@ SELECT /* sqlalchemy:_get_schema_columns */
     WHERE ic.table_schema=:table_schema
     ORDER BY ic.ordinal_position
 """
+
+SNOWFLAKE_TABLE_WATERMARKS = """
+SELECT TABLE_NAME AS table_name, LAST_ALTERED AS last_altered
+FROM information_schema.tables
+WHERE TABLE_SCHEMA = :schema_name
+"""
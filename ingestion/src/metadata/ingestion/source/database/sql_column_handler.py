@@ -24,6 +24,10 @@ from metadata.generated.schema.entity.data.table import (
     DataType,
     TableConstraint,
 )
+from metadata.ingestion.source.database.bulk_reflection import (
+    SchemaConstraints,
+    schema_constraints_factory,
+)
 from metadata.ingestion.source.database.column_type_parser import ColumnTypeParser
 from metadata.utils.helpers import clean_up_starting_ending_double_quotes_in_string
 from metadata.utils.logger import ingestion_logger
@@ -36,6 +40,9 @@ class SqlColumnHandlerMixin:
     Mixin class to handle sql source columns
     """
 
+    _schema_constraints_key: Optional[Tuple[Inspector, str]] = None
+    _schema_constraints: Optional[SchemaConstraints] = None
+
     def fetch_column_tags(  # pylint: disable=unused-argument
         self, column: dict, col_obj: Column
     ) -> None:
@@ -106,10 +113,25 @@ class SqlColumnHandlerMixin:
             data_type_display = data_type_display or column.get("display_type")
         return data_type_display, arr_data_type, parsed_string
 
+    def _get_schema_constraints(
+        self, schema_name: str, inspector: Inspector
+    ) -> Optional[SchemaConstraints]:
+        """
+        Constraints of all the schema tables, reflected once
+        per schema and inspector if the dialect supports it
+        """
+        key = (inspector, schema_name)
+        if self._schema_constraints_key != key:
+            self._schema_constraints_key = key
+            self._schema_constraints = schema_constraints_factory.get_constraints(
+                inspector, schema_name
+            )
+        return self._schema_constraints
+
     @staticmethod
-    def _get_columns_with_constraints(
+    def _reflect_table_constraints(
         schema_name: str, table_name: str, inspector: Inspector
-    ) -> Tuple[List, List, List]:
+    ) -> Tuple[dict, List, List]:
         pk_constraints = inspector.get_pk_constraint(table_name, schema_name)
         try:
             unique_constraints = inspector.get_unique_constraints(
@@ -127,6 +149,24 @@ class SqlColumnHandlerMixin:
                 "Cannot obtain foreign constraints for table [{schema_name}.{table_name}]: NotImplementedError"
             )
             foreign_constraints = []
+        return pk_constraints, unique_constraints, foreign_constraints
+
+    def _get_columns_with_constraints(
+        self, schema_name: str, table_name: str, inspector: Inspector
+    ) -> Tuple[List, List, List]:
+        schema_constraints = self._get_schema_constraints(schema_name, inspector)
+        # Tables missing from the results, e.g., created after reflecting
+        # the schema, are reflected one by one
+        if schema_constraints and schema_constraints.has_table(table_name):
+            pk_constraints = schema_constraints.get_pk_constraint(table_name)
+            unique_constraints = schema_constraints.get_unique_constraints(table_name)
+            foreign_constraints = schema_constraints.get_foreign_keys(table_name)
+        else:
+            (
+                pk_constraints,
+                unique_constraints,
+                foreign_constraints,
+            ) = self._reflect_table_constraints(schema_name, table_name, inspector)
 
         pk_columns = (
             pk_constraints.get("constrained_columns")
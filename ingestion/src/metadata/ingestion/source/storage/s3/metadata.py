@@ -53,7 +53,7 @@ from metadata.ingestion.source.storage.s3.models import (
     S3ContainerDetails,
 )
 from metadata.ingestion.source.storage.storage_service import StorageServiceSource
-from metadata.utils.datalake.datalake_utils import fetch_dataframe
+from metadata.utils.datalake.datalake_utils import fetch_dataframe_first_chunk
 from metadata.utils.filters import filter_by_container
 from metadata.utils.logger import ingestion_logger
 
@@ -204,7 +204,7 @@ class S3Source(StorageServiceSource):
         Extract Column related metadata from s3
         """
         connection_args = self.service_connection.awsConfig
-        data_structure_details = fetch_dataframe(
+        data_structure_details = fetch_dataframe_first_chunk(
             config_source=S3Config(),
             client=self.s3_client,
             file_fqn=DatalakeTableSchemaWrapper(
@@ -215,8 +215,6 @@ class S3Source(StorageServiceSource):
         columns = []
         if isinstance(data_structure_details, DataFrame):
             columns = DatalakeSource.get_columns(data_structure_details)
-        if isinstance(data_structure_details, list) and data_structure_details:
-            columns = DatalakeSource.get_columns(data_structure_details[0])
         return columns
 
     def fetch_buckets(self) -> List[S3BucketResponse]:
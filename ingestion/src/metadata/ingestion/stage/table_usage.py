@@ -16,8 +16,10 @@ to be further processed by the BulkSink.
 import json
 import os
 import shutil
+import time
 import traceback
 from pathlib import Path
+from typing import List, Optional
 
 from metadata.config.common import ConfigModel
 from metadata.generated.schema.api.data.createQuery import CreateQueryRequest
@@ -27,16 +29,28 @@ from metadata.generated.schema.entity.services.connections.metadata.openMetadata
 from metadata.generated.schema.entity.teams.user import User
 from metadata.generated.schema.type.queryParserData import QueryParserData
 from metadata.generated.schema.type.tableUsageCount import TableUsageCount
-from metadata.ingestion.api.stage import Stage
+from metadata.ingestion.api.stage import Stage, StageStatus
 from metadata.ingestion.ometa.ometa_api import OpenMetadata
 from metadata.utils.constants import UTF_8
 from metadata.utils.logger import ingestion_logger
+from metadata.utils.lru_cache import TTLLRUCache
 
 logger = ingestion_logger()
 
 
 class TableStageConfig(ConfigModel):
     filename: str
+    # Users resolved from the query usernames
+    user_cache_size: int = 100_000
+    user_cache_ttl_seconds: int = 3600
+    # Usernames that are not OM users, kept apart so that they
+    # never evict the users we prefetched
+    unknown_user_cache_size: int = 10_000
+
+
+class TableUsageStageStatus(StageStatus):
+    user_cache_hits: int = 0
+    user_cache_misses: int = 0
 
 
 class TableUsageStage(Stage[QueryParserData]):
@@ -48,6 +62,7 @@ class TableUsageStage(Stage[QueryParserData]):
     """
 
     config: TableStageConfig
+    status: TableUsageStageStatus
 
     def __init__(
         self,
@@ -55,13 +70,27 @@ class TableUsageStage(Stage[QueryParserData]):
         metadata_config: OpenMetadataConnection,
     ):
         super().__init__()
+        self.status = TableUsageStageStatus()
         self.config = config
         self.metadata_config = metadata_config
         self.metadata = OpenMetadata(self.metadata_config)
         self.table_usage = {}
         self.table_queries = {}
 
+        # username -> user FQN
+        self.user_cache = TTLLRUCache(
+            capacity=self.config.user_cache_size,
+            ttl=self.config.user_cache_ttl_seconds,
+        )
+        # usernames that are not in OM
+        self.unknown_user_cache = TTLLRUCache(
+            capacity=self.config.unknown_user_cache_size,
+            ttl=self.config.user_cache_ttl_seconds,
+        )
+        self.users_prefetched_at: Optional[float] = None
+
         self.init_location()
+        self.prefetch_users()
 
         self.wrote_something = False
 
@@ -81,32 +110,77 @@ class TableUsageStage(Stage[QueryParserData]):
         logger.info(f"Creating the directory to store staging data in {location}")
         location.mkdir(parents=True, exist_ok=True)
 
-    def _get_user_entity(self, username: str):
-        if username:
+    def prefetch_users(self) -> None:
+        """
+        Load all the users once, so that we do not need to
+        ask OM for each username found in the queries.
+
+        If all of them fit in the cache, any username not
+        found there is not an OM user.
+        """
+        try:
+            count = 0
+            for user in self.metadata.list_all_entities(entity=User):
+                self.user_cache.put(
+                    user.name.__root__, user.fullyQualifiedName.__root__
+                )
+                count += 1
+            if count <= self.config.user_cache_size:
+                self.users_prefetched_at = time.monotonic()
+            logger.info(f"Prefetched {count} users for the query usage")
+        except Exception as exc:
+            logger.debug(traceback.format_exc())
+            logger.warning(f"Could not prefetch the users: {exc}")
+
+    def _all_users_cached(self) -> bool:
+        """
+        While the prefetched users have not expired, a username
+        missing from the cache is not an OM user
+        """
+        return (
+            self.users_prefetched_at is not None
+            and time.monotonic() - self.users_prefetched_at
+            < self.config.user_cache_ttl_seconds
+        )
+
+    def _get_user_fqn(self, username: str) -> Optional[str]:
+        """
+        Resolve the username from the cache, falling back to OM
+        and caching unknown usernames as well
+        """
+        if username in self.user_cache:
+            self.status.user_cache_hits += 1
+            return self.user_cache.get(username)
+        if username in self.unknown_user_cache:
+            self.status.user_cache_hits += 1
+            return None
+
+        self.status.user_cache_misses += 1
+        user = None
+        if not self._all_users_cached():
             user = self.metadata.get_by_name(entity=User, fqn=username)
-            if user:
-                return [user.fullyQualifiedName.__root__]
+        if user is None:
+            self.unknown_user_cache.put(username, None)
+            return None
+        self.user_cache.put(username, user.fullyQualifiedName.__root__)
+        return user.fullyQualifiedName.__root__
+
+    def _get_user_entity(self, username: str) -> List[str]:
+        if username:
+            user_fqn = self._get_user_fqn(username)
+            if user_fqn:
+                return [user_fqn]
         return []
 
     def _add_sql_query(self, record, table):
-        if self.table_queries.get((table, record.date)):
-            self.table_queries[(table, record.date)].append(
-                CreateQueryRequest(
-                    query=record.sql,
-                    users=self._get_user_entity(record.userName),
-                    queryDate=record.date,
-                    duration=record.duration,
-                )
+        self.table_queries.setdefault((table, record.date), []).append(
+            CreateQueryRequest(
+                query=record.sql,
+                users=self._get_user_entity(record.userName),
+                queryDate=record.date,
+                duration=record.duration,
             )
-        else:
-            self.table_queries[(table, record.date)] = [
-                CreateQueryRequest(
-                    query=record.sql,
-                    users=self._get_user_entity(record.userName),
-                    queryDate=record.date,
-                    duration=record.duration,
-                )
-            ]
+        )
 
     def stage_record(self, record: QueryParserData) -> None:
         """
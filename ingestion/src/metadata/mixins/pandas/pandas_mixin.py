@@ -15,6 +15,7 @@ supporting sqlalchemy abstraction layer
 """
 import math
 import random
+from functools import partial
 from typing import cast
 
 from metadata.data_quality.validations.table.pandas.tableRowInsertedCountToBeBetween import (
@@ -28,7 +29,11 @@ from metadata.generated.schema.entity.data.table import (
 from metadata.ingestion.source.database.datalake.models import (
     DatalakeTableSchemaWrapper,
 )
-from metadata.utils.datalake.datalake_utils import fetch_dataframe
+from metadata.utils.datalake.datalake_utils import (
+    DataFrameChunks,
+    close_chunks,
+    fetch_dataframe,
+)
 from metadata.utils.logger import test_suite_logger
 
 logger = test_suite_logger()
@@ -46,84 +51,111 @@ class PandasInterfaceMixin:
         self.table_partition_config = cast(
             PartitionProfilerConfig, self.table_partition_config
         )
+        # Lazy chunks are filtered as they are read
+        if isinstance(dfs, DataFrameChunks):
+            return dfs.map(self._get_partition)
+        return [self._get_partition(df) for df in dfs]
+
+    def _get_partition(self, df):
+        """Filter the rows of the dataframe in the partition"""
         partition_field = self.table_partition_config.partitionColumnName
         if (
             self.table_partition_config.partitionIntervalType
             == PartitionIntervalType.COLUMN_VALUE
         ):
-            return [
-                df[
-                    df[partition_field].isin(
-                        self.table_partition_config.partitionValues
-                    )
-                ]
-                for df in dfs
+            return df[
+                df[partition_field].isin(self.table_partition_config.partitionValues)
             ]
         if (
             self.table_partition_config.partitionIntervalType
             == PartitionIntervalType.INTEGER_RANGE
         ):
-            return [
-                df[
-                    df[partition_field].between(
-                        self.table_partition_config.partitionIntegerRangeStart,
-                        self.table_partition_config.partitionIntegerRangeEnd,
-                    )
-                ]
-                for df in dfs
-            ]
-        return [
-            df[
-                df[partition_field]
-                >= TableRowInsertedCountToBeBetweenValidator._get_threshold_date(  # pylint: disable=protected-access
-                    self.table_partition_config.partitionIntervalUnit.value,
-                    self.table_partition_config.partitionInterval,
+            return df[
+                df[partition_field].between(
+                    self.table_partition_config.partitionIntegerRangeStart,
+                    self.table_partition_config.partitionIntegerRangeEnd,
                 )
             ]
-            for df in dfs
+        return df[
+            df[partition_field]
+            >= TableRowInsertedCountToBeBetweenValidator._get_threshold_date(  # pylint: disable=protected-access
+                self.table_partition_config.partitionIntervalUnit.value,
+                self.table_partition_config.partitionInterval,
+            )
         ]
 
+    @staticmethod
+    def _sample_rows(dfs, rows: int):
+        """
+        Uniformly sample `rows` rows while reading the chunks, only keeping
+        in memory the rows with the smallest random keys seen so far
+        """
+        # pylint: disable=import-outside-toplevel
+        import numpy as np
+        import pandas as pd
+
+        sample, keys = None, None
+        for df in dfs:
+            df_keys = np.random.random(len(df))
+            if sample is not None:
+                df = pd.concat([sample, df])
+                df_keys = np.concatenate([keys, df_keys])
+            keep = np.argsort(df_keys)[:rows]
+            sample, keys = df.iloc[keep], df_keys[keep]
+        return [sample] if sample is not None else []
+
     def return_ometa_dataframes_sampled(
         self, service_connection_config, client, table, profile_sample_config
     ):
         """
-        returns sampled ometa dataframes
+        returns sampled ometa dataframes.
+
+        Chunks are sampled as they are read, so that only the
+        sampled data is kept in memory. Without a sample, we
+        return the lazy chunks of the file.
         """
-        data = fetch_dataframe(
+        read_chunks = partial(
+            fetch_dataframe,
             config_source=service_connection_config.configSource,
             client=client,
             file_fqn=DatalakeTableSchemaWrapper(
                 key=table.name.__root__, bucket_name=table.databaseSchema.name
             ),
             is_profiler=True,
+            lazy=True,
         )
-        if data:
-            random.shuffle(data)
+        data = read_chunks()
+        if data is not None:
             # sampling data based on profiler config (if any)
-            if hasattr(profile_sample_config, "profile_sample"):
-                if (
-                    profile_sample_config.profile_sample_type
-                    == ProfileSampleType.PERCENTAGE
-                ):
-                    return [
-                        df.sample(
-                            frac=profile_sample_config.profile_sample / 100,
-                            random_state=random.randint(0, 100),
-                            replace=True,
-                        )
-                        for df in data
-                    ]
-                if profile_sample_config.profile_sample_type == ProfileSampleType.ROWS:
-                    sample_rows_per_chunk: int = math.floor(
-                        profile_sample_config.profile_sample / len(data)
+            profile_sample_type = getattr(
+                profile_sample_config, "profile_sample_type", None
+            )
+            if (
+                hasattr(profile_sample_config, "profile_sample")
+                and profile_sample_type == ProfileSampleType.PERCENTAGE
+            ):
+                data = [
+                    df.sample(
+                        frac=profile_sample_config.profile_sample / 100,
+                        random_state=random.randint(0, 100),
+                        replace=True,
                     )
-                    return [
-                        df.sample(
-                            n=sample_rows_per_chunk,
-                            random_state=random.randint(0, 100),
-                            replace=True,
-                        )
-                        for df in data
-                    ]
-            return data
+                    for df in data
+                ]
+            elif (
+                hasattr(profile_sample_config, "profile_sample")
+                and profile_sample_type == ProfileSampleType.ROWS
+            ):
+                data = self._sample_rows(
+                    data, math.floor(profile_sample_config.profile_sample)
+                )
+            else:
+                # Without sampling, the file is read again one chunk at a
+                # time whenever the data is needed
+                close_chunks(data)
+                data = DataFrameChunks(read_chunks)
+            if data:
+                if isinstance(data, list):
+                    random.shuffle(data)
+                return data
         raise TypeError(f"Couldn't fetch {table.name.__root__}")
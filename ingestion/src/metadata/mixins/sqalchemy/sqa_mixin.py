@@ -14,10 +14,14 @@ Interfaces with database for all database engine
 supporting sqlalchemy abstraction layer
 """
 
+import threading
+from contextlib import contextmanager
+from typing import Dict, Iterator, List, Optional
 
-from typing import List, Optional
-
+from pydantic import SecretStr
+from pydantic.json import pydantic_encoder
 from sqlalchemy import Column, MetaData, inspect
+from sqlalchemy.engine import Engine
 from sqlalchemy.orm import DeclarativeMeta
 
 from metadata.generated.schema.entity.services.connections.database.databricksConnection import (
@@ -36,17 +40,46 @@ from metadata.profiler.orm.converter import ometa_to_sqa_orm
 class SQAInterfaceMixin:
     """SQLAlchemy inteface mixin grouping shared methods between sequential and threaded executor"""
 
-    def _get_engine(self):
-        """Get engine for database
+    # Engines by connection while sharing them, so that the tables
+    # of the same database processed concurrently share a connection pool
+    _engines: Optional[Dict[str, Engine]] = None
+    _lock = threading.Lock()
+
+    @classmethod
+    @contextmanager
+    def shared_engines(cls) -> Iterator[None]:
+        """
+        Share the engines of the interfaces created within the context,
+        disposing them on exit
+        """
+        cls._engines = {}
+        try:
+            yield
+        finally:
+            engines, cls._engines = cls._engines, None
+            for engine in engines.values():
+                engine.dispose()
+
+    def _get_engine(self) -> Engine:
+        """Get engine for database, shared if within `shared_engines`
 
         Args:
             service_connection_config: connection details for the specific service
         Returns:
             sqlalchemy engine
         """
-        engine = get_connection(self.service_connection_config)
-
-        return engine
+        if self._engines is None:
+            return get_connection(self.service_connection_config)
+        key = self.service_connection_config.json(
+            encoder=lambda value: value.get_secret_value()
+            if isinstance(value, SecretStr)
+            else pydantic_encoder(value),
+            sort_keys=True,
+        )
+        with self._lock:
+            if key not in self._engines:
+                self._engines[key] = get_connection(self.service_connection_config)
+            return self._engines[key]
 
     def _convert_table_to_orm_object(
         self,
@@ -59,7 +92,11 @@ class SQAInterfaceMixin:
         Returns:
             DeclarativeMeta
         """
-        return ometa_to_sqa_orm(self.table_entity, self.ometa_client, sqa_metadata_obj)
+        # The ORM objects of the tables processed concurrently share their registry
+        with self._lock:
+            return ometa_to_sqa_orm(
+                self.table_entity, self.ometa_client, sqa_metadata_obj
+            )
 
     def get_columns(self) -> Column:
         """get columns from an orm object"""
@@ -17,11 +17,16 @@ Workflow definition for the ORM Profiler.
 - How to define metrics & tests
 """
 import traceback
-from typing import Iterable, Optional, cast
+from concurrent.futures import FIRST_COMPLETED, Future, as_completed, wait
+from datetime import datetime, timezone
+from typing import Iterable, Optional, Tuple, cast
 
 from pydantic import ValidationError
 
 from metadata.config.common import WorkflowExecutionError
+from metadata.generated.schema.api.data.createTableProfile import (
+    CreateTableProfileRequest,
+)
 from metadata.generated.schema.entity.data.database import Database
 from metadata.generated.schema.entity.data.table import Table
 from metadata.generated.schema.entity.services.connections.database.datalakeConnection import (
@@ -40,10 +45,12 @@ from metadata.generated.schema.entity.services.ingestionPipelines.ingestionPipel
 from metadata.generated.schema.entity.services.serviceType import ServiceType
 from metadata.generated.schema.metadataIngestion.databaseServiceProfilerPipeline import (
     DatabaseServiceProfilerPipeline,
+    UnchangedTables,
 )
 from metadata.generated.schema.metadataIngestion.workflow import (
     OpenMetadataWorkflowConfig,
 )
+from metadata.generated.schema.type.basic import Timestamp
 from metadata.ingestion.api.parser import parse_workflow_config_gracefully
 from metadata.ingestion.api.sink import Sink
 from metadata.ingestion.api.source import SourceStatus
@@ -52,7 +59,16 @@ from metadata.ingestion.ometa.client_utils import create_ometa_client
 from metadata.ingestion.ometa.ometa_api import OpenMetadata
 from metadata.ingestion.source.connections import get_connection, get_test_connection_fn
 from metadata.profiler.api.models import ProfilerProcessorConfig, ProfilerResponse
+from metadata.profiler.interface.profiler_protocol import ProfilerProtocol
+from metadata.profiler.interface.sqlalchemy.sqa_profiler_interface import (
+    SQAProfilerInterface,
+)
+from metadata.profiler.metrics.system.table_changes import has_changed_since
 from metadata.profiler.processor.core import Profiler
+from metadata.profiler.processor.partition_state import (
+    PartitionProfiler,
+    PartitionStateStore,
+)
 from metadata.profiler.source.base_profiler_source import BaseProfilerSource
 from metadata.profiler.source.profiler_source_factory import profiler_source_factory
 from metadata.timer.repeated_timer import RepeatedTimer
@@ -62,6 +78,7 @@ from metadata.utils.class_helper import (
     get_service_class_from_service_type,
     get_service_type_from_source_type,
 )
+from metadata.utils.custom_thread_pool import CustomThreadPoolExecutor
 from metadata.utils.filters import filter_by_database, filter_by_schema, filter_by_table
 from metadata.utils.importer import get_sink
 from metadata.utils.logger import profiler_logger
@@ -109,6 +126,11 @@ class ProfilerWorkflow(WorkflowStatusMixin):
         )  # Used to satisfy type checked
         self.source_status = SourceStatus()
         self._profiler_interface_args = None
+        self.partition_state_store = (
+            PartitionStateStore(self.source_config.partitionStateDirectory)
+            if self.source_config.partitionStateDirectory
+            else None
+        )
         if self.config.sink:
             self.sink = get_sink(
                 sink_type=self.config.sink.type,
@@ -270,10 +292,25 @@ class ProfilerWorkflow(WorkflowStatusMixin):
             profiler_runner: Profiler = profiler_source.get_profiler_runner(
                 entity, self.profiler_config
             )
-            profile: ProfilerResponse = profiler_runner.process(
-                self.source_config.generateSampleData,
-                self.source_config.processPiiSensitive,
+            latest_profile = self.get_unchanged_table_profile(
+                entity, profiler_runner.profiler_interface
             )
+            if latest_profile:
+                profile = self.carry_forward_profile(entity, latest_profile)
+            elif self.partition_state_store and PartitionProfiler.is_supported(
+                profiler_runner
+            ):
+                profile = PartitionProfiler(
+                    profiler_runner, self.partition_state_store
+                ).process(
+                    self.source_config.generateSampleData,
+                    self.source_config.processPiiSensitive,
+                )
+            else:
+                profile = profiler_runner.process(
+                    self.source_config.generateSampleData,
+                    self.source_config.processPiiSensitive,
+                )
         except Exception as exc:
             name = entity.fullyQualifiedName.__root__
             error = f"Unexpected exception processing entity [{name}]: {exc}"
@@ -281,26 +318,125 @@ class ProfilerWorkflow(WorkflowStatusMixin):
             logger.error(error)
             self.source_status.failed(name, error, traceback.format_exc())
             try:
-                # if we fail to instantiate a profiler_interface, we won't have a profiler_interface variable
+                # if we fail to instantiate a profiler_interface, we won't have a profiler_runner variable
                 # we'll also catch scenarios where we don't have an interface set
                 self.source_status.fail_all(
-                    profiler_source.interface.processor_status.failures
+                    profiler_runner.profiler_interface.processor_status.failures
                 )
                 self.source_status.records.extend(
-                    profiler_source.interface.processor_status.records
+                    profiler_runner.profiler_interface.processor_status.records
                 )
+                profiler_runner.profiler_interface.close()
             except (UnboundLocalError, AttributeError):
                 pass
         else:
             # at this point we know we have an interface variable since we the `try` block above didn't raise
-            self.source_status.fail_all(profiler_source.interface.processor_status.failures)  # type: ignore
+            # The runner interface is the one of this table, the source one could be
+            # of another table profiled concurrently
+            self.source_status.fail_all(profiler_runner.profiler_interface.processor_status.failures)  # type: ignore
             self.source_status.records.extend(
-                profiler_source.interface.processor_status.records  # type: ignore
+                profiler_runner.profiler_interface.processor_status.records  # type: ignore
             )
+            profiler_runner.profiler_interface.close()
             return profile
 
         return None
 
+    def get_unchanged_table_profile(
+        self, entity: Table, profiler_interface: ProfilerProtocol
+    ) -> Optional[Table]:
+        """
+        Latest profile of the table, if we don't profile unchanged tables
+        and the table did not change since
+        """
+        if self.source_config.unchangedTables in {None, UnchangedTables.profile}:
+            return None
+        try:
+            latest_profile = self.metadata.get_latest_table_profile(
+                entity.fullyQualifiedName
+            )
+            if not latest_profile or has_changed_since(
+                profiler_interface.get_table_changes(), latest_profile.profile
+            ):
+                return None
+        except Exception as exc:  # pylint: disable=broad-except
+            logger.debug(traceback.format_exc())
+            logger.warning(
+                f"Could not check if {entity.fullyQualifiedName.__root__} changed: {exc}"
+            )
+            return None
+        return latest_profile
+
+    def carry_forward_profile(
+        self, entity: Table, latest_profile: Table
+    ) -> Optional[ProfilerResponse]:
+        """
+        Skip the unchanged table, or carry its latest
+        profile forward with a fresh timestamp
+        """
+        name = entity.fullyQualifiedName.__root__
+        if self.source_config.unchangedTables == UnchangedTables.skip:
+            logger.info(f"Skipping {name}, unchanged since its latest profile")
+            self.source_status.filter(name, "Table unchanged since its latest profile")
+            return None
+
+        logger.info(f"Carrying forward the latest profile of unchanged {name}")
+        timestamp = Timestamp(__root__=int(datetime.now(tz=timezone.utc).timestamp()))
+        return ProfilerResponse(
+            table=entity,
+            profile=CreateTableProfileRequest(
+                tableProfile=latest_profile.profile.copy(
+                    update={"timestamp": timestamp}
+                ),
+                columnProfile=[
+                    column.profile.copy(update={"timestamp": timestamp})
+                    for column in latest_profile.columns
+                    if column.profile
+                ],
+            ),
+        )
+
+    def get_profiler_tasks(self) -> Iterable[Tuple[Table, BaseProfilerSource]]:
+        """Tables to profile, with the profiler source of their database"""
+        for database in self.get_database_entities():
+            profiler_source = profiler_source_factory.create(
+                self.config.source.type.lower(),
+                self.config,
+                database,
+                self.metadata,
+            )
+            for entity in self.get_table_entities(database=database):
+                yield entity, profiler_source
+
+    def write_profile(self, profile: Optional[ProfilerResponse]) -> None:
+        if hasattr(self, "sink") and profile:
+            self.sink.write_record(profile)
+
+    def run_profiler_concurrently(self, table_thread_count: int) -> None:
+        """
+        Profile several tables at the same time. Tables share the engine of
+        their database and a global cap on the queries running concurrently.
+        Profiles are sent to the sink from this thread as tables finish.
+        """
+        max_queries = int(
+            self.source_config.maxConcurrentQueries or self.source_config.threadCount
+        )
+        with SQAProfilerInterface.shared_engines(), SQAProfilerInterface.limit_queries(
+            max_queries
+        ), CustomThreadPoolExecutor(max_workers=table_thread_count) as pool:
+            futures = set()
+            for entity, profiler_source in self.get_profiler_tasks():
+                # Keep a bounded number of tables in flight
+                if len(futures) >= 2 * table_thread_count:
+                    done, futures = wait(futures, return_when=FIRST_COMPLETED)
+                    self._write_profiles(done)
+                futures.add(pool.submit(self.run_profiler, entity, profiler_source))
+            self._write_profiles(as_completed(futures))
+
+    def _write_profiles(self, futures: Iterable[Future]) -> None:
+        for future in futures:
+            self.write_profile(future.result())
+
     def execute(self):
         """
         Run the profiling and tests
@@ -308,17 +444,12 @@ class ProfilerWorkflow(WorkflowStatusMixin):
         self.timer.trigger()
 
         try:
-            for database in self.get_database_entities():
-                profiler_source = profiler_source_factory.create(
-                    self.config.source.type.lower(),
-                    self.config,
-                    database,
-                    self.metadata,
-                )
-                for entity in self.get_table_entities(database=database):
-                    profile = self.run_profiler(entity, profiler_source)
-                    if hasattr(self, "sink") and profile:
-                        self.sink.write_record(profile)
+            table_thread_count = int(self.source_config.tableThreadCount or 1)
+            if table_thread_count > 1:
+                self.run_profiler_concurrently(table_thread_count)
+            else:
+                for entity, profiler_source in self.get_profiler_tasks():
+                    self.write_profile(self.run_profiler(entity, profiler_source))
             # At the end of the `execute`, update the associated Ingestion Pipeline status as success
             self.update_ingestion_status_at_end()
 
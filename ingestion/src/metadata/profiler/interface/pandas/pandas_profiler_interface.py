@@ -16,7 +16,7 @@ supporting sqlalchemy abstraction layer
 import traceback
 from collections import defaultdict
 from datetime import datetime, timezone
-from typing import Dict, List
+from typing import Any, Dict, List, Optional
 
 from sqlalchemy import Column
 
@@ -34,6 +34,7 @@ from metadata.mixins.pandas.pandas_mixin import PandasInterfaceMixin
 from metadata.profiler.interface.profiler_protocol import ProfilerProtocol
 from metadata.profiler.metrics.core import MetricTypes
 from metadata.profiler.metrics.registry import Metrics
+from metadata.profiler.metrics.sketches import SKETCH_METRICS, compute_sketch_metrics
 from metadata.profiler.processor.datalake_sampler import DatalakeSampler
 from metadata.utils.dispatch import valuedispatch
 from metadata.utils.logger import profiler_interface_registry_logger
@@ -147,8 +148,12 @@ class PandasProfilerInterface(ProfilerProtocol, PandasInterfaceMixin):
         import pandas as pd  # pylint: disable=import-outside-toplevel
 
         try:
-            row_dict = {}
+            row_dict = self._get_sketch_metrics(
+                metrics, column, kwargs.get("sketch_results")
+            )
             for metric in metrics:
+                if metric.name() in row_dict:
+                    continue
                 metric_resp = metric(column).df_fn(self.dfs)
                 row_dict[metric.name()] = (
                     None if pd.isnull(metric_resp) else metric_resp
@@ -179,8 +184,13 @@ class PandasProfilerInterface(ProfilerProtocol, PandasInterfaceMixin):
         Returns:
             dictionnary of results
         """
-        col_metric = None
-        col_metric = metrics(column).df_fn(self.dfs)
+        sketch_metrics = self._get_sketch_metrics(
+            [metrics], column, kwargs.get("sketch_results")
+        )
+        if metrics.name() in sketch_metrics:
+            col_metric = sketch_metrics[metrics.name()]
+        else:
+            col_metric = metrics(column).df_fn(self.dfs)
         if not col_metric:
             return None
         return {metrics.name(): col_metric}
@@ -200,15 +210,79 @@ class PandasProfilerInterface(ProfilerProtocol, PandasInterfaceMixin):
         and returns the values
         """
         try:
-            metric_values = {}
+            metric_values = self._get_sketch_metrics(
+                metrics, column, kwargs.get("sketch_results")
+            )
             for metric in metrics:
-                metric_values[metric.name()] = metric(column).df_fn(self.dfs)
+                if metric.name() not in metric_values:
+                    metric_values[metric.name()] = metric(column).df_fn(self.dfs)
             return metric_values if metric_values else None
         except Exception as exc:
             logger.debug(traceback.format_exc())
             logger.warning(f"Unexpected exception computing metrics: {exc}")
             return None
 
+    @property
+    def approximate_metrics(self) -> bool:
+        return bool(getattr(self.source_config, "approximateMetrics", False))
+
+    def _get_sketch_metrics(
+        self,
+        metrics: List[Metrics],
+        column,
+        sketch_results: Optional[Dict[str, Dict[str, Any]]] = None,
+    ) -> Dict:
+        """
+        In approximate mode, pick the metrics supported by the streaming
+        sketches from the single pass over the dataframes of the column
+
+        Args:
+            metrics: metrics to compute
+            column: the column to compute the metrics against
+            sketch_results: sketch metrics already computed by column name
+        """
+        names = {metric.name() for metric in metrics} & SKETCH_METRICS
+        if not self.approximate_metrics or not names:
+            return {}
+        if sketch_results is None or column.name not in sketch_results:
+            return compute_sketch_metrics(
+                {column.name: (column, metrics)}, self.dfs
+            ).get(column.name, {})
+        return {
+            name: value
+            for name, value in sketch_results[column.name].items()
+            if name in names
+        }
+
+    def _compute_sketch_metrics(self, metric_funcs: list) -> Dict[str, Dict[str, Any]]:
+        """
+        Compute at once all the sketch metrics requested for each column,
+        whatever the metric type they are computed with, in a single pass
+        over the chunks
+        """
+        if not self.approximate_metrics or not self.dfs:
+            return {}
+
+        requested = defaultdict(dict)
+        for metrics, _, column, _ in metric_funcs:
+            for metric in metrics if isinstance(metrics, list) else [metrics]:
+                if column is not None and metric.name() in SKETCH_METRICS:
+                    requested[column.name][metric.name()] = (column, metric)
+
+        columns = {
+            column_name: (
+                next(iter(column_metrics.values()))[0],
+                [metric for _, metric in column_metrics.values()],
+            )
+            for column_name, column_metrics in requested.items()
+        }
+        try:
+            return compute_sketch_metrics(columns, self.dfs)
+        except Exception as exc:
+            logger.debug(traceback.format_exc())
+            logger.warning(f"Error computing the sketch metrics: {exc}")
+            return {}
+
     @_get_metrics.register(MetricTypes.System.value)
     def _(
         self,
@@ -227,6 +301,7 @@ class PandasProfilerInterface(ProfilerProtocol, PandasInterfaceMixin):
         metric_type,
         column,
         table,
+        sketch_results: Optional[Dict[str, Dict[str, Any]]] = None,
     ):
         """Run metrics in processor worker"""
         logger.debug(f"Running profiler for {table}")
@@ -238,6 +313,7 @@ class PandasProfilerInterface(ProfilerProtocol, PandasInterfaceMixin):
                     metrics,
                     session=self.client,
                     column=column,
+                    sketch_results=sketch_results,
                 )
         except Exception as exc:
             name = f"{column if column is not None else table}"
@@ -316,8 +392,10 @@ class PandasProfilerInterface(ProfilerProtocol, PandasInterfaceMixin):
         """get all profiler metrics"""
 
         profile_results = {"table": {}, "columns": defaultdict(dict)}
+        sketch_results = self._compute_sketch_metrics(metric_funcs)
         metric_list = [
-            self.compute_metrics(*metric_func) for metric_func in metric_funcs
+            self.compute_metrics(*metric_func, sketch_results=sketch_results)
+            for metric_func in metric_funcs
         ]
         for metric_result in metric_list:
             profile, column, metric_type = metric_result
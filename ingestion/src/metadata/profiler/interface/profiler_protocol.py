@@ -35,6 +35,7 @@ from metadata.generated.schema.metadataIngestion.databaseServiceProfilerPipeline
 from metadata.ingestion.ometa.ometa_api import OpenMetadata
 from metadata.profiler.api.models import ProfileSampleConfig, TableConfig
 from metadata.profiler.metrics.registry import Metrics
+from metadata.profiler.metrics.system.table_changes import TableChanges
 from metadata.utils.partition import get_partition_details
 
 
@@ -230,3 +231,7 @@ class ProfilerProtocol(ABC):
     def fetch_sample_data(self, table) -> TableData:
         """run profiler metrics"""
         raise NotImplementedError
+
+    def get_table_changes(self) -> Optional[TableChanges]:
+        """Row count and last modification of the table, None if unknown"""
+        return None
@@ -16,12 +16,15 @@ supporting sqlalchemy abstraction layer
 
 import concurrent.futures
 import threading
+import time
 import traceback
 from collections import defaultdict
+from contextlib import contextmanager
 from datetime import datetime, timezone
-from typing import Dict, List, Optional, Union
+from typing import Dict, Iterator, List, Optional, Tuple, Union
 
 from sqlalchemy import Column
+from sqlalchemy import column as sqa_column
 from sqlalchemy.exc import ProgrammingError
 from sqlalchemy.orm import scoped_session
 
@@ -29,7 +32,6 @@ from metadata.generated.schema.entity.data.table import TableData
 from metadata.generated.schema.entity.services.databaseService import DatabaseConnection
 from metadata.ingestion.api.processor import ProfilerProcessorStatus
 from metadata.ingestion.connections.session import create_and_bind_thread_safe_session
-from metadata.ingestion.source.connections import get_connection
 from metadata.mixins.sqalchemy.sqa_mixin import SQAInterfaceMixin
 from metadata.profiler.interface.profiler_protocol import ProfilerProtocol
 from metadata.profiler.metrics.core import MetricTypes
@@ -37,9 +39,16 @@ from metadata.profiler.metrics.registry import Metrics
 from metadata.profiler.metrics.static.mean import Mean
 from metadata.profiler.metrics.static.stddev import StdDev
 from metadata.profiler.metrics.static.sum import Sum
+from metadata.profiler.metrics.system.table_changes import (
+    TableChanges,
+    get_table_changes_for_dialect,
+)
+from metadata.profiler.orm.functions.length import LenFn
+from metadata.profiler.orm.functions.quantiles import get_quantile_values, quantiles_fn
 from metadata.profiler.orm.functions.table_metric_construct import (
     table_metric_construct_factory,
 )
+from metadata.profiler.orm.registry import is_concatenable, is_quantifiable
 from metadata.profiler.processor.runner import QueryRunner
 from metadata.profiler.processor.sampler import Sampler
 from metadata.utils.custom_thread_pool import CustomThreadPoolExecutor
@@ -53,6 +62,22 @@ OVERFLOW_ERROR_CODES = {
     "snowflake": {100046, 100058},
 }
 
+# Static metrics of several columns computed in a single SELECT are
+# chunked to stay under the column limits (e.g., 1000 for Oracle, 1664
+# for Postgres) and query length limits (e.g., 256KB for Athena)
+FUSED_MAX_EXPRESSIONS = 1000
+FUSED_MAX_QUERY_LENGTH = 200_000
+
+# Window metrics computed together by a single quantile function
+QUANTILE_METRICS = {"median": 0.5, "firstQuartile": 0.25, "thirdQuartile": 0.75}
+
+
+def _remaining(deadline: Optional[float]) -> Optional[float]:
+    """Seconds left until the deadline, None if there is no deadline"""
+    if deadline is None:
+        return None
+    return max(deadline - time.monotonic(), 0)
+
 
 def handle_query_exception(msg, exc, session):
     """Handle exception for query runs"""
@@ -70,6 +95,9 @@ class SQAProfilerInterface(ProfilerProtocol, SQAInterfaceMixin):
 
     _profiler_type: str = DatabaseConnection.__name__
 
+    # Global cap on the queries running concurrently, while limited
+    _query_slots: Optional[threading.BoundedSemaphore] = None
+
     def __init__(
         self,
         service_connection_config,
@@ -100,7 +128,7 @@ class SQAProfilerInterface(ProfilerProtocol, SQAInterfaceMixin):
 
         self._table = self._convert_table_to_orm_object(sqa_metadata)
 
-        self.session_factory = self._session_factory(service_connection_config)
+        self.session_factory = self._session_factory()
         self.session = self.session_factory()
         self.set_session_tag(self.session)
         self.set_catalog(self.session)
@@ -112,6 +140,10 @@ class SQAProfilerInterface(ProfilerProtocol, SQAInterfaceMixin):
         )
 
         self.timeout_seconds = timeout_seconds
+        self.fuse_column_metrics = getattr(source_config, "fuseColumnMetrics", True)
+        self.approximate_metrics = bool(
+            getattr(source_config, "approximateMetrics", False)
+        )
 
     @property
     def table(self):
@@ -139,13 +171,42 @@ class SQAProfilerInterface(ProfilerProtocol, SQAInterfaceMixin):
 
         return kwargs
 
-    @staticmethod
-    def _session_factory(service_connection_config) -> scoped_session:
+    def _session_factory(self) -> scoped_session:
         """Create thread safe session that will be automatically
         garbage collected once the application thread ends
         """
-        engine = get_connection(service_connection_config)
-        return create_and_bind_thread_safe_session(engine)
+        return create_and_bind_thread_safe_session(self._get_engine())
+
+    @classmethod
+    @contextmanager
+    def limit_queries(cls, max_queries: int) -> Iterator[None]:
+        """
+        Cap the queries running at the same time across all the
+        interfaces, e.g., when profiling several tables concurrently
+        """
+        cls._query_slots = threading.BoundedSemaphore(max_queries)
+        try:
+            yield
+        finally:
+            cls._query_slots = None
+
+    @contextmanager
+    def _query_slot(self, deadline: Optional[float] = None) -> Iterator[None]:
+        """
+        Wait for a free query slot, if queries are limited, until the deadline
+        """
+        query_slots = self._query_slots
+        if query_slots is None:
+            yield
+            return
+        if not query_slots.acquire(timeout=_remaining(deadline)):
+            raise concurrent.futures.TimeoutError(
+                f"No query slot available before the timeout for {self.table.__tablename__}"
+            )
+        try:
+            yield
+        finally:
+            query_slots.release()
 
     @staticmethod
     def _compute_static_metrics_wo_sum(
@@ -268,6 +329,136 @@ class SQAProfilerInterface(ProfilerProtocol, SQAInterfaceMixin):
             msg = f"Error trying to compute profile for {runner.table.__tablename__}.{column.name}: {exc}"
             handle_query_exception(msg, exc, session)
 
+    # pylint: disable=unused-argument
+    @_get_metrics.register(MetricTypes.MultiColumnStatic.value)
+    def _(
+        self,
+        metric_type: str,
+        metrics: List[Tuple[Column, List[Metrics]]],
+        runner: QueryRunner,
+        session,
+        *args,
+        **kwargs,
+    ):
+        """Given the static metrics of several columns, compute them with
+        a single query, falling back to one query per column if it fails
+
+        Args:
+            metrics: list of columns with the metrics to compute
+        Returns:
+            dictionnary of results by column name
+        """
+        keys, expressions = self._get_fused_expressions(metrics)
+        try:
+            row = dict(runner.select_first_from_sample(*expressions))
+        except Exception as exc:
+            logger.debug(traceback.format_exc())
+            logger.info(
+                f"Could not compute the metrics of {len(metrics)} columns of {runner.table.__tablename__}"
+                f" together, computing them column by column: {exc}"
+            )
+            session.rollback()
+            return self._compute_static_metrics_by_column(
+                metrics, runner=runner, session=session
+            )
+
+        results = defaultdict(dict)
+        for idx, (column_name, metric_name) in enumerate(keys):
+            results[column_name][metric_name] = row[f"m{idx}"]
+        return dict(results)
+
+    @staticmethod
+    def _get_fused_expressions(
+        metrics: List[Tuple[Column, List[Metrics]]]
+    ) -> Tuple[List[Tuple[str, str]], list]:
+        """Label the expressions of the fused query. Returns the
+        column and metric names of each label with the expressions.
+        """
+        keys = []
+        expressions = []
+        for column, column_metrics in metrics:
+            for metric in column_metrics:
+                expression = metric(column).fn()
+                if expression is not None:
+                    # short labels, as some dialects limit the identifiers length
+                    expressions.append(expression.element.label(f"m{len(keys)}"))
+                    keys.append((column.name, expression.name))
+        return keys, expressions
+
+    def _compute_static_metrics_by_column(
+        self,
+        metrics: List[Tuple[Column, List[Metrics]]],
+        runner: QueryRunner,
+        session,
+    ) -> Dict[str, dict]:
+        """Compute the static metrics of each column with its own query"""
+        results = {}
+        for column, column_metrics in metrics:
+            try:
+                results[column.name] = self._get_metrics(
+                    MetricTypes.Static.value,
+                    column_metrics,
+                    runner=runner,
+                    session=session,
+                    column=column,
+                )
+            except Exception as exc:
+                error = f"{column} {MetricTypes.Static.value}: {exc}"
+                logger.error(error)
+                self.processor_status.failed_profiler(error, traceback.format_exc())
+        return results
+
+    def _fuse_static_metrics(self, metric_funcs: list) -> list:
+        """
+        Replace the static metrics of the columns by chunks of columns
+        whose metrics are computed with a single query.
+        Array columns keep their own queries.
+        """
+        dialect = self.session.get_bind().dialect
+        chunks = []
+        chunk, chunk_expressions, chunk_length = [], 0, 0
+        others = []
+        for metric_func in metric_funcs:
+            metrics, metric_type, column, _ = metric_func
+            if (
+                metric_type != MetricTypes.Static
+                or not metrics
+                or self._is_array_column(column)["is_array"]
+            ):
+                others.append(metric_func)
+                continue
+            try:
+                expressions = [metric(column).fn() for metric in metrics]
+                length = sum(
+                    len(str(expression.compile(dialect=dialect)))
+                    for expression in expressions
+                    # metrics not supported by the column type have no expression
+                    if expression is not None
+                )
+            except Exception:  # pylint: disable=broad-except
+                # e.g., a metric not supported by the dialect
+                others.append(metric_func)
+                continue
+            if chunk and (
+                chunk_expressions + len(metrics) > FUSED_MAX_EXPRESSIONS
+                or chunk_length + length > FUSED_MAX_QUERY_LENGTH
+            ):
+                chunks.append(chunk)
+                chunk, chunk_expressions, chunk_length = [], 0, 0
+            chunk.append((column, metrics))
+            chunk_expressions += len(metrics)
+            chunk_length += length
+        if chunk:
+            chunks.append(chunk)
+
+        return [
+            *(
+                (chunk, MetricTypes.MultiColumnStatic, None, self.table)
+                for chunk in chunks
+            ),
+            *others,
+        ]
+
     # pylint: disable=unused-argument
     @_get_metrics.register(MetricTypes.Query.value)
     def _(
@@ -327,6 +518,9 @@ class SQAProfilerInterface(ProfilerProtocol, SQAInterfaceMixin):
         """
         if not metrics:
             return None
+        quantiles = self._compute_quantiles(metrics, runner, session, column)
+        if quantiles is not None:
+            return quantiles
         try:
             row = runner.select_first_from_sample(
                 *[metric(column).fn() for metric in metrics],
@@ -349,6 +543,49 @@ class SQAProfilerInterface(ProfilerProtocol, SQAInterfaceMixin):
             return dict(row)
         return None
 
+    def _compute_quantiles(
+        self,
+        metrics: List[Metrics],
+        runner: QueryRunner,
+        session,
+        column: Column,
+    ) -> Optional[dict]:
+        """Compute the quantile metrics of the column with a single function,
+        when the dialect has one. Return None to compute them one by one.
+        """
+        if (
+            any(metric.name() not in QUANTILE_METRICS for metric in metrics)
+            or self._is_array_column(column)["is_array"]
+        ):
+            return None
+
+        if is_quantifiable(column.type):
+            col = sqa_column(column.name)
+        elif is_concatenable(column.type):
+            col = LenFn(sqa_column(column.name))
+        else:
+            return None
+
+        dialect = session.bind.dialect.name
+        percentiles = [QUANTILE_METRICS[metric.name()] for metric in metrics]
+        fn = quantiles_fn(dialect, col, percentiles, self.approximate_metrics)
+        if fn is None:
+            return None
+
+        try:
+            row = runner.select_first_from_sample(fn.label("quantiles"))
+        except Exception as exc:  # pylint: disable=broad-except
+            logger.debug(traceback.format_exc())
+            logger.debug(
+                f"Could not compute the quantiles of {runner.table.__tablename__}.{column.name} together: {exc}"
+            )
+            session.rollback()
+            return None
+        values = get_quantile_values(
+            dialect, percentiles, row["quantiles"] if row else None
+        )
+        return {metric.name(): value for metric, value in zip(metrics, values)}
+
     @_get_metrics.register(MetricTypes.System.value)
     def _(
         self,
@@ -376,6 +613,24 @@ class SQAProfilerInterface(ProfilerProtocol, SQAInterfaceMixin):
             msg = f"Error trying to compute profile for {runner.table.__tablename__}: {exc}"
             handle_query_exception(msg, exc, session)
 
+    def get_table_changes(self) -> Optional[TableChanges]:
+        """Row count and last modification of the table,
+        read from the system tables of the engine
+        """
+        try:
+            return get_table_changes_for_dialect(
+                self.session.get_bind().dialect.name,
+                session=self.session,
+                table=self.table,
+            )
+        except Exception as exc:  # pylint: disable=broad-except
+            logger.debug(traceback.format_exc())
+            logger.warning(
+                f"Could not get the changes of {self.table.__tablename__}: {exc}"
+            )
+            self.session.rollback()
+            return None
+
     def _create_thread_safe_sampler(
         self,
         session,
@@ -416,13 +671,14 @@ class SQAProfilerInterface(ProfilerProtocol, SQAInterfaceMixin):
         metric_type,
         column,
         table,
+        deadline=None,
     ):
         """Run metrics in processor worker"""
         logger.debug(
             f"Running profiler for {table.__tablename__} on thread {threading.current_thread()}"
         )
         Session = self.session_factory  # pylint: disable=invalid-name
-        with Session() as session:
+        with self._query_slot(deadline), Session() as session:
             self.set_session_tag(session)
             self.set_catalog(session)
             sampler = self._create_thread_safe_sampler(
@@ -454,6 +710,11 @@ class SQAProfilerInterface(ProfilerProtocol, SQAInterfaceMixin):
             if column is not None:
                 column = column.name
                 self.processor_status.scanned(f"{table.__tablename__}.{column}")
+            elif metric_type == MetricTypes.MultiColumnStatic:
+                for chunk_column, _ in metrics:
+                    self.processor_status.scanned(
+                        f"{table.__tablename__}.{chunk_column.name}"
+                    )
             else:
                 self.processor_status.scanned(table.__tablename__)
 
@@ -467,11 +728,20 @@ class SQAProfilerInterface(ProfilerProtocol, SQAInterfaceMixin):
         """get all profiler metrics"""
         logger.debug(f"Computing metrics with {self._thread_count} threads.")
         profile_results = {"table": dict(), "columns": defaultdict(dict)}
+        if self.fuse_column_metrics:
+            metric_funcs = self._fuse_static_metrics(metric_funcs)
+        # The timeout applies to the metrics of the table as a whole
+        deadline = (
+            time.monotonic() + self.timeout_seconds
+            if self.timeout_seconds is not None
+            else None
+        )
         with CustomThreadPoolExecutor(max_workers=self._thread_count) as pool:
             futures = [
                 pool.submit(
                     self.compute_metrics_in_thread,
                     *metric_func,
+                    deadline=deadline,
                 )
                 for metric_func in metric_funcs
             ]
@@ -482,7 +752,7 @@ class SQAProfilerInterface(ProfilerProtocol, SQAInterfaceMixin):
 
                 try:
                     profile, column, metric_type = future.result(
-                        timeout=self.timeout_seconds
+                        timeout=_remaining(deadline)
                     )
                     if metric_type != MetricTypes.System.value and not isinstance(
                         profile, dict
@@ -492,6 +762,17 @@ class SQAProfilerInterface(ProfilerProtocol, SQAInterfaceMixin):
                         profile_results["table"].update(profile)
                     elif metric_type == MetricTypes.System.value:
                         profile_results["system"] = profile
+                    elif metric_type == MetricTypes.MultiColumnStatic.value:
+                        for column_name, column_profile in profile.items():
+                            profile_results["columns"][column_name].update(
+                                {
+                                    "name": column_name,
+                                    "timestamp": datetime.now(
+                                        tz=timezone.utc
+                                    ).timestamp(),
+                                    **(column_profile or {}),
+                                }
+                            )
                     else:
                         profile_results["columns"][column].update(
                             {
@@ -526,7 +807,8 @@ class SQAProfilerInterface(ProfilerProtocol, SQAInterfaceMixin):
             profile_sample_query=self.profile_query,
         )
 
-        return sampler.fetch_sqa_sample_data()
+        with self._query_slot():
+            return sampler.fetch_sqa_sample_data()
 
     def get_composed_metrics(
         self, column: Column, metric: Metrics, column_results: Dict
@@ -570,7 +852,8 @@ class SQAProfilerInterface(ProfilerProtocol, SQAInterfaceMixin):
         )
         sample = sampler.random_sample()
         try:
-            return metric(column).fn(sample, column_results, self.session)
+            with self._query_slot():
+                return metric(column).fn(sample, column_results, self.session)
         except Exception as exc:
             logger.debug(traceback.format_exc())
             logger.warning(f"Unexpected exception computing metrics: {exc}")
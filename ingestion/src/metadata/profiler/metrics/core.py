@@ -271,3 +271,4 @@ class MetricTypes(Enum):
     Query = "Query"
     Window = "Window"
     System = "System"
+    MultiColumnStatic = "MultiColumnStatic"
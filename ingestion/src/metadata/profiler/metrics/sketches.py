@@ -0,0 +1,407 @@
+#  Copyright 2021 Collate
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#  http://www.apache.org/licenses/LICENSE-2.0
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+"""
+Mergeable streaming sketches to compute the pandas metrics
+one chunk at a time in bounded memory:
+
+- Welford moments for the mean and standard deviation (exact)
+- KLL for the quantiles
+- HyperLogLog for the distinct count
+- K minimum values with multiplicities for the unique count
+"""
+# pylint: disable=import-outside-toplevel
+import base64
+import math
+import traceback
+import zlib
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+from metadata.profiler.metrics.registry import Metrics
+from metadata.profiler.orm.registry import is_concatenable, is_quantifiable
+from metadata.utils.logger import profiler_logger
+
+logger = profiler_logger()
+
+KLL_K = 200
+HLL_PRECISION = 14
+KMV_SIZE = 4096
+
+QUANTILES = {
+    Metrics.FIRST_QUARTILE.value.name(): 0.25,
+    Metrics.MEDIAN.value.name(): 0.5,
+    Metrics.THIRD_QUARTILE.value.name(): 0.75,
+}
+
+SKETCH_METRICS = {
+    Metrics.MEAN.value.name(),
+    Metrics.STDDEV.value.name(),
+    Metrics.DISTINCT_COUNT.value.name(),
+    Metrics.UNIQUE_COUNT.value.name(),
+    *QUANTILES,
+}
+
+
+def hash_values(series):
+    """
+    64 bits hash of the non null values. Numbers are hashed as floats so
+    that the same value gets the same hash in chunks with different dtypes.
+    """
+    import pandas as pd
+
+    series = series.dropna()
+    if pd.api.types.is_numeric_dtype(series) and not pd.api.types.is_bool_dtype(series):
+        series = series.astype("float64")
+    return pd.util.hash_pandas_object(series, index=False).to_numpy()
+
+
+class WelfordMoments:
+    """
+    Count, mean and sum of squared differences, merged chunk by chunk
+    with Chan's parallel version of Welford's algorithm
+    """
+
+    def __init__(self):
+        self.count = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+
+    def _combine(self, count: int, mean: float, m2: float) -> None:
+        if not count:
+            return
+        total = self.count + count
+        delta = mean - self.mean
+        self.mean += delta * count / total
+        self.m2 += m2 + delta**2 * self.count * count / total
+        self.count = total
+
+    def update(self, values) -> None:
+        if len(values):
+            mean = values.mean()
+            self._combine(len(values), mean, float(((values - mean) ** 2).sum()))
+
+    def merge(self, other: "WelfordMoments") -> None:
+        self._combine(other.count, other.mean, other.m2)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {"count": self.count, "mean": self.mean, "m2": self.m2}
+
+    @classmethod
+    def from_dict(cls, state: Dict[str, Any]) -> "WelfordMoments":
+        moments = cls()
+        moments.count, moments.mean, moments.m2 = (
+            state["count"],
+            state["mean"],
+            state["m2"],
+        )
+        return moments
+
+    @property
+    def stddev(self) -> Optional[float]:
+        """Sample standard deviation, as pandas computes it"""
+        if self.count < 2:
+            return None
+        return math.sqrt(self.m2 / (self.count - 1))
+
+
+class KLLSketch:
+    """
+    KLL quantiles sketch. Items at level `h` weight 2^h. When a level
+    goes over its capacity, it is sorted and every other item is promoted.
+    While nothing has been compacted, quantiles are exact.
+    """
+
+    def __init__(self, k: int = KLL_K, seed: Optional[int] = None):
+        import numpy as np
+
+        self.k = k
+        self.levels: List[np.ndarray] = [np.empty(0)]
+        self._rng = np.random.default_rng(seed)
+
+    def _capacity(self, level: int) -> int:
+        depth = len(self.levels) - level - 1
+        return max(int(math.ceil(self.k * (2 / 3) ** depth)), 2)
+
+    def _compress(self) -> None:
+        import numpy as np
+
+        compacted = True
+        while compacted:
+            compacted = False
+            # Levels are added while compacting
+            level = 0
+            while level < len(self.levels):
+                items = self.levels[level]
+                if len(items) > self._capacity(level):
+                    if level + 1 == len(self.levels):
+                        self.levels.append(np.empty(0))
+                    items = np.sort(items)
+                    # An odd item stays at its level
+                    leftover, items = items[: len(items) % 2], items[len(items) % 2 :]
+                    promoted = items[self._rng.integers(2) :: 2]
+                    self.levels[level] = leftover
+                    self.levels[level + 1] = np.concatenate(
+                        [self.levels[level + 1], promoted]
+                    )
+                    compacted = True
+                level += 1
+
+    def update(self, values) -> None:
+        import numpy as np
+
+        self.levels[0] = np.concatenate([self.levels[0], values])
+        self._compress()
+
+    def merge(self, other: "KLLSketch") -> None:
+        import numpy as np
+
+        for level, items in enumerate(other.levels):
+            if level == len(self.levels):
+                self.levels.append(np.empty(0))
+            self.levels[level] = np.concatenate([self.levels[level], items])
+        self._compress()
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {"k": self.k, "levels": [items.tolist() for items in self.levels]}
+
+    @classmethod
+    def from_dict(cls, state: Dict[str, Any]) -> "KLLSketch":
+        import numpy as np
+
+        sketch = cls(k=state["k"])
+        sketch.levels = [np.array(items, dtype=np.float64) for items in state["levels"]]
+        return sketch
+
+    def quantile(self, fraction: float) -> Optional[float]:
+        """Value at the given fraction of the weighted items"""
+        import numpy as np
+        import pandas as pd
+
+        if len(self.levels) == 1:
+            if self.levels[0].size == 0:
+                return None
+            return pd.Series(self.levels[0]).quantile(
+                fraction, interpolation="midpoint"
+            )
+
+        items = np.concatenate(self.levels)
+        weights = np.concatenate(
+            [
+                np.full(len(level_items), 2**level)
+                for level, level_items in enumerate(self.levels)
+            ]
+        )
+        order = np.argsort(items)
+        cumulative = np.cumsum(weights[order])
+        idx = np.searchsorted(cumulative, fraction * cumulative[-1])
+        return float(items[order][min(idx, len(items) - 1)])
+
+
+class HyperLogLog:
+    """
+    HyperLogLog distinct count estimation from 64 bits hashes
+    """
+
+    def __init__(self, precision: int = HLL_PRECISION):
+        import numpy as np
+
+        self.precision = precision
+        self.registers = np.zeros(1 << precision, dtype=np.uint8)
+
+    def update(self, hashes) -> None:
+        import numpy as np
+
+        if hashes.size == 0:
+            return
+        idx = (hashes >> np.uint64(64 - self.precision)).astype(np.int64)
+        # Leading zeros of the next 32 bits, counting from 1
+        remaining = (hashes << np.uint64(self.precision)) >> np.uint64(32)
+        _, bit_length = np.frexp(remaining.astype(np.float64))
+        np.maximum.at(self.registers, idx, (33 - bit_length).astype(np.uint8))
+
+    def merge(self, other: "HyperLogLog") -> None:
+        import numpy as np
+
+        np.maximum(self.registers, other.registers, out=self.registers)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Registers are mostly zeros for small sets, we compress them"""
+        return {
+            "precision": self.precision,
+            "registers": base64.b64encode(
+                zlib.compress(self.registers.tobytes())
+            ).decode(),
+        }
+
+    @classmethod
+    def from_dict(cls, state: Dict[str, Any]) -> "HyperLogLog":
+        import numpy as np
+
+        hll = cls(precision=state["precision"])
+        hll.registers = np.frombuffer(
+            zlib.decompress(base64.b64decode(state["registers"])), dtype=np.uint8
+        ).copy()
+        return hll
+
+    def count(self) -> int:
+        import numpy as np
+
+        size = len(self.registers)
+        alpha = 0.7213 / (1 + 1.079 / size)
+        estimate = alpha * size**2 / np.sum(2.0 ** -self.registers.astype(np.float64))
+        zeros = int(np.count_nonzero(self.registers == 0))
+        if estimate <= 2.5 * size and zeros:
+            # Small range correction
+            estimate = size * math.log(size / zeros)
+        return int(round(estimate))
+
+
+class UniqueCountSketch:
+    """
+    K minimum values sketch keeping how many times each hash was seen.
+    The ratio of hashes seen once among the kept ones estimates the
+    ratio of unique values. It is exact while we see less than `k` values.
+    """
+
+    def __init__(self, size: int = KMV_SIZE):
+        import numpy as np
+
+        self.size = size
+        self.hashes = np.empty(0, dtype=np.uint64)
+        self.counts = np.empty(0, dtype=np.int64)
+
+    def _add(self, hashes, counts) -> None:
+        import numpy as np
+
+        if len(self.hashes) >= self.size:
+            # Larger hashes will never be among the k minimum values
+            keep = hashes <= self.hashes[-1]
+            hashes, counts = hashes[keep], counts[keep]
+        all_hashes, inverse = np.unique(
+            np.concatenate([self.hashes, hashes]), return_inverse=True
+        )
+        all_counts = np.bincount(
+            inverse, weights=np.concatenate([self.counts, counts])
+        ).astype(np.int64)
+        self.hashes, self.counts = all_hashes[: self.size], all_counts[: self.size]
+
+    def update(self, hashes) -> None:
+        import numpy as np
+
+        if len(hashes):
+            self._add(*np.unique(hashes, return_counts=True))
+
+    def merge(self, other: "UniqueCountSketch") -> None:
+        self._add(other.hashes, other.counts)
+
+    def count(self) -> int:
+        uniques = int((self.counts == 1).sum())
+        if len(self.hashes) < self.size:
+            return uniques
+        distinct = (self.size - 1) / ((float(self.hashes[-1]) + 1) / 2.0**64)
+        return int(round(distinct * uniques / self.size))
+
+
+class ColumnSketches:
+    """
+    Sketches of the metrics requested for a column,
+    updated one chunk of the column at a time
+    """
+
+    def __init__(self, column, names: Set[str]):
+        self.names = names
+        self.quantifiable = is_quantifiable(column.type)
+        self.concatenable = is_concatenable(column.type)
+        self.moments = WelfordMoments()
+        self.kll = KLLSketch() if self.quantifiable and names & set(QUANTILES) else None
+        self.hll = (
+            HyperLogLog() if Metrics.DISTINCT_COUNT.value.name() in names else None
+        )
+        self.kmv = (
+            UniqueCountSketch() if Metrics.UNIQUE_COUNT.value.name() in names else None
+        )
+
+    def _values(self, series):
+        """
+        Values the moments and quantiles are computed from: the numbers
+        or the lengths of the strings. None for other columns.
+        """
+        import numpy as np
+
+        if self.quantifiable:
+            return series.dropna().to_numpy(dtype=np.float64)
+        if self.concatenable:
+            return series.dropna().astype(str).str.len().to_numpy(dtype=np.float64)
+        return None
+
+    def update(self, series) -> None:
+        if self.hll or self.kmv:
+            hashes = hash_values(series)
+            for sketch in (self.hll, self.kmv):
+                if sketch:
+                    sketch.update(hashes)
+        values = self._values(series)
+        if values is not None:
+            self.moments.update(values)
+            if self.kll:
+                self.kll.update(values)
+
+    def results(self) -> Dict[str, Any]:
+        """Value of the requested metrics"""
+        results: Dict[str, Any] = {}
+        if self.quantifiable or self.concatenable:
+            results[Metrics.MEAN.value.name()] = (
+                self.moments.mean if self.moments.count else None
+            )
+        if self.quantifiable:
+            results[Metrics.STDDEV.value.name()] = self.moments.stddev
+        if self.kll:
+            for name, fraction in QUANTILES.items():
+                results[name] = self.kll.quantile(fraction)
+        if self.hll:
+            results[Metrics.DISTINCT_COUNT.value.name()] = self.hll.count()
+        if self.kmv:
+            results[Metrics.UNIQUE_COUNT.value.name()] = self.kmv.count()
+        return {name: value for name, value in results.items() if name in self.names}
+
+
+def compute_sketch_metrics(
+    columns: Dict[str, Tuple[Any, Iterable]], dfs
+) -> Dict[str, Dict[str, Any]]:
+    """
+    Compute the metrics supported by the sketches for all the columns in a
+    single pass over the dataframes, so that the chunks are read only once
+    and never held together. Other metrics are not part of the results.
+
+    Args:
+        columns: column and metrics to compute by column name
+        dfs: dataframes, e.g., the lazy chunks of a file
+    """
+    sketches = {
+        column_name: ColumnSketches(
+            column, {metric.name() for metric in metrics} & SKETCH_METRICS
+        )
+        for column_name, (column, metrics) in columns.items()
+    }
+    for df in dfs:
+        for column_name, column_sketches in list(sketches.items()):
+            try:
+                column_sketches.update(df[column_name])
+            except Exception as exc:  # pylint: disable=broad-except
+                logger.debug(traceback.format_exc())
+                logger.warning(
+                    f"Error computing the sketch metrics of {column_name}: {exc}"
+                )
+                sketches.pop(column_name)
+    return {
+        column_name: column_sketches.results()
+        for column_name, column_sketches in sketches.items()
+    }
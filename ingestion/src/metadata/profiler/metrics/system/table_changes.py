@@ -0,0 +1,202 @@
+#  Copyright 2021 Collate
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#  http://www.apache.org/licenses/LICENSE-2.0
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+"""
+Table change signals, read from the engine system tables, telling
+whether a table changed since its latest profile
+"""
+
+from datetime import datetime, timezone
+from textwrap import dedent
+from typing import NamedTuple, Optional
+
+from sqlalchemy import text
+from sqlalchemy.orm import DeclarativeMeta, Session
+
+from metadata.generated.schema.entity.data.table import TableProfile
+from metadata.profiler.orm.registry import Dialects
+from metadata.utils.dispatch import valuedispatch
+from metadata.utils.logger import profiler_logger
+
+logger = profiler_logger()
+
+
+class TableChanges(NamedTuple):
+    """Row count and last modification time of a table"""
+
+    row_count: Optional[int]
+    last_modified: Optional[datetime]
+
+
+def _to_utc(value: Optional[datetime]) -> Optional[datetime]:
+    """System tables without a timezone are in UTC"""
+    if value is None or value.tzinfo is not None:
+        return value
+    return value.replace(tzinfo=timezone.utc)
+
+
+def has_changed_since(
+    changes: Optional[TableChanges], profile: Optional[TableProfile]
+) -> bool:
+    """
+    Check if the table changed since the profile was computed. We assume
+    it did whenever the changes or the profile are unknown.
+    """
+    if not changes or not profile or profile.timestamp is None:
+        return True
+    if changes.row_count is None and changes.last_modified is None:
+        return True
+    if changes.row_count is not None and changes.row_count != profile.rowCount:
+        return True
+    if changes.last_modified is not None:
+        profile_date = datetime.fromtimestamp(
+            profile.timestamp.__root__, tz=timezone.utc
+        )
+        return changes.last_modified >= profile_date
+    return False
+
+
+# pylint: disable=unused-argument
+@valuedispatch
+def get_table_changes_for_dialect(
+    dialect: str,
+    session: Session,
+    table: DeclarativeMeta,
+    *args,
+    **kwargs,
+) -> Optional[TableChanges]:
+    """Get the row count and last modification of the table
+
+    Args:
+        dialect (str): database API dialect
+        session (Session): session object
+        table (DeclarativeMeta): orm table
+
+    Returns:
+        Optional[TableChanges]: For BigQuery, Snowflake, Redshift returns
+            the table changes else returns None
+    """
+    logger.debug(f"Table changes not supported for {dialect}. Skipping processing.")
+
+
+# pylint: disable=unused-argument
+@get_table_changes_for_dialect.register(Dialects.BigQuery)
+def _(
+    dialect: str,
+    session: Session,
+    table: DeclarativeMeta,
+    *args,
+    **kwargs,
+) -> Optional[TableChanges]:
+    """Read the dataset __TABLES__ metadata, updated by every DML"""
+    project_id = session.get_bind().url.host
+    dataset_id = table.__table_args__["schema"]
+
+    tables = dedent(
+        f"""
+        SELECT
+            row_count,
+            last_modified_time
+        FROM
+            `{project_id}.{dataset_id}.__TABLES__`
+        WHERE
+            table_id = '{table.__tablename__}'
+        """
+    )
+    row = session.execute(text(tables)).first()
+    if not row:
+        return None
+    return TableChanges(
+        row_count=row.row_count,
+        last_modified=datetime.fromtimestamp(
+            row.last_modified_time / 1000, tz=timezone.utc
+        ),
+    )
+
+
+# pylint: disable=unused-argument
+@get_table_changes_for_dialect.register(Dialects.Snowflake)
+def _(
+    dialect: str,
+    session: Session,
+    table: DeclarativeMeta,
+    *args,
+    **kwargs,
+) -> Optional[TableChanges]:
+    """Read the INFORMATION_SCHEMA of the database. LAST_ALTERED
+    is updated by DML and DDL statements alike.
+    """
+    schema = table.__table_args__["schema"]
+
+    tables = dedent(
+        f"""
+        SELECT
+            ROW_COUNT,
+            LAST_ALTERED
+        FROM
+            INFORMATION_SCHEMA.TABLES
+        WHERE
+            UPPER(TABLE_SCHEMA) = UPPER('{schema}') AND
+            UPPER(TABLE_NAME) = UPPER('{table.__tablename__}')
+        """
+    )
+    row = session.execute(text(tables)).first()
+    if not row:
+        return None
+    # Column names are normalized by the dialect, we read them by position
+    return TableChanges(row_count=row[0], last_modified=_to_utc(row[1]))
+
+
+# pylint: disable=unused-argument
+@get_table_changes_for_dialect.register(Dialects.Redshift)
+def _(
+    dialect: str,
+    session: Session,
+    table: DeclarativeMeta,
+    *args,
+    **kwargs,
+) -> Optional[TableChanges]:
+    """Read the row count of svv_table_info and the latest insert or delete
+    of the STL logs, as the system metrics do. The logs are only kept a few
+    days, older changes are told by the row count, which counts the rows
+    deleted or updated until the table is vacuumed.
+    """
+    database = session.get_bind().url.database
+    schema = table.__table_args__["schema"]
+
+    tables = dedent(
+        f"""
+        SELECT
+            sti.tbl_rows AS row_count,
+            (
+                SELECT MAX(dml.endtime)
+                FROM (
+                    SELECT tbl, endtime FROM pg_catalog.stl_insert
+                    UNION ALL
+                    SELECT tbl, endtime FROM pg_catalog.stl_delete
+                ) dml
+                WHERE dml.tbl = sti.table_id
+            ) AS last_modified
+        FROM
+            pg_catalog.svv_table_info sti
+        WHERE
+            sti."database" = '{database}' AND
+            sti."schema" = '{schema}' AND
+            sti."table" = '{table.__tablename__}'
+        """
+    )
+    row = session.execute(text(tables)).first()
+    if not row:
+        return None
+    return TableChanges(
+        row_count=row.row_count,
+        last_modified=_to_utc(row.last_modified),
+    )
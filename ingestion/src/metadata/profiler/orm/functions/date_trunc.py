@@ -0,0 +1,115 @@
+#  Copyright 2021 Collate
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#  http://www.apache.org/licenses/LICENSE-2.0
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+"""
+Define the function truncating a date or datetime
+to the start of its HOUR, DAY, MONTH or YEAR
+"""
+# Keep SQA docs style defining custom constructs
+# pylint: disable=consider-using-f-string,duplicate-code
+from sqlalchemy import text
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.sql.functions import FunctionElement
+
+from metadata.profiler.metrics.core import CACHE
+from metadata.profiler.orm.registry import Dialects
+
+# strftime-like formats keeping the start of the unit
+FORMAT_UNITS = {
+    "HOUR": "%Y-%m-%d %H:00:00",
+    "DAY": "%Y-%m-%d",
+    "MONTH": "%Y-%m-01",
+    "YEAR": "%Y-01-01",
+}
+HIVE_FORMAT_UNITS = {
+    "HOUR": "yyyy-MM-dd HH:00:00",
+    "DAY": "yyyy-MM-dd",
+    "MONTH": "yyyy-MM-01",
+    "YEAR": "yyyy-01-01",
+}
+ORACLE_UNITS = {"HOUR": "HH", "DAY": "DD", "MONTH": "MM", "YEAR": "YYYY"}
+CLICKHOUSE_FUNCTIONS = {
+    "HOUR": "toStartOfHour",
+    "DAY": "toStartOfDay",
+    "MONTH": "toStartOfMonth",
+    "YEAR": "toStartOfYear",
+}
+
+
+class DateTruncFn(FunctionElement):
+    """
+    Truncate the column to the start of the unit: DateTruncFn(col, "DAY").
+    The result type depends on the dialect, a timestamp or its ISO string.
+    """
+
+    inherit_cache = CACHE
+
+    def __init__(self, col, unit: str):
+        # As text, for the unit to be part of the statement cache key
+        super().__init__(col, text(unit.upper()))
+
+
+def _compile_args(elements, compiler, **kwargs):
+    col, unit = elements.clauses.clauses
+    return compiler.process(col, **kwargs), unit.text
+
+
+@compiles(DateTruncFn)
+def _(elements, compiler, **kwargs):
+    col, unit = _compile_args(elements, compiler, **kwargs)
+    return "DATE_TRUNC('%s', %s)" % (unit.lower(), col)
+
+
+@compiles(DateTruncFn, Dialects.BigQuery)
+def _(elements, compiler, **kwargs):
+    col, unit = _compile_args(elements, compiler, **kwargs)
+    return "TIMESTAMP_TRUNC(CAST(%s AS TIMESTAMP), %s)" % (col, unit)
+
+
+@compiles(DateTruncFn, Dialects.MySQL)
+@compiles(DateTruncFn, Dialects.MariaDB)
+@compiles(DateTruncFn, Dialects.SingleStore)
+def _(elements, compiler, **kwargs):
+    col, unit = _compile_args(elements, compiler, **kwargs)
+    return "DATE_FORMAT(%s, '%s')" % (col, FORMAT_UNITS[unit].replace("%", "%%"))
+
+
+@compiles(DateTruncFn, Dialects.SQLite)
+def _(elements, compiler, **kwargs):
+    col, unit = _compile_args(elements, compiler, **kwargs)
+    return "STRFTIME('%s', %s)" % (FORMAT_UNITS[unit], col)
+
+
+@compiles(DateTruncFn, Dialects.Hive)
+def _(elements, compiler, **kwargs):
+    col, unit = _compile_args(elements, compiler, **kwargs)
+    return "DATE_FORMAT(%s, '%s')" % (col, HIVE_FORMAT_UNITS[unit])
+
+
+@compiles(DateTruncFn, Dialects.MSSQL)
+@compiles(DateTruncFn, Dialects.AzureSQL)
+def _(elements, compiler, **kwargs):
+    col, unit = _compile_args(elements, compiler, **kwargs)
+    return "DATEADD(%s, DATEDIFF(%s, 0, %s), 0)" % (unit, unit, col)
+
+
+@compiles(DateTruncFn, Dialects.Oracle)
+@compiles(DateTruncFn, Dialects.Db2)
+@compiles(DateTruncFn, Dialects.IbmDbSa)
+def _(elements, compiler, **kwargs):
+    col, unit = _compile_args(elements, compiler, **kwargs)
+    return "TRUNC(%s, '%s')" % (col, ORACLE_UNITS[unit])
+
+
+@compiles(DateTruncFn, Dialects.ClickHouse)
+def _(elements, compiler, **kwargs):
+    col, unit = _compile_args(elements, compiler, **kwargs)
+    return "%s(%s)" % (CLICKHOUSE_FUNCTIONS[unit], col)
@@ -0,0 +1,155 @@
+#  Copyright 2021 Collate
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#  http://www.apache.org/licenses/LICENSE-2.0
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+"""
+Define the functions computing several quantiles of a column in a
+single aggregation, instead of one MedianFn per quantile
+"""
+# Keep SQA docs style defining custom constructs
+# pylint: disable=consider-using-f-string
+from typing import List, Optional, Sequence
+
+from sqlalchemy import literal
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.sql.functions import FunctionElement
+
+from metadata.profiler.metrics.core import CACHE
+from metadata.profiler.orm.registry import Dialects
+
+# Buckets of BigQuery APPROX_QUANTILES, which returns the
+# min, the 99 percentiles and the max of the column
+BIGQUERY_QUANTILE_BUCKETS = 100
+
+
+class QuantilesFn(FunctionElement):
+    """Exact values of the percentiles of a column, as an array"""
+
+    inherit_cache = CACHE
+
+
+class ApproxQuantilesFn(FunctionElement):
+    """Approximate values of the percentiles of a column, as an array"""
+
+    inherit_cache = CACHE
+
+
+# Dialects with a multi-quantile function
+QUANTILES_DIALECTS = {
+    QuantilesFn: {
+        Dialects.ClickHouse,
+        Dialects.Databricks,
+        Dialects.Hive,
+        Dialects.Postgres,
+    },
+    ApproxQuantilesFn: {
+        Dialects.Athena,
+        Dialects.BigQuery,
+        Dialects.ClickHouse,
+        Dialects.Databricks,
+        Dialects.Hive,
+        Dialects.Presto,
+        Dialects.Trino,
+    },
+}
+
+# Dialects whose MedianFn is already approximate
+APPROXIMATE_ONLY_DIALECTS = {Dialects.Athena, Dialects.Presto, Dialects.Trino}
+
+
+def quantiles_fn(
+    dialect: str, col, percentiles: Sequence[float], approximate: bool
+) -> Optional[FunctionElement]:
+    """
+    Build the multi-quantile function of the dialect,
+    None if it has none for the requested precision
+    """
+    fn_class = (
+        ApproxQuantilesFn
+        if approximate or dialect in APPROXIMATE_ONLY_DIALECTS
+        else QuantilesFn
+    )
+    if dialect not in QUANTILES_DIALECTS[fn_class]:
+        return None
+    return fn_class(col, *[literal(percentile) for percentile in percentiles])
+
+
+def get_quantile_values(
+    dialect: str, percentiles: Sequence[float], values: Optional[Sequence]
+) -> List[Optional[float]]:
+    """Pick the value of each percentile from the array the function returned"""
+    if not values:
+        return [None for _ in percentiles]
+    if dialect == Dialects.BigQuery:
+        values = [
+            values[round(percentile * BIGQUERY_QUANTILE_BUCKETS)]
+            for percentile in percentiles
+        ]
+    return [float(value) if value is not None else None for value in values]
+
+
+def _compile_args(elements, compiler, **kwargs):
+    col, *percentiles = elements.clauses.clauses
+    return compiler.process(col, **kwargs), [
+        "%s" % percentile.value for percentile in percentiles
+    ]
+
+
+@compiles(QuantilesFn, Dialects.Postgres)
+def _(elements, compiler, **kwargs):
+    col, percentiles = _compile_args(elements, compiler, **kwargs)
+    return "percentile_cont(ARRAY[%s]) WITHIN GROUP (ORDER BY %s ASC)" % (
+        ", ".join(percentiles),
+        col,
+    )
+
+
+# Approximate, as the `quantile` of MedianFn: the exact function
+# loads all the values of the column in memory
+@compiles(QuantilesFn, Dialects.ClickHouse)
+@compiles(ApproxQuantilesFn, Dialects.ClickHouse)
+def _(elements, compiler, **kwargs):
+    col, percentiles = _compile_args(elements, compiler, **kwargs)
+    return "quantiles(%s)(%s)" % (", ".join(percentiles), col)
+
+
+@compiles(QuantilesFn, Dialects.Databricks)
+def _(elements, compiler, **kwargs):
+    col, percentiles = _compile_args(elements, compiler, **kwargs)
+    return "percentile(%s, array(%s))" % (col, ", ".join(percentiles))
+
+
+@compiles(QuantilesFn, Dialects.Hive)
+def _(elements, compiler, **kwargs):
+    """Hive exact percentiles only support integers, as MedianFn"""
+    col, percentiles = _compile_args(elements, compiler, **kwargs)
+    return "percentile(cast(%s as BIGINT), array(%s))" % (col, ", ".join(percentiles))
+
+
+@compiles(ApproxQuantilesFn, Dialects.Databricks)
+@compiles(ApproxQuantilesFn, Dialects.Hive)
+def _(elements, compiler, **kwargs):
+    col, percentiles = _compile_args(elements, compiler, **kwargs)
+    return "percentile_approx(%s, array(%s))" % (col, ", ".join(percentiles))
+
+
+@compiles(ApproxQuantilesFn, Dialects.Athena)
+@compiles(ApproxQuantilesFn, Dialects.Trino)
+@compiles(ApproxQuantilesFn, Dialects.Presto)
+def _(elements, compiler, **kwargs):
+    col, percentiles = _compile_args(elements, compiler, **kwargs)
+    return "approx_percentile(%s, ARRAY[%s])" % (col, ", ".join(percentiles))
+
+
+@compiles(ApproxQuantilesFn, Dialects.BigQuery)
+def _(elements, compiler, **kwargs):
+    """The percentiles are picked from the result by `get_quantile_values`"""
+    col, _ = _compile_args(elements, compiler, **kwargs)
+    return "APPROX_QUANTILES(%s, %d)" % (col, BIGQUERY_QUANTILE_BUCKETS)
@@ -0,0 +1,144 @@
+#  Copyright 2021 Collate
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#  http://www.apache.org/licenses/LICENSE-2.0
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+"""
+Estimate the number of rows of a table from the catalog statistics
+instead of running a COUNT(*) over the whole table
+"""
+
+import traceback
+from typing import Callable, Optional
+
+from sqlalchemy import func, text
+from sqlalchemy.orm import DeclarativeMeta, Session
+
+from metadata.profiler.orm.registry import Dialects
+from metadata.utils.logger import profiler_logger
+
+logger = profiler_logger()
+
+POSTGRES_ROW_ESTIMATE = text(
+    "SELECT c.reltuples FROM pg_catalog.pg_class c "
+    "JOIN pg_catalog.pg_namespace n ON n.oid = c.relnamespace "
+    "WHERE n.nspname = :schema_name AND c.relname = :table_name"
+)
+REDSHIFT_ROW_ESTIMATE = text(
+    'SELECT estimated_visible_rows FROM pg_catalog.svv_table_info WHERE "schema" = '
+    ':schema_name AND "table" = :table_name'
+)
+MYSQL_ROW_ESTIMATE = text(
+    "SELECT TABLE_ROWS FROM information_schema.tables "
+    "WHERE TABLE_SCHEMA = :schema_name AND TABLE_NAME = :table_name"
+)
+SNOWFLAKE_ROW_ESTIMATE = text(
+    "SELECT ROW_COUNT FROM information_schema.tables "
+    "WHERE LOWER(TABLE_SCHEMA) = LOWER(:schema_name) "
+    "AND LOWER(TABLE_NAME) = LOWER(:table_name)"
+)
+MSSQL_ROW_ESTIMATE = text(
+    "SELECT SUM(p.rows) FROM sys.partitions p "
+    "JOIN sys.tables t ON t.object_id = p.object_id "
+    "JOIN sys.schemas s ON s.schema_id = t.schema_id "
+    "WHERE s.name = :schema_name AND t.name = :table_name AND p.index_id IN (0, 1)"
+)
+ORACLE_ROW_ESTIMATE = text(
+    "SELECT NUM_ROWS FROM all_tables "
+    "WHERE LOWER(owner) = LOWER(:schema_name) AND LOWER(table_name) = LOWER(:table_name)"
+)
+CLICKHOUSE_ROW_ESTIMATE = text(
+    "SELECT total_rows FROM system.tables "
+    "WHERE database = :schema_name AND name = :table_name"
+)
+
+
+def _catalog_estimate(query) -> Callable:
+    """Build an estimate function running the catalog query for the table"""
+
+    def estimate(session: Session, table: DeclarativeMeta) -> Optional[int]:
+        schema_name = getattr(table, "__table_args__", {}).get("schema")
+        if not schema_name:
+            return None
+        row = session.execute(
+            query, {"schema_name": schema_name, "table_name": table.__tablename__}
+        ).first()
+        return int(row[0]) if row and row[0] is not None else None
+
+    return estimate
+
+
+def bigquery_row_estimate(session: Session, table: DeclarativeMeta) -> Optional[int]:
+    """BigQuery keeps the row count in the dataset __TABLES__ metadata"""
+    schema_name = getattr(table, "__table_args__", {}).get("schema")
+    if not schema_name:
+        return None
+    row = session.execute(
+        text(
+            f"SELECT row_count FROM `{schema_name}.__TABLES__` WHERE table_id = :name"
+        ),
+        {"name": table.__tablename__},
+    ).first()
+    return int(row[0]) if row and row[0] is not None else None
+
+
+def count_rows(session: Session, table: DeclarativeMeta) -> int:
+    """Exact number of rows, scanning the table"""
+    return session.query(func.count()).select_from(table).scalar()
+
+
+class RowEstimateFactory:
+    """Factory returning the estimated number of rows based on dialect"""
+
+    def __init__(self):
+        self._estimates = {}
+
+    def register(self, dialect: str, estimate: Callable):
+        """Register an estimate for a dialect"""
+        self._estimates[dialect] = estimate
+
+    def estimate(self, session: Session, table: DeclarativeMeta) -> int:
+        """
+        Estimate the rows from the catalog. If the dialect has no statistics or
+        they are missing, e.g., the table was never analyzed, we count the rows.
+        """
+        estimate = self._estimates.get(session.get_bind().dialect.name)
+        if estimate:
+            try:
+                rows = estimate(session, table)
+                if rows and rows > 0:
+                    return rows
+            except Exception as exc:
+                # Do not leave the transaction aborted for the next queries
+                session.rollback()
+                logger.debug(traceback.format_exc())
+                logger.debug(
+                    f"Could not estimate the rows of {table.__tablename__}: {exc}"
+                )
+        return count_rows(session, table)
+
+
+row_estimate_factory = RowEstimateFactory()
+row_estimate_factory.register(
+    Dialects.Postgres, _catalog_estimate(POSTGRES_ROW_ESTIMATE)
+)
+row_estimate_factory.register(
+    Dialects.Redshift, _catalog_estimate(REDSHIFT_ROW_ESTIMATE)
+)
+row_estimate_factory.register(Dialects.MySQL, _catalog_estimate(MYSQL_ROW_ESTIMATE))
+row_estimate_factory.register(Dialects.MariaDB, _catalog_estimate(MYSQL_ROW_ESTIMATE))
+row_estimate_factory.register(
+    Dialects.Snowflake, _catalog_estimate(SNOWFLAKE_ROW_ESTIMATE)
+)
+row_estimate_factory.register(Dialects.MSSQL, _catalog_estimate(MSSQL_ROW_ESTIMATE))
+row_estimate_factory.register(Dialects.Oracle, _catalog_estimate(ORACLE_ROW_ESTIMATE))
+row_estimate_factory.register(
+    Dialects.ClickHouse, _catalog_estimate(CLICKHOUSE_ROW_ESTIMATE)
+)
+row_estimate_factory.register(Dialects.BigQuery, bigquery_row_estimate)
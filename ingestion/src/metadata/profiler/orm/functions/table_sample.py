@@ -0,0 +1,101 @@
+#  Copyright 2021 Collate
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#  http://www.apache.org/licenses/LICENSE-2.0
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+"""
+Define the TABLESAMPLE sampling method
+
+Used with sqlalchemy `tablesample` to sample the table
+without scanning and sorting it:
+
+    table.tablesample(TableSampleFn(10), name="sample")
+"""
+from typing import Union
+
+from sqlalchemy import literal_column
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.sql.functions import Function
+
+from metadata.profiler.metrics.core import CACHE
+from metadata.profiler.orm.registry import Dialects
+from metadata.utils.logger import profiler_logger
+
+logger = profiler_logger()
+
+ROWS = "ROWS"
+
+# Dialects supporting a TABLESAMPLE clause after the table alias
+TABLESAMPLE_DIALECTS = {
+    Dialects.Athena,
+    Dialects.BigQuery,
+    Dialects.MSSQL,
+    Dialects.Postgres,
+    Dialects.Presto,
+    Dialects.Snowflake,
+    Dialects.Trino,
+}
+
+
+def format_sample_size(size: Union[int, float]) -> str:
+    """Render the size without scientific notation"""
+    return f"{size:.10f}".rstrip("0").rstrip(".")
+
+
+class TableSampleFn(Function):
+    """
+    Sampling method of the TABLESAMPLE clause. The size is a percentage
+    or, if `rows` is set, the number of rows to sample.
+    """
+
+    inherit_cache = CACHE
+
+    def __init__(self, size: Union[int, float], rows: bool = False):
+        # Literal columns to render the size inline and keep it in the cache key
+        clauses = [literal_column(format_sample_size(size))]
+        if rows:
+            clauses.append(literal_column(ROWS))
+        super().__init__("tablesample", *clauses)
+
+
+def validate_and_compile(element, compiler, **kw) -> str:
+    """
+    Use like:
+    size = validate_and_compile(...)
+    """
+    if len(element.clauses) != 1:
+        raise ValueError("Sampling a number of rows is only supported in Snowflake")
+
+    return compiler.process(element.clauses, **kw)
+
+
+@compiles(TableSampleFn)
+@compiles(TableSampleFn, Dialects.Postgres)
+@compiles(TableSampleFn, Dialects.Athena)
+@compiles(TableSampleFn, Dialects.Presto)
+@compiles(TableSampleFn, Dialects.Trino)
+def _(element, compiler, **kw):
+    """Row level sampling, scanning the table without sorting it"""
+    return f"BERNOULLI ({validate_and_compile(element, compiler, **kw)})"
+
+
+@compiles(TableSampleFn, Dialects.BigQuery)
+@compiles(TableSampleFn, Dialects.MSSQL)
+def _(element, compiler, **kw):
+    """BigQuery and MSSQL sample the storage blocks or pages"""
+    return f"SYSTEM ({validate_and_compile(element, compiler, **kw)} PERCENT)"
+
+
+@compiles(TableSampleFn, Dialects.Snowflake)
+def _(element, compiler, **kw):
+    """Snowflake can sample a fixed number of rows"""
+    size, *rows = [compiler.process(elem, **kw) for elem in element.clauses]
+    if rows:
+        return f"BERNOULLI ({size} {ROWS})"
+    return f"BERNOULLI ({size})"
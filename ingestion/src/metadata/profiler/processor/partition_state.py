@@ -0,0 +1,704 @@
+#  Copyright 2021 Collate
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#  http://www.apache.org/licenses/LICENSE-2.0
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+"""
+Profile append-only, time-partitioned tables by merging the
+stored state of each partition with the newly landed partitions.
+
+The state of a partition holds its row count and, for each column,
+mergeable aggregates: counts, sum, min and max, computed in SQL grouping
+by the partition, and the sketches computed from the values: moments,
+a KLL sketch for the quantiles and a HyperLogLog for the distinct count.
+Values are only read for the columns profiled with a sketch metric,
+from the profile sample if any.
+
+The whole-table profile is the merge of the partition states, so
+each run only scans the partitions landed since the latest one it
+stored, which is scanned again as it could have been partially loaded.
+"""
+# pylint: disable=import-outside-toplevel
+import json
+import os
+import traceback
+from collections import defaultdict
+from datetime import datetime, timezone
+from typing import Any, Dict, Iterable, List, Optional, Set
+from urllib.parse import quote
+
+from sqlalchemy import Column, Date, column, func, or_
+
+from metadata.generated.schema.api.data.createTableProfile import (
+    CreateTableProfileRequest,
+)
+from metadata.generated.schema.entity.data.table import (
+    ColumnProfile,
+    PartitionIntervalType,
+    PartitionProfilerConfig,
+    ProfileSampleType,
+    TableProfile,
+)
+from metadata.profiler.api.models import ProfilerResponse
+from metadata.profiler.metrics.registry import Metrics
+from metadata.profiler.metrics.sketches import (
+    HyperLogLog,
+    KLLSketch,
+    WelfordMoments,
+    hash_values,
+)
+from metadata.profiler.orm.functions.date_trunc import DateTruncFn
+from metadata.profiler.orm.functions.modulo import ModuloFn
+from metadata.profiler.orm.functions.random_num import RandomNumFn
+from metadata.profiler.orm.registry import is_concatenable, is_quantifiable
+from metadata.profiler.processor.core import Profiler
+from metadata.utils.logger import profiler_logger
+from metadata.utils.sqa_utils import get_partition_col_type
+
+logger = profiler_logger()
+
+PARTITION_LABEL = "om_partition"
+ROW_COUNT_LABEL = "om_row_count"
+NULL_PARTITION = "null"
+CHUNK_SIZE = 10_000
+# 2048 registers, ~2.3% standard error, to keep the stored states small
+PARTITION_HLL_PRECISION = 11
+
+# numpy datetime units truncating the partition column to its partition
+PARTITION_UNITS = {"HOUR": "h", "DAY": "D", "MONTH": "M", "YEAR": "Y"}
+
+QUANTIFIABLE = "quantifiable"
+CONCATENABLE = "concatenable"
+OTHER = "other"
+
+# Metrics computed from the sketches, which need to read the column values
+SKETCH_METRICS = {
+    metric.value.name()
+    for metric in (
+        Metrics.DISTINCT_COUNT,
+        Metrics.DISTINCT_RATIO,
+        Metrics.MEDIAN,
+        Metrics.FIRST_QUARTILE,
+        Metrics.THIRD_QUARTILE,
+        Metrics.IQR,
+        Metrics.STDDEV,
+        Metrics.NON_PARAMETRIC_SKEW,
+    )
+}
+COLUMN_METRICS = SKETCH_METRICS | {
+    metric.value.name()
+    for metric in (
+        Metrics.COUNT,
+        Metrics.NULL_COUNT,
+        Metrics.NULL_RATIO,
+        Metrics.MEAN,
+        Metrics.MIN,
+        Metrics.MAX,
+        Metrics.SUM,
+        Metrics.MIN_LENGTH,
+        Metrics.MAX_LENGTH,
+    )
+}
+TABLE_METRICS = {
+    metric.value.name()
+    for metric in (Metrics.ROW_COUNT, Metrics.COLUMN_COUNT, Metrics.COLUMN_NAMES)
+}
+# Aggregated in SQL for the quantifiable and concatenable columns,
+# by length for the latter. Only the count for the other ones.
+SQL_METRICS = (Metrics.SUM, Metrics.MIN, Metrics.MAX)
+
+
+def get_column_kind(col: Column) -> str:
+    """Quantifiable columns are profiled by value, concatenable ones by length"""
+    if is_quantifiable(col.type):
+        return QUANTIFIABLE
+    if is_concatenable(col.type):
+        return CONCATENABLE
+    return OTHER
+
+
+class ColumnState:
+    """
+    Mergeable profile state of a column: the SQL aggregates and,
+    if the column is profiled with a sketch metric, its sketches
+    """
+
+    def __init__(self, kind: str, sketches: bool = True):
+        self.kind = kind
+        self.values_count = 0
+        self.null_count = 0
+        self.min: Optional[float] = None
+        self.max: Optional[float] = None
+        self.sum = 0.0
+        # Values read for the sketches, fewer than values_count with a sample
+        self.sketch_count = 0
+        self.moments = WelfordMoments() if sketches and kind != OTHER else None
+        self.kll = KLLSketch() if sketches and kind != OTHER else None
+        self.hll = HyperLogLog(PARTITION_HLL_PRECISION) if sketches else None
+
+    @property
+    def has_sketches(self) -> bool:
+        return self.hll is not None
+
+    def update_aggregates(self, row_count: int, aggregates: Dict[str, Any]) -> None:
+        """Add the SQL aggregates of a partition, by metric name"""
+        values_count = aggregates.get(Metrics.COUNT.value.name()) or 0
+        self.values_count += values_count
+        self.null_count += row_count - values_count
+        self.sum += float(aggregates.get(Metrics.SUM.value.name()) or 0)
+        self._update_bounds(
+            _to_float(aggregates.get(Metrics.MIN.value.name())),
+            _to_float(aggregates.get(Metrics.MAX.value.name())),
+        )
+
+    def update_sketches(self, series) -> None:
+        """Add the values of a chunk to the sketches"""
+        import numpy as np
+        import pandas as pd
+
+        if self.kind == QUANTIFIABLE:
+            # Same dtype in all the chunks, for the values to get the same hash
+            series = pd.to_numeric(series).astype("float64")
+        self.sketch_count += int(series.count())
+        self.hll.update(hash_values(series))
+
+        if self.kind == QUANTIFIABLE:
+            values = series.dropna().to_numpy()
+        elif self.kind == CONCATENABLE:
+            values = series.dropna().astype(str).str.len().to_numpy(dtype=np.float64)
+        else:
+            return
+        if values.size:
+            self.moments.update(values)
+            self.kll.update(values)
+
+    def _update_bounds(self, min_: Optional[float], max_: Optional[float]) -> None:
+        if min_ is not None:
+            self.min = min_ if self.min is None else min(self.min, min_)
+        if max_ is not None:
+            self.max = max_ if self.max is None else max(self.max, max_)
+
+    def merge(self, other: "ColumnState") -> None:
+        self.values_count += other.values_count
+        self.null_count += other.null_count
+        self._update_bounds(other.min, other.max)
+        self.sum += other.sum
+        self.sketch_count += other.sketch_count
+        if self.moments and other.moments:
+            self.moments.merge(other.moments)
+        if self.kll and other.kll:
+            self.kll.merge(other.kll)
+        if self.hll and other.hll:
+            self.hll.merge(other.hll)
+
+    def get_metrics(self) -> Dict[str, Any]:
+        """Column profile metrics of the state"""
+        metrics: Dict[str, Any] = {
+            "valuesCount": self.values_count,
+            "nullCount": self.null_count,
+        }
+        if self.values_count + self.null_count:
+            metrics["nullProportion"] = self.null_count / (
+                self.values_count + self.null_count
+            )
+        if self.hll and self.sketch_count:
+            distinct_count = self.hll.count()
+            metrics["distinctCount"] = distinct_count
+            metrics["distinctProportion"] = distinct_count / self.sketch_count
+        if self.kind == OTHER or not self.values_count:
+            return metrics
+
+        metrics["mean"] = self.sum / self.values_count
+        if self.kind == QUANTIFIABLE:
+            metrics["min"] = self.min
+            metrics["max"] = self.max
+            metrics["sum"] = self.sum
+        else:
+            metrics["minLength"] = self.min
+            metrics["maxLength"] = self.max
+        if self.kll and self.moments.count:
+            metrics.update(self._get_sketch_metrics(metrics["mean"]))
+        return metrics
+
+    def _get_sketch_metrics(self, mean: float) -> Dict[str, Any]:
+        metrics = {
+            "median": self.kll.quantile(0.5),
+            "firstQuartile": self.kll.quantile(0.25),
+            "thirdQuartile": self.kll.quantile(0.75),
+        }
+        metrics["interQuartileRange"] = (
+            metrics["thirdQuartile"] - metrics["firstQuartile"]
+        )
+        if self.kind == QUANTIFIABLE:
+            metrics["stddev"] = self.moments.stddev
+            if metrics["stddev"]:
+                metrics["nonParametricSkew"] = (mean - metrics["median"]) / metrics[
+                    "stddev"
+                ]
+        return metrics
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "kind": self.kind,
+            "valuesCount": self.values_count,
+            "nullCount": self.null_count,
+            "min": self.min,
+            "max": self.max,
+            "sum": self.sum,
+            "sketchCount": self.sketch_count,
+            "moments": self.moments.to_dict() if self.moments else None,
+            "kll": self.kll.to_dict() if self.kll else None,
+            "hll": self.hll.to_dict() if self.hll else None,
+        }
+
+    @classmethod
+    def from_dict(cls, state: Dict[str, Any]) -> "ColumnState":
+        column_state = cls(state["kind"], sketches=False)
+        column_state.values_count = state["valuesCount"]
+        column_state.null_count = state["nullCount"]
+        column_state.min = state["min"]
+        column_state.max = state["max"]
+        column_state.sum = state["sum"]
+        column_state.sketch_count = state["sketchCount"]
+        if state["moments"]:
+            column_state.moments = WelfordMoments.from_dict(state["moments"])
+        if state["kll"]:
+            column_state.kll = KLLSketch.from_dict(state["kll"])
+        if state["hll"]:
+            column_state.hll = HyperLogLog.from_dict(state["hll"])
+        return column_state
+
+
+def _to_float(value: Any) -> Optional[float]:
+    return None if value is None else float(value)
+
+
+class PartitionState:
+    """Mergeable profile state of a partition"""
+
+    def __init__(
+        self, columns: Dict[str, str], sketch_columns: Optional[Set[str]] = None
+    ):
+        """Sketches are kept for the `sketch_columns`, all of them by default"""
+        self.row_count = 0
+        self.columns = {
+            name: ColumnState(
+                kind, sketches=sketch_columns is None or name in sketch_columns
+            )
+            for name, kind in columns.items()
+        }
+
+    def update_aggregates(
+        self, row_count: int, aggregates: Dict[str, Dict[str, Any]]
+    ) -> None:
+        """Add the SQL aggregates of the partition, by column name"""
+        self.row_count += row_count
+        for name, column_state in self.columns.items():
+            column_state.update_aggregates(row_count, aggregates.get(name, {}))
+
+    def update_sketches(self, df) -> None:
+        for name, column_state in self.columns.items():
+            if column_state.has_sketches:
+                column_state.update_sketches(df[name])
+
+    def merge(self, other: "PartitionState") -> None:
+        self.row_count += other.row_count
+        for name, column_state in self.columns.items():
+            column_state.merge(other.columns[name])
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "rowCount": self.row_count,
+            "columns": {
+                name: column_state.to_dict()
+                for name, column_state in self.columns.items()
+            },
+        }
+
+    @classmethod
+    def from_dict(cls, state: Dict[str, Any]) -> "PartitionState":
+        partition_state = cls({})
+        partition_state.row_count = state["rowCount"]
+        partition_state.columns = {
+            name: ColumnState.from_dict(column_state)
+            for name, column_state in state["columns"].items()
+        }
+        return partition_state
+
+
+class PartitionStateStore:
+    """
+    Partition states of the tables, in a JSON file per table. The states are
+    discarded when the profiled columns or the partitioning change.
+    """
+
+    def __init__(self, directory: str):
+        self.directory = directory
+        os.makedirs(directory, exist_ok=True)
+
+    def _path(self, table_fqn: str) -> str:
+        return os.path.join(self.directory, f"{quote(table_fqn, safe='')}.json")
+
+    def load(self, table_fqn: str, signature: Dict) -> Dict[str, PartitionState]:
+        try:
+            with open(self._path(table_fqn), encoding="utf-8") as file:
+                stored = json.load(file)
+        except FileNotFoundError:
+            return {}
+        except Exception as exc:  # pylint: disable=broad-except
+            logger.debug(traceback.format_exc())
+            logger.warning(f"Could not read the partition states of {table_fqn}: {exc}")
+            return {}
+        if stored.get("signature") != signature:
+            logger.info(
+                f"Partitioning or columns of {table_fqn} changed, profiling all its partitions"
+            )
+            return {}
+        return {
+            key: PartitionState.from_dict(state)
+            for key, state in stored["partitions"].items()
+        }
+
+    def save(
+        self, table_fqn: str, signature: Dict, states: Dict[str, PartitionState]
+    ) -> None:
+        path = self._path(table_fqn)
+        with open(f"{path}.tmp", "w", encoding="utf-8") as file:
+            json.dump(
+                {
+                    "signature": signature,
+                    "partitions": {
+                        key: state.to_dict() for key, state in states.items()
+                    },
+                },
+                file,
+            )
+        os.replace(f"{path}.tmp", path)
+
+
+def get_partition_keys(series, unit: str):
+    """Partition of each value of the partition column, as an ISO string"""
+    import pandas as pd
+
+    dates = pd.to_datetime(series, utc=True).dt.tz_convert(None)
+    truncated = dates.to_numpy().astype(f"datetime64[{PARTITION_UNITS[unit]}]")
+    keys = pd.Series(truncated.astype(str), index=series.index)
+    return keys.where(dates.notna(), NULL_PARTITION)
+
+
+def get_partition_start(key: str, partition_type) -> Any:
+    """Start of the partition, typed as the partition column"""
+    import numpy as np
+    import pandas as pd
+
+    start = pd.Timestamp(np.datetime64(key)).to_pydatetime()
+    if isinstance(partition_type, Date):
+        return start.date()
+    return start
+
+
+def _get_row_aggregates(keys: List, row: Dict[str, Any]) -> Dict[str, Dict[str, Any]]:
+    """Aggregates of the labelled row, by column and metric names"""
+    aggregates: Dict[str, Dict[str, Any]] = defaultdict(dict)
+    for idx, (column_name, metric_name) in enumerate(keys):
+        aggregates[column_name][metric_name] = row[f"m{idx}"]
+    return aggregates
+
+
+class PartitionProfiler:
+    """
+    Profile a table from the states of its partitions. Only applies to
+    time-partitioned tables profiled through SQLAlchemy, without a profile query.
+    """
+
+    def __init__(self, profiler: Profiler, store: PartitionStateStore):
+        self.profiler = profiler
+        self.store = store
+        self.profiler_interface = profiler.profiler_interface
+        self.partition_details: PartitionProfilerConfig = (
+            self.profiler_interface.partition_details
+        )
+        self.table_fqn = (
+            self.profiler_interface.table_entity.fullyQualifiedName.__root__
+        )
+        self.columns = {col.name: get_column_kind(col) for col in profiler.columns}
+        # Metrics of each column, as set in the includeColumns of the table
+        self.column_metrics = {
+            col.name: {
+                metric.name()
+                for metric in profiler.get_col_metrics(profiler.metrics, col)
+            }
+            for col in profiler.columns
+        }
+        self.sketch_columns = {
+            name
+            for name, metrics in self.column_metrics.items()
+            if metrics & SKETCH_METRICS
+        }
+        self.metrics = {metric.name() for metric in profiler.metrics}
+
+        dropped = self.metrics - COLUMN_METRICS - TABLE_METRICS
+        if dropped:
+            logger.warning(
+                f"Metrics {sorted(dropped)} are not computed when profiling {self.table_fqn}"
+                " from the state of its partitions"
+            )
+
+    @staticmethod
+    def is_supported(profiler: Profiler) -> bool:
+        """Check if the table is profiled by time partitions"""
+        partition_details = getattr(
+            profiler.profiler_interface, "partition_details", None
+        )
+        return bool(
+            hasattr(profiler.profiler_interface, "session")
+            and not getattr(profiler.profiler_interface, "profile_query", None)
+            and partition_details
+            and partition_details.enablePartitioning
+            and partition_details.partitionIntervalType
+            in {PartitionIntervalType.TIME_UNIT, PartitionIntervalType.INGESTION_TIME}
+            and partition_details.partitionIntervalUnit
+            and partition_details.partitionIntervalUnit.value in PARTITION_UNITS
+        )
+
+    @property
+    def signature(self) -> Dict:
+        profile_sample_config = self.profiler_interface.profile_sample_config
+        return {
+            "partitionColumnName": self.partition_details.partitionColumnName,
+            "partitionIntervalUnit": self.partition_details.partitionIntervalUnit.value,
+            "columns": self.columns,
+            "sketchColumns": sorted(self.sketch_columns),
+            "profileSample": profile_sample_config.dict(exclude_none=True)
+            if profile_sample_config and profile_sample_config.profile_sample
+            else None,
+        }
+
+    @property
+    def partition_unit(self) -> str:
+        return self.partition_details.partitionIntervalUnit.value
+
+    def _get_partition_key(self):
+        """Partition column truncated to the start of its partition"""
+        return DateTruncFn(
+            column(self.partition_details.partitionColumnName), self.partition_unit
+        )
+
+    def _filter_since(self, query, since: Optional[str]):
+        """Keep the partitions from `since`, and the rows without partition"""
+        if not since:
+            return query
+        partition_field = self.partition_details.partitionColumnName
+        partition_col = column(partition_field)
+        partition_type = get_partition_col_type(
+            partition_field, self.profiler_interface.table.__table__.c
+        )
+        return query.filter(
+            or_(
+                partition_col >= get_partition_start(since, partition_type),
+                partition_col.is_(None),
+            )
+        )
+
+    def _get_sample_percent(self, row_count: int) -> Optional[float]:
+        """Percentage of the rows read for the sketches, as set by profileSample"""
+        profile_sample_config = self.profiler_interface.profile_sample_config
+        if not profile_sample_config or not profile_sample_config.profile_sample:
+            return None
+        if profile_sample_config.profile_sample_type == ProfileSampleType.ROWS:
+            # Rows out of the rows scanned by this run
+            return (
+                100 * profile_sample_config.profile_sample / row_count
+                if row_count
+                else None
+            )
+        return profile_sample_config.profile_sample
+
+    def _get_aggregate_expressions(self):
+        """
+        Label the SQL aggregates of the columns. Returns the
+        column and metric names of each label with the expressions.
+        """
+        keys = []
+        expressions = []
+        for col in self.profiler.columns:
+            metrics = (
+                (Metrics.COUNT, *SQL_METRICS)
+                if self.columns[col.name] != OTHER
+                else (Metrics.COUNT,)
+            )
+            for metric in metrics:
+                expression = metric.value(col).fn()
+                if expression is not None:
+                    # short labels, as some dialects limit the identifiers length
+                    expressions.append(expression.element.label(f"m{len(keys)}"))
+                    keys.append((col.name, metric.value.name()))
+        return keys, expressions
+
+    def _compute_aggregates(self, since: Optional[str]) -> Dict[str, PartitionState]:
+        """Row count, counts, sum, min and max of each partition, in SQL"""
+        import pandas as pd
+
+        keys, expressions = self._get_aggregate_expressions()
+        partition_key = self._get_partition_key()
+        query = self._filter_since(
+            self.profiler_interface.session.query(
+                partition_key.label(PARTITION_LABEL),
+                func.count().label(ROW_COUNT_LABEL),
+                *expressions,
+            ).select_from(self.profiler_interface.table),
+            since,
+        ).group_by(partition_key)
+        rows = [
+            dict(row)
+            for row in self.profiler_interface.session.execute(query.statement)
+        ]
+
+        partition_keys = get_partition_keys(
+            pd.Series([row[PARTITION_LABEL] for row in rows], dtype=object),
+            self.partition_unit,
+        )
+        states: Dict[str, PartitionState] = {}
+        for key, row in zip(partition_keys, rows):
+            states.setdefault(
+                key, PartitionState(self.columns, self.sketch_columns)
+            ).update_aggregates(row[ROW_COUNT_LABEL], _get_row_aggregates(keys, row))
+        return states
+
+    def _compute_sketches(
+        self, states: Dict[str, PartitionState], since: Optional[str]
+    ) -> None:
+        """
+        Read the values of the columns profiled with a sketch metric,
+        streamed one chunk at a time, and add them to the partition states
+        """
+        import pandas as pd
+
+        if not self.sketch_columns or not states:
+            return
+
+        query = self._filter_since(
+            self.profiler_interface.session.query(
+                *[
+                    col.label(col.name)
+                    for col in self.profiler.columns
+                    if col.name in self.sketch_columns
+                ],
+                self._get_partition_key().label(PARTITION_LABEL),
+            ).select_from(self.profiler_interface.table),
+            since,
+        )
+        percent = self._get_sample_percent(
+            sum(state.row_count for state in states.values())
+        )
+        if percent is not None and percent < 100:
+            query = query.filter(ModuloFn(RandomNumFn(), 100) < percent)
+
+        result = self.profiler_interface.session.execute(
+            query.statement.execution_options(stream_results=True)
+        )
+        keys = list(result.keys())
+        for rows in result.partitions(CHUNK_SIZE):
+            df = pd.DataFrame([tuple(row) for row in rows], columns=keys)
+            partition_keys = get_partition_keys(
+                df[PARTITION_LABEL], self.partition_unit
+            )
+            for key, partition_df in df.groupby(partition_keys):
+                # Partitions landed after the aggregates are profiled by the next run
+                if key in states:
+                    states[key].update_sketches(partition_df)
+
+    def compute_partition_states(
+        self, since: Optional[str]
+    ) -> Dict[str, PartitionState]:
+        """Compute the states of the partitions from `since`, or all of them"""
+        states = self._compute_aggregates(since)
+        self._compute_sketches(states, since)
+        return states
+
+    def get_partition_states(self) -> Dict[str, PartitionState]:
+        """Stored states, updated with the partitions landed since"""
+        states = self.store.load(self.table_fqn, self.signature)
+        since = max((key for key in states if key != NULL_PARTITION), default=None)
+        logger.debug(
+            f"Profiling the partitions of {self.table_fqn} since {since}"
+            if since
+            else f"Profiling all the partitions of {self.table_fqn}"
+        )
+        states = {
+            key: state
+            for key, state in states.items()
+            if key != NULL_PARTITION and key < (since or "")
+        }
+        states.update(self.compute_partition_states(since))
+        self.store.save(self.table_fqn, self.signature, states)
+        return states
+
+    def get_profile(
+        self, states: Iterable[PartitionState]
+    ) -> CreateTableProfileRequest:
+        """
+        Whole-table profile from the merge of the partition states,
+        keeping the metrics set for the table and its columns
+        """
+        table_state = PartitionState(self.columns, self.sketch_columns)
+        for state in states:
+            table_state.merge(state)
+
+        timestamp = datetime.now(tz=timezone.utc).timestamp()
+        column_profile: List[ColumnProfile] = [
+            ColumnProfile(
+                name=name,
+                timestamp=timestamp,
+                **{
+                    metric: value
+                    for metric, value in column_state.get_metrics().items()
+                    if metric in self.column_metrics[name]
+                },
+            )
+            for name, column_state in table_state.columns.items()
+        ]
+        profile_sample_config = self.profiler_interface.profile_sample_config
+        return CreateTableProfileRequest(
+            tableProfile=TableProfile(
+                timestamp=timestamp,
+                columnCount=len(self.profiler_interface.get_columns())
+                if Metrics.COLUMN_COUNT.value.name() in self.metrics
+                else None,
+                rowCount=table_state.row_count
+                if Metrics.ROW_COUNT.value.name() in self.metrics
+                else None,
+                profileSample=profile_sample_config.profile_sample
+                if profile_sample_config
+                else None,
+                profileSampleType=profile_sample_config.profile_sample_type
+                if profile_sample_config
+                else None,
+            ),
+            columnProfile=column_profile,
+        )
+
+    def process(
+        self,
+        generate_sample_data: Optional[bool],
+        process_pii_sensitive: Optional[bool],
+    ) -> ProfilerResponse:
+        """Profile the table as `Profiler.process` does"""
+        profile = self.get_profile(self.get_partition_states().values())
+        sample_data = (
+            self.profiler.generate_sample_data() if generate_sample_data else None
+        )
+        if process_pii_sensitive:
+            self.profiler.process_pii_sensitive(sample_data)
+
+        return ProfilerResponse(
+            table=self.profiler_interface.table_entity,
+            profile=profile,
+            sample_data=sample_data,
+        )
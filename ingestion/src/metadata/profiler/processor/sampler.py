@@ -14,7 +14,7 @@ for the profiler
 """
 from typing import Dict, List, Optional, Union, cast
 
-from sqlalchemy import Column, inspect, text
+from sqlalchemy import Column, inspect, literal_column, text
 from sqlalchemy.orm import DeclarativeMeta, Query, Session, aliased
 from sqlalchemy.orm.util import AliasedClass
 from sqlalchemy.sql.sqltypes import Enum
@@ -28,6 +28,11 @@ from metadata.generated.schema.entity.data.table import (
 from metadata.profiler.api.models import ProfileSampleConfig
 from metadata.profiler.orm.functions.modulo import ModuloFn
 from metadata.profiler.orm.functions.random_num import RandomNumFn
+from metadata.profiler.orm.functions.row_estimate import row_estimate_factory
+from metadata.profiler.orm.functions.table_sample import (
+    TABLESAMPLE_DIALECTS,
+    TableSampleFn,
+)
 from metadata.profiler.orm.registry import Dialects
 from metadata.profiler.processor.handle_partition import partition_filter_handler
 from metadata.utils.sqa_utils import (
@@ -39,6 +44,10 @@ from metadata.utils.sqa_utils import (
 )
 
 RANDOM_LABEL = "random"
+# Sample more rows than needed in case the table statistics are outdated,
+# and so that random samples of few rows are not short of them
+OVERSAMPLING = 1.5
+OVERSAMPLING_ROWS = 100
 
 
 def _object_value_for_elem(self, elem):
@@ -85,46 +94,87 @@ class Sampler:
         self.sample_limit = 100
         self._sample_rows = None
 
+    @property
+    def _dialect(self) -> str:
+        return self.session.get_bind().dialect.name
+
+    def _get_sample_columns(self, selectable) -> List[Column]:
+        return [
+            selectable.c.get(
+                col_name.lower()
+            )  # key is lowercase. See converter.py line 155
+            for col_name in self.sample_columns
+        ]
+
+    def _tablesample(self, size: Union[int, float], rows: bool = False):
+        return self.table.__table__.tablesample(
+            TableSampleFn(size, rows=rows),
+            name=f"{self.table.__tablename__}_tablesample",
+        )
+
     @partition_filter_handler(build_sample=True)
     def get_sample_query(self) -> Query:
         """get query for sample data"""
         if self.profile_sample_type == ProfileSampleType.PERCENTAGE:
+            return self._get_percentage_sample_query(self.profile_sample or 100)
+        return self._get_rows_sample_query(self.profile_sample or self.sample_limit)
+
+    def _get_percentage_sample_query(self, percent: Union[int, float]) -> Query:
+        """
+        Use TABLESAMPLE if the dialect supports it. Otherwise, we add
+        a random number between 0 and 100 to filter the rows with.
+        """
+        if percent < 100 and self._dialect in TABLESAMPLE_DIALECTS:
+            sampled = self._tablesample(percent)
             return (
                 self.session.query(
-                    *[
-                        self.table.__table__.c.get(
-                            col_name.lower()
-                        )  # key is lowercase. See converter.py line 155
-                        for col_name in self.sample_columns
-                    ],
-                    (ModuloFn(RandomNumFn(), 100)).label(RANDOM_LABEL),
-                )
-                .select_from(self.table)
-                .suffix_with(
-                    f"SAMPLE BERNOULLI ({self.profile_sample or 100})",
-                    dialect=Dialects.Snowflake,
+                    *self._get_sample_columns(sampled),
+                    # Rows are already sampled, keep all of them
+                    literal_column("0").label(RANDOM_LABEL),
                 )
+                .select_from(sampled)
                 .cte(f"{self.table.__tablename__}_rnd")
             )
-        table_query = self.session.query(
-            *[
-                self.table.__table__.c.get(col_name.lower())
-                for col_name in self.sample_columns
-            ]  # key is lowercase. See converter.py line 155
-        ).select_from(self.table)
         return (
             self.session.query(
-                *[
-                    self.table.__table__.c.get(
-                        col_name.lower()
-                    )  # key is lowercase. See converter.py line 155
-                    for col_name in self.sample_columns
-                ],
-                (ModuloFn(RandomNumFn(), table_query.count())).label(RANDOM_LABEL),
+                *self._get_sample_columns(self.table.__table__),
+                (ModuloFn(RandomNumFn(), 100)).label(RANDOM_LABEL),
             )
             .select_from(self.table)
+            .cte(f"{self.table.__tablename__}_rnd")
+        )
+
+    def _get_rows_sample_query(self, rows: int) -> Query:
+        """
+        Pick random rows sorting them by a random number. To not sort the whole
+        table, we first sample a bit more than the rows we need, using the
+        estimated table size: with TABLESAMPLE if the dialect supports it, or
+        filtering by a random number otherwise.
+        """
+        if self._dialect == Dialects.Snowflake:
+            sampled, row_count, filters = self._tablesample(rows, rows=True), rows, []
+        else:
+            row_count = row_estimate_factory.estimate(self.session, self.table)
+            percent = (
+                100 * (rows * OVERSAMPLING + OVERSAMPLING_ROWS) / row_count
+                if row_count
+                else 100
+            )
+            sampled, filters = self.table.__table__, []
+            if percent < 100 and self._dialect in TABLESAMPLE_DIALECTS:
+                sampled = self._tablesample(percent)
+            elif percent < 100:
+                filters.append(ModuloFn(RandomNumFn(), 100) <= percent)
+
+        return (
+            self.session.query(
+                *self._get_sample_columns(sampled),
+                (ModuloFn(RandomNumFn(), max(row_count, 1))).label(RANDOM_LABEL),
+            )
+            .select_from(sampled)
+            .filter(*filters)
             .order_by(RANDOM_LABEL)
-            .limit(self.profile_sample)
+            .limit(rows)
             .cte(f"{self.table.__tablename__}_rnd")
         )
 
@@ -146,10 +196,10 @@ class Sampler:
         rnd = self.get_sample_query()
         session_query = self.session.query(rnd)
 
-        # Prepare sampled CTE
-        sampled = session_query.where(rnd.c.random <= self.profile_sample).cte(
-            f"{self.table.__tablename__}_sample"
-        )
+        # Prepare sampled CTE. Row samples are already limited
+        if self.profile_sample_type == ProfileSampleType.PERCENTAGE:
+            session_query = session_query.where(rnd.c.random <= self.profile_sample)
+        sampled = session_query.cte(f"{self.table.__tablename__}_sample")
         # Assign as an alias
         return aliased(self.table, sampled)
 
@@ -17,7 +17,8 @@ from Avro file formats
 
 import io
 from functools import singledispatch
-from typing import Any
+from itertools import islice
+from typing import Any, Iterator, Optional
 
 from avro.datafile import DataFileReader
 from avro.errors import InvalidAvroBinaryEncoding
@@ -36,8 +37,12 @@ from metadata.generated.schema.entity.services.connections.database.datalake.s3C
 from metadata.generated.schema.type.schema import DataTypeTopic
 from metadata.ingestion.source.database.datalake.models import DatalakeColumnWrapper
 from metadata.parsers.avro_parser import parse_avro_schema
-from metadata.utils.constants import UTF_8
-from metadata.utils.datalake.datalake_utils import DatalakeFileFormatException
+from metadata.utils.constants import CHUNKSIZE, UTF_8
+from metadata.utils.datalake.datalake_utils import (
+    SCHEMA_SAMPLE_SIZE,
+    DatalakeFileFormatException,
+)
+from metadata.utils.datalake.head_dispatch import read_head_dispatch
 from metadata.utils.logger import utils_logger
 
 logger = utils_logger()
@@ -83,6 +88,46 @@ def read_from_avro(
         return DatalakeColumnWrapper(columns=columns, dataframes=DataFrame(field_map))
 
 
+def read_avro_chunks(avro_text: bytes) -> Iterator:
+    """
+    Lazily decode the avro records in dataframes of CHUNKSIZE rows
+    """
+    # pylint: disable=import-outside-toplevel
+    from pandas import DataFrame
+
+    try:
+        elements = DataFileReader(io.BytesIO(avro_text), DatumReader())
+    except (AssertionError, InvalidAvroBinaryEncoding):
+        # Schema files only give us an empty typed dataframe
+        yield read_from_avro(avro_text).dataframes
+        return
+
+    with elements:
+        records = list(islice(elements, CHUNKSIZE))
+        while records:
+            yield DataFrame.from_records(records)
+            records = list(islice(elements, CHUNKSIZE))
+
+
+def read_avro_schema_dispatch(
+    config_source: Any, key: str, **kwargs
+) -> Optional[DatalakeColumnWrapper]:
+    """
+    Parse the schema stored in the avro header, from the first bytes of the file
+    """
+    head = read_head_dispatch(config_source, key=key, size=SCHEMA_SAMPLE_SIZE, **kwargs)
+    # The reader only decodes the header when opened
+    with DataFileReader(io.BytesIO(head), DatumReader()) as elements:
+        schema = elements.meta.get(AVRO_SCHEMA)
+    if not schema:
+        return None
+    # The table columns are the fields of the top level record
+    records = parse_avro_schema(schema=schema.decode(UTF_8), cls=Column)
+    if not records or not records[0].children:
+        return None
+    return DatalakeColumnWrapper(columns=records[0].children)
+
+
 @singledispatch
 def read_avro_dispatch(config_source: Any, key: str, **kwargs):
     raise DatalakeFileFormatException(config_source=config_source, file_name=key)
@@ -93,24 +138,18 @@ def _(_: GCSConfig, key: str, bucket_name: str, client, **kwargs):
     """
     Read the avro file from the gcs bucket and return a dataframe
     """
-    from metadata.utils.datalake.datalake_utils import dataframe_to_chunks
-
     avro_text = client.get_bucket(bucket_name).get_blob(key).download_as_string()
-    return dataframe_to_chunks(read_from_avro(avro_text).dataframes)
+    return read_avro_chunks(avro_text)
 
 
 @read_avro_dispatch.register
 def _(_: S3Config, key: str, bucket_name: str, client, **kwargs):
-    from metadata.utils.datalake.datalake_utils import dataframe_to_chunks
-
     avro_text = client.get_object(Bucket=bucket_name, Key=key)["Body"].read()
-    return dataframe_to_chunks(read_from_avro(avro_text).dataframes)
+    return read_avro_chunks(avro_text)
 
 
 @read_avro_dispatch.register
 def _(_: AzureConfig, key: str, bucket_name: str, client, **kwargs):
-    from metadata.utils.datalake.datalake_utils import dataframe_to_chunks
-
     container_client = client.get_container_client(bucket_name)
     avro_text = container_client.get_blob_client(key).download_blob().readall()
-    return dataframe_to_chunks(read_from_avro(avro_text).dataframes)
+    return read_avro_chunks(avro_text)
@@ -13,8 +13,9 @@
 Module to define helper methods for datalake and to fetch data and metadata 
 from Csv and Tsv file formats
 """
+import io
 from functools import singledispatch
-from typing import Any
+from typing import Any, Iterator
 
 import pandas as pd
 
@@ -27,8 +28,13 @@ from metadata.generated.schema.entity.services.connections.database.datalake.gcs
 from metadata.generated.schema.entity.services.connections.database.datalake.s3Config import (
     S3Config,
 )
+from metadata.ingestion.source.database.datalake.models import DatalakeColumnWrapper
 from metadata.utils.constants import CHUNKSIZE
-from metadata.utils.datalake.datalake_utils import DatalakeFileFormatException
+from metadata.utils.datalake.datalake_utils import (
+    SCHEMA_SAMPLE_SIZE,
+    DatalakeFileFormatException,
+)
+from metadata.utils.datalake.head_dispatch import read_head_dispatch
 from metadata.utils.logger import utils_logger
 
 logger = utils_logger()
@@ -37,14 +43,46 @@ TSV_SEPARATOR = "\t"
 CSV_SEPARATOR = ","
 
 
-def read_from_pandas(path: str, separator: str, storage_options=None):
-    chunk_list = []
+def read_from_pandas(
+    path: str, separator: str, storage_options=None
+) -> Iterator[pd.DataFrame]:
+    """
+    Lazily read the file in chunks of CHUNKSIZE rows
+    """
     with pd.read_csv(
         path, sep=separator, chunksize=CHUNKSIZE, storage_options=storage_options
     ) as reader:
-        for chunks in reader:
-            chunk_list.append(chunks)
-    return chunk_list
+        yield from reader
+
+
+def read_head_from_pandas(head: bytes, separator: str) -> pd.DataFrame:
+    """
+    Read the first bytes of the file. If we did not get the whole
+    file, we drop the last line as it might be incomplete.
+    """
+    if len(head) >= SCHEMA_SAMPLE_SIZE:
+        head = head[: head.rfind(b"\n") + 1]
+    return pd.read_csv(io.BytesIO(head), sep=separator)
+
+
+def read_csv_schema_dispatch(config_source: Any, key: str, **kwargs):
+    """
+    Infer the CSV schema from the first bytes of the file
+    """
+    head = read_head_dispatch(config_source, key=key, size=SCHEMA_SAMPLE_SIZE, **kwargs)
+    return DatalakeColumnWrapper(
+        dataframes=read_head_from_pandas(head=head, separator=CSV_SEPARATOR)
+    )
+
+
+def read_tsv_schema_dispatch(config_source: Any, key: str, **kwargs):
+    """
+    Infer the TSV schema from the first bytes of the file
+    """
+    head = read_head_dispatch(config_source, key=key, size=SCHEMA_SAMPLE_SIZE, **kwargs)
+    return DatalakeColumnWrapper(
+        dataframes=read_head_from_pandas(head=head, separator=TSV_SEPARATOR)
+    )
 
 
 @singledispatch
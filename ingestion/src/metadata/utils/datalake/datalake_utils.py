@@ -16,9 +16,11 @@ from different auths and different file systems.
 
 
 from enum import Enum
-from typing import Any, Dict
+from itertools import islice
+from typing import Any, Callable, Dict, Iterator, Optional
 
 from metadata.ingestion.source.database.datalake.models import (
+    DatalakeColumnWrapper,
     DatalakeTableSchemaWrapper,
 )
 from metadata.utils.constants import CHUNKSIZE
@@ -27,6 +29,8 @@ from metadata.utils.logger import utils_logger
 logger = utils_logger()
 COMPLEX_COLUMN_SEPARATOR = "_##"
 AZURE_PATH = "abfs://{bucket_name}@{account_name}.dfs.core.windows.net/{key}"
+# Bytes read from the start of csv, tsv, json and avro files to infer their schema
+SCHEMA_SAMPLE_SIZE = 64 * 1024
 logger = utils_logger()
 
 
@@ -57,6 +61,26 @@ class FILE_FORMAT_DISPATCH_MAP:
             SUPPORTED_TYPES.JSONZIP: read_json_dispatch,
         }
 
+    @classmethod
+    def fetch_schema_dispatch(cls):
+        from metadata.utils.datalake.avro_dispatch import read_avro_schema_dispatch
+        from metadata.utils.datalake.csv_tsv_dispatch import (
+            read_csv_schema_dispatch,
+            read_tsv_schema_dispatch,
+        )
+        from metadata.utils.datalake.json_dispatch import read_json_schema_dispatch
+        from metadata.utils.datalake.parquet_dispatch import (
+            read_parquet_schema_dispatch,
+        )
+
+        return {
+            SUPPORTED_TYPES.CSV: read_csv_schema_dispatch,
+            SUPPORTED_TYPES.TSV: read_tsv_schema_dispatch,
+            SUPPORTED_TYPES.AVRO: read_avro_schema_dispatch,
+            SUPPORTED_TYPES.PARQUET: read_parquet_schema_dispatch,
+            SUPPORTED_TYPES.JSON: read_json_schema_dispatch,
+        }
+
 
 class SUPPORTED_TYPES(Enum):
     CSV = "csv"
@@ -71,6 +95,10 @@ class SUPPORTED_TYPES(Enum):
     def return_dispatch(self):
         return FILE_FORMAT_DISPATCH_MAP.fetch_dispatch().get(self)
 
+    @property
+    def return_schema_dispatch(self):
+        return FILE_FORMAT_DISPATCH_MAP.fetch_schema_dispatch().get(self)
+
 
 def return_azure_storage_options(config_source: Any) -> Dict:
     connection_args = config_source.securityConfig
@@ -92,11 +120,71 @@ def dataframe_to_chunks(df):
     ]
 
 
+class DataFrameChunks:
+    """
+    Chunks of a file read lazily, one at a time. Each iteration reads the
+    file again, so that we never hold more than a chunk in memory.
+    """
+
+    def __init__(self, read_chunks: Callable[[], Optional[Iterator]]):
+        self._read_chunks = read_chunks
+        self._first_chunk = None
+
+    def __iter__(self) -> Iterator:
+        return iter(self._read_chunks() or [])
+
+    def __getitem__(self, idx: int):
+        """
+        Only read the chunks up to `idx`. The first one is kept, e.g., to get the columns
+        """
+        if idx == 0 and self._first_chunk is not None:
+            return self._first_chunk
+        chunks = iter(self)
+        try:
+            chunk = next(islice(chunks, idx, None), None)
+        finally:
+            close_chunks(chunks)
+        if chunk is None:
+            raise IndexError(f"No chunk {idx} in the file")
+        if idx == 0:
+            self._first_chunk = chunk
+        return chunk
+
+    def __bool__(self) -> bool:
+        try:
+            self[0]  # pylint: disable=pointless-statement
+            return True
+        except IndexError:
+            return False
+
+    def map(self, func: Callable) -> "DataFrameChunks":
+        """
+        Apply `func` to each chunk as it is read
+        """
+        return DataFrameChunks(lambda: (func(chunk) for chunk in self))
+
+
+def close_chunks(chunks: Iterator) -> None:
+    """
+    Release the file when we don't need the rest of it
+    """
+    close = getattr(chunks, "close", None)
+    if close:
+        close()
+
+
 def fetch_dataframe(
-    config_source, client, file_fqn: DatalakeTableSchemaWrapper, **kwargs
+    config_source,
+    client,
+    file_fqn: DatalakeTableSchemaWrapper,
+    lazy: bool = False,
+    **kwargs,
 ):
     """
-    Method to get dataframe for profiling
+    Method to get dataframe for profiling.
+
+    With `lazy`, we return an iterator reading the file one chunk at a time.
+    Errors while reading the chunks are then raised to the caller.
     """
     # dispatch to handle fetching of data from multiple file formats (csv, tsv, json, avro and parquet)
     key: str = file_fqn.key
@@ -105,15 +193,89 @@ def fetch_dataframe(
     try:
         for supported_types_enum in SUPPORTED_TYPES:
             if key.endswith(supported_types_enum.value):
-                return supported_types_enum.return_dispatch(
+                chunks = supported_types_enum.return_dispatch(
                     config_source,
                     key=key,
                     bucket_name=bucket_name,
                     client=client,
                     **kwargs,
                 )
+                return iter(chunks) if lazy else list(chunks)
     except Exception as err:
         logger.error(
             f"Error fetching file {bucket_name}/{key} using {config_source.__class__.__name__} due to: {err}"
         )
     return None
+
+
+def fetch_dataframe_first_chunk(
+    config_source, client, file_fqn: DatalakeTableSchemaWrapper, **kwargs
+):
+    """
+    Read only the first chunk of the file, e.g., to infer its schema
+    """
+    chunks = fetch_dataframe(config_source, client, file_fqn, lazy=True, **kwargs)
+    if chunks is None:
+        return None
+    try:
+        return next(chunks, None)
+    except Exception as err:
+        logger.error(
+            f"Error fetching file {file_fqn.bucket_name}/{file_fqn.key} "
+            f"using {config_source.__class__.__name__} due to: {err}"
+        )
+        return None
+    finally:
+        close_chunks(chunks)
+
+
+def fetch_dataframe_schema(
+    config_source,
+    client,
+    file_fqn: DatalakeTableSchemaWrapper,
+    use_avro_schema: bool = False,
+    **kwargs,
+) -> Optional[DatalakeColumnWrapper]:
+    """
+    Infer the file schema reading as little of it as possible: the parquet
+    footer, the avro header or the first bytes of csv, tsv and json files.
+    We fall back to reading the first chunk of the file.
+
+    Avro columns are only read from the header with `use_avro_schema`,
+    as their types differ from the ones inferred from the records.
+    """
+    key: str = file_fqn.key
+    bucket_name: str = file_fqn.bucket_name
+
+    try:
+        for supported_types_enum in SUPPORTED_TYPES:
+            if key.endswith(supported_types_enum.value):
+                schema_dispatch = (
+                    supported_types_enum.return_schema_dispatch
+                    if use_avro_schema or supported_types_enum != SUPPORTED_TYPES.AVRO
+                    else None
+                )
+                wrapper = (
+                    schema_dispatch(
+                        config_source,
+                        key=key,
+                        bucket_name=bucket_name,
+                        client=client,
+                        **kwargs,
+                    )
+                    if schema_dispatch
+                    else None
+                )
+                if wrapper:
+                    return wrapper
+                break
+    except Exception as err:
+        logger.debug(
+            f"Could not infer the schema of {bucket_name}/{key} without reading it, "
+            f"reading its first chunk instead: {err}"
+        )
+
+    data_frame = fetch_dataframe_first_chunk(config_source, client, file_fqn, **kwargs)
+    if data_frame is None:
+        return None
+    return DatalakeColumnWrapper(dataframes=data_frame)
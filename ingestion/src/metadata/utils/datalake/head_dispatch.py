@@ -0,0 +1,59 @@
+#  Copyright 2021 Collate
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#  http://www.apache.org/licenses/LICENSE-2.0
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+"""
+Module to read only the first bytes of the datalake files
+with ranged requests, e.g., to infer their schema
+"""
+from functools import singledispatch
+from typing import Any
+
+from metadata.generated.schema.entity.services.connections.database.datalake.azureConfig import (
+    AzureConfig,
+)
+from metadata.generated.schema.entity.services.connections.database.datalake.gcsConfig import (
+    GCSConfig,
+)
+from metadata.generated.schema.entity.services.connections.database.datalake.s3Config import (
+    S3Config,
+)
+from metadata.utils.datalake.datalake_utils import DatalakeFileFormatException
+
+
+@singledispatch
+def read_head_dispatch(config_source: Any, key: str, size: int, **kwargs) -> bytes:
+    raise DatalakeFileFormatException(config_source=config_source, file_name=key)
+
+
+@read_head_dispatch.register
+def _(_: GCSConfig, key: str, size: int, bucket_name: str, client, **kwargs) -> bytes:
+    return (
+        client.get_bucket(bucket_name)
+        .get_blob(key)
+        .download_as_string(start=0, end=size - 1)
+    )
+
+
+@read_head_dispatch.register
+def _(_: S3Config, key: str, size: int, bucket_name: str, client, **kwargs) -> bytes:
+    return client.get_object(Bucket=bucket_name, Key=key, Range=f"bytes=0-{size - 1}")[
+        "Body"
+    ].read()
+
+
+@read_head_dispatch.register
+def _(_: AzureConfig, key: str, size: int, bucket_name: str, client, **kwargs) -> bytes:
+    container_client = client.get_container_client(bucket_name)
+    return (
+        container_client.get_blob_client(key)
+        .download_blob(offset=0, length=size)
+        .readall()
+    )
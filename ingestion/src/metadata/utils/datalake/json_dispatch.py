@@ -18,7 +18,7 @@ import io
 import json
 import zipfile
 from functools import singledispatch
-from typing import Any, List
+from typing import Any, List, Optional
 
 from metadata.generated.schema.entity.services.connections.database.datalake.azureConfig import (
     AzureConfig,
@@ -29,8 +29,13 @@ from metadata.generated.schema.entity.services.connections.database.datalake.gcs
 from metadata.generated.schema.entity.services.connections.database.datalake.s3Config import (
     S3Config,
 )
+from metadata.ingestion.source.database.datalake.models import DatalakeColumnWrapper
 from metadata.utils.constants import UTF_8
-from metadata.utils.datalake.datalake_utils import DatalakeFileFormatException
+from metadata.utils.datalake.datalake_utils import (
+    SCHEMA_SAMPLE_SIZE,
+    DatalakeFileFormatException,
+)
+from metadata.utils.datalake.head_dispatch import read_head_dispatch
 from metadata.utils.logger import utils_logger
 
 logger = utils_logger()
@@ -73,6 +78,38 @@ def read_from_json(
     return dataframe_to_chunks(json_normalize(data, sep=COMPLEX_COLUMN_SEPARATOR))
 
 
+def read_json_schema_dispatch(
+    config_source: Any, key: str, **kwargs
+) -> Optional[DatalakeColumnWrapper]:
+    """
+    Infer the schema of JSON files from their first bytes. Files not fitting
+    in there can only be read partially if they are JSON Lines.
+    """
+    # pylint: disable=import-outside-toplevel
+    from pandas import json_normalize
+
+    from metadata.utils.datalake.datalake_utils import COMPLEX_COLUMN_SEPARATOR
+
+    head = read_head_dispatch(config_source, key=key, size=SCHEMA_SAMPLE_SIZE, **kwargs)
+    if len(head) < SCHEMA_SAMPLE_SIZE:
+        return DatalakeColumnWrapper(
+            dataframes=read_from_json(key=key, json_text=head, decode=True)[0]
+        )
+
+    # Drop the last line, which might be incomplete
+    lines = head[: head.rfind(b"\n")].decode(UTF_8).strip().split("\n")
+    try:
+        data = [json.loads(line) for line in lines if line.strip()]
+    except json.decoder.JSONDecodeError:
+        logger.debug(f"{key} is not JSON Lines, its schema needs the whole file")
+        return None
+    if not data or not all(isinstance(obj, dict) for obj in data):
+        return None
+    return DatalakeColumnWrapper(
+        dataframes=json_normalize(data, sep=COMPLEX_COLUMN_SEPARATOR)
+    )
+
+
 @singledispatch
 def read_json_dispatch(config_source: Any, key: str, **kwargs):
     raise DatalakeFileFormatException(config_source=config_source, file_name=key)
@@ -16,7 +16,7 @@ from Parquet file formats
 
 
 from functools import singledispatch
-from typing import Any
+from typing import Any, Iterator, Optional, Set
 
 import pandas as pd
 
@@ -29,46 +29,113 @@ from metadata.generated.schema.entity.services.connections.database.datalake.gcs
 from metadata.generated.schema.entity.services.connections.database.datalake.s3Config import (
     S3Config,
 )
+from metadata.ingestion.source.database.datalake.models import DatalakeColumnWrapper
+from metadata.utils.constants import CHUNKSIZE
 from metadata.utils.datalake.datalake_utils import DatalakeFileFormatException
 from metadata.utils.logger import utils_logger
 
 logger = utils_logger()
 
 
-@singledispatch
+def read_from_parquet(file) -> Iterator[pd.DataFrame]:
+    """
+    Lazily read the parquet file from a file-like object, one batch of
+    at most CHUNKSIZE rows at a time, without loading the whole file
+    """
+    # pylint: disable=import-outside-toplevel
+    from pyarrow.parquet import ParquetFile
+
+    with file:
+        for batch in ParquetFile(file).iter_batches(batch_size=CHUNKSIZE):
+            yield batch.to_pandas(split_blocks=True, self_destruct=True)
+
+
 def read_parquet_dispatch(config_source: Any, key: str, **kwargs):
+    """
+    Lazily read the parquet file in dataframe chunks
+    """
+    return read_from_parquet(open_parquet_dispatch(config_source, key=key, **kwargs))
+
+
+def columns_with_nulls(parquet_file) -> Optional[Set[str]]:
+    """
+    Columns with nulls in the row groups of the first chunk, from the
+    footer statistics. None if the statistics don't tell.
+    """
+    metadata = parquet_file.metadata
+    columns, rows = set(), 0
+    for row_group_idx in range(metadata.num_row_groups):
+        if rows >= CHUNKSIZE:
+            break
+        row_group = metadata.row_group(row_group_idx)
+        rows += row_group.num_rows
+        for column_idx in range(row_group.num_columns):
+            column = row_group.column(column_idx)
+            statistics = column.statistics
+            if statistics is None or not statistics.has_null_count:
+                return None
+            if statistics.null_count:
+                columns.add(column.path_in_schema.split(".")[0])
+    return columns
+
+
+def read_parquet_schema_dispatch(
+    config_source: Any, key: str, **kwargs
+) -> Optional[DatalakeColumnWrapper]:
+    """
+    Get an empty dataframe with the parquet schema. Remote files only
+    fetch the ranges being read, so we just download the footer.
+
+    Columns get the dtypes pandas gives to the first chunk of the file,
+    e.g., float64 for integers with nulls. When the footer statistics
+    don't tell which columns have nulls, we return None to read the
+    first chunk instead.
+    """
+    # pylint: disable=import-outside-toplevel
+    import pyarrow as pa
+    from pyarrow.parquet import ParquetFile
+
+    with open_parquet_dispatch(config_source, key=key, **kwargs) as file:
+        parquet_file = ParquetFile(file)
+        schema = parquet_file.schema_arrow
+        nullable_columns = columns_with_nulls(parquet_file)
+    if nullable_columns is None:
+        return None
+
+    data_frame = schema.empty_table().to_pandas()
+    if nullable_columns:
+        null_row = pa.Table.from_arrays(
+            [pa.nulls(1, type=field.type) for field in schema], schema=schema
+        ).to_pandas()
+        for column in nullable_columns & set(data_frame.columns):
+            data_frame[column] = data_frame[column].astype(null_row[column].dtype)
+    return DatalakeColumnWrapper(dataframes=data_frame)
+
+
+@singledispatch
+def open_parquet_dispatch(config_source: Any, key: str, **kwargs):
     raise DatalakeFileFormatException(config_source=config_source, file_name=key)
 
 
-@read_parquet_dispatch.register
+@open_parquet_dispatch.register
 def _(_: GCSConfig, key: str, bucket_name: str, **kwargs):
     """
-    Read the parquet file from the gcs bucket and return a dataframe
+    Open the parquet file from the gcs bucket
     """
     # pylint: disable=import-outside-toplevel
     from gcsfs import GCSFileSystem
-    from pyarrow.parquet import ParquetFile
-
-    from metadata.utils.datalake.datalake_utils import dataframe_to_chunks
 
     gcs = GCSFileSystem()
-    file = gcs.open(f"gs://{bucket_name}/{key}")
-    dataframe_response = (
-        ParquetFile(file).read().to_pandas(split_blocks=True, self_destruct=True)
-    )
-    return dataframe_to_chunks(dataframe_response)
+    return gcs.open(f"gs://{bucket_name}/{key}")
 
 
-@read_parquet_dispatch.register
+@open_parquet_dispatch.register
 def _(_: S3Config, key: str, bucket_name: str, connection_kwargs, **kwargs):
     """
-    Read the parquet file from the s3 bucket and return a dataframe
+    Open the parquet file from the s3 bucket
     """
     # pylint: disable=import-outside-toplevel
     import s3fs
-    from pyarrow.parquet import ParquetDataset
-
-    from metadata.utils.datalake.datalake_utils import dataframe_to_chunks
 
     client_kwargs = {}
     client = connection_kwargs
@@ -88,15 +155,19 @@ def _(_: S3Config, key: str, bucket_name: str, connection_kwargs, **kwargs):
             client_kwargs=client_kwargs,
         )
     bucket_uri = f"s3://{bucket_name}/{key}"
-    dataset = ParquetDataset(bucket_uri, filesystem=s3_fs)
-    return dataframe_to_chunks(dataset.read_pandas().to_pandas())
+    return s3_fs.open(bucket_uri, "rb")
 
 
-@read_parquet_dispatch.register
+@open_parquet_dispatch.register
 def _(config_source: AzureConfig, key: str, bucket_name: str, **kwargs):
+    """
+    Open the parquet file from the azure container
+    """
+    # pylint: disable=import-outside-toplevel
+    import fsspec
+
     from metadata.utils.datalake.datalake_utils import (
         AZURE_PATH,
-        dataframe_to_chunks,
         return_azure_storage_options,
     )
 
@@ -106,5 +177,4 @@ def _(config_source: AzureConfig, key: str, bucket_name: str, **kwargs):
         account_name=storage_options.get("account_name"),
         key=key,
     )
-    dataframe = pd.read_parquet(account_url, storage_options=storage_options)
-    return dataframe_to_chunks(dataframe)
+    return fsspec.open(account_url, "rb", **storage_options).open()
@@ -52,6 +52,31 @@ ES_INDEX_MAP = {
     "web_analytic_entity_view_report": "web_analytic_entity_view_report_data_index",
 }
 
+# Fields indexed with a different shape than the entity's,
+# e.g., the tier is split from the tags and followers are ids
+ES_SOURCE_SKIPPED_FIELDS = {"tags", "followers"}
+ES_SOURCE_SKIPPED_ENTITY_FIELDS = {
+    # Dashboards are indexed with their display name
+    Dashboard.__name__: {"name"},
+}
+
+# Fields the API returns when no fields are requested, indexed as the
+# entity defines them. Other attributes are only read from the documents
+# when requested, or when the entity requires them.
+ES_SOURCE_BASE_FIELDS = {
+    "id",
+    "name",
+    "fullyQualifiedName",
+    "displayName",
+    "description",
+    "version",
+    "updatedAt",
+    "updatedBy",
+    "href",
+    "deleted",
+    "service",
+}
+
 
 def get_entity_from_es_result(
     entity_list: Optional[List[T]], fetch_multiple_entities: bool = False
@@ -13,6 +13,7 @@
 LRU cache
 """
 
+import time
 from collections import OrderedDict
 
 
@@ -52,3 +53,36 @@ class LRUCache:
 
     def __len__(self) -> int:
         return len(self._cache)
+
+
+class TTLLRUCache(LRUCache):
+    """
+    Least Recently Used cache whose elements
+    expire `ttl` seconds after being put
+    """
+
+    def __init__(self, capacity: int, ttl: float) -> None:
+        super().__init__(capacity)
+        self.ttl = ttl
+
+    def get(self, key):
+        """
+        Returns the value associated to `key` if it exists and
+        has not expired, updating the cache usage.
+        Raises `KeyError` if `key` doesn't exist in the cache.
+        """
+        expires_at, value = super().get(key)
+        if expires_at < time.monotonic():
+            del self._cache[key]
+            raise KeyError(key)
+        return value
+
+    def put(self, key, value) -> None:
+        super().put(key, (time.monotonic() + self.ttl, value))
+
+    def __contains__(self, key) -> bool:
+        try:
+            self.get(key)
+            return True
+        except KeyError:
+            return False
@@ -18,7 +18,10 @@ import inspect
 import os
 import platform
 import signal
-from typing import Callable
+import threading
+from concurrent.futures import Future
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from typing import Callable, Optional
 
 from metadata.utils.constants import TEN_MIN
 from metadata.utils.logger import utils_logger
@@ -33,21 +36,55 @@ def _handle_timeout(signum, frame):
     raise TimeoutError(f"[SIGNUM {signum}] {os.strerror(errno.ETIME)}")
 
 
-def timeout(seconds: int = TEN_MIN) -> Callable:
+def _run_with_timeout(seconds: int, fn: Callable, *args, **kwargs):
+    """
+    Run the function in a daemon thread and wait for its result up to
+    `seconds`. Python threads cannot be interrupted: on timeout the
+    function keeps running in the background until it returns.
+    """
+    future = Future()
+    name = getattr(fn, "__name__", repr(fn))
+
+    def run():
+        if not future.set_running_or_notify_cancel():
+            return
+        try:
+            future.set_result(fn(*args, **kwargs))
+        except BaseException as exc:  # pylint: disable=broad-except
+            future.set_exception(exc)
+
+    threading.Thread(target=run, name=f"timeout-{name}", daemon=True).start()
+    try:
+        return future.result(timeout=seconds)
+    except FutureTimeoutError as exc:
+        raise TimeoutError(
+            f"[{name}] {os.strerror(errno.ETIME)} after {seconds} seconds"
+        ) from exc
+
+
+def timeout(
+    seconds: int = TEN_MIN, on_timeout: Optional[Callable[[], None]] = None
+) -> Callable:
     """
     Decorator factory to handle timeouts in functions. Defaults
     to 10 min.
 
-    This functionality is not supported on Windows.
+    In the main thread we rely on SIGALRM. Signals can only be handled
+    in the main thread, so elsewhere (and on Windows) the function runs
+    in a separate thread and we stop waiting for it after `seconds`.
 
     Args:
          seconds: seconds to wait until raising the timeout
+         on_timeout: called before raising the timeout, e.g., to release
+            the resources the function may still be using
     """
 
     def decorator(fn):
-        @functools.wraps(fn)
-        def inner(*args, **kwargs):
-            if platform.system() != "Windows":  # SIGALRM not supported on Windows
+        def run(*args, **kwargs):
+            if (
+                platform.system() != "Windows"  # SIGALRM not supported on Windows
+                and threading.current_thread() is threading.main_thread()
+            ):
                 signal.signal(signal.SIGALRM, _handle_timeout)
                 signal.alarm(seconds)
                 try:
@@ -56,19 +93,30 @@ def timeout(seconds: int = TEN_MIN) -> Callable:
                     signal.alarm(0)
                 return result
 
-            # If platform is Windows, run the function as-is
-            return fn(*args, **kwargs)
+            return _run_with_timeout(seconds, fn, *args, **kwargs)
+
+        @functools.wraps(fn)
+        def inner(*args, **kwargs):
+            try:
+                return run(*args, **kwargs)
+            except TimeoutError:
+                if on_timeout:
+                    on_timeout()
+                raise
 
         return inner
 
     return decorator
 
 
-def cls_timeout(seconds: int = TEN_MIN):
+def cls_timeout(
+    seconds: int = TEN_MIN, on_timeout: Optional[Callable[[], None]] = None
+):
     """
     Decorates with `timeout` all methods
     of a class cls
     :param seconds: timeout to use
+    :param on_timeout: called when a method times out
     :return: class with decorated methods
     """
 
@@ -76,7 +124,11 @@ def cls_timeout(seconds: int = TEN_MIN):
         for attr_name, attr in inspect.getmembers(  # pylint: disable=unused-variable
             cls, inspect.ismethod
         ):
-            setattr(cls, attr_name, timeout(seconds)(getattr(cls, attr_name)))
+            setattr(
+                cls,
+                attr_name,
+                timeout(seconds, on_timeout=on_timeout)(getattr(cls, attr_name)),
+            )
 
         return cls
 
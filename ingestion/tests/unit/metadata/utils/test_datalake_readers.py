@@ -0,0 +1,285 @@
+#  Copyright 2021 Collate
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#  http://www.apache.org/licenses/LICENSE-2.0
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+"""
+Test the lazy datalake readers
+"""
+import io
+import os
+import tempfile
+from types import GeneratorType, SimpleNamespace
+from unittest import TestCase
+from unittest.mock import MagicMock, patch
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+from metadata.generated.schema.entity.data.table import ProfileSampleType
+from metadata.generated.schema.entity.services.connections.database.datalake.s3Config import (
+    S3Config,
+)
+from metadata.ingestion.source.database.datalake.models import (
+    DatalakeTableSchemaWrapper,
+)
+from metadata.mixins.pandas.pandas_mixin import PandasInterfaceMixin
+from metadata.profiler.api.models import ProfileSampleConfig
+from metadata.utils.datalake.avro_dispatch import read_avro_chunks
+from metadata.utils.datalake.csv_tsv_dispatch import read_from_pandas
+from metadata.utils.datalake.datalake_utils import (
+    DataFrameChunks,
+    fetch_dataframe,
+    fetch_dataframe_first_chunk,
+    fetch_dataframe_schema,
+)
+from metadata.utils.datalake.parquet_dispatch import read_from_parquet
+
+AVRO_DATA_FILE = b'Obj\x01\x04\x16avro.schema\xe8\x05{"type":"record","name":"twitter_schema","namespace":"com.miguno.avro","fields":[{"name":"username","type":"string","doc":"Name of the user account on Twitter.com"},{"name":"tweet","type":"string","doc":"The content of the user\'s Twitter message"},{"name":"timestamp","type":"long","doc":"Unix epoch time in seconds"}],"doc:":"A basic schema for storing Twitter messages"}\x14avro.codec\x08null\x00g\xc75)s\xef\xdf\x94\xad\xd3\x00~\x9e\xeb\xff\xae\x04\xc8\x01\x0cmigunoFRock: Nerf paper, scissors is fine.\xb2\xb8\xee\x96\n\x14BlizzardCSFWorks as intended.  Terran is IMBA.\xe2\xf3\xee\x96\ng\xc75)s\xef\xdf\x94\xad\xd3\x00~\x9e\xeb\xff\xae'  # pylint: disable=line-too-long
+
+
+@patch("metadata.utils.datalake.csv_tsv_dispatch.CHUNKSIZE", 2)
+@patch("metadata.utils.datalake.parquet_dispatch.CHUNKSIZE", 2)
+@patch("metadata.utils.datalake.avro_dispatch.CHUNKSIZE", 1)
+class DatalakeReadersTest(TestCase):
+    """
+    Files are read one chunk at a time
+    """
+
+    df = pd.DataFrame({"id": range(5), "name": list("abcde")})
+
+    def test_csv_chunks(self):
+        reader = read_from_pandas(io.StringIO(self.df.to_csv(index=False)), ",")
+        self.assertIsInstance(reader, GeneratorType)
+        chunks = list(reader)
+        self.assertEqual([len(chunk) for chunk in chunks], [2, 2, 1])
+        self.assertTrue(pd.concat(chunks).equals(self.df))
+
+    def test_parquet_chunks(self):
+        buffer = io.BytesIO()
+        pq.write_table(pa.Table.from_pandas(self.df), buffer, row_group_size=3)
+        buffer.seek(0)
+
+        reader = read_from_parquet(buffer)
+        first_chunk = next(reader)
+        self.assertEqual(len(first_chunk), 2)
+        chunks = [first_chunk, *reader]
+        self.assertEqual(sum(len(chunk) for chunk in chunks), 5)
+        self.assertEqual(pd.concat(chunks)["name"].to_list(), list("abcde"))
+        self.assertTrue(buffer.closed)
+
+    def test_avro_chunks(self):
+        chunks = list(read_avro_chunks(AVRO_DATA_FILE))
+        self.assertEqual(len(chunks), 2)
+        self.assertEqual(chunks[0]["username"].to_list(), ["miguno"])
+        self.assertEqual(chunks[1]["username"].to_list(), ["BlizzardCS"])
+
+    def test_fetch_dataframe(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = os.path.join(tmp_dir, "data.csv")
+            self.df.to_csv(path, index=False)
+            client = MagicMock()
+            client.get_object.return_value = {"Body": path}
+            file_fqn = DatalakeTableSchemaWrapper(key="data.csv", bucket_name="bucket")
+
+            chunks = fetch_dataframe(S3Config(), client, file_fqn)
+            self.assertEqual([len(chunk) for chunk in chunks], [2, 2, 1])
+
+            lazy_chunks = fetch_dataframe(S3Config(), client, file_fqn, lazy=True)
+            self.assertIsInstance(lazy_chunks, GeneratorType)
+            self.assertEqual(len(list(lazy_chunks)), 3)
+
+            first_chunk = fetch_dataframe_first_chunk(S3Config(), client, file_fqn)
+            self.assertEqual(first_chunk["id"].to_list(), [0, 1])
+
+
+def ranged_s3_client(content: bytes) -> MagicMock:
+    """S3 client mock honouring the Range of get_object calls"""
+
+    def get_object(Bucket, Key, Range=None):  # pylint: disable=invalid-name
+        body = content
+        if Range:
+            start, end = Range.replace("bytes=", "").split("-")
+            body = content[int(start) : int(end) + 1]
+        return {"Body": io.BytesIO(body)}
+
+    client = MagicMock()
+    client.get_object.side_effect = get_object
+    return client
+
+
+@patch("metadata.utils.datalake.csv_tsv_dispatch.SCHEMA_SAMPLE_SIZE", 64)
+@patch("metadata.utils.datalake.json_dispatch.SCHEMA_SAMPLE_SIZE", 64)
+@patch("metadata.utils.datalake.avro_dispatch.SCHEMA_SAMPLE_SIZE", 1024)
+class DatalakeSchemaTest(TestCase):
+    """
+    Schemas are inferred without reading the whole files
+    """
+
+    df = pd.DataFrame({"id": range(100), "name": ["name"] * 100})
+
+    def test_parquet_schema(self):
+        buffer = io.BytesIO()
+        pq.write_table(pa.Table.from_pandas(self.df), buffer)
+        buffer.seek(0)
+        with patch(
+            "metadata.utils.datalake.parquet_dispatch.open_parquet_dispatch",
+            return_value=buffer,
+        ):
+            wrapper = fetch_dataframe_schema(
+                S3Config(),
+                MagicMock(),
+                DatalakeTableSchemaWrapper(key="data.parquet", bucket_name="bucket"),
+            )
+        self.assertTrue(wrapper.dataframes.empty)
+        self.assertEqual(list(wrapper.dataframes.columns), ["id", "name"])
+        self.assertEqual(str(wrapper.dataframes["id"].dtype), "int64")
+
+    def _parquet_schema(self, table, **kwargs):
+        buffer = io.BytesIO()
+        pq.write_table(table, buffer, **kwargs)
+        with patch(
+            "metadata.utils.datalake.parquet_dispatch.open_parquet_dispatch",
+            side_effect=lambda *_, **__: io.BytesIO(buffer.getvalue()),
+        ):
+            return fetch_dataframe_schema(
+                S3Config(),
+                MagicMock(),
+                DatalakeTableSchemaWrapper(key="data.parquet", bucket_name="bucket"),
+            )
+
+    def test_parquet_schema_with_nulls(self):
+        table = pa.table(
+            {
+                "id": pa.array([1, None, 3], type=pa.int64()),
+                "flag": pa.array([True, None, False]),
+                "count": pa.array([1, 2, 3], type=pa.int32()),
+            }
+        )
+        first_chunk = table.to_pandas()
+
+        wrapper = self._parquet_schema(table)
+        self.assertTrue(wrapper.dataframes.empty)
+        self.assertEqual(
+            wrapper.dataframes.dtypes.to_dict(), first_chunk.dtypes.to_dict()
+        )
+        self.assertEqual(str(wrapper.dataframes["id"].dtype), "float64")
+        self.assertEqual(str(wrapper.dataframes["count"].dtype), "int32")
+
+        # Without the null counts, we read the first chunk
+        wrapper = self._parquet_schema(table, write_statistics=False)
+        self.assertEqual(len(wrapper.dataframes), 3)
+        self.assertEqual(str(wrapper.dataframes["id"].dtype), "float64")
+
+    def test_csv_schema(self):
+        client = ranged_s3_client(self.df.to_csv(index=False).encode())
+        wrapper = fetch_dataframe_schema(
+            S3Config(),
+            client,
+            DatalakeTableSchemaWrapper(key="data.csv", bucket_name="bucket"),
+        )
+        self.assertEqual(client.get_object.call_args.kwargs["Range"], "bytes=0-63")
+        # The last, incomplete line is dropped
+        self.assertEqual(wrapper.dataframes["name"].to_list(), ["name"] * 8)
+        self.assertEqual(list(wrapper.dataframes.columns), ["id", "name"])
+
+    def test_json_lines_schema(self):
+        client = ranged_s3_client(
+            self.df.to_json(orient="records", lines=True).encode()
+        )
+        wrapper = fetch_dataframe_schema(
+            S3Config(),
+            client,
+            DatalakeTableSchemaWrapper(key="data.json", bucket_name="bucket"),
+        )
+        self.assertEqual(list(wrapper.dataframes.columns), ["id", "name"])
+        self.assertLess(len(wrapper.dataframes), len(self.df))
+
+    def test_json_document_falls_back_to_first_chunk(self):
+        client = ranged_s3_client(self.df.to_json(orient="records").encode())
+        wrapper = fetch_dataframe_schema(
+            S3Config(),
+            client,
+            DatalakeTableSchemaWrapper(key="data.json", bucket_name="bucket"),
+        )
+        self.assertEqual(list(wrapper.dataframes.columns), ["id", "name"])
+        self.assertIsNone(client.get_object.call_args.kwargs.get("Range"))
+
+    def test_avro_schema(self):
+        client = ranged_s3_client(AVRO_DATA_FILE)
+        wrapper = fetch_dataframe_schema(
+            S3Config(),
+            client,
+            DatalakeTableSchemaWrapper(key="data.avro", bucket_name="bucket"),
+            use_avro_schema=True,
+        )
+        self.assertIsNone(wrapper.dataframes)
+        self.assertEqual(
+            [column.name.__root__ for column in wrapper.columns],
+            ["username", "tweet", "timestamp"],
+        )
+
+    def test_avro_schema_from_records(self):
+        """Without the flag, columns are still inferred from the records"""
+        client = ranged_s3_client(AVRO_DATA_FILE)
+        wrapper = fetch_dataframe_schema(
+            S3Config(),
+            client,
+            DatalakeTableSchemaWrapper(key="data.avro", bucket_name="bucket"),
+        )
+        self.assertIsNone(wrapper.columns)
+        self.assertEqual(
+            list(wrapper.dataframes.columns), ["username", "tweet", "timestamp"]
+        )
+
+
+class SampleWhileReadingTest(TestCase):
+    """
+    Chunks are sampled as they are read
+    """
+
+    chunks = [
+        pd.DataFrame({"id": range(idx * 100, (idx + 1) * 100)}) for idx in range(5)
+    ]
+
+    def _sample(self, profile_sample_config):
+        table = SimpleNamespace(
+            name=SimpleNamespace(__root__="data.csv"),
+            databaseSchema=SimpleNamespace(name="bucket"),
+        )
+        with patch(
+            "metadata.mixins.pandas.pandas_mixin.fetch_dataframe",
+            side_effect=lambda **_: iter(self.chunks),
+        ):
+            return PandasInterfaceMixin().return_ometa_dataframes_sampled(
+                service_connection_config=MagicMock(),
+                client=None,
+                table=table,
+                profile_sample_config=profile_sample_config,
+            )
+
+    def test_rows_sample(self):
+        dfs = self._sample(
+            ProfileSampleConfig(
+                profile_sample=50, profile_sample_type=ProfileSampleType.ROWS
+            )
+        )
+        sample = pd.concat(dfs)
+        self.assertEqual(len(sample), 50)
+        self.assertTrue(sample["id"].is_unique)
+        self.assertGreater(sample["id"].max(), 100)
+
+    def test_no_sample(self):
+        dfs = self._sample(None)
+        self.assertIsInstance(dfs, DataFrameChunks)
+        self.assertEqual(list(dfs[0]["id"]), list(range(100)))
+        # The chunks can be read more than once
+        self.assertEqual(sum(len(df) for df in dfs), 500)
+        self.assertEqual(sum(len(df) for df in dfs), 500)
@@ -1,8 +1,10 @@
 """Tests for the LRU cache class"""
 
+from unittest.mock import patch
+
 import pytest
 
-from metadata.utils.lru_cache import LRUCache
+from metadata.utils.lru_cache import LRUCache, TTLLRUCache
 
 
 class TestLRUCache:
@@ -48,3 +50,25 @@ class TestLRUCache:
         cache = LRUCache(2)
         cache.put(1, 2)
         assert cache.get(1) == 2
+
+
+class TestTTLLRUCache:
+    def test_elements_expire_after_ttl(self) -> None:
+        cache = TTLLRUCache(2, ttl=10)
+        with patch("metadata.utils.lru_cache.time.monotonic", return_value=0):
+            cache.put(1, 2)
+        with patch("metadata.utils.lru_cache.time.monotonic", return_value=5):
+            assert cache.get(1) == 2
+        with patch("metadata.utils.lru_cache.time.monotonic", return_value=11):
+            assert 1 not in cache
+            with pytest.raises(KeyError):
+                cache.get(1)
+        assert len(cache) == 0
+
+    def test_putting_over_capacity_rotates_cache(self) -> None:
+        cache = TTLLRUCache(2, ttl=10)
+        cache.put(1, None)
+        cache.put(2, None)
+        cache.put(3, None)
+        assert 1 not in cache
+        assert 3 in cache
@@ -126,7 +126,10 @@ Source Status:
 Stage Status:
 {'failures': [StackTraceError(name='name', error='error', stack_trace='stack_trace')], 'records': ['record'], 'warnings': ['warning']}
 Sink Status:
-{'failures': [StackTraceError(name='name', error='error', stack_trace='stack_trace')], 'records': ['record'], 'warnings': ['warning']}
+{'failures': [StackTraceError(name='name', error='error', stack_trace='stack_trace')],
+ 'records': ['record'],
+ 'skipped_records': [],
+ 'warnings': ['warning']}
 Bulk Sink Status:
 {'failures': [StackTraceError(name='name', error='error', stack_trace='stack_trace')], 'records': ['record'], 'warnings': ['warning']}
 Processor Status:
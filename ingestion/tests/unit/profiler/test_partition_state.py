@@ -0,0 +1,281 @@
+#  Copyright 2021 Collate
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#  http://www.apache.org/licenses/LICENSE-2.0
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+"""
+Test the profile of time-partitioned tables merged from partition states
+"""
+import os
+import tempfile
+from datetime import date
+from unittest import TestCase
+from unittest.mock import patch
+from uuid import uuid4
+
+import pytest
+from sqlalchemy import Column, Date, Integer, String, column, func
+from sqlalchemy.engine.default import DefaultDialect
+from sqlalchemy.orm import declarative_base
+
+from metadata.generated.schema.entity.data.table import Column as EntityColumn
+from metadata.generated.schema.entity.data.table import (
+    ColumnName,
+    ColumnProfilerConfig,
+    DataType,
+    PartitionIntervalType,
+    PartitionIntervalUnit,
+    PartitionProfilerConfig,
+    Table,
+)
+from metadata.generated.schema.entity.services.connections.database.sqliteConnection import (
+    SQLiteConnection,
+    SQLiteScheme,
+)
+from metadata.profiler.api.models import ProfileSampleConfig
+from metadata.profiler.interface.sqlalchemy.sqa_profiler_interface import (
+    SQAProfilerInterface,
+)
+from metadata.profiler.metrics.registry import Metrics
+from metadata.profiler.orm.functions.date_trunc import DateTruncFn
+from metadata.profiler.processor.core import Profiler
+from metadata.profiler.processor.default import DefaultProfiler
+from metadata.profiler.processor.partition_state import (
+    PartitionProfiler,
+    PartitionState,
+    PartitionStateStore,
+)
+
+Base = declarative_base()
+
+
+class Event(Base):
+    __tablename__ = "events"
+    id = Column(Integer, primary_key=True)
+    name = Column(String(256))
+    amount = Column(Integer)
+    event_date = Column(Date)
+
+
+def get_events(day: int, count: int, start: int = 0):
+    return [
+        Event(
+            name=f"name_{idx % 7}",
+            amount=idx if idx % 5 else None,
+            event_date=date(2023, 1, day),
+        )
+        for idx in range(start, start + count)
+    ]
+
+
+class PartitionProfilerTest(TestCase):
+    """Profile a table partitioned by day"""
+
+    db_path = os.path.join(
+        os.path.dirname(__file__), f"{os.path.splitext(__file__)[0]}.db"
+    )
+    sqlite_conn = SQLiteConnection(
+        scheme=SQLiteScheme.sqlite_pysqlite,
+        databaseMode=db_path + "?check_same_thread=False",
+    )
+    table_entity = Table(
+        id=uuid4(),
+        name="events",
+        fullyQualifiedName="service.db.main.events",
+        columns=[
+            EntityColumn(
+                name=ColumnName(__root__="id"),
+                dataType=DataType.INT,
+            )
+        ],
+    )
+    partition_config = PartitionProfilerConfig(
+        enablePartitioning=True,
+        partitionColumnName="event_date",
+        partitionIntervalType=PartitionIntervalType.TIME_UNIT,
+        partitionIntervalUnit=PartitionIntervalUnit.DAY,
+        partitionInterval=1,
+    )
+
+    with patch.object(
+        SQAProfilerInterface, "_convert_table_to_orm_object", return_value=Event
+    ):
+        sqa_profiler_interface = SQAProfilerInterface(
+            sqlite_conn,
+            None,
+            table_entity,
+            None,
+            None,
+            None,
+            partition_config,
+        )
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        Event.__table__.create(bind=cls.sqa_profiler_interface.session.get_bind())
+        cls.sqa_profiler_interface.session.add_all(
+            get_events(1, 100) + get_events(2, 100, 100) + get_events(3, 50, 200)
+        )
+        cls.sqa_profiler_interface.session.commit()
+
+    def get_profile(self, directory: str):
+        profiler = DefaultProfiler(profiler_interface=self.sqa_profiler_interface)
+        assert PartitionProfiler.is_supported(profiler)
+        partition_profiler = PartitionProfiler(profiler, PartitionStateStore(directory))
+        with patch.object(
+            PartitionProfiler,
+            "compute_partition_states",
+            side_effect=partition_profiler.compute_partition_states,
+        ) as compute:
+            profile = partition_profiler.process(False, False).profile
+        columns = {
+            column_profile.name: column_profile
+            for column_profile in profile.columnProfile
+        }
+        return profile.tableProfile, columns, compute.call_args.args[0]
+
+    def test_merged_profile(self):
+        """
+        New partitions are merged with the stored ones, and the latest
+        stored partition is scanned again to get the rows landed since
+        """
+        with tempfile.TemporaryDirectory() as directory:
+            table_profile, columns, since = self.get_profile(directory)
+            assert since is None
+            assert table_profile.rowCount == 250
+            assert columns["amount"].valuesCount == 200
+            assert columns["amount"].nullCount == 50
+            assert columns["amount"].min == 1
+            assert columns["amount"].max == 249
+            assert columns["amount"].sum == sum(idx for idx in range(250) if idx % 5)
+            assert columns["name"].distinctCount == 7
+            assert columns["name"].maxLength == 6
+
+            self.sqa_profiler_interface.session.add_all(
+                get_events(3, 50, 250) + get_events(4, 100, 300)
+            )
+            self.sqa_profiler_interface.session.commit()
+
+            table_profile, merged_columns, since = self.get_profile(directory)
+            assert since == "2023-01-03"
+            assert table_profile.rowCount == 400
+
+        with tempfile.TemporaryDirectory() as directory:
+            _, columns, since = self.get_profile(directory)
+            assert since is None
+
+        for name, column_profile in columns.items():
+            merged_profile = merged_columns[name]
+            for metric in ("valuesCount", "nullCount", "min", "max", "sum"):
+                assert getattr(merged_profile, metric) == getattr(
+                    column_profile, metric
+                )
+            if column_profile.mean is not None:
+                assert merged_profile.mean == pytest.approx(column_profile.mean)
+                # Quantiles are approximate once the KLL sketches are compacted
+                assert merged_profile.median == pytest.approx(
+                    column_profile.median, rel=0.05
+                )
+            assert merged_profile.distinctCount == pytest.approx(
+                column_profile.distinctCount, rel=0.05
+            )
+
+    def test_metrics_config(self):
+        """
+        Only the configured metrics and columns are profiled, and the
+        values are only read for the metrics computed from sketches
+        """
+        profiler = Profiler(
+            Metrics.ROW_COUNT.value,
+            Metrics.COUNT.value,
+            Metrics.SUM.value,
+            Metrics.HISTOGRAM.value,
+            profiler_interface=self.sqa_profiler_interface,
+            include_columns=[ColumnProfilerConfig(columnName="amount")],
+        )
+        with patch(
+            "metadata.profiler.processor.partition_state.logger"
+        ) as logger, tempfile.TemporaryDirectory() as directory:
+            partition_profiler = PartitionProfiler(
+                profiler, PartitionStateStore(directory)
+            )
+            assert "histogram" in logger.warning.call_args.args[0]
+            assert not partition_profiler.sketch_columns
+            profile = partition_profiler.process(False, False).profile
+
+        session = self.sqa_profiler_interface.session
+        row_count, values_count, amount_sum = session.query(
+            func.count(), func.count(Event.amount), func.sum(Event.amount)
+        ).one()
+        assert profile.tableProfile.rowCount == row_count
+        assert profile.tableProfile.columnCount is None
+        (column_profile,) = profile.columnProfile
+        assert column_profile.name == "amount"
+        assert column_profile.valuesCount == values_count
+        assert column_profile.sum == amount_sum
+        assert column_profile.nullCount is None
+        assert column_profile.distinctCount is None
+        assert column_profile.median is None
+
+    def test_profile_sample(self):
+        """Counts are exact, and sketches read the profile sample"""
+        with patch.object(
+            self.sqa_profiler_interface,
+            "profile_sample_config",
+            ProfileSampleConfig(profile_sample=50),
+        ), tempfile.TemporaryDirectory() as directory:
+            profiler = DefaultProfiler(profiler_interface=self.sqa_profiler_interface)
+            partition_profiler = PartitionProfiler(
+                profiler, PartitionStateStore(directory)
+            )
+            states = partition_profiler.compute_partition_states(None).values()
+            profile = partition_profiler.get_profile(states)
+
+        column_states = [state.columns["amount"] for state in states]
+        values_count = sum(state.values_count for state in column_states)
+        sketch_count = sum(state.sketch_count for state in column_states)
+        assert 0 < sketch_count < values_count
+        assert profile.tableProfile.profileSample == 50
+        assert profile.tableProfile.rowCount == sum(state.row_count for state in states)
+
+    def test_store(self):
+        """States are discarded when the partitioning or the columns change"""
+        state = PartitionState({"amount": "quantifiable"})
+        with tempfile.TemporaryDirectory() as directory:
+            store = PartitionStateStore(directory)
+            store.save("service.db.main.events", {"columns": 1}, {"2023-01-01": state})
+            stored = store.load("service.db.main.events", {"columns": 1})
+            assert stored["2023-01-01"].to_dict() == state.to_dict()
+            assert not store.load("service.db.main.events", {"columns": 2})
+            assert not store.load("service.db.main.other", {"columns": 1})
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        os.remove(cls.db_path)
+
+
+@pytest.mark.parametrize(
+    "dialect,unit,expected",
+    [
+        ("postgresql", "DAY", "DATE_TRUNC('day', event_date)"),
+        ("bigquery", "HOUR", "TIMESTAMP_TRUNC(CAST(event_date AS TIMESTAMP), HOUR)"),
+        ("sqlite", "MONTH", "STRFTIME('%Y-%m-01', event_date)"),
+        ("mssql", "YEAR", "DATEADD(YEAR, DATEDIFF(YEAR, 0, event_date), 0)"),
+        ("oracle", "DAY", "TRUNC(event_date, 'DD')"),
+        ("clickhouse", "DAY", "toStartOfDay(event_date)"),
+    ],
+)
+def test_date_trunc(dialect, unit, expected):
+    """The partition column is truncated in SQL to group by partition"""
+    sqa_dialect = DefaultDialect()
+    sqa_dialect.name = dialect
+    assert (
+        str(DateTruncFn(column("event_date"), unit).compile(dialect=sqa_dialect))
+        == expected
+    )
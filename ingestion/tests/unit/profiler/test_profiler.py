@@ -50,6 +50,7 @@ from metadata.profiler.metrics.core import MetricTypes, add_props
 from metadata.profiler.metrics.registry import Metrics
 from metadata.profiler.processor.core import MissingMetricException, Profiler
 from metadata.profiler.processor.default import DefaultProfiler
+from metadata.profiler.processor.runner import QueryRunner
 
 Base = declarative_base()
 
@@ -165,6 +166,71 @@ class ProfilerTest(TestCase):
             histogram=Histogram(boundaries=["30.00 and up"], frequencies=[2]),
         )
 
+    def get_column_profiles(self, select_first_from_sample=None):
+        """Profile the table, counting the queries on the sample"""
+        queries = []
+        original = QueryRunner.select_first_from_sample
+
+        def count_queries(runner, *entities, **kwargs):
+            queries.append(len(entities))
+            if select_first_from_sample:
+                return select_first_from_sample(runner, *entities, **kwargs)
+            return original(runner, *entities, **kwargs)
+
+        with patch.object(QueryRunner, "select_first_from_sample", count_queries):
+            profiler = DefaultProfiler(
+                profiler_interface=self.sqa_profiler_interface,
+            )
+            profiler.compute_metrics()
+
+        column_profiles = {
+            column_profile.name: column_profile.copy(update={"timestamp": None})
+            for column_profile in profiler.get_profile().columnProfile
+        }
+        return column_profiles, queries
+
+    def test_fused_static_metrics(self):
+        """
+        Static metrics of all the columns are computed with a single
+        query, with the same results as column by column
+        """
+        fused_profiles, fused_queries = self.get_column_profiles()
+
+        self.sqa_profiler_interface.fuse_column_metrics = False
+        try:
+            profiles, queries = self.get_column_profiles()
+        finally:
+            self.sqa_profiler_interface.fuse_column_metrics = True
+
+        assert fused_profiles == profiles
+        assert len(fused_queries) == len(queries) - 4
+
+        with patch(
+            "metadata.profiler.interface.sqlalchemy.sqa_profiler_interface.FUSED_MAX_EXPRESSIONS",
+            20,
+        ):
+            chunked_profiles, chunked_queries = self.get_column_profiles()
+        assert chunked_profiles == profiles
+        assert len(fused_queries) < len(chunked_queries) < len(queries)
+
+    def test_fused_static_metrics_fallback(self):
+        """Columns are computed one by one if the single query fails"""
+        original = QueryRunner.select_first_from_sample
+
+        def select_first_from_sample(runner, *entities, **kwargs):
+            if len(entities) > 20:
+                raise RuntimeError("Too many columns")
+            return original(runner, *entities, **kwargs)
+
+        self.sqa_profiler_interface.fuse_column_metrics = False
+        try:
+            profiles, _ = self.get_column_profiles()
+        finally:
+            self.sqa_profiler_interface.fuse_column_metrics = True
+
+        fallback_profiles, _ = self.get_column_profiles(select_first_from_sample)
+        assert fallback_profiles == profiles
+
     def test_required_metrics(self):
         """
         Check that we raise properly MissingMetricException
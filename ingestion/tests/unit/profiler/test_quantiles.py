@@ -0,0 +1,118 @@
+#  Copyright 2021 Collate
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#  http://www.apache.org/licenses/LICENSE-2.0
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+"""
+Validate the quantiles of a column are computed by a single function
+"""
+from unittest.mock import MagicMock
+
+import pytest
+from sqlalchemy import Column, Integer, column
+from sqlalchemy.engine.default import DefaultDialect
+from sqlalchemy.orm import declarative_base
+
+from metadata.profiler.interface.sqlalchemy.sqa_profiler_interface import (
+    SQAProfilerInterface,
+)
+from metadata.profiler.metrics.registry import Metrics
+from metadata.profiler.orm.functions.quantiles import get_quantile_values, quantiles_fn
+
+Base = declarative_base()
+
+
+class Users(Base):
+    __tablename__ = "users"
+    id = Column(Integer, primary_key=True)
+    age = Column(Integer)
+
+
+QUARTILES = [0.25, 0.5, 0.75]
+
+
+def get_dialect(name: str) -> DefaultDialect:
+    dialect = DefaultDialect()
+    dialect.name = name
+    return dialect
+
+
+@pytest.mark.parametrize(
+    "dialect,approximate,expected",
+    [
+        (
+            "postgresql",
+            False,
+            "percentile_cont(ARRAY[0.25, 0.5, 0.75]) WITHIN GROUP (ORDER BY age ASC)",
+        ),
+        ("clickhouse", False, "quantiles(0.25, 0.5, 0.75)(age)"),
+        ("clickhouse", True, "quantiles(0.25, 0.5, 0.75)(age)"),
+        ("databricks", True, "percentile_approx(age, array(0.25, 0.5, 0.75))"),
+        (b"hive", False, "percentile(cast(age as BIGINT), array(0.25, 0.5, 0.75))"),
+        ("trino", False, "approx_percentile(age, ARRAY[0.25, 0.5, 0.75])"),
+        ("bigquery", True, "APPROX_QUANTILES(age, 100)"),
+    ],
+)
+def test_quantiles_fn(dialect, approximate, expected):
+    """Quantiles are compiled to the function of the dialect"""
+    fn = quantiles_fn(dialect, column("age"), QUARTILES, approximate)
+    assert str(fn.compile(dialect=get_dialect(dialect))) == expected
+
+
+@pytest.mark.parametrize(
+    "dialect,approximate",
+    [("mssql", False), ("mssql", True), ("bigquery", False), ("postgresql", True)],
+)
+def test_quantiles_fn_not_supported(dialect, approximate):
+    """Dialects without a multi-quantile function keep one window per quantile"""
+    assert quantiles_fn(dialect, column("age"), QUARTILES, approximate) is None
+
+
+def test_get_quantile_values():
+    """Values are mapped to the requested percentiles"""
+    assert get_quantile_values("postgresql", QUARTILES, [1, 2.5, 4]) == [1, 2.5, 4]
+    assert get_quantile_values("bigquery", QUARTILES, list(range(101))) == [
+        25,
+        50,
+        75,
+    ]
+    assert get_quantile_values("postgresql", QUARTILES, None) == [None] * 3
+
+
+def test_compute_quantiles():
+    """Median and quartiles are computed by a single query"""
+    interface = SQAProfilerInterface.__new__(SQAProfilerInterface)
+    interface.approximate_metrics = False
+    session = MagicMock(**{"bind.dialect.name": "postgresql"})
+    runner = MagicMock(
+        **{"select_first_from_sample.return_value": {"quantiles": [30, 31, 32]}}
+    )
+    metrics = [
+        Metrics.FIRST_QUARTILE.value,
+        Metrics.MEDIAN.value,
+        Metrics.THIRD_QUARTILE.value,
+    ]
+
+    results = interface._get_metrics(  # pylint: disable=protected-access
+        "Window", metrics, runner=runner, session=session, column=Users.age
+    )
+
+    assert results == {"firstQuartile": 30.0, "median": 31.0, "thirdQuartile": 32.0}
+    runner.select_first_from_sample.assert_called_once()
+
+    session.bind.dialect.name = "mssql"
+    runner.select_first_from_sample.return_value = {"median": 31}
+    results = interface._get_metrics(  # pylint: disable=protected-access
+        "Window",
+        [Metrics.MEDIAN.value],
+        runner=runner,
+        session=session,
+        column=Users.age,
+    )
+    assert results == {"median": 31}
@@ -13,7 +13,9 @@
 Test Sample behavior
 """
 import time
+from concurrent.futures import ThreadPoolExecutor
 from unittest import TestCase
+from unittest.mock import MagicMock
 
 import pytest
 from sqlalchemy import TEXT, Column, Integer, String, create_engine, func
@@ -157,6 +159,30 @@ class RunnerTest(TestCase):
         with pytest.raises(TimeoutError):
             self.timeout_runner.slow()
 
+    def test_timeout_runner_in_thread(self):
+        """
+        Check that timeouts also apply outside of the main thread
+        """
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            assert executor.submit(self.timeout_runner.fast).result() == 1
+
+            with pytest.raises(TimeoutError):
+                executor.submit(self.timeout_runner.slow).result()
+
+    def test_timeout_callback(self):
+        """
+        Check the callback releasing what a timed out method may still use
+        """
+        on_timeout = MagicMock()
+        timeout_runner = cls_timeout(1, on_timeout=on_timeout)(Timer())
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            assert executor.submit(timeout_runner.fast).result() == 1
+            on_timeout.assert_not_called()
+
+            with pytest.raises(TimeoutError):
+                executor.submit(timeout_runner.slow).result()
+        on_timeout.assert_called_once()
+
     def test_select_from_statement(self):
         """
         Test querying using `from_statement` returns expected values
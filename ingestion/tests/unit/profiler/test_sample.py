@@ -18,10 +18,16 @@ from unittest.mock import patch
 from uuid import uuid4
 
 from sqlalchemy import TEXT, Column, Integer, String, func
+from sqlalchemy.dialects import postgresql
 from sqlalchemy.orm import declarative_base
 
 from metadata.generated.schema.entity.data.table import Column as EntityColumn
-from metadata.generated.schema.entity.data.table import ColumnName, DataType, Table
+from metadata.generated.schema.entity.data.table import (
+    ColumnName,
+    DataType,
+    ProfileSampleType,
+    Table,
+)
 from metadata.generated.schema.entity.services.connections.database.sqliteConnection import (
     SQLiteConnection,
     SQLiteScheme,
@@ -31,7 +37,7 @@ from metadata.profiler.interface.sqlalchemy.sqa_profiler_interface import (
     SQAProfilerInterface,
 )
 from metadata.profiler.metrics.registry import Metrics
-from metadata.profiler.orm.registry import CustomTypes
+from metadata.profiler.orm.registry import CustomTypes, Dialects
 from metadata.profiler.processor.core import Profiler
 from metadata.profiler.processor.sampler import Sampler
 
@@ -157,6 +163,59 @@ class SampleTest(TestCase):
         res = self.session.query(func.count()).select_from(random_sample).first()
         assert res[0] < 30
 
+    def test_rows_sampler(self):
+        """
+        Row samples are limited to the number of rows
+        """
+        sampler = Sampler(
+            session=self.session,
+            table=User,
+            profile_sample_config=ProfileSampleConfig(
+                profile_sample=10, profile_sample_type=ProfileSampleType.ROWS
+            ),
+            sample_columns=[col.name for col in User.__table__.columns],
+        )
+        random_sample = sampler.random_sample()
+        res = self.session.query(func.count()).select_from(random_sample).first()
+        assert res[0] == 10
+
+    def test_tablesample_query(self):
+        """
+        Dialects supporting it sample the table with TABLESAMPLE
+        """
+        sampler = Sampler(
+            session=self.session,
+            table=User,
+            profile_sample_config=ProfileSampleConfig(profile_sample=50.0),
+            sample_columns=[col.name for col in User.__table__.columns],
+        )
+        with patch.object(Sampler, "_dialect", Dialects.Postgres):
+            query = self.session.query(sampler.get_sample_query())
+        compiled = str(query.statement.compile(dialect=postgresql.dialect()))
+        assert "FROM users AS users_tablesample TABLESAMPLE BERNOULLI (50)" in compiled
+
+    def test_rows_tablesample_query(self):
+        """
+        Row samples use the estimated rows to sample
+        a bit more than needed before sorting them
+        """
+        sampler = Sampler(
+            session=self.session,
+            table=User,
+            profile_sample_config=ProfileSampleConfig(
+                profile_sample=1000, profile_sample_type=ProfileSampleType.ROWS
+            ),
+            sample_columns=[col.name for col in User.__table__.columns],
+        )
+        with patch.object(Sampler, "_dialect", Dialects.Postgres), patch(
+            "metadata.profiler.processor.sampler.row_estimate_factory.estimate",
+            return_value=1_000_000,
+        ):
+            query = self.session.query(sampler.get_sample_query())
+        compiled = str(query.statement.compile(dialect=postgresql.dialect()))
+        assert "TABLESAMPLE BERNOULLI (0.16)" in compiled
+        assert "ORDER BY random" in compiled
+
     def test_sample_property(self):
         """
         Sample property should be properly generated
@@ -0,0 +1,196 @@
+#  Copyright 2021 Collate
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#  http://www.apache.org/licenses/LICENSE-2.0
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+"""
+Test the streaming sketches used by the approximate pandas metrics
+"""
+import os
+from unittest import TestCase
+from unittest.mock import patch
+from uuid import uuid4
+
+import numpy as np
+import pandas as pd
+
+from metadata.generated.schema.entity.data.table import Column as EntityColumn
+from metadata.generated.schema.entity.data.table import ColumnName, DataType, Table
+from metadata.generated.schema.metadataIngestion.databaseServiceProfilerPipeline import (
+    DatabaseServiceProfilerPipeline,
+)
+from metadata.mixins.pandas.pandas_mixin import PandasInterfaceMixin
+from metadata.profiler.interface.pandas.pandas_profiler_interface import (
+    PandasProfilerInterface,
+)
+from metadata.profiler.metrics.registry import Metrics
+from metadata.profiler.metrics.sketches import (
+    HyperLogLog,
+    KLLSketch,
+    UniqueCountSketch,
+    WelfordMoments,
+    compute_sketch_metrics,
+    hash_values,
+)
+from metadata.profiler.processor.core import Profiler
+
+
+class SketchesTest(TestCase):
+    """
+    Check the sketches against the exact values
+    """
+
+    rng = np.random.default_rng(42)
+    values = rng.normal(100, 15, 200_000)
+    chunks = np.array_split(values, 7)
+
+    def test_welford_moments(self):
+        moments = WelfordMoments()
+        for chunk in self.chunks[:3]:
+            moments.update(chunk)
+        other = WelfordMoments()
+        for chunk in self.chunks[3:]:
+            other.update(chunk)
+        moments.merge(other)
+
+        self.assertEqual(moments.count, len(self.values))
+        self.assertAlmostEqual(moments.mean, self.values.mean())
+        self.assertAlmostEqual(moments.stddev, pd.Series(self.values).std())
+
+    def test_kll_quantiles(self):
+        small = KLLSketch()
+        small.update(np.array([4.0, 1.0, 3.0, 2.0]))
+        self.assertEqual(small.quantile(0.5), 2.5)
+
+        kll = KLLSketch(seed=1)
+        other = KLLSketch(seed=2)
+        for idx, chunk in enumerate(self.chunks):
+            (kll if idx % 2 else other).update(chunk)
+        kll.merge(other)
+
+        self.assertLess(sum(len(level) for level in kll.levels), 1_000)
+        sorted_values = np.sort(self.values)
+        for fraction in (0.25, 0.5, 0.75):
+            rank = np.searchsorted(sorted_values, kll.quantile(fraction))
+            self.assertAlmostEqual(rank / len(self.values), fraction, delta=0.02)
+
+    def test_distinct_and_unique_counts(self):
+        series = pd.Series(np.arange(100_000)).astype(str)
+        # 100_000 distinct values, 80_000 of them appearing only once
+        series = pd.concat([series, series[:20_000]])
+        hll, kmv = HyperLogLog(), UniqueCountSketch()
+        other_hll, other_kmv = HyperLogLog(), UniqueCountSketch()
+        for idx, start in enumerate(range(0, len(series), 20_000)):
+            chunk = series[start : start + 20_000]
+            hashes = hash_values(chunk)
+            (hll if idx % 2 else other_hll).update(hashes)
+            (kmv if idx % 2 else other_kmv).update(hashes)
+        hll.merge(other_hll)
+        kmv.merge(other_kmv)
+
+        self.assertAlmostEqual(hll.count(), 100_000, delta=3_000)
+        self.assertAlmostEqual(kmv.count(), 80_000, delta=5_000)
+
+        small_hll, small_kmv = HyperLogLog(), UniqueCountSketch()
+        for chunk in (pd.Series([1, 2, 2, None]), pd.Series([2.0, 3.0, 4.0])):
+            small_hll.update(hash_values(chunk))
+            small_kmv.update(hash_values(chunk))
+        self.assertEqual(small_hll.count(), 4)
+        self.assertEqual(small_kmv.count(), 3)
+
+
+class ApproximateDatalakeMetricsTest(TestCase):
+    """
+    Compute the pandas metrics with the sketches
+    """
+
+    root_dir = os.path.dirname(os.path.abspath(__file__))
+    df1 = pd.read_csv(
+        os.path.join(root_dir, "custom_csv", "test_datalake_metrics_1.csv")
+    )
+    df2 = pd.read_csv(
+        os.path.join(root_dir, "custom_csv", "test_datalake_metrics_2.csv")
+    )
+
+    @patch.object(
+        PandasProfilerInterface,
+        "get_connection_client",
+        return_value=None,
+    )
+    @patch.object(
+        PandasInterfaceMixin,
+        "return_ometa_dataframes_sampled",
+        return_value=[df1, df2],
+    )
+    def __init__(
+        self, methodName, return_ometa_dataframes_sampled, get_connection_client
+    ):
+        super().__init__(methodName)
+        table_entity = Table(
+            id=uuid4(),
+            name="user",
+            columns=[
+                EntityColumn(
+                    name=ColumnName(__root__="id"),
+                    dataType=DataType.INT,
+                )
+            ],
+        )
+
+        self.datalake_profiler_interface = PandasProfilerInterface(
+            entity=table_entity,
+            service_connection_config=None,
+            ometa_client=None,
+            thread_count=None,
+            profile_sample_config=None,
+            source_config=DatabaseServiceProfilerPipeline(approximateMetrics=True),
+            sample_query=None,
+            table_partition_config=None,
+        )
+
+    def test_metrics(self):
+        """
+        Small datasets get the exact values
+        """
+        ages = pd.concat([self.df1, self.df2])["age"]
+        with patch.object(
+            Metrics.MEDIAN.value, "df_fn", side_effect=AssertionError
+        ), patch.object(
+            Metrics.DISTINCT_COUNT.value, "df_fn", side_effect=AssertionError
+        ), patch(
+            "metadata.profiler.interface.pandas.pandas_profiler_interface.compute_sketch_metrics",
+            wraps=compute_sketch_metrics,
+        ) as compute:
+            res = (
+                Profiler(
+                    Metrics.MEAN.value,
+                    Metrics.STDDEV.value,
+                    Metrics.DISTINCT_COUNT.value,
+                    Metrics.UNIQUE_COUNT.value,
+                    Metrics.MEDIAN.value,
+                    Metrics.MIN.value,
+                    profiler_interface=self.datalake_profiler_interface,
+                )
+                .compute_metrics()
+                ._column_results
+            )
+
+        # The sketch metrics of all the columns are computed in one pass
+        compute.assert_called_once()
+        self.assertTrue({"age", "name"} <= set(compute.call_args.args[0]))
+        age = res.get("age")
+        self.assertAlmostEqual(age[Metrics.MEAN.name], ages.mean())
+        self.assertAlmostEqual(age[Metrics.STDDEV.name], ages.std())
+        self.assertEqual(age[Metrics.MEDIAN.name], ages.median())
+        self.assertEqual(age[Metrics.DISTINCT_COUNT.name], ages.nunique())
+        self.assertEqual(
+            age[Metrics.UNIQUE_COUNT.name], int((ages.value_counts() == 1).sum())
+        )
+        self.assertEqual(age[Metrics.MIN.name], ages.min())
+        self.assertEqual(res.get("name")[Metrics.MEAN.name], 4.0)
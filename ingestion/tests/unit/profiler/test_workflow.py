@@ -12,19 +12,25 @@
 """
 Validate workflow configs and filters
 """
+import threading
+import time
 import uuid
+from concurrent.futures import ThreadPoolExecutor, TimeoutError
 from copy import deepcopy
-from unittest.mock import patch
+from datetime import datetime, timedelta, timezone
+from unittest.mock import MagicMock, patch
 
 import sqlalchemy as sqa
-from pytest import raises
+from pytest import mark, raises
 from sqlalchemy import MetaData
 from sqlalchemy.orm import declarative_base
 
 from metadata.generated.schema.entity.data.table import (
     Column,
+    ColumnProfile,
     DataType,
     Table,
+    TableProfile,
     TableProfilerConfig,
 )
 from metadata.generated.schema.entity.services.connections.metadata.openMetadataConnection import (
@@ -45,6 +51,10 @@ from metadata.profiler.interface.profiler_protocol import ProfilerProtocol
 from metadata.profiler.interface.sqlalchemy.sqa_profiler_interface import (
     SQAProfilerInterface,
 )
+from metadata.profiler.metrics.system.table_changes import (
+    TableChanges,
+    has_changed_since,
+)
 from metadata.profiler.processor.default import DefaultProfiler
 from metadata.profiler.source.base_profiler_source import BaseProfilerSource
 
@@ -299,3 +309,170 @@ def test_service_name_validation_raised():
     """
     with raises(ValueError, match="Service name `.*` does not exist"):
         ProfilerWorkflow.create(config)
+
+
+@patch.object(
+    ProfilerWorkflow,
+    "_validate_service_name",
+    return_value=True,
+)
+def test_run_profiler_concurrently(mocked_method):
+    """Tables are profiled concurrently and all their profiles reach the sink"""
+    concurrent_config = deepcopy(config)
+    concurrent_config["source"]["sourceConfig"]["config"].update(
+        {"tableThreadCount": 3, "maxConcurrentQueries": 2}
+    )
+    with patch("metadata.profiler.api.workflow.create_ometa_client"), patch(
+        "metadata.profiler.api.workflow.get_sink"
+    ):
+        workflow = ProfilerWorkflow.create(concurrent_config)
+
+    running = []
+    max_running = []
+
+    def run_profiler(entity, profiler_source):  # pylint: disable=unused-argument
+        assert SQAProfilerInterface._query_slots is not None
+        running.append(entity)
+        max_running.append(len(running))
+        time.sleep(0.05)
+        running.remove(entity)
+        return None if entity == 3 else entity
+
+    with patch.object(
+        workflow,
+        "get_profiler_tasks",
+        return_value=((entity, None) for entity in range(1, 11)),
+    ), patch.object(workflow, "run_profiler", side_effect=run_profiler):
+        workflow.execute()
+    workflow.stop()
+
+    assert sorted(
+        call.args[0] for call in workflow.sink.write_record.call_args_list
+    ) == [1, 2, 4, 5, 6, 7, 8, 9, 10]
+    assert max(max_running) > 1
+    assert SQAProfilerInterface._query_slots is None
+
+
+def test_limit_queries():
+    """Queries wait for a free slot until the table deadline"""
+    interface = SQAProfilerInterface.__new__(SQAProfilerInterface)
+    interface._table = User  # pylint: disable=protected-access
+    running = []
+    max_running = []
+    lock = threading.Lock()
+
+    def query():
+        with interface._query_slot():  # pylint: disable=protected-access
+            with lock:
+                running.append(1)
+                max_running.append(len(running))
+            time.sleep(0.05)
+            with lock:
+                running.pop()
+
+    with SQAProfilerInterface.limit_queries(2), ThreadPoolExecutor(5) as pool:
+        list(pool.map(lambda _: query(), range(6)))
+    assert max(max_running) == 2
+
+    with SQAProfilerInterface.limit_queries(1):
+        with interface._query_slot():  # pylint: disable=protected-access
+            with raises(TimeoutError):
+                with interface._query_slot(  # pylint: disable=protected-access
+                    deadline=time.monotonic() + 0.01
+                ):
+                    pass
+
+
+NOW = datetime.now(tz=timezone.utc)
+LATEST_PROFILE = TABLE.copy(
+    update={
+        "profile": TableProfile(
+            timestamp=int((NOW - timedelta(hours=1)).timestamp()), rowCount=2
+        ),
+        "columns": [
+            Column(
+                name="age",
+                dataType=DataType.INT,
+                profile=ColumnProfile(
+                    name="age",
+                    timestamp=int((NOW - timedelta(hours=1)).timestamp()),
+                    mean=30.5,
+                ),
+            )
+        ],
+    }
+)
+
+
+@mark.parametrize(
+    "changes,changed",
+    [
+        (None, True),
+        (TableChanges(row_count=None, last_modified=None), True),
+        (TableChanges(row_count=2, last_modified=NOW - timedelta(hours=2)), False),
+        (TableChanges(row_count=2, last_modified=None), False),
+        (TableChanges(row_count=3, last_modified=NOW - timedelta(hours=2)), True),
+        (TableChanges(row_count=2, last_modified=NOW), True),
+        (TableChanges(row_count=None, last_modified=NOW), True),
+    ],
+)
+def test_has_changed_since(changes, changed):
+    """Tables changed unless all the known signals match the profile"""
+    assert has_changed_since(changes, LATEST_PROFILE.profile) == changed
+
+
+@mark.parametrize(
+    "mode,changes,processed",
+    [
+        ("profile", TableChanges(2, NOW - timedelta(hours=2)), True),
+        ("skip", TableChanges(2, NOW - timedelta(hours=2)), False),
+        ("skip", TableChanges(3, NOW - timedelta(hours=2)), True),
+        ("carryForward", TableChanges(2, NOW - timedelta(hours=2)), False),
+    ],
+)
+@patch.object(
+    ProfilerWorkflow,
+    "_validate_service_name",
+    return_value=True,
+)
+def test_unchanged_tables(
+    mocked_method, mode, changes, processed
+):  # pylint: disable=unused-argument
+    """Unchanged tables are skipped or get their latest profile carried forward"""
+    incremental_config = deepcopy(config)
+    incremental_config["source"]["sourceConfig"]["config"].update(
+        {"unchangedTables": mode}
+    )
+    with patch("metadata.profiler.api.workflow.create_ometa_client"), patch(
+        "metadata.profiler.api.workflow.get_sink"
+    ):
+        workflow = ProfilerWorkflow.create(incremental_config)
+    workflow.metadata.get_latest_table_profile.return_value = LATEST_PROFILE
+
+    profiler_source = MagicMock()
+    profiler_runner = profiler_source.get_profiler_runner.return_value
+    profiler_runner.profiler_interface.get_table_changes.return_value = changes
+    profiler_runner.profiler_interface.processor_status.failures = []
+    profiler_runner.profiler_interface.processor_status.records = []
+
+    profile = workflow.run_profiler(TABLE, profiler_source)
+
+    assert profiler_runner.process.called == processed
+    profiler_runner.profiler_interface.close.assert_called_once()
+    if processed:
+        assert profile is profiler_runner.process.return_value
+    elif mode == "skip":
+        assert profile is None
+        assert workflow.source_status.filtered
+    else:
+        assert profile.table == TABLE
+        assert profile.profile.tableProfile.rowCount == 2
+        assert profile.profile.tableProfile.timestamp.__root__ >= int(NOW.timestamp())
+        assert [
+            (
+                column.name,
+                column.mean,
+                column.timestamp.__root__ >= int(NOW.timestamp()),
+            )
+            for column in profile.profile.columnProfile
+        ] == [("age", 30.5, True)]
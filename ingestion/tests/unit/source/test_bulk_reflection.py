@@ -0,0 +1,192 @@
+#  Copyright 2021 Collate
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#  http://www.apache.org/licenses/LICENSE-2.0
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+"""
+Validate the constraints reflected for a whole schema
+"""
+import types
+from unittest import TestCase
+from unittest.mock import MagicMock
+
+from sqlalchemy import create_engine
+
+from metadata.ingestion.source.database.bulk_reflection import (
+    SchemaConstraints,
+    SchemaConstraintsFactory,
+    schema_constraints_factory,
+)
+from metadata.ingestion.source.database.sql_column_handler import SqlColumnHandlerMixin
+
+ROWS = [
+    ("orders", "orders_pk", "p", "id", 1, None, None, None),
+    ("orders", "orders_fk", "f", "user_id", 1, "public", "users", "id"),
+    ("orders", "orders_fk", "f", "user_org", 2, "public", "users", "org"),
+    ("users", "users_pk", "p", "id", 1, None, None, None),
+    ("users", "users_email", "u", "email", 1, None, None, None),
+    ("users", "users_name", "u", "first_name", 1, None, None, None),
+    ("users", "users_name", "u", "last_name", 2, None, None, None),
+    ("orders", None, None, None, None, None, None, None),
+    ("users", None, None, None, None, None, None, None),
+    ("audit", None, None, None, None, None, None, None),
+]
+
+SQLITE_SCHEMA_CONSTRAINTS = """
+SELECT table_name, constraint_name, constraint_type, column_name,
+    referred_schema, referred_table, referred_column
+FROM schema_constraints
+WHERE schema_name = :schema_name
+ORDER BY table_name, constraint_name, position
+"""
+
+
+class BulkReflectionTest(TestCase):
+    """
+    Check the constraints are reflected once per schema
+    """
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.engine = create_engine("sqlite+pysqlite:///:memory:")
+        cls.engine.execute(
+            "CREATE TABLE schema_constraints (schema_name, table_name, constraint_name,"
+            " constraint_type, column_name, position, referred_schema, referred_table,"
+            " referred_column)"
+        )
+        for row in ROWS:
+            cls.engine.execute(
+                "INSERT INTO schema_constraints VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                ("public", *row),
+            )
+
+    def setUp(self) -> None:
+        self.factory = SchemaConstraintsFactory()
+        self.factory.register("sqlite", SQLITE_SCHEMA_CONSTRAINTS)
+
+    def get_inspector(self):
+        return types.SimpleNamespace(
+            dialect=self.engine.dialect,
+            bind=self.engine,
+            get_pk_constraint=MagicMock(),
+            get_unique_constraints=MagicMock(),
+            get_foreign_keys=MagicMock(),
+        )
+
+    def test_schema_constraints(self):
+        constraints = self.factory.get_constraints(self.get_inspector(), "public")
+
+        self.assertEqual(
+            constraints.get_pk_constraint("orders"),
+            {"constrained_columns": ["id"], "name": "orders_pk"},
+        )
+        self.assertEqual(
+            constraints.get_foreign_keys("orders"),
+            [
+                {
+                    "name": "orders_fk",
+                    "constrained_columns": ["user_id", "user_org"],
+                    "referred_schema": "public",
+                    "referred_table": "users",
+                    "referred_columns": ["id", "org"],
+                    "options": {},
+                }
+            ],
+        )
+        self.assertEqual(
+            constraints.get_unique_constraints("users"),
+            [
+                {"column_names": ["email"], "name": "users_email"},
+                {"column_names": ["first_name", "last_name"], "name": "users_name"},
+            ],
+        )
+        self.assertEqual(
+            constraints.get_pk_constraint("missing"),
+            {"constrained_columns": [], "name": None},
+        )
+        self.assertEqual(constraints.get_foreign_keys("users"), [])
+        self.assertTrue(constraints.has_table("audit"))
+        self.assertFalse(constraints.has_table("missing"))
+
+    def test_normalize_names(self):
+        """Names are normalized as the dialect does, e.g., Oracle"""
+        rows = [
+            types.SimpleNamespace(
+                table_name="ORDERS",
+                constraint_name="ORDERS_FK",
+                constraint_type="f",
+                column_name="USER_ID",
+                referred_schema="HR",
+                referred_table="Users",
+                referred_column="ID",
+            )
+        ]
+        dialect = self.engine.dialect
+        constraints = SchemaConstraints(rows, normalize_name=dialect.normalize_name)
+
+        self.assertTrue(constraints.has_table("orders"))
+        foreign_key = constraints.get_foreign_keys("orders")[0]
+        self.assertEqual(foreign_key["name"], "orders_fk")
+        self.assertEqual(foreign_key["constrained_columns"], ["user_id"])
+        self.assertEqual(foreign_key["referred_schema"], "hr")
+        # Case sensitive names are kept as they are
+        self.assertEqual(foreign_key["referred_table"], "Users")
+
+    def test_unsupported_dialect(self):
+        inspector = self.get_inspector()
+        inspector.dialect = types.SimpleNamespace(name="other")
+        self.assertIsNone(self.factory.get_constraints(inspector, "public"))
+
+    def test_query_error(self):
+        self.factory.register("sqlite", "SELECT * FROM missing_table")
+        self.assertIsNone(self.factory.get_constraints(self.get_inspector(), "public"))
+
+    def test_columns_with_constraints(self):
+        schema_constraints_factory.register("sqlite", SQLITE_SCHEMA_CONSTRAINTS)
+        self.addCleanup(
+            schema_constraints_factory._queries.pop,  # pylint: disable=protected-access
+            "sqlite",
+        )
+        handler = SqlColumnHandlerMixin()
+        inspector = self.get_inspector()
+
+        results = {}
+        for table_name in ("orders", "users", "audit"):
+            results[
+                table_name
+            ] = handler._get_columns_with_constraints(  # pylint: disable=protected-access
+                "public", table_name, inspector
+            )
+
+        pk_columns, unique_columns, foreign_columns = results["users"]
+        self.assertEqual(pk_columns, ["id"])
+        self.assertEqual(unique_columns, [["email"], ["first_name", "last_name"]])
+        self.assertEqual(foreign_columns, [])
+        self.assertEqual(results["orders"][2][0]["referred_table"], "users")
+        self.assertEqual(results["audit"], ([], [], []))
+        inspector.get_pk_constraint.assert_not_called()
+        inspector.get_unique_constraints.assert_not_called()
+        inspector.get_foreign_keys.assert_not_called()
+
+        # Tables missing from the schema results are reflected on their own
+        inspector.get_pk_constraint.return_value = {
+            "constrained_columns": ["id"],
+            "name": "new_pk",
+        }
+        inspector.get_unique_constraints.return_value = []
+        inspector.get_foreign_keys.return_value = []
+        (
+            pk_columns,
+            _,
+            _,
+        ) = handler._get_columns_with_constraints(  # pylint: disable=protected-access
+            "public", "new_table", inspector
+        )
+        self.assertEqual(pk_columns, ["id"])
+        inspector.get_pk_constraint.assert_called_once_with("new_table", "public")
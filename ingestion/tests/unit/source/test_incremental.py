@@ -0,0 +1,111 @@
+#  Copyright 2021 Collate
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#  http://www.apache.org/licenses/LICENSE-2.0
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+"""
+Validate the table watermarks of the incremental extraction
+"""
+import os
+import tempfile
+from unittest import TestCase
+
+from sqlalchemy import create_engine, inspect
+
+from metadata.ingestion.source.database.incremental import (
+    IncrementalState,
+    TableWatermarkFactory,
+    hash_table_rows,
+)
+
+
+class IncrementalTest(TestCase):
+    """
+    Check the watermarks and their state between runs
+    """
+
+    def test_hash_table_rows(self):
+        watermarks = hash_table_rows(
+            [("a", "id", "int"), ("a", "name", "text"), ("b", "id", "int")]
+        )
+        self.assertEqual(
+            watermarks,
+            hash_table_rows(
+                [("b", "id", "int"), ("a", "name", "text"), ("a", "id", "int")]
+            ),
+        )
+        self.assertNotEqual(
+            watermarks["a"],
+            hash_table_rows([("a", "id", "int"), ("a", "name", "varchar")])["a"],
+        )
+
+    def test_factory(self):
+        engine = create_engine("sqlite+pysqlite:///:memory:")
+        factory = TableWatermarkFactory()
+        factory.register(
+            "sqlite",
+            lambda conn, schema_name: conn.execute(
+                "SELECT name, sql FROM sqlite_master WHERE type = 'table'"
+            ),
+        )
+        engine.execute("CREATE TABLE users (id INTEGER)")
+
+        watermarks = factory.get_watermarks(inspect(engine), "main")
+        self.assertEqual(list(watermarks), ["users"])
+
+        factory.register("sqlite", lambda conn, schema_name: 1 / 0)
+        self.assertIsNone(factory.get_watermarks(inspect(engine), "main"))
+
+    def test_state(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            location = os.path.join(tmp_dir, "state.json")
+
+            state = IncrementalState(location, "config")
+            self.assertFalse(state.is_unchanged("service.db.schema.a", "w1"))
+            for table in ("a", "b", "failed"):
+                state.add_pending(f"service.db.schema.{table}", "w1")
+            state.confirm("service.db.schema.a")
+            state.confirm("service.db.schema.b")
+            state.save()
+
+            # The sink did not store the failed table
+            state = IncrementalState(location, "config")
+            self.assertEqual(
+                state.previous,
+                {"service.db.schema.a": "w1", "service.db.schema.b": "w1"},
+            )
+            self.assertTrue(state.is_unchanged("service.db.schema.a", "w1"))
+            self.assertFalse(state.is_unchanged("service.db.schema.b", "w2"))
+            self.assertFalse(state.is_unchanged("service.db.schema.c", None))
+            state.save()
+
+            # b was not extracted, so it does not keep its watermark
+            state = IncrementalState(location, "config")
+            self.assertEqual(state.previous, {"service.db.schema.a": "w1"})
+
+            state = IncrementalState(location, "other config")
+            self.assertFalse(state.is_unchanged("service.db.schema.a", "w1"))
+
+    def test_prune_dropped_tables(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            location = os.path.join(tmp_dir, "state.json")
+
+            state = IncrementalState(location, "config")
+            for table_fqn in ("service.db.schema.a", "service.db.other.b"):
+                state.add_pending(table_fqn, "w1")
+                state.confirm(table_fqn)
+            state.save()
+
+            # a was dropped from the schema, while the other schema was not listed
+            state = IncrementalState(location, "config")
+            state.visit_schema("service.db.schema")
+            state.save()
+
+            state = IncrementalState(location, "config")
+            self.assertEqual(state.previous, {"service.db.other.b": "w1"})
@@ -0,0 +1,80 @@
+#  Copyright 2021 Collate
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#  http://www.apache.org/licenses/LICENSE-2.0
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+"""
+Validate the backup dump of the metadata CLI
+"""
+import tempfile
+from functools import partial
+from pathlib import Path
+from unittest import TestCase
+from unittest.mock import patch
+
+from sqlalchemy import create_engine
+
+from metadata.cli.db_dump import dump_json_table, dump_parallel, open_dump
+
+TABLES = ["table_entity", "topic_entity"]
+
+
+class DbDumpTest(TestCase):
+    """
+    Dump a SQLite database
+    """
+
+    def setUp(self):
+        self.tmp_dir = (
+            tempfile.TemporaryDirectory()
+        )  # pylint: disable=consider-using-with
+        self.engine = create_engine(f"sqlite:///{self.tmp_dir.name}/om.db")
+        for table in TABLES:
+            self.engine.execute(f"CREATE TABLE {table} (json TEXT)")
+            for idx in range(3):
+                self.engine.execute(
+                    f'INSERT INTO {table} VALUES (\'{{"name": "{table}_{idx}"}}\')'
+                )
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def read(self, name: str) -> list:
+        with open_dump(Path(self.tmp_dir.name) / name, "r") as file:
+            return file.readlines()
+
+    @patch("metadata.cli.db_dump.INSERT_BATCH_ROWS", 2)
+    def test_multi_row_inserts(self):
+        with open_dump(Path(self.tmp_dir.name) / "backup.sql", "w") as file:
+            dump_json_table("table_entity", self.engine, file)
+
+        self.assertEqual(
+            self.read("backup.sql"),
+            [
+                "TRUNCATE TABLE table_entity;\n",
+                "INSERT INTO table_entity (json) VALUES "
+                '(\'{"name": "table_entity_0"}\'),(\'{"name": "table_entity_1"}\');\n',
+                "INSERT INTO table_entity (json) VALUES "
+                '(\'{"name": "table_entity_2"}\');\n',
+            ],
+        )
+
+    def test_parallel_compressed(self):
+        dump_tables = [partial(dump_json_table, table, self.engine) for table in TABLES]
+        dump_parallel(dump_tables, Path(self.tmp_dir.name) / "parallel.sql.gz", 2)
+        with open_dump(Path(self.tmp_dir.name) / "sequential.sql", "w") as file:
+            for dump_table in dump_tables:
+                dump_table(file=file)
+
+        self.assertEqual(self.read("parallel.sql.gz"), self.read("sequential.sql"))
+        # Only the backup files are left
+        self.assertEqual(
+            sorted(path.name for path in Path(self.tmp_dir.name).iterdir()),
+            ["om.db", "parallel.sql.gz", "sequential.sql"],
+        )
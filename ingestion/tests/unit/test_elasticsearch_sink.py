@@ -0,0 +1,207 @@
+#  Copyright 2021 Collate
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#  http://www.apache.org/licenses/LICENSE-2.0
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+"""
+Validate the bulk mode and the parent cache of the Elasticsearch sink
+"""
+import json
+import uuid
+from unittest import TestCase
+from unittest.mock import MagicMock, patch
+
+from metadata.generated.schema.entity.data.databaseSchema import DatabaseSchema
+from metadata.generated.schema.type.entityReference import EntityReference
+from metadata.ingestion.sink.elasticsearch import ElasticSearchConfig, ElasticsearchSink
+from metadata.ingestion.sink.es_parent_cache import ParentReferenceCache
+
+
+def _bulk_response(*statuses: int) -> dict:
+    return {
+        "items": [
+            {"index": {"status": status, "error": None if status < 300 else "boom"}}
+            for status in statuses
+        ]
+    }
+
+
+def _indexed_ids(bulk_call) -> list:
+    return [line["index"]["_id"] for line in bulk_call.kwargs["body"][::2]]
+
+
+class ElasticsearchSinkBulkTest(TestCase):
+    """
+    Check how the sink buffers and indexes the documents
+    """
+
+    @patch("elasticsearch.Elasticsearch")
+    @patch("metadata.ingestion.sink.elasticsearch.OpenMetadata")
+    def get_sink(self, metadata_mock, es_mock, **config) -> ElasticsearchSink:
+        return ElasticsearchSink(
+            ElasticSearchConfig(es_host="localhost", **config), MagicMock()
+        )
+
+    @staticmethod
+    def index(sink: ElasticsearchSink, name: str) -> None:
+        sink._index_document(  # pylint: disable=protected-access
+            index="table_search_index",
+            doc_id=name,
+            body=json.dumps({"name": name}),
+            name=name,
+        )
+
+    def test_index_one_by_one(self):
+        sink = self.get_sink()
+        self.index(sink, "a")
+        sink.elasticsearch_client.index.assert_called_once()
+        sink.elasticsearch_client.bulk.assert_not_called()
+        self.assertEqual(sink.status.records, ["a"])
+
+    def test_bulk_by_size(self):
+        sink = self.get_sink(bulk_size=2)
+        sink.elasticsearch_client.bulk.side_effect = [
+            _bulk_response(201, 201),
+            _bulk_response(201),
+        ]
+
+        self.index(sink, "a")
+        sink.elasticsearch_client.bulk.assert_not_called()
+        self.index(sink, "b")
+        self.index(sink, "c")
+        sink.close()
+
+        self.assertEqual(sink.elasticsearch_client.bulk.call_count, 2)
+        sink.elasticsearch_client.index.assert_not_called()
+        self.assertEqual(sorted(sink.status.records), ["a", "b", "c"])
+
+    def test_bulk_by_bytes(self):
+        sink = self.get_sink(bulk_size=100, bulk_max_bytes=10)
+        sink.elasticsearch_client.bulk.return_value = _bulk_response(201)
+
+        self.index(sink, "a")
+        sink.flush()
+
+        sink.elasticsearch_client.bulk.assert_called_once()
+        self.assertEqual(sink.status.records, ["a"])
+
+    @patch("metadata.ingestion.sink.es_bulk.time.sleep")
+    def test_retry_items(self, _):
+        sink = self.get_sink(bulk_size=4)
+        sink.elasticsearch_client.bulk.side_effect = [
+            _bulk_response(201, 429, 409, 400),
+            _bulk_response(429),
+            _bulk_response(200),
+        ]
+
+        for name in ("a", "b", "c", "d"):
+            self.index(sink, name)
+        sink.flush()
+
+        calls = sink.elasticsearch_client.bulk.call_args_list
+        self.assertEqual(len(calls), 3)
+        self.assertEqual(_indexed_ids(calls[0]), ["a", "b", "c", "d"])
+        self.assertEqual(_indexed_ids(calls[1]), ["b"])
+        self.assertEqual(_indexed_ids(calls[2]), ["b"])
+        self.assertEqual(sorted(sink.status.records), ["a", "b"])
+        self.assertEqual([failure.name for failure in sink.status.failures], ["c", "d"])
+
+    @patch("metadata.ingestion.sink.es_bulk.time.sleep")
+    def test_retries_exhausted(self, _):
+        sink = self.get_sink(bulk_size=2, bulk_max_retries=1)
+        sink.elasticsearch_client.bulk.return_value = _bulk_response(429, 201)
+
+        self.index(sink, "a")
+        self.index(sink, "b")
+        sink.flush()
+
+        self.assertEqual(sink.elasticsearch_client.bulk.call_count, 2)
+        self.assertEqual([failure.name for failure in sink.status.failures], ["a"])
+
+    def test_unexpected_error(self):
+        """An error other than the ES ones fails all the documents of the batch"""
+        sink = self.get_sink(bulk_size=2)
+        sink.elasticsearch_client.bulk.side_effect = ValueError("boom")
+
+        self.index(sink, "a")
+        self.index(sink, "b")
+        sink.flush()
+
+        self.assertEqual(sink.status.records, [])
+        self.assertEqual(
+            sorted(failure.name for failure in sink.status.failures), ["a", "b"]
+        )
+        self.assertEqual(sink.bulk_indexer.futures, {})
+
+
+class ParentReferenceCacheTest(TestCase):
+    """
+    Check the parent names are fetched once
+    """
+
+    @staticmethod
+    def reference(name=None) -> EntityReference:
+        return EntityReference(id=uuid.uuid4(), type="databaseSchema", name=name)
+
+    @staticmethod
+    def get_metadata() -> MagicMock:
+        metadata = MagicMock()
+        metadata.get_by_id.side_effect = lambda entity, entity_id: MagicMock(
+            **{"name.__root__": f"name_{entity_id}"}
+        )
+        return metadata
+
+    def test_reference_name(self):
+        metadata = self.get_metadata()
+        cache = ParentReferenceCache(metadata)
+
+        name = cache.get_name(DatabaseSchema, self.reference("schema"))
+
+        self.assertEqual(name, "schema")
+        metadata.get_by_id.assert_not_called()
+        self.assertEqual(cache.get_stats()["size"], 0)
+
+    def test_fetch_once(self):
+        metadata = self.get_metadata()
+        cache = ParentReferenceCache(metadata)
+        reference = self.reference()
+
+        for _ in range(3):
+            name = cache.get_name(DatabaseSchema, reference)
+
+        self.assertEqual(name, f"name_{reference.id.__root__}")
+        metadata.get_by_id.assert_called_once()
+        stats = cache.get_stats()
+        self.assertEqual((stats["hits"], stats["misses"]), (2, 1))
+        self.assertAlmostEqual(stats["hitRate"], 2 / 3)
+
+        resolved = cache.resolve(DatabaseSchema, reference)
+        self.assertEqual(resolved.name, name)
+        self.assertIsNone(reference.name)
+
+    def test_eviction(self):
+        metadata = self.get_metadata()
+        cache = ParentReferenceCache(metadata, capacity=2)
+        first, second, third = self.reference(), self.reference(), self.reference()
+
+        for reference in (first, second, third, first):
+            cache.get_name(DatabaseSchema, reference)
+
+        stats = cache.get_stats()
+        self.assertEqual(stats["size"], 2)
+        self.assertEqual(stats["evictions"], 2)
+        self.assertEqual(metadata.get_by_id.call_count, 4)
+
+    def test_missing_entity(self):
+        metadata = MagicMock()
+        cache = ParentReferenceCache(metadata)
+        metadata.get_by_id.return_value = None
+
+        self.assertIsNone(cache.get_name(DatabaseSchema, self.reference()))
+        self.assertEqual(cache.get_stats()["size"], 0)
@@ -0,0 +1,284 @@
+#  Copyright 2021 Collate
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#  http://www.apache.org/licenses/LICENSE-2.0
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+"""
+Validate the bulk mode and the request fingerprints of the metadata REST sink
+"""
+import os
+import tempfile
+import time
+import uuid
+from unittest import TestCase
+from unittest.mock import MagicMock, patch
+
+from metadata.generated.schema.api.data.createDatabaseSchema import (
+    CreateDatabaseSchemaRequest,
+)
+from metadata.generated.schema.api.data.createTable import CreateTableRequest
+from metadata.generated.schema.api.lineage.addLineage import AddLineageRequest
+from metadata.generated.schema.entity.data.databaseSchema import DatabaseSchema
+from metadata.generated.schema.entity.data.table import Column, DataType, Table
+from metadata.generated.schema.type.entityLineage import EntitiesEdge
+from metadata.generated.schema.type.entityReference import EntityReference
+from metadata.ingestion.models.delete_entity import DeleteEntity
+from metadata.ingestion.ometa.models import BulkResult
+from metadata.ingestion.sink.metadata_rest import (
+    MetadataRestSink,
+    MetadataRestSinkConfig,
+)
+from metadata.ingestion.sink.request_fingerprint import request_key
+
+
+def _table_request(name: str) -> CreateTableRequest:
+    return CreateTableRequest(
+        name=name,
+        databaseSchema="service.db.schema",
+        columns=[Column(name="id", dataType=DataType.INT)],
+    )
+
+
+def _bulk_results(data, max_workers):  # pylint: disable=unused-argument
+    """Fail the tables named `fail`, create the rest"""
+    return [
+        BulkResult(request=request, error="boom")
+        if request.name.__root__ == "fail"
+        else BulkResult(
+            request=request,
+            entity=Table(
+                id=uuid.uuid4(),
+                name=request.name,
+                fullyQualifiedName=f"service.db.schema.{request.name.__root__}",
+                columns=request.columns,
+            ),
+        )
+        for request in data
+    ]
+
+
+class MetadataRestSinkBulkTest(TestCase):
+    """
+    Check how the sink buffers and flushes the requests
+    """
+
+    @patch("metadata.ingestion.sink.metadata_rest.OpenMetadata")
+    def get_sink(self, metadata_mock, **config) -> MetadataRestSink:
+        sink = MetadataRestSink(MetadataRestSinkConfig(**config), MagicMock())
+        sink.metadata = MagicMock()
+        sink.metadata.bulk_create_or_update.side_effect = _bulk_results
+        return sink
+
+    def test_flush_by_size(self):
+        sink = self.get_sink(bulk_size=2)
+
+        sink.write_record(_table_request("a"))
+        sink.metadata.bulk_create_or_update.assert_not_called()
+
+        sink.write_record(_table_request("fail"))
+        sink.metadata.bulk_create_or_update.assert_called_once()
+
+        sink.write_record(_table_request("c"))
+        sink.close()
+
+        self.assertEqual(sink.metadata.bulk_create_or_update.call_count, 2)
+        self.assertEqual(
+            sink.status.records,
+            ["Table: service.db.schema.a", "Table: service.db.schema.c"],
+        )
+        self.assertEqual(len(sink.status.failures), 1)
+        self.assertEqual(sink.status.failures[0].name, "CreateTableRequest [fail]")
+
+    def test_flush_by_bytes(self):
+        sink = self.get_sink(bulk_size=100, bulk_max_bytes=1)
+
+        sink.write_record(_table_request("a"))
+        sink.metadata.bulk_create_or_update.assert_called_once()
+
+    def test_flush_by_time(self):
+        sink = self.get_sink(bulk_size=100, bulk_flush_interval_seconds=0.1)
+
+        sink.write_record(_table_request("a"))
+        sink.metadata.bulk_create_or_update.assert_not_called()
+
+        # The timer flushes the buffer without waiting for another request
+        time.sleep(0.5)
+        sink.metadata.bulk_create_or_update.assert_called_once()
+        sink.close()
+        self.assertEqual(sink.status.records, ["Table: service.db.schema.a"])
+
+    def test_flush_on_same_entity(self):
+        sink = self.get_sink(bulk_size=100)
+
+        sink.write_record(_table_request("a"))
+        sink.write_record(
+            CreateTableRequest(
+                name="a",
+                databaseSchema="service.db.other",
+                columns=[Column(name="id", dataType=DataType.INT)],
+            )
+        )
+        # Same name under another schema
+        sink.metadata.bulk_create_or_update.assert_not_called()
+
+        sink.write_record(_table_request("a"))
+        sink.metadata.bulk_create_or_update.assert_called_once()
+
+    def test_flush_on_type_change(self):
+        sink = self.get_sink(bulk_size=100)
+        sink.metadata.bulk_create_or_update.side_effect = None
+
+        schema = CreateDatabaseSchemaRequest(name="schema", database="service.db")
+        sink.write_record(schema)
+        sink.write_record(_table_request("a"))
+
+        sink.metadata.bulk_create_or_update.assert_called_once_with(
+            [schema], max_workers=10
+        )
+
+    def test_flush_before_dependent_records(self):
+        sink = self.get_sink(bulk_size=100)
+
+        sink.write_record(_table_request("a"))
+        sink.write_record(
+            AddLineageRequest(
+                edge=EntitiesEdge(
+                    fromEntity=EntityReference(id=uuid.uuid4(), type="table"),
+                    toEntity=EntityReference(id=uuid.uuid4(), type="table"),
+                )
+            )
+        )
+
+        sink.metadata.bulk_create_or_update.assert_called_once()
+        sink.metadata.add_lineage.assert_called_once()
+
+    def test_no_buffer_by_default(self):
+        sink = self.get_sink()
+
+        sink.write_record(_table_request("a"))
+
+        sink.metadata.create_or_update.assert_called_once()
+        sink.metadata.bulk_create_or_update.assert_not_called()
+
+
+class MetadataRestSinkFingerprintTest(TestCase):
+    """
+    Check unchanged requests are not sent again
+    """
+
+    def setUp(self):
+        self.tmp_dir = (
+            tempfile.TemporaryDirectory()
+        )  # pylint: disable=consider-using-with
+        self.location = os.path.join(self.tmp_dir.name, "fingerprints.db")
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    @patch("metadata.ingestion.sink.metadata_rest.OpenMetadata")
+    def run_sink(self, requests, metadata_mock, **config) -> MetadataRestSink:
+        sink = MetadataRestSink(
+            MetadataRestSinkConfig(fingerprint_location=self.location, **config),
+            MagicMock(),
+        )
+        sink.metadata = MagicMock()
+        sink.metadata.bulk_create_or_update.side_effect = _bulk_results
+        sink.metadata.create_or_update.side_effect = lambda request: _bulk_results(
+            [request], max_workers=1
+        )[0].entity
+        for request in requests:
+            sink.write_record(request)
+        sink.close()
+        return sink
+
+    def test_request_key(self):
+        self.assertEqual(
+            request_key(_table_request("a")),
+            "CreateTableRequest:service.db.schema:a",
+        )
+
+    def test_skip_unchanged(self):
+        self.run_sink([_table_request("a"), _table_request("b")])
+
+        changed = _table_request("b")
+        changed.description = "new description"
+        sink = self.run_sink([_table_request("a"), changed])
+
+        sink.metadata.create_or_update.assert_called_once_with(changed)
+        self.assertEqual(sink.status.records, ["Table: service.db.schema.b"])
+        self.assertEqual(sink.status.skipped_records, ["CreateTableRequest [a]"])
+
+    def test_skip_unchanged_in_bulk(self):
+        self.run_sink([_table_request("a"), _table_request("fail")], bulk_size=10)
+
+        sink = self.run_sink(
+            [_table_request("a"), _table_request("fail")], bulk_size=10
+        )
+
+        # Failed requests are sent again
+        sink.metadata.bulk_create_or_update.assert_called_once_with(
+            [_table_request("fail")], max_workers=10
+        )
+        self.assertEqual(sink.status.skipped_records, ["CreateTableRequest [a]"])
+
+    @patch("metadata.ingestion.sink.metadata_rest.OpenMetadata")
+    def test_fingerprints_of_timer_flush(self, metadata_mock):
+        sink = MetadataRestSink(
+            MetadataRestSinkConfig(
+                fingerprint_location=self.location,
+                bulk_size=100,
+                bulk_flush_interval_seconds=0.1,
+            ),
+            MagicMock(),
+        )
+        sink.metadata = MagicMock()
+        sink.metadata.bulk_create_or_update.side_effect = _bulk_results
+        sink.write_record(_table_request("a"))
+
+        # The timer thread flushes the buffer and keeps the fingerprints
+        time.sleep(0.5)
+        sink.metadata.bulk_create_or_update.assert_called_once()
+        sink.close()
+
+        sink = self.run_sink([_table_request("a")], bulk_size=100)
+        sink.metadata.bulk_create_or_update.assert_not_called()
+        self.assertEqual(sink.status.skipped_records, ["CreateTableRequest [a]"])
+
+    def test_expired_fingerprints(self):
+        self.run_sink([_table_request("a")])
+
+        sink = self.run_sink([_table_request("a")], fingerprint_ttl_seconds=0)
+
+        sink.metadata.create_or_update.assert_called_once()
+        self.assertEqual(sink.status.skipped_records, [])
+
+    def test_invalidate_deleted(self):
+        self.run_sink([_table_request(name) for name in ("a", "b", "a_b")])
+
+        deleted = _bulk_results([_table_request("a")], max_workers=1)[0].entity
+        sink = self.run_sink(
+            [DeleteEntity(entity=deleted)]
+            + [_table_request(name) for name in ("a", "b", "a_b")]
+        )
+
+        sink.metadata.create_or_update.assert_called_once_with(_table_request("a"))
+
+        # Deleting the schema drops the fingerprints of its tables
+        schema = DatabaseSchema(
+            id=uuid.uuid4(),
+            name="schema",
+            fullyQualifiedName="service.db.schema",
+            database=EntityReference(id=uuid.uuid4(), type="database"),
+            service=EntityReference(id=uuid.uuid4(), type="databaseService"),
+        )
+        sink = self.run_sink(
+            [DeleteEntity(entity=schema, mark_deleted_entities=True)]
+            + [_table_request(name) for name in ("a", "b")]
+        )
+        self.assertEqual(sink.metadata.create_or_update.call_count, 2)
@@ -0,0 +1,135 @@
+#  Copyright 2021 Collate
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#  http://www.apache.org/licenses/LICENSE-2.0
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+"""
+Validate how the ES mixin builds the entities from the search results
+"""
+import uuid
+from unittest import TestCase
+from unittest.mock import MagicMock, patch
+
+from metadata.generated.schema.entity.data.table import Table
+from metadata.ingestion.ometa.mixins.es_mixin import ESMixin
+
+
+def _table_source(name: str) -> dict:
+    return {
+        "id": str(uuid.uuid4()),
+        "name": name,
+        "fullyQualifiedName": f"service.db.schema.{name}",
+        "columns": [{"name": "id", "dataType": "INT"}],
+        "owner": {"id": str(uuid.uuid4()), "type": "user", "name": "owner"},
+        "tags": [],
+        "suggest": [{"input": name, "weight": 10}],
+        "tier": None,
+    }
+
+
+class MockESClient(ESMixin):
+    def __init__(self, *sources: dict):
+        self.client = MagicMock()
+        self.client.get.return_value = {
+            "hits": {"hits": [{"_source": source} for source in sources]}
+        }
+        self.get_by_name = MagicMock()
+
+
+class ESMixinTest(TestCase):
+    """
+    Check the entities are built from the ES documents
+    """
+
+    query = (
+        "/search/query?q=fullyQualifiedName:service.*.table&index=table_search_index"
+    )
+
+    def test_build_from_source(self):
+        client = MockESClient(_table_source("a"), _table_source("b"))
+
+        entities = client._search_es_entity(  # pylint: disable=protected-access
+            entity_type=Table, query_string=self.query, fields=["owner", "columns"]
+        )
+
+        self.assertEqual([entity.name.__root__ for entity in entities], ["a", "b"])
+        self.assertEqual(entities[0].owner.name, "owner")
+        client.get_by_name.assert_not_called()
+
+    def test_build_known_fields(self):
+        source = _table_source("a")
+        source["description"] = ""
+        client = MockESClient(source)
+
+        entity = client._search_es_entity(  # pylint: disable=protected-access
+            entity_type=Table, query_string=self.query
+        )[0]
+
+        self.assertIsNone(entity.description)
+        # Only read from the document when requested
+        self.assertIsNone(entity.owner)
+        self.assertEqual(entity.columns[0].name.__root__, "id")
+        client.get_by_name.assert_not_called()
+
+    def test_skip_deleted(self):
+        deleted = _table_source("b")
+        deleted["deleted"] = True
+        client = MockESClient(_table_source("a"), deleted)
+
+        entities = client._search_es_entity(  # pylint: disable=protected-access
+            entity_type=Table, query_string=self.query, fields=["owner"]
+        )
+
+        self.assertEqual([entity.name.__root__ for entity in entities], ["a"])
+        client.get_by_name.assert_not_called()
+
+    def test_fetch_missing_fields(self):
+        client = MockESClient(_table_source("a"))
+
+        entities = client._search_es_entity(  # pylint: disable=protected-access
+            entity_type=Table, query_string=self.query, fields=["tags"]
+        )
+
+        self.assertEqual(entities, [client.get_by_name.return_value])
+        client.get_by_name.assert_called_once_with(
+            entity=Table, fqn="service.db.schema.a", fields=["tags"]
+        )
+
+    def test_fetch_invalid_source(self):
+        source = _table_source("a")
+        source.pop("columns")
+        client = MockESClient(source)
+
+        client._search_es_entity(  # pylint: disable=protected-access
+            entity_type=Table, query_string=self.query
+        )
+
+        client.get_by_name.assert_called_once()
+
+    def test_cache(self):
+        client = MockESClient(_table_source("a"))
+
+        for _ in range(2):
+            client._search_es_entity(  # pylint: disable=protected-access
+                entity_type=Table, query_string=self.query, fields=["owner"]
+            )
+        client.client.get.assert_called_once()
+
+        # Other clients do not share the results
+        other = MockESClient(_table_source("a"))
+        other._search_es_entity(  # pylint: disable=protected-access
+            entity_type=Table, query_string=self.query, fields=["owner"]
+        )
+        other.client.get.assert_called_once()
+
+        with patch("metadata.utils.lru_cache.time.monotonic", return_value=10**9):
+            client._search_es_entity(  # pylint: disable=protected-access
+                entity_type=Table, query_string=self.query, fields=["owner"]
+            )
+        self.assertEqual(client.client.get.call_count, 2)
@@ -12,14 +12,29 @@
 """
 Validate query parser logic
 """
-
+import os
+import tempfile
+import time
 from unittest import TestCase
+from unittest.mock import MagicMock, patch
 
 from sqllineage.core.models import Column
 
+from metadata.generated.schema.type.tableQuery import TableQuery
 from metadata.generated.schema.type.tableUsageCount import TableColumn, TableColumnJoin
 from metadata.ingestion.lineage.models import Dialect
+from metadata.ingestion.lineage.parse_cache import LineageParseCache, fingerprint_query
 from metadata.ingestion.lineage.parser import LineageParser
+from metadata.ingestion.lineage.parser_selection import (
+    ParserChoice,
+    ParserSelector,
+    query_shape,
+)
+from metadata.ingestion.processor.query_parser import (
+    QueryParserPool,
+    parse_sql_statement,
+)
+from metadata.ingestion.source.database.query_parser_source import QueryParserSource
 
 
 class QueryParserTests(TestCase):
@@ -333,3 +348,228 @@ class QueryParserTests(TestCase):
             parser.column_lineage,
             expected_lineage,
         )
+
+
+def _parse_or_break(record: TableQuery, dialect: Dialect):
+    """Kill or hang the parser process for some queries"""
+    if record.query == "die":
+        os._exit(1)  # pylint: disable=protected-access
+    if record.query == "hang":
+        time.sleep(60)
+    return parse_sql_statement(record, dialect)
+
+
+class QueryParserPoolTests(TestCase):
+    """
+    Check the parsing of queries in a process pool
+    """
+
+    @staticmethod
+    def _table_query(query: str) -> TableQuery:
+        return TableQuery(
+            query=query,
+            userName="",
+            startTime="",
+            endTime="",
+            analysisDate="2023-01-01 00:00:00",
+            aborted=False,
+            databaseName="db",
+            serviceName="service",
+            databaseSchema="schema",
+        )
+
+    def test_results_keep_the_query_order(self):
+        queries = [self._table_query(f"select * from table_{idx}") for idx in range(8)]
+        pool = QueryParserPool(processes=3, query_timeout_seconds=60)
+        try:
+            results = pool.parse(queries, Dialect.ANSI)
+        finally:
+            pool.close()
+
+        self.assertEqual(
+            [result.tables for result in results],
+            [[f"table_{idx}"] for idx in range(8)],
+        )
+
+    def test_parser_selection_stats_are_merged(self):
+        selector = ParserSelector()
+        queries = [self._table_query(f"select * from table_{idx}") for idx in range(4)]
+        pool = QueryParserPool(processes=2, query_timeout_seconds=60)
+        try:
+            with patch(
+                "metadata.ingestion.processor.query_parser.parser_selector", selector
+            ), patch("metadata.ingestion.lineage.parser.parser_selector", selector):
+                pool.parse(queries, Dialect.ANSI)
+        finally:
+            pool.close()
+
+        stats = selector.stats_for(Dialect.ANSI, "select * from tbl")
+        self.assertEqual(stats.evaluations, 4)
+        self.assertEqual(stats.sqlparseRuns, 4)
+
+    @patch(
+        "metadata.ingestion.processor.query_parser.parse_sql_statement",
+        _parse_or_break,
+    )
+    def test_broken_queries_are_isolated(self):
+        queries = [
+            self._table_query("select * from table_a"),
+            self._table_query("die"),
+            self._table_query("hang"),
+            self._table_query("select * from table_b"),
+        ]
+        pool = QueryParserPool(processes=2, query_timeout_seconds=2)
+        try:
+            results = pool.parse(queries, Dialect.ANSI)
+        finally:
+            pool.close()
+
+        self.assertEqual(results[0].tables, ["table_a"])
+        self.assertIsNone(results[1])
+        self.assertIsNone(results[2])
+        self.assertEqual(results[3].tables, ["table_b"])
+
+
+class LineageParseCacheTests(TestCase):
+    """
+    Check the caching of the parsing results by query shape
+    """
+
+    def test_fingerprint_ignores_literals_and_format(self):
+        query = "SELECT a FROM db.tbl WHERE b = 'x' AND c > 10"
+        same_shape = """
+            SELECT a -- the column
+            FROM   db.tbl
+            WHERE b = 'y' /* filter */ AND c > 25.5
+        """
+        self.assertEqual(
+            fingerprint_query(query, Dialect.ANSI),
+            fingerprint_query(same_shape, Dialect.ANSI),
+        )
+        self.assertNotEqual(
+            fingerprint_query(query, Dialect.ANSI),
+            fingerprint_query(query, Dialect.MYSQL),
+        )
+        # Quoted identifiers are not literals
+        self.assertNotEqual(
+            fingerprint_query('select * from "tbl_a"', Dialect.ANSI),
+            fingerprint_query('select * from "tbl_b"', Dialect.ANSI),
+        )
+
+    def test_parser_uses_the_cache(self):
+        cache = LineageParseCache()
+        query = (
+            "insert into db.target select a.id from db.source a "
+            "join db.other b on a.id = b.id where a.id = {}"
+        )
+        with patch(
+            "metadata.ingestion.lineage.parser.parse_cache", cache
+        ), patch.object(
+            LineageParser,
+            "_evaluate_best_parser",
+            wraps=LineageParser._evaluate_best_parser,
+        ) as evaluate:
+            first = LineageParser(query.format(1))
+            second = LineageParser(query.format(2))
+
+            self.assertEqual(evaluate.call_count, 1)
+            self.assertEqual((cache.hits, cache.misses), (1, 1))
+            self.assertEqual(first.clean_table_list, second.clean_table_list)
+            self.assertEqual(
+                [str(col) for col in second.column_lineage[0]],
+                ["db.source.id", "db.target.id"],
+            )
+            # Joins come from the query being parsed
+            self.assertEqual(
+                second.table_joins["db.source"][0].tableColumn,
+                TableColumn(table="db.source", column="id"),
+            )
+
+    def test_cache_is_persisted(self):
+        query = "insert into db.target (id) select id from db.source"
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            location = os.path.join(tmp_dir, "parse_cache.db")
+            cache = LineageParseCache(location=location)
+            with patch("metadata.ingestion.lineage.parser.parse_cache", cache):
+                LineageParser(query)
+            cache.close()
+
+            new_cache = LineageParseCache(location=location)
+            with patch(
+                "metadata.ingestion.lineage.parser.parse_cache", new_cache
+            ), patch.object(LineageParser, "_evaluate_best_parser") as evaluate:
+                parser = LineageParser(query)
+                evaluate.assert_not_called()
+            new_cache.close()
+
+        self.assertEqual(new_cache.hits, 1)
+        self.assertEqual(
+            {str(table) for table in parser.involved_tables},
+            {"db.source", "db.target"},
+        )
+        self.assertEqual(
+            [str(col) for col in parser.column_lineage[0]],
+            ["db.source.id", "db.target.id"],
+        )
+
+    def test_source_closes_the_cache(self):
+        with patch(
+            "metadata.ingestion.source.database.query_parser_source.parse_cache"
+        ) as cache:
+            QueryParserSource.close(MagicMock())
+        cache.close.assert_called_once()
+
+
+class ParserSelectorTests(TestCase):
+    """
+    Check the adaptive selection of the lineage parsers
+    """
+
+    def test_query_shape(self):
+        self.assertEqual(query_shape("select * from tbl"), "SELECT:<1000")
+        self.assertEqual(
+            query_shape("/* dbt */ INSERT INTO tbl SELECT 1"), "INSERT:<1000"
+        )
+        self.assertEqual(
+            query_shape("with cte as (select 1) select * from cte"), "WITH:<1000"
+        )
+
+    def test_choose_after_enough_evaluations(self):
+        selector = ParserSelector(min_evaluations=4, win_ratio=0.75, evaluate_every=3)
+        stats = selector.stats_for(Dialect.REDSHIFT, "select * from tbl")
+
+        for winner in (ParserChoice.SQLPARSE,) * 3 + (ParserChoice.SQLFLUFF,):
+            self.assertEqual(selector.choose(stats), ParserChoice.BOTH)
+            selector.record_winner(stats, winner)
+
+        self.assertEqual(selector.choose(stats), ParserChoice.SQLPARSE)
+        self.assertEqual(selector.choose(stats), ParserChoice.SQLPARSE)
+        # Both parsers are evaluated again from time to time
+        self.assertEqual(selector.choose(stats), ParserChoice.BOTH)
+        self.assertEqual(stats.sqlfluffSkipped, 2)
+        self.assertEqual(
+            list(selector.get_stats()), [f"{Dialect.REDSHIFT.value}:SELECT:<1000"]
+        )
+
+    def test_parser_skips_the_losing_parser(self):
+        selector = ParserSelector(min_evaluations=2)
+        cache = LineageParseCache()
+        with patch(
+            "metadata.ingestion.lineage.parser.parser_selector", selector
+        ), patch("metadata.ingestion.lineage.parser.parse_cache", cache), patch.object(
+            LineageParser, "_run_sqlfluff_parser", return_value=(None, 0)
+        ) as run_sqlfluff:
+            for idx in range(4):
+                parser = LineageParser(
+                    f"insert into db.target_{idx} select id from db.source"
+                )
+                self.assertEqual(
+                    {str(table) for table in parser.involved_tables},
+                    {"db.source", f"db.target_{idx}"},
+                )
+
+        self.assertEqual(run_sqlfluff.call_count, 2)
+        stats = selector.stats_for(Dialect.ANSI, "insert into db.target select 1")
+        self.assertEqual(stats.sqlparseWins, 2)
+        self.assertEqual(stats.sqlfluffSkipped, 2)
+        self.assertEqual(stats.sqlparseRuns, 4)
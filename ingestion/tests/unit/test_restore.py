@@ -0,0 +1,91 @@
+#  Copyright 2021 Collate
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#  http://www.apache.org/licenses/LICENSE-2.0
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+"""
+Validate the backup restore of the metadata CLI
+"""
+import json
+import tempfile
+from pathlib import Path
+from unittest import TestCase
+from unittest.mock import patch
+
+from sqlalchemy import create_engine
+
+from metadata.cli.db_dump import open_dump
+from metadata.cli.restore import Restore, RestoreWorker
+
+TABLES = ["table_entity", "topic_entity"]
+
+
+class RestoreTest(TestCase):
+    """
+    Restore a backup into SQLite. It has no TRUNCATE,
+    so those statements fail and the inserts are kept.
+    """
+
+    def setUp(self):
+        self.tmp_dir = (
+            tempfile.TemporaryDirectory()
+        )  # pylint: disable=consider-using-with
+        self.engine = create_engine(f"sqlite:///{self.tmp_dir.name}/om.db")
+        self.sql_file = Path(self.tmp_dir.name) / "backup.sql.gz"
+        with open_dump(self.sql_file, "w") as file:
+            for table in TABLES:
+                self.engine.execute(f"CREATE TABLE {table} (json TEXT)")
+                file.write(f"TRUNCATE TABLE {table};\n")
+                for idx in range(3):
+                    file.write(f"INSERT INTO {table} (json) VALUES ('{idx}');\n")
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def count(self, table: str) -> int:
+        return self.engine.execute(f"SELECT COUNT(*) FROM {table}").scalar()
+
+    @patch("metadata.cli.restore.log_ansi_encoded_string")
+    def test_restore(self, log_mock):
+        Restore(self.engine, self.sql_file, batch_size=2, workers=2).run()
+
+        self.assertEqual([self.count(table) for table in TABLES], [3, 3])
+        self.assertIn("2 queries failed from 8", log_mock.call_args.kwargs["message"])
+        self.assertFalse(Path(f"{self.sql_file}.checkpoint").exists())
+
+    @patch("metadata.cli.restore.log_ansi_encoded_string")
+    def test_resume(self, _):
+        with open(f"{self.sql_file}.checkpoint", "w", encoding="utf-8") as file:
+            json.dump(["table_entity"], file)
+
+        Restore(self.engine, self.sql_file, resume=True).run()
+
+        self.assertEqual([self.count(table) for table in TABLES], [0, 3])
+
+    @patch("metadata.cli.restore.log_ansi_encoded_string")
+    def test_checkpoint_tables_without_failures(self, _):
+        execute = RestoreWorker.execute
+
+        def execute_without_truncate(worker, statements):
+            return execute(
+                worker,
+                [
+                    statement
+                    for statement in statements
+                    if not statement.startswith("TRUNCATE")
+                ],
+            )
+
+        # The inserts into the missing table fail
+        self.engine.execute("DROP TABLE topic_entity")
+        with patch.object(RestoreWorker, "execute", execute_without_truncate):
+            Restore(self.engine, self.sql_file).run()
+
+        with open(f"{self.sql_file}.checkpoint", encoding="utf-8") as file:
+            self.assertEqual(json.load(file), ["table_entity"])
@@ -18,7 +18,12 @@ from datetime import date, datetime
 from unittest.mock import patch
 
 import pytest
+from sqlalchemy import event, literal
 
+from metadata.data_quality.interface.sqlalchemy.fused_metrics import (
+    MetricRecorder,
+    UnrecordableQuery,
+)
 from metadata.data_quality.validations.validator import Validator
 from metadata.generated.schema.tests.basic import (
     TestCaseFailureStatusType,
@@ -345,3 +350,76 @@ def test_suite_validation_database(
             == TestCaseFailureStatusType.New
         )
         assert res.testCaseFailureStatus.updatedAt is not None
+
+
+def test_suite_validation_database_fused(request, create_sqlite_table):
+    """Metrics computed together give the same results with fewer queries"""
+    runner = create_sqlite_table
+    cases = [
+        (
+            request.getfixturevalue(test_case_name),
+            import_test_case_class("COLUMN", "sqlalchemy", test_case_type),
+        )
+        for test_case_name, test_case_type in [
+            (
+                "test_case_column_value_length_to_be_between",
+                "columnValueLengthsToBeBetween",
+            ),
+            ("test_case_column_value_max_to_be_between", "columnValueMaxToBeBetween"),
+            ("test_case_column_value_mean_to_be_between", "columnValueMeanToBeBetween"),
+            (
+                "test_case_column_value_median_to_be_between",
+                "columnValueMedianToBeBetween",
+            ),
+            ("test_case_column_value_min_to_be_between", "columnValueMinToBeBetween"),
+            ("test_case_column_value_in_set", "columnValuesToBeInSet"),
+            ("test_case_column_values_not_in_set", "columnValuesToBeNotInSet"),
+            ("test_case_column_values_to_be_not_null", "columnValuesToBeNotNull"),
+            ("test_case_column_values_to_match_regex", "columnValuesToMatchRegex"),
+        ]
+    ]
+
+    def run_validations(runner_):
+        return [
+            test_handler_obj(
+                runner_,
+                test_case=test_case,
+                execution_date=EXECUTION_DATE.timestamp(),
+            ).run_validation()
+            for test_case, test_handler_obj in cases
+        ]
+
+    expected = run_validations(runner)
+    recorder = MetricRecorder(runner.table)
+    run_validations(recorder)
+    runner.prefetch(recorder.expressions)
+
+    queries = []
+    event.listen(
+        runner._session.get_bind(),  # pylint: disable=protected-access
+        "before_cursor_execute",
+        lambda *args: queries.append(args[2]),
+    )
+    results = run_validations(runner)
+
+    assert [res.testResultValue for res in results] == [
+        res.testResultValue for res in expected
+    ]
+    assert [res.testCaseStatus for res in results] == [
+        res.testCaseStatus for res in expected
+    ]
+    # Only the median, a window metric, is queried on its own
+    assert len(queries) == 1
+
+
+def test_unrecordable_queries():
+    """Only single metrics are recorded, other queries run on their own"""
+    recorder = MetricRecorder(None)
+    assert recorder.dispatch_query_select_first(literal(1).label("a")) == {"a": 0}
+    with pytest.raises(UnrecordableQuery):
+        recorder.dispatch_query_select_first(
+            literal(1).label("a"), literal(2).label("b")
+        )
+    with pytest.raises(UnrecordableQuery):
+        recorder._session  # pylint: disable=protected-access,pointless-statement
+    assert len(recorder.expressions) == 1
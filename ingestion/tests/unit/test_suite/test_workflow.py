@@ -0,0 +1,236 @@
+#  Copyright 2021 Collate
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#  http://www.apache.org/licenses/LICENSE-2.0
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+"""Validate the test suite workflow runs the tests of several tables"""
+
+import uuid
+from contextlib import nullcontext
+from unittest.mock import MagicMock, patch
+
+import sqlalchemy as sqa
+from pytest import mark, raises
+from sqlalchemy.orm import declarative_base
+
+from metadata.data_quality.api.workflow import TestSuiteWorkflow
+from metadata.data_quality.interface.sqlalchemy.sqa_test_suite_interface import (
+    SQATestSuiteInterface,
+)
+from metadata.generated.schema.entity.data.table import Column, DataType, Table
+from metadata.generated.schema.entity.services.connections.database.sqliteConnection import (
+    SQLiteConnection,
+    SQLiteScheme,
+)
+
+
+def get_config(**source_config) -> dict:
+    return {
+        "source": {
+            "type": "sqlite",
+            "serviceName": "sqlite_service",
+            "serviceConnection": {
+                "config": {"type": "SQLite", "databaseMode": ":memory:"}
+            },
+            "sourceConfig": {"config": {"type": "TestSuite", **source_config}},
+        },
+        "processor": {"type": "orm-test-runner", "config": {}},
+        "sink": {"type": "metadata-rest", "config": {}},
+        "workflowConfig": {
+            "openMetadataServerConfig": {
+                "hostPort": "http://localhost:8585/api",
+                "authProvider": "openmetadata",
+            }
+        },
+    }
+
+
+def get_table(name: str) -> Table:
+    return Table(
+        id=uuid.uuid4(),
+        name=name,
+        fullyQualifiedName=f"sqlite_service.main.main.{name}",
+        columns=[Column(name="id", dataType=DataType.INT)],
+    )  # type: ignore
+
+
+def get_workflow(tables, **source_config) -> TestSuiteWorkflow:
+    metadata = MagicMock()
+    metadata.get_by_name.side_effect = lambda entity, fqn, fields: next(
+        (table for table in tables if table.fullyQualifiedName.__root__ == fqn),
+        None,
+    )
+    metadata.list_all_entities.return_value = tables
+    with patch(
+        "metadata.data_quality.api.workflow.create_ometa_client",
+        return_value=metadata,
+    ), patch("metadata.data_quality.api.workflow.get_sink"):
+        return TestSuiteWorkflow.create(get_config(**source_config))
+
+
+def get_result(table: Table) -> MagicMock:
+    return MagicMock(
+        **{
+            "testCase.name.__root__": "test",
+            "testCase.fullyQualifiedName.__root__": f"{table.fullyQualifiedName.__root__}.test",
+        }
+    )
+
+
+TABLES = [get_table("users"), get_table("orders"), get_table("items")]
+
+
+@mark.parametrize(
+    "source_config,expected",
+    [
+        (
+            {"entityFullyQualifiedName": "sqlite_service.main.main.users"},
+            ["users"],
+        ),
+        (
+            {
+                "entityFullyQualifiedNames": [
+                    "sqlite_service.main.main.users",
+                    "sqlite_service.main.main.orders",
+                ]
+            },
+            ["users", "orders"],
+        ),
+        (
+            {
+                "entityFullyQualifiedName": "sqlite_service.main.main.users",
+                "tableFilterPattern": {"excludes": ["orders"]},
+            },
+            ["users", "items"],
+        ),
+        (
+            {"tableFilterPattern": {"excludes": ["orders"]}},
+            ["users", "items"],
+        ),
+    ],
+)
+def test_get_table_entities(source_config, expected):
+    """Tables are listed, filtered and deduplicated"""
+    workflow = get_workflow(TABLES, **source_config)
+    assert [table.name.__root__ for table in workflow.get_table_entities()] == expected
+
+
+@mark.parametrize(
+    "source_config",
+    [
+        {},
+        {
+            "entityFullyQualifiedName": "sqlite_service.main.main.users",
+            "entityFullyQualifiedNames": ["sqlite_service.main.main.orders"],
+        },
+        {"entityFullyQualifiedNames": ["other_service.main.main.orders"]},
+    ],
+)
+def test_invalid_source_config(source_config):
+    """Tables come from one of the FQN fields or the filter, within the service"""
+    with raises(ValueError):
+        get_workflow(TABLES, **source_config)
+
+
+def test_missing_table():
+    """Missing tables fail on their own"""
+    workflow = get_workflow(
+        TABLES,
+        entityFullyQualifiedNames=[
+            "sqlite_service.main.main.users",
+            "sqlite_service.main.main.missing",
+        ],
+    )
+    assert len(workflow.get_table_entities()) == 1
+    assert [failure.name for failure in workflow.status.failures] == [
+        "sqlite_service.main.main.missing"
+    ]
+
+    workflow = get_workflow(
+        [], entityFullyQualifiedName="sqlite_service.main.main.users"
+    )
+    with raises(ValueError):
+        workflow.run_test_suite()
+
+
+@mark.parametrize("thread_count", [1, 3])
+def test_run_test_suite(thread_count):
+    """Results of all the tables reach the sink, even when a table fails"""
+    workflow = get_workflow(
+        TABLES,
+        entityFullyQualifiedName="sqlite_service.main.main.users",
+        tableFilterPattern={"includes": [".*"]},
+        threadCount=thread_count,
+    )
+
+    def run_table_test_suite(table):
+        if table.name.__root__ == "orders":
+            raise RuntimeError("boom")
+        return [get_result(table)]
+
+    with patch.object(
+        workflow, "run_table_test_suite", side_effect=run_table_test_suite
+    ):
+        workflow.run_test_suite()
+
+    assert workflow.sink.write_record.call_count == 2
+    assert sorted(workflow.status.records) == [
+        "sqlite_service.main.main.items.test",
+        "sqlite_service.main.main.users.test",
+    ]
+    assert [failure.name for failure in workflow.status.failures] == [
+        "sqlite_service.main.main.orders"
+    ]
+
+
+def test_shared_engines():
+    """Interfaces of the same connection share their engine within the context"""
+    connection = SQLiteConnection(
+        scheme=SQLiteScheme.sqlite_pysqlite,
+        databaseMode=":memory:",
+    )  # type: ignore
+
+    interface = SQATestSuiteInterface.__new__(SQATestSuiteInterface)
+    interface.service_connection_config = connection
+    get_engine = interface._get_engine  # pylint: disable=protected-access
+
+    assert get_engine() is not get_engine()
+    with SQATestSuiteInterface.shared_engines():
+        assert get_engine() is get_engine()
+    assert get_engine() is not get_engine()
+
+
+class Users(declarative_base()):
+    __tablename__ = "users"
+    id = sqa.Column(sqa.Integer, primary_key=True)
+
+
+@mark.parametrize("shared", [False, True])
+def test_close_interface(shared):
+    """Interfaces close their session, and only dispose the engines they own"""
+    connection = SQLiteConnection(
+        scheme=SQLiteScheme.sqlite_pysqlite,
+        databaseMode=":memory:",
+    )  # type: ignore
+
+    with patch.object(
+        SQATestSuiteInterface, "_convert_table_to_orm_object", return_value=Users
+    ), patch("sqlalchemy.engine.Engine.dispose") as dispose:
+        with SQATestSuiteInterface.shared_engines() if shared else nullcontext():
+            interface = SQATestSuiteInterface(
+                connection,  # type: ignore
+                table_entity=get_table("users"),
+                ometa_client=None,  # type: ignore
+            )
+            with patch.object(interface.session, "close") as close_session:
+                interface.close()
+            close_session.assert_called_once()
+            assert dispose.call_count == (0 if shared else 1)
+        # The shared engines are disposed when leaving the context
+        assert dispose.call_count == 1
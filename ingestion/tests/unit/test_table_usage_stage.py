@@ -0,0 +1,81 @@
+#  Copyright 2021 Collate
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#  http://www.apache.org/licenses/LICENSE-2.0
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+"""
+Validate the user resolution of the table usage stage
+"""
+import tempfile
+import uuid
+from unittest import TestCase
+from unittest.mock import MagicMock, patch
+
+from metadata.generated.schema.entity.teams.user import User
+from metadata.ingestion.stage.table_usage import TableStageConfig, TableUsageStage
+
+
+def _user(name: str) -> User:
+    return User(
+        id=uuid.uuid4(),
+        name=name,
+        fullyQualifiedName=name,
+        email=f"{name}@openmetadata.org",
+        href="http://localhost:8585/api/v1/users/",
+    )
+
+
+class TableUsageStageUserCacheTest(TestCase):
+    """
+    Users are prefetched once and unknown usernames are not asked again
+    """
+
+    @patch("metadata.ingestion.stage.table_usage.OpenMetadata")
+    def get_stage(self, metadata_mock, **config) -> TableUsageStage:
+        metadata_mock.return_value.list_all_entities.return_value = [
+            _user("alice"),
+            _user("bob"),
+        ]
+        return TableUsageStage(
+            TableStageConfig(filename=tempfile.mkdtemp(), **config), MagicMock()
+        )
+
+    def test_users_are_resolved_from_the_prefetch(self):
+        stage = self.get_stage()
+
+        self.assertEqual(stage._get_user_entity("alice"), ["alice"])
+        self.assertEqual(stage._get_user_entity("alice"), ["alice"])
+        self.assertEqual(stage._get_user_entity("unknown"), [])
+        self.assertEqual(stage._get_user_entity("unknown"), [])
+        self.assertEqual(stage._get_user_entity(None), [])
+
+        stage.metadata.get_by_name.assert_not_called()
+        self.assertEqual(stage.status.user_cache_hits, 3)
+        self.assertEqual(stage.status.user_cache_misses, 1)
+
+    def test_unknown_users_are_fetched_once_without_full_prefetch(self):
+        stage = self.get_stage(user_cache_size=1)
+        stage.metadata.get_by_name.return_value = None
+
+        self.assertEqual(stage._get_user_entity("unknown"), [])
+        self.assertEqual(stage._get_user_entity("unknown"), [])
+
+        stage.metadata.get_by_name.assert_called_once()
+        self.assertEqual(stage.status.user_cache_hits, 1)
+        self.assertEqual(stage.status.user_cache_misses, 1)
+
+    def test_unknown_users_do_not_evict_prefetched_users(self):
+        stage = self.get_stage(user_cache_size=2, unknown_user_cache_size=1)
+
+        self.assertEqual(stage._get_user_entity("unknown_1"), [])
+        self.assertEqual(stage._get_user_entity("unknown_2"), [])
+        self.assertEqual(stage._get_user_entity("alice"), ["alice"])
+        self.assertEqual(stage._get_user_entity("bob"), ["bob"])
+
+        stage.metadata.get_by_name.assert_not_called()
@@ -1,3 +1,5 @@
+import os
+import tempfile
 import types
 from unittest import TestCase
 from unittest.mock import patch
@@ -16,6 +18,8 @@ from metadata.generated.schema.metadataIngestion.workflow import (
     OpenMetadataWorkflowConfig,
 )
 from metadata.generated.schema.type.entityReference import EntityReference
+from metadata.ingestion.source.database.common_db_source import TableNameAndType
+from metadata.ingestion.source.database.incremental import IncrementalState
 from metadata.ingestion.source.database.postgres.metadata import (
     GEOMETRY,
     POINT,
@@ -306,3 +310,37 @@ class PostgresUnitTest(TestCase):
 
         execute_fn.return_value = [[]]
         self.assertIsNone(self.postgres_usage_source.get_postgres_version())
+
+    def test_incremental(self):
+        table_fqn = "postgres_source.118146679784.default.{}"
+        watermarks = {"unchanged": "w1", "changed": "w2"}
+
+        with tempfile.TemporaryDirectory() as tmp_dir, patch.object(
+            self.postgres_source,
+            "query_table_names_and_types",
+            return_value=[
+                TableNameAndType(name="unchanged"),
+                TableNameAndType(name="changed"),
+            ],
+        ), patch.object(
+            self.postgres_source,
+            "get_table_watermark",
+            side_effect=lambda schema_name, table_name: watermarks[table_name],
+        ):
+            location = os.path.join(tmp_dir, "state.json")
+            self.postgres_source.incremental_state = IncrementalState(location, "")
+            self.postgres_source.incremental_state.previous = {
+                table_fqn.format("unchanged"): "w1",
+                table_fqn.format("changed"): "w1",
+            }
+            self.postgres_source.source_config.includeViews = False
+
+            tables = list(self.postgres_source.get_tables_name_and_type())
+
+            self.assertEqual([name for name, _ in tables], ["changed"])
+            self.assertIn(
+                table_fqn.format("unchanged"),
+                self.postgres_source.database_source_state,
+            )
+            self.postgres_source.incremental_state = None
+            self.postgres_source.source_config.includeViews = True
@@ -12,10 +12,24 @@
 """
 Check that we are properly running nodes and stages
 """
+import uuid
 from unittest import TestCase
+from unittest.mock import MagicMock
 
+from pydantic import BaseModel
+
+from metadata.generated.schema.api.data.createDatabase import CreateDatabaseRequest
+from metadata.generated.schema.api.data.createDatabaseSchema import (
+    CreateDatabaseSchemaRequest,
+)
+from metadata.generated.schema.entity.data.database import Database
+from metadata.generated.schema.entity.data.databaseSchema import DatabaseSchema
+from metadata.generated.schema.type.basic import EntityName
+from metadata.generated.schema.type.entityReference import EntityReference
 from metadata.ingestion.api.topology_runner import TopologyRunnerMixin
 from metadata.ingestion.models.topology import (
+    EntityAck,
+    MissingExpectedEntityAckException,
     NodeStage,
     ServiceTopology,
     TopologyNode,
@@ -81,3 +95,177 @@ class TopologyRunnerTest(TestCase):
         source = MockSource()
         processed = list(source.next_record())
         assert processed == [2, "abc2", "def2", 3, "abc3", "def3"]
+
+
+class MockService(BaseModel):
+    name: EntityName
+
+
+class MockPipelinedTopology(ServiceTopology):
+    root = TopologyNode(
+        producer="get_services",
+        stages=[
+            NodeStage(
+                type_=MockService,
+                context="database_service",
+                processor="yield_service",
+                ack_sink=False,
+            )
+        ],
+        children=["database"],
+    )
+    database = TopologyNode(
+        producer="get_database_names",
+        stages=[
+            NodeStage(
+                type_=Database,
+                context="database",
+                processor="yield_database",
+                consumer=["database_service"],
+            )
+        ],
+        children=["databaseSchema"],
+    )
+    databaseSchema = TopologyNode(
+        producer="get_database_schema_names",
+        stages=[
+            NodeStage(
+                type_=DatabaseSchema,
+                context="database_schema",
+                processor="yield_database_schema",
+                consumer=["database_service", "database"],
+            )
+        ],
+    )
+
+
+def _list_entities(entity_type, params: dict):
+    """Build the entities OM would return after the sink wrote them"""
+    parent_fqn = list(params.values())[0]
+    names = ["db1", "db2"] if entity_type == Database else ["schema1", "schema2"]
+    for name in names:
+        kwargs = (
+            {}
+            if entity_type == Database
+            else {"database": EntityReference(id=uuid.uuid4(), type="database")}
+        )
+        yield entity_type(
+            id=uuid.uuid4(),
+            name=name,
+            fullyQualifiedName=f"{parent_fqn}.{name}",
+            service=EntityReference(id=uuid.uuid4(), type="databaseService"),
+            **kwargs,
+        )
+
+
+class MockPipelinedSource(TopologyRunnerMixin):
+    topology = MockPipelinedTopology()
+    context = create_source_context(topology)
+
+    def __init__(self, read_database: bool = False):
+        self.read_database = read_database
+        self.acked = []
+        self.metadata = MagicMock()
+        self.metadata.config.forceEntityOverwriting = False
+        self.metadata.config.pipelinedEntityAck = True
+        self.metadata.list_all_entities.side_effect = (
+            lambda entity, fields, params: _list_entities(entity, params)
+        )
+        self.metadata.get_by_name.side_effect = lambda entity, fqn, fields: next(
+            elem
+            for elem in _list_entities(entity, {"service": "service"})
+            if elem.fullyQualifiedName.__root__ == fqn
+        )
+
+    def on_entity_ack(self, stage: NodeStage, entity) -> None:
+        self.acked.append(entity.fullyQualifiedName.__root__)
+
+    @staticmethod
+    def get_services():
+        yield "service"
+
+    @staticmethod
+    def get_database_names():
+        yield "db1"
+        yield "db2"
+
+    @staticmethod
+    def get_database_schema_names():
+        yield "schema1"
+        yield "schema2"
+
+    @staticmethod
+    def yield_service(name: str):
+        yield MockService(name=name)
+
+    @staticmethod
+    def yield_database(name: str):
+        yield CreateDatabaseRequest(name=name, service="service")
+
+    def yield_database_schema(self, name: str):
+        if self.read_database:
+            # Any attribute not known from the request needs the Entity
+            assert self.context.database.id
+        yield CreateDatabaseSchemaRequest(
+            name=name, database=self.context.database.fullyQualifiedName.__root__
+        )
+
+
+class PipelinedAckTest(TestCase):
+    """
+    Validate that acks are reconciled in batch
+    """
+
+    def test_acks_are_listed_per_parent(self):
+        source = MockPipelinedSource()
+        processed = list(source.next_record())
+
+        assert [record.name.__root__ for record in processed] == [
+            "service",
+            "db1",
+            "schema1",
+            "schema2",
+            "db2",
+            "schema1",
+            "schema2",
+        ]
+        # One list for the databases of the service + one per database
+        assert source.metadata.list_all_entities.call_count == 3
+        source.metadata.get_by_name.assert_not_called()
+        assert sorted(source.acked) == [
+            "service.db1",
+            "service.db1.schema1",
+            "service.db1.schema2",
+            "service.db2",
+            "service.db2.schema1",
+            "service.db2.schema2",
+        ]
+
+    def test_children_block_on_needed_parents(self):
+        source = MockPipelinedSource(read_database=True)
+        processed = list(source.next_record())
+
+        assert len(processed) == 7
+        # The schemas read the database entity, fetched once per database
+        assert source.metadata.get_by_name.call_count == 2
+        assert source.metadata.list_all_entities.call_count == 2
+        assert len(source.acked) == 6
+
+    def test_missing_ack_of_must_return_stage(self):
+        stage = NodeStage(
+            type_=Database,
+            context="database",
+            processor="yield_database",
+            must_return=True,
+        )
+        ack = EntityAck(
+            stage=stage,
+            entity_request=CreateDatabaseRequest(name="db1", service="service"),
+            entity_fqn="service.db1",
+            parent_fqn="service",
+            resolver=lambda _: None,
+        )
+
+        assert ack.fullyQualifiedName.__root__ == "service.db1"
+        with self.assertRaises(MissingExpectedEntityAckException):
+            ack.get_entity()